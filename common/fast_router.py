@@ -0,0 +1,316 @@
+"""
+빠른 경로 라우터.
+
+langgraph-app과 langgraph-hybrid가 함께 쓰는 공통 모듈입니다. 각 앱은 graph/fast_router.py,
+agents/fast_router.py에서 이 모듈을 다시 내보내므로 규칙과 절 분리 방식은 여기서만 관리합니다.
+"""
+import os
+import re
+import json
+import threading
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage
+from dotenv import load_dotenv
+from logging_config import setup_logger
+
+# 로거 설정
+logger = setup_logger("fast_router")
+
+# 환경 변수 로드
+load_dotenv()
+FAST_ROUTER_ENABLE = os.getenv("FAST_ROUTER_ENABLE", "true").lower() in ("true", "1", "yes")
+FAST_ROUTER_THRESHOLD = float(os.getenv("FAST_ROUTER_THRESHOLD", "0.8"))
+FAST_ROUTER_RULES_PATH = os.getenv("FAST_ROUTER_RULES_PATH")
+
+# 빠른 라우팅 대상 에이전트
+ROUTABLE_AGENTS = ("routine_agent", "device_agent", "robot_cleaner_agent")
+
+# 복합 요청을 절 단위로 나눌 때 절 끝으로 보는 연결형 동사 ("에어컨 켜고 로봇청소기도 돌려줘" → "에어컨 켜고", "로봇청소기도 돌려줘")
+# "냉장고 재고", "차고 문"처럼 "고"로 끝나는 명사에서 잘못 나누지 않도록 목록에 있는 동사 뒤에서만 나눔
+# 규칙 파일의 clause_connectives로 바꿀 수 있음
+DEFAULT_CLAUSE_CONNECTIVES: List[str] = [
+    "켜고", "켜주고", "켜며",
+    "끄고", "꺼주고", "끄며",
+    "틀고", "틀어주고",
+    "돌리고", "돌려주고",
+    "시작하고", "멈추고", "중지하고",
+    "설정하고", "변경하고", "바꾸고", "맞추고",
+    "올리고", "내리고", "낮추고", "높이고",
+    "확인하고", "알려주고", "조회하고",
+    "등록하고", "추가하고", "삭제하고", "실행하고",
+]
+
+# 기본 라우팅 규칙
+# - keywords: 소문자로 비교하는 포함 검사, patterns: 대소문자를 구분하지 않는 정규식
+# - weight: 규칙이 일치했을 때 해당 에이전트의 신뢰도
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {
+        "agent": "routine_agent",
+        "keywords": ["루틴", "routine"],
+        "patterns": [],
+        "weight": 0.95,
+    },
+    {
+        "agent": "robot_cleaner_agent",
+        "keywords": ["로봇청소기", "로봇 청소기", "청소기", "robot", "cleaner"],
+        "patterns": [r"방범\s*(구역|모드)"],
+        "weight": 0.95,
+    },
+    {
+        "agent": "robot_cleaner_agent",
+        "keywords": [],
+        "patterns": [r"청소\s*(시작|중지|멈춰|해\s*줘)"],
+        "weight": 0.85,
+    },
+    {
+        "agent": "device_agent",
+        "keywords": ["에어컨", "냉장고", "air conditioner", "refrigerator"],
+        "patterns": [],
+        "weight": 0.95,
+    },
+    {
+        "agent": "device_agent",
+        "keywords": ["냉방", "제습", "송풍"],
+        "patterns": [r"\d+\s*도\s*로", r"(실내|희망|설정)\s*온도"],
+        "weight": 0.85,
+    },
+]
+
+
+def build_clause_split_pattern(connectives: List[str]) -> "re.Pattern[str]":
+    """
+    명시적인 연결어("그리고", "및", 쉼표)와 연결형 동사 뒤의 공백에서 절을 나누는 정규식을 만듭니다.
+    연결형 동사는 앞 절에 그대로 남습니다.
+    """
+    parts = [r"\s*(?:그리고|,)\s*", r"\s+및\s+"]
+    if connectives:
+        lookbehinds = "|".join(f"(?<={re.escape(connective)})" for connective in connectives)
+        parts.append(f"(?:{lookbehinds})(?:\\s*,)?\\s+")
+    return re.compile("|".join(parts))
+
+
+# 기본 연결형 동사로 만든 절 분리 정규식
+CLAUSE_SPLIT_PATTERN = build_clause_split_pattern(DEFAULT_CLAUSE_CONNECTIVES)
+
+
+class FastRouter:
+    """
+    키워드/정규식 규칙으로 첫 라우팅을 결정하는 빠른 경로 라우터.
+
+    규칙이 한 에이전트만 가리키고 신뢰도가 임계값 이상이면 슈퍼바이저 LLM 호출 없이 라우팅합니다.
+    여러 에이전트가 함께 일치하거나(복합 요청) 신뢰도가 낮으면 None을 반환하여 LLM이 결정하도록 합니다.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]], threshold: float = FAST_ROUTER_THRESHOLD, enabled: bool = FAST_ROUTER_ENABLE, clause_connectives: Optional[List[str]] = None):
+        self.threshold = threshold
+        self.enabled = enabled
+        self._rules = self._compile_rules(rules)
+        self._clause_pattern = CLAUSE_SPLIT_PATTERN if clause_connectives is None else build_clause_split_pattern(clause_connectives)
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "ambiguous": 0,
+            "skipped": 0,
+            "fan_outs": 0,
+            "by_agent": {agent: 0 for agent in ROUTABLE_AGENTS},
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _compile_rules(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """규칙을 검증하고 정규식을 컴파일합니다."""
+        compiled = []
+        for rule in rules:
+            agent = rule.get("agent")
+            if agent not in ROUTABLE_AGENTS:
+                raise ValueError(f"알 수 없는 라우팅 대상입니다: {agent}")
+            compiled.append({
+                "agent": agent,
+                "keywords": [keyword.lower() for keyword in rule.get("keywords", [])],
+                "patterns": [re.compile(pattern, re.IGNORECASE) for pattern in rule.get("patterns", [])],
+                "weight": float(rule.get("weight", 0.9)),
+            })
+        return compiled
+
+    def score(self, text: str) -> Dict[str, float]:
+        """에이전트별 신뢰도를 계산합니다. 한 에이전트에 여러 규칙이 일치하면 가장 높은 가중치를 사용합니다."""
+        lowered = text.lower()
+        scores: Dict[str, float] = {}
+        for rule in self._rules:
+            matched = any(keyword in lowered for keyword in rule["keywords"]) or \
+                any(pattern.search(text) for pattern in rule["patterns"])
+            if matched:
+                scores[rule["agent"]] = max(scores.get(rule["agent"], 0.0), rule["weight"])
+        return scores
+
+    def classify(self, text: str) -> Tuple[Optional[str], float, int]:
+        """
+        질의를 분류합니다.
+
+        Returns:
+            (에이전트 이름 또는 None, 신뢰도, 일치한 에이전트 수).
+            여러 에이전트가 일치하면 신뢰도는 1, 2위 점수의 차이입니다.
+        """
+        scores = self.score(text)
+        if not scores:
+            return None, 0.0, 0
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        agent, confidence = ranked[0]
+        if len(ranked) > 1:
+            confidence -= ranked[1][1]
+        return agent, confidence, len(ranked)
+
+    def split_clauses(self, text: str) -> List[str]:
+        """요청을 연결어와 연결형 동사 기준으로 절 단위로 나눕니다."""
+        return [clause.strip() for clause in self._clause_pattern.split(text) if clause and clause.strip()]
+
+    def split_targets(self, text: str) -> List[str]:
+        """
+        복합 요청을 절 단위로 나누어 서로 다른 에이전트가 맡을 작업인지 확인합니다.
+
+        모든 절이 각각 한 에이전트로 확실하게 분류되고 대상 에이전트가 둘 이상일 때만
+        대상 목록을 반환합니다. 분류할 수 없는 절이 하나라도 있으면 빈 목록을 반환합니다.
+        """
+        clauses = self.split_clauses(text)
+        if len(clauses) < 2:
+            return []
+        targets: List[str] = []
+        for clause in clauses:
+            agent, confidence, _ = self.classify(clause)
+            if agent is None or confidence < self.threshold:
+                return []
+            if agent not in targets:
+                targets.append(agent)
+        return targets if len(targets) > 1 else []
+
+    def fan_out_targets(self, messages: List[BaseMessage], request_id: str = "") -> List[str]:
+        """
+        새 사용자 요청이 여러 에이전트의 독립적인 작업으로 나뉘면 대상 에이전트 목록을 반환합니다.
+
+        Returns:
+            동시에 실행할 에이전트 목록. 나눌 수 없으면 빈 목록.
+        """
+        if not self.enabled or not messages:
+            return []
+        last_message = messages[-1]
+        if getattr(last_message, "name", None) in ROUTABLE_AGENTS or not isinstance(last_message.content, str):
+            return []
+        targets = self.split_targets(last_message.content)
+        if targets:
+            with self._lock:
+                self._stats["fan_outs"] += 1
+            logger.info("[%s] 복합 요청 병렬 라우팅: %s", request_id, targets)
+        return targets
+
+    def route(self, messages: List[BaseMessage], request_id: str = "") -> Optional[str]:
+        """
+        새 사용자 요청이면 규칙으로 라우팅을 시도합니다.
+
+        에이전트가 이미 응답한 뒤의 결정(계속 또는 FINISH)은 다루지 않습니다.
+
+        Returns:
+            라우팅할 에이전트 이름. LLM이 결정해야 하면 None.
+        """
+        if not self.enabled or not messages:
+            return None
+
+        last_message = messages[-1]
+        if getattr(last_message, "name", None) in ROUTABLE_AGENTS or not isinstance(last_message.content, str):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return None
+
+        agent, confidence, candidates = self.classify(last_message.content)
+        with self._lock:
+            if agent is not None and confidence >= self.threshold:
+                self._stats["hits"] += 1
+                self._stats["by_agent"][agent] += 1
+                logger.info("[%s] 빠른 라우팅: %s (신뢰도: %.2f)", request_id, agent, confidence)
+                return agent
+            self._stats["misses"] += 1
+            if candidates > 1:
+                self._stats["ambiguous"] += 1
+        logger.info("[%s] 빠른 라우팅 실패, LLM으로 결정 (후보: %s, 신뢰도: %.2f)", request_id, agent, confidence)
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """빠른 라우팅 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            decided = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "by_agent": dict(self._stats["by_agent"]),
+                "hit_rate": self._stats["hits"] / decided if decided else None,
+                "enabled": self.enabled,
+                "threshold": self.threshold,
+                "rule_count": len(self._rules),
+            }
+
+
+def _read_rules_file(path: str) -> Dict[str, Any]:
+    """
+    규칙 파일을 읽습니다. 규칙 목록만 담은 JSON 배열과
+    {"rules": [...], "clause_connectives": [...]} 형식의 객체를 모두 받습니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {"rules": data} if isinstance(data, list) else data
+
+
+def load_rules(path: Optional[str] = FAST_ROUTER_RULES_PATH) -> List[Dict[str, Any]]:
+    """
+    라우팅 규칙을 불러옵니다.
+
+    FAST_ROUTER_RULES_PATH가 지정되어 있으면 해당 JSON 파일의 규칙을 사용하고,
+    읽을 수 없으면 기본 규칙을 사용합니다.
+    """
+    if not path:
+        return DEFAULT_RULES
+    try:
+        rules = _read_rules_file(path)["rules"]
+        FastRouter._compile_rules(rules)
+        logger.info("빠른 라우팅 규칙 로드: %s (%s개 규칙)", path, len(rules))
+        return rules
+    except Exception as e:
+        logger.error("빠른 라우팅 규칙 로드 실패, 기본 규칙 사용: %s", e)
+        logger.error(traceback.format_exc())
+        return DEFAULT_RULES
+
+
+def load_clause_connectives(path: Optional[str] = FAST_ROUTER_RULES_PATH) -> List[str]:
+    """
+    절 분리에 쓸 연결형 동사 목록을 불러옵니다.
+
+    규칙 파일에 clause_connectives가 있으면 그 목록을, 없거나 읽을 수 없으면 기본 목록을 사용합니다.
+    """
+    if not path:
+        return DEFAULT_CLAUSE_CONNECTIVES
+    try:
+        connectives = _read_rules_file(path).get("clause_connectives")
+        if connectives is None:
+            return DEFAULT_CLAUSE_CONNECTIVES
+        if not all(isinstance(connective, str) and connective for connective in connectives):
+            raise ValueError("clause_connectives는 비어 있지 않은 문자열 목록이어야 합니다")
+        logger.info("절 분리 연결형 동사 로드: %s (%s개)", path, len(connectives))
+        return connectives
+    except Exception as e:
+        logger.error("절 분리 연결형 동사 로드 실패, 기본 목록 사용: %s", e)
+        return DEFAULT_CLAUSE_CONNECTIVES
+
+
+# 싱글톤 인스턴스
+_fast_router_instance = None
+_fast_router_lock = threading.Lock()
+
+
+def get_fast_router() -> FastRouter:
+    """빠른 경로 라우터의 싱글톤 인스턴스를 반환합니다."""
+    global _fast_router_instance
+    if _fast_router_instance is None:
+        with _fast_router_lock:
+            if _fast_router_instance is None:
+                _fast_router_instance = FastRouter(load_rules(), clause_connectives=load_clause_connectives())
+                logger.info("빠른 라우터 생성 완료 (사용: %s, 임계값: %s)", FAST_ROUTER_ENABLE, FAST_ROUTER_THRESHOLD)
+    return _fast_router_instance
@@ -1,2 +1,3 @@
 # 에이전트 모듈 임포트
-from agents.agents import create_routine_agent, create_device_agent, create_robot_cleaner_agent 
\ No newline at end of file
+from agents.agents import create_routine_agent, create_device_agent, create_robot_cleaner_agent
+from agents.agent_registry import AgentRegistry, get_agent_registry
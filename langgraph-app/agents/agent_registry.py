@@ -0,0 +1,242 @@
+import os
+import time
+import asyncio
+import threading
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from logging_config import setup_logger
+from agents.agents import (
+    create_routine_agent,
+    create_device_agent,
+    get_routine_agent_tools,
+    get_device_agent_tools,
+)
+
+# 로거 설정
+logger = setup_logger("agent_registry")
+
+# 도구 구성 변경을 확인하는 주기(초). 도구 목록 생성 비용 때문에 요청마다 확인하지 않음
+AGENT_TOOLS_CHECK_INTERVAL = float(os.getenv("AGENT_TOOLS_CHECK_INTERVAL", "60"))
+
+
+def _get_model_name() -> str:
+    """현재 설정된 에이전트 LLM 모델 이름을 반환합니다."""
+    return os.getenv("MODEL_NAME", "")
+
+
+def _get_tool_names(tools_provider: Callable[[], List]) -> Tuple[str, ...]:
+    """도구 목록의 이름을 정렬된 튜플로 반환합니다."""
+    return tuple(sorted(getattr(tool, "name", str(tool)) for tool in tools_provider()))
+
+
+class AgentRegistry:
+    """
+    컴파일된 에이전트 실행기를 프로세스 단위로 캐싱하는 레지스트리.
+
+    에이전트는 처음 요청될 때(또는 warm_up 호출 시) 한 번만 생성되며,
+    모델 이름이나 도구 구성이 바뀌거나 invalidate가 호출되면 다시 생성됩니다.
+    에이전트 생성은 레지스트리 잠금 밖에서 에이전트별 잠금으로 한 번만 수행하므로
+    한 에이전트를 생성하는 동안 다른 에이전트 조회가 막히지 않습니다.
+    """
+
+    def __init__(self, tools_check_interval: float = AGENT_TOOLS_CHECK_INTERVAL):
+        self.tools_check_interval = tools_check_interval
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._tools_providers: Dict[str, Callable[[], List]] = {}
+        self._agents: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        # 에이전트별 (도구 이름 목록, 확인 시각)
+        self._tool_names: Dict[str, Tuple[Tuple[str, ...], float]] = {}
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any], tools_provider: Callable[[], List]) -> None:
+        """
+        에이전트 생성 함수를 등록합니다.
+
+        Args:
+            name: 에이전트 이름
+            factory: 에이전트 실행기를 생성하는 함수
+            tools_provider: 에이전트가 사용하는 도구 목록을 반환하는 함수
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._tools_providers[name] = tools_provider
+            self._stats.setdefault(name, {
+                "builds": 0,
+                "hits": 0,
+                "build_time_total": 0.0,
+                "last_build_time": None,
+                "last_built_at": None,
+                "invalidations": 0,
+            })
+            self._build_locks.setdefault(name, threading.Lock())
+            self._agents.pop(name, None)
+            self._fingerprints.pop(name, None)
+            self._tool_names.pop(name, None)
+        logger.info("에이전트 등록: %s", name)
+
+    def _fingerprint(self, name: str) -> Tuple[str, Tuple[str, ...]]:
+        """현재 모델 이름과 도구 이름 목록을 반환합니다. 도구 목록은 tools_check_interval초마다 다시 구합니다."""
+        now = time.time()
+        with self._lock:
+            cached = self._tool_names.get(name)
+        if cached is None or now - cached[1] >= self.tools_check_interval:
+            tool_names = _get_tool_names(self._tools_providers[name])
+            with self._lock:
+                self._tool_names[name] = (tool_names, now)
+        else:
+            tool_names = cached[0]
+        return _get_model_name(), tool_names
+
+    def _lookup(self, name: str, fingerprint: Tuple[str, Tuple[str, ...]]) -> Optional[Any]:
+        """캐시된 에이전트가 현재 구성과 같으면 반환하고, 구성이 바뀌었으면 캐시에서 제거합니다."""
+        with self._lock:
+            agent = self._agents.get(name)
+            if agent is None:
+                return None
+            cached = self._fingerprints[name]
+            if cached == fingerprint:
+                self._stats[name]["hits"] += 1
+                return agent
+            logger.info("에이전트 구성 변경 감지 (%s -> %s), 에이전트 재생성: %s", cached, fingerprint, name)
+            self._agents.pop(name, None)
+            self._fingerprints.pop(name, None)
+            self._stats[name]["invalidations"] += 1
+            return None
+
+    def _build(self, name: str, fingerprint: Tuple[str, Tuple[str, ...]]) -> Any:
+        """
+        에이전트를 생성하고 캐시에 저장합니다.
+
+        레지스트리 잠금 밖에서 생성하며, 같은 에이전트를 동시에 요청하면 한 번만 생성합니다.
+        """
+        with self._build_locks[name]:
+            # 기다리는 동안 다른 스레드가 생성했으면 그대로 사용
+            with self._lock:
+                if self._fingerprints.get(name) == fingerprint and name in self._agents:
+                    return self._agents[name]
+
+            factory = self._factories[name]
+            start_time = time.time()
+            agent = factory()
+            elapsed_time = time.time() - start_time
+
+            with self._lock:
+                self._agents[name] = agent
+                self._fingerprints[name] = fingerprint
+
+                stats = self._stats[name]
+                stats["builds"] += 1
+                stats["build_time_total"] += elapsed_time
+                stats["last_build_time"] = elapsed_time
+                stats["last_built_at"] = time.time()
+        logger.info("에이전트 생성 완료: %s (소요시간: %.2f초, 누적 생성 횟수: %s)", name, elapsed_time, stats['builds'])
+        return agent
+
+    def get(self, name: str) -> Any:
+        """
+        캐시된 에이전트 실행기를 반환합니다. 없거나 모델 이름, 도구 구성이 바뀌었으면 새로 생성합니다.
+
+        Args:
+            name: 에이전트 이름
+
+        Returns:
+            컴파일된 에이전트 실행기
+        """
+        if name not in self._factories:
+            raise KeyError(f"등록되지 않은 에이전트입니다: {name}")
+
+        fingerprint = self._fingerprint(name)
+        agent = self._lookup(name, fingerprint)
+        if agent is not None:
+            return agent
+        return self._build(name, fingerprint)
+
+    async def aget(self, name: str) -> Any:
+        """
+        get의 비동기 버전입니다.
+
+        캐시 적중 시에는 바로 반환하고, 에이전트를 새로 생성해야 하면(기능 정보 HTTP 조회 포함)
+        스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+        """
+        if name not in self._factories:
+            raise KeyError(f"등록되지 않은 에이전트입니다: {name}")
+
+        fingerprint = self._fingerprint(name)
+        agent = self._lookup(name, fingerprint)
+        if agent is not None:
+            return agent
+        return await asyncio.to_thread(self._build, name, fingerprint)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        캐시된 에이전트를 무효화합니다. 다음 요청 시 다시 생성됩니다.
+
+        Args:
+            name: 무효화할 에이전트 이름 (없으면 전체 무효화)
+        """
+        with self._lock:
+            names = [name] if name else list(self._agents.keys())
+            for agent_name in names:
+                self._tool_names.pop(agent_name, None)
+                if self._agents.pop(agent_name, None) is not None:
+                    self._fingerprints.pop(agent_name, None)
+                    self._stats[agent_name]["invalidations"] += 1
+                    logger.info("에이전트 캐시 무효화: %s", agent_name)
+
+    def warm_up(self, names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        등록된 에이전트를 미리 생성합니다. 서버 시작 시 호출됩니다.
+
+        Args:
+            names: 미리 생성할 에이전트 이름 목록 (없으면 전체)
+
+        Returns:
+            에이전트별 생성 성공 여부
+        """
+        results = {}
+        for name in names or list(self._factories.keys()):
+            try:
+                self.get(name)
+                results[name] = True
+            except Exception as e:
+                logger.error("에이전트 사전 생성 실패: %s - %s", name, e)
+                logger.error(traceback.format_exc())
+                results[name] = False
+        logger.info("에이전트 사전 생성 완료: %s", results)
+        return results
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """에이전트별 생성 시간과 재사용 횟수 통계를 반환합니다."""
+        with self._lock:
+            result = {}
+            for name, stats in self._stats.items():
+                builds = stats["builds"]
+                result[name] = {
+                    **stats,
+                    "cached": name in self._agents,
+                    "model_name": self._fingerprints.get(name, (None, ()))[0],
+                    "avg_build_time": stats["build_time_total"] / builds if builds else None,
+                }
+            return result
+
+
+# 싱글톤 인스턴스
+_registry_instance = None
+_registry_lock = threading.Lock()
+
+
+def get_agent_registry() -> AgentRegistry:
+    """기본 에이전트가 등록된 에이전트 레지스트리의 싱글톤 인스턴스를 반환합니다."""
+    global _registry_instance
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                registry = AgentRegistry()
+                registry.register("routine_agent", create_routine_agent, get_routine_agent_tools)
+                registry.register("device_agent", create_device_agent, get_device_agent_tools)
+                _registry_instance = registry
+    return _registry_instance
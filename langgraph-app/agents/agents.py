@@ -21,12 +21,21 @@ from logging_config import setup_logger
 from tools.routine_tools import register_routine, list_routines, delete_routine, suggest_routine
 from tools.device_tools import (
     get_refrigerator_tools, 
-    get_air_conditioner_tools
+    get_air_conditioner_tools,
+    get_snapshot_tools,
+    get_batch_tools,
+    get_capability_prompt,
+    aget_capability_prompt
 )
+from tools.turn_memo import memoize_tools
 
 # 로거 설정
 logger = setup_logger("agents")
 
+# 에이전트 프롬프트에 미리 넣을 기기 기능 정보
+DEVICE_AGENT_CAPABILITIES = ["refrigerator.modes", "air_conditioner.modes", "air_conditioner.temperature_range"]
+ROBOT_CLEANER_AGENT_CAPABILITIES = ["robot_cleaner.modes", "robot_cleaner.patrol_areas"]
+
 # Vertex AI 초기화
 try:
     import vertexai
@@ -40,19 +49,19 @@ try:
     REGION = os.getenv("VERTEX_REGION", "us-central1")
     
     if PROJECT_ID and REGION:
-        logger.info(f"Vertex AI 초기화 시도 (프로젝트: {PROJECT_ID}, 리전: {REGION})")
+        logger.info("Vertex AI 초기화 시도 (프로젝트: %s, 리전: %s)", PROJECT_ID, REGION)
         try:
             vertexai.init(project=PROJECT_ID, location=REGION)
             logger.info("Vertex AI 초기화 성공")
         except Exception as e:
-            logger.error(f"Vertex AI 초기화 실패: {str(e)}")
+            logger.error("Vertex AI 초기화 실패: %s", e)
             logger.error(traceback.format_exc())
     else:
         logger.warning("Vertex AI 초기화에 필요한 환경 변수가 없습니다. (VERTEX_PROJECT_ID, VERTEX_REGION)")
 except ImportError:
     logger.warning("vertexai 또는 google.cloud.aiplatform 모듈을 찾을 수 없습니다. Vertex AI를 사용할 수 없습니다.")
 except Exception as e:
-    logger.error(f"Vertex AI 초기화 중 오류 발생: {str(e)}")
+    logger.error("Vertex AI 초기화 중 오류 발생: %s", e)
 
 # 로깅 콜백 핸들러 정의
 class LoggingCallbackHandler(BaseCallbackHandler):
@@ -63,24 +72,24 @@ class LoggingCallbackHandler(BaseCallbackHandler):
         self.logger = logger
     
     def on_chain_start(self, serialized: Dict[str, Any], inputs: Dict[str, Any], **kwargs) -> None:
-        self.logger.info(f"{self.agent_name} 체인 시작: {inputs.get('input', '')[:100]}...")
+        self.logger.info("%s 체인 시작: %s...", self.agent_name, inputs.get('input', '')[:100])
     
     def on_chain_end(self, outputs: Dict[str, Any], **kwargs) -> None:
         output = outputs.get("output", "")
-        self.logger.info(f"{self.agent_name} 체인 종료: {output[:100]}...")
+        self.logger.info("%s 체인 종료: %s...", self.agent_name, output[:100])
     
     def on_chain_error(self, error: Exception, **kwargs) -> None:
-        self.logger.error(f"{self.agent_name} 체인 오류: {str(error)}")
+        self.logger.error("%s 체인 오류: %s", self.agent_name, error)
         self.logger.error(traceback.format_exc())
     
     def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs) -> None:
-        self.logger.info(f"{self.agent_name} LLM 호출 시작")
+        self.logger.info("%s LLM 호출 시작", self.agent_name)
     
     def on_llm_end(self, response, **kwargs) -> None:
-        self.logger.info(f"{self.agent_name} LLM 호출 완료")
+        self.logger.info("%s LLM 호출 완료", self.agent_name)
     
     def on_llm_error(self, error: Exception, **kwargs) -> None:
-        self.logger.error(f"{self.agent_name} LLM 호출 오류: {str(error)}")
+        self.logger.error("%s LLM 호출 오류: %s", self.agent_name, error)
         self.logger.error(traceback.format_exc())
 
 # FakeRoutineAgentLLM 클래스
@@ -123,6 +132,17 @@ class FakeDeviceAgentLLM(LLM):
     def _llm_type(self) -> str:
         return "fake-device-agent-llm"
 
+# 루틴 에이전트 도구 목록
+def get_routine_agent_tools() -> List:
+    """루틴 에이전트가 사용하는 도구 목록을 반환합니다."""
+    return [register_routine, list_routines, delete_routine, suggest_routine]
+
+# 가전제품 제어 에이전트 도구 목록
+def get_device_agent_tools() -> List:
+    """가전제품 제어 에이전트가 사용하는 도구 목록을 반환합니다. (냉장고, 에어컨)"""
+    # 한 턴 안의 중복 조회를 없애도록 턴 메모를 사용하는 도구로 감쌈
+    return memoize_tools(get_refrigerator_tools() + get_air_conditioner_tools() + get_snapshot_tools() + get_batch_tools())
+
 # 루틴 에이전트 생성 함수
 def create_routine_agent():
     """루틴 관리 에이전트를 생성합니다."""
@@ -163,7 +183,7 @@ def create_routine_agent():
     ])
     
     # 루틴 관리용 도구 목록
-    routine_tools = [register_routine, list_routines, delete_routine, suggest_routine]
+    routine_tools = get_routine_agent_tools()
     
     # Gemini 모델만 사용 (Vertex AI)
     try:
@@ -174,9 +194,9 @@ def create_routine_agent():
         llm = ChatVertexAI(model_name=model_name, temperature=0)
         
         end_time = time.time()
-        logger.info(f"루틴 에이전트 LLM 초기화 성공 (소요 시간: {end_time - start_time:.2f}초)")
+        logger.info("루틴 에이전트 LLM 초기화 성공 (소요 시간: %.2f초)", end_time - start_time)
     except Exception as e:
-        logger.error(f"루틴 에이전트 LLM 초기화 실패, 테스트 모드로 전환: {str(e)}")
+        logger.error("루틴 에이전트 LLM 초기화 실패, 테스트 모드로 전환: %s", e)
         logger.error(traceback.format_exc())
         
         # 실패 시 테스트용 LLM 사용
@@ -198,6 +218,9 @@ def create_device_agent():
     """가전제품 제어 에이전트를 생성합니다. (냉장고, 에어컨만 담당)"""
     logger.info("기기 에이전트 생성 시작")
     
+    # 바뀌지 않는 기능 정보(모드 목록, 온도 범위)를 프롬프트에 미리 넣어 조회 도구 호출을 줄임
+    capability_prompt = get_capability_prompt(DEVICE_AGENT_CAPABILITIES)
+    
     # 가전제품 제어 에이전트용 프롬프트 템플릿
     device_agent_prompt = ChatPromptTemplate.from_messages([
         ("system", """스마트홈 가전제품 제어 에이전트입니다. 당신은 다양한 스마트홈 가전제품(냉장고, 에어컨)을 제어합니다.
@@ -208,21 +231,19 @@ def create_device_agent():
 
 사용자의 요청에 따라 적절한 가전제품과 기능을 선택하여 제어하세요.
 항상 현재 상태를 확인한 후 변경하는 것이 좋습니다.
+현재 상태는 get_device_snapshot 도구 한 번으로 확인하세요. 상태, 모드, 모드 목록, 온도 범위 등을 개별 도구로 여러 번 조회하지 마세요.
+설정을 두 가지 이상 바꿀 때(예: 에어컨을 켜고 냉방 모드, 22도로 설정)는 apply_device_settings 도구로 한 번에 적용하세요.
 작업 완료 후에는 수행한 작업의 결과를 사용자에게 명확히 알려주세요.
 
 참고: 로봇청소기는 별도의 에이전트가 담당하므로 당신은 제어할 수 없습니다.
 
 모든 응답은 명확하고 친절하게 제공하세요.
-"""),
+""" + capability_prompt),
         MessagesPlaceholder(variable_name="messages"),
     ])
     
-    # 각 가전제품 제어용 도구 목록
-    refrigerator_tools = get_refrigerator_tools()
-    air_conditioner_tools = get_air_conditioner_tools()
-    
-    # 냉장고와 에어컨 도구만 합침
-    device_tools = refrigerator_tools + air_conditioner_tools
+    # 냉장고와 에어컨 제어용 도구 목록
+    device_tools = get_device_agent_tools()
     
     # Gemini 모델만 사용 (Vertex AI)
     try:
@@ -233,9 +254,9 @@ def create_device_agent():
         llm = ChatVertexAI(model_name=model_name, temperature=0)
         
         end_time = time.time()
-        logger.info(f"기기 에이전트 LLM 초기화 성공 (소요 시간: {end_time - start_time:.2f}초)")
+        logger.info("기기 에이전트 LLM 초기화 성공 (소요 시간: %.2f초)", end_time - start_time)
     except Exception as e:
-        logger.error(f"기기 에이전트 LLM 초기화 실패, 테스트 모드로 전환: {str(e)}")
+        logger.error("기기 에이전트 LLM 초기화 실패, 테스트 모드로 전환: %s", e)
         logger.error(traceback.format_exc())
         
         # 실패 시 테스트용 LLM 사용
@@ -256,19 +277,24 @@ def create_device_agent():
 async def create_robot_cleaner_agent():
     """로봇청소기 제어 에이전트를 생성합니다."""
     logger.info("로봇청소기 에이전트 생성 시작")
+    acquired = False
 
     try:
-        # MCP 클라이언트에서 로봇청소기 도구 가져오기
+        # 공유 MCP 클라이언트 매니저에서 로봇청소기 도구 가져오기
+        # 에이전트가 살아있는 동안 연결을 유지하도록 참조를 획득하며, 에이전트를 버릴 때 release 해야 함
         logger.info("MCP 클라이언트에서 로봇청소기 도구 가져오기")
-        from mcp_client import get_mcp_tools
+        from mcp_client import get_mcp_client_manager
         
         # MCP 도구 가져오기 - 실패하면 예외를 그대로 전파
-        tools = get_mcp_tools()
-        logger.info(f"MCP 도구 {len(tools)}개 로드됨")
+        manager = get_mcp_client_manager()
+        await manager.acquire()
+        acquired = True
+        tools = await manager.get_tools()
+        logger.info("MCP 도구 %s개 로드됨", len(tools))
         
         # 로봇청소기 LLM 이름 로깅
         model_name = os.getenv("MODEL_NAME", "")
-        logger.info(f"로봇청소기 에이전트 LLM: {model_name}")
+        logger.info("로봇청소기 에이전트 LLM: %s", model_name)
         
         # Gemini 모델 초기화
         try:
@@ -280,7 +306,7 @@ async def create_robot_cleaner_agent():
             if not PROJECT_ID:
                 raise ValueError("Vertex AI 프로젝트 ID가 설정되지 않았습니다")
             
-            logger.info(f"Vertex AI ChatVertexAI 초기화 (모델: {model_name})")
+            logger.info("Vertex AI ChatVertexAI 초기화 (모델: %s)", model_name)
             llm = ChatVertexAI(
                 model_name=model_name,
                 convert_system_message_to_human=True,
@@ -288,16 +314,21 @@ async def create_robot_cleaner_agent():
                 max_output_tokens=1024
             )
         except Exception as e:
-            logger.error(f"Vertex AI 초기화 실패: {str(e)}")
+            logger.error("Vertex AI 초기화 실패: %s", e)
             logger.error(traceback.format_exc())
             raise ValueError(f"로봇청소기 에이전트 LLM 초기화 실패: {str(e)}")
         
+        # 바뀌지 않는 기능 정보(모드 목록, 방범 가능 구역)를 프롬프트에 미리 넣어 조회 도구 호출을 줄임
+        capability_prompt = await aget_capability_prompt(ROBOT_CLEANER_AGENT_CAPABILITIES)
+        
         # 로봇청소기 프롬프트 생성 - 단순화된 프롬프트 구조 사용
         robot_cleaner_prompt = ChatPromptTemplate.from_messages([
             ("system", """당신은 로봇청소기를 제어하는 스마트홈 에이전트입니다. 
 로봇청소기의 상태 확인, 전원 제어, 모드 변경, 방범 기능 설정 등을 수행할 수 있습니다.
+현재 상태는 get_robot_cleaner_snapshot 도구 한 번으로 확인하세요. 상태, 모드, 방범 구역 등을 개별 도구로 여러 번 조회하지 마세요.
+설정을 두 가지 이상 바꿀 때는 apply_robot_cleaner_settings 도구로 한 번에 적용하세요.
 
-응답은 항상 한국어로 제공하세요."""),
+응답은 항상 한국어로 제공하세요.""" + capability_prompt),
             MessagesPlaceholder(variable_name="messages")
         ])
         
@@ -313,6 +344,9 @@ async def create_robot_cleaner_agent():
         return robot_cleaner_agent.with_config({"run_name": "RobotCleanerAgent"})
     
     except Exception as e:
-        logger.error(f"로봇청소기 에이전트 생성 중 오류 발생: {str(e)}")
+        logger.error("로봇청소기 에이전트 생성 중 오류 발생: %s", e)
         logger.error(traceback.format_exc())
+        # 생성에 실패했으므로 획득한 MCP 연결 참조를 반납
+        if acquired:
+            await manager.release()
         raise 
\ No newline at end of file
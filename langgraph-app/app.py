@@ -1,21 +1,31 @@
 from fastapi import FastAPI, HTTPException, Depends, Body
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse, PlainTextResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional, DefaultDict
 from dotenv import load_dotenv
 import os
+import asyncio
 import uvicorn
 from uuid import uuid4
 from collections import defaultdict
 import glob
+import json
 import time
 import traceback
 
-from graph.supervisor import create_smart_home_graph, SmartHomeState
+from graph.supervisor import create_smart_home_graph, SmartHomeState, reset_supervisor_router
+from graph.fast_router import get_fast_router
+from graph.completion_policy import get_completion_policy
+from agents.agent_registry import get_agent_registry
+from tools.http_client import close_http_clients
+from tools.capability_cache import get_capability_cache
+from tools.turn_memo import get_turn_memo_stats
 from langchain_core.messages import HumanMessage
-from session_manager import create_session_manager, SessionManager
+from session_manager import create_session_manager, AsyncSessionManager
+from context_window import get_context_window
+from metrics import MetricsCallbackHandler, get_agent_metrics
 from logging_config import setup_logger
 
 # Langfuse 임포트
@@ -43,7 +53,7 @@ if LANGFUSE_ENABLE:
         )
         logger.info("Langfuse 초기화 성공")
     except Exception as e:
-        logger.error(f"Langfuse 초기화 실패: {str(e)}")
+        logger.error("Langfuse 초기화 실패: %s", e)
         logger.error(traceback.format_exc())
         langfuse = None
 else:
@@ -64,17 +74,17 @@ async def log_requests(request, call_next):
     request_method = request.method
     client_host = request.client.host if request.client else "unknown"
     
-    logger.info(f"요청 {request_id} - 메소드: {request_method} 경로: {request_path} - 클라이언트: {client_host}")
+    logger.info("요청 %s - 메소드: %s 경로: %s - 클라이언트: %s", request_id, request_method, request_path, client_host)
     
     try:
         start_time = time.time()
         response = await call_next(request)
         process_time = time.time() - start_time
         
-        logger.info(f"응답 {request_id} - 상태: {response.status_code} - 소요시간: {process_time:.4f}초")
+        logger.info("응답 %s - 상태: %s - 소요시간: %.4f초", request_id, response.status_code, process_time)
         return response
     except Exception as e:
-        logger.error(f"요청 {request_id} 처리 중 오류 발생: {str(e)}")
+        logger.error("요청 %s 처리 중 오류 발생: %s", request_id, e)
         logger.error(traceback.format_exc())
         raise
 
@@ -100,17 +110,17 @@ try:
     smart_home_graph = create_smart_home_graph()
     logger.info("멀티에이전트 그래프 초기화 완료!")
 except Exception as e:
-    logger.error(f"멀티에이전트 그래프 초기화 중 오류 발생: {str(e)}")
+    logger.error("멀티에이전트 그래프 초기화 중 오류 발생: %s", e)
     logger.error(traceback.format_exc())
     raise
 
 # 세션 관리자 초기화
 try:
     logger.info("세션 관리자 초기화 중...")
-    session_manager = create_session_manager()
+    session_manager: AsyncSessionManager = create_session_manager(use_async=True)
     logger.info("세션 관리자 초기화 완료!")
 except Exception as e:
-    logger.error(f"세션 관리자 초기화 중 오류 발생: {str(e)}")
+    logger.error("세션 관리자 초기화 중 오류 발생: %s", e)
     logger.error(traceback.format_exc())
     raise
 
@@ -122,6 +132,7 @@ class QueryRequest(BaseModel):
 class QueryResponse(BaseModel):
     response: str
     agent: str
+    supervisor_calls_avoided: int = 0
     
 # 대화형 세션 요청 모델
 class ChatRequest(BaseModel):
@@ -134,6 +145,7 @@ class ChatResponse(BaseModel):
     agent: str
     session_id: str
     message_count: int
+    supervisor_calls_avoided: int = 0
     
 # 루트 엔드포인트
 @app.get("/")
@@ -152,7 +164,7 @@ async def get_graph_image():
             # 가장 최근에 수정된 파일 찾기
             latest_image = max(image_files, key=os.path.getmtime)
             filename = os.path.basename(latest_image)
-            logger.info(f"그래프 PNG 이미지 반환: {filename}")
+            logger.info("그래프 PNG 이미지 반환: %s", filename)
             
             # 이미지 파일 반환
             return FileResponse(
@@ -169,7 +181,7 @@ async def get_graph_image():
             # 가장 최근에 수정된 MMD 파일 찾기
             latest_mmd = max(mmd_files, key=os.path.getmtime)
             filename = os.path.basename(latest_mmd)
-            logger.info(f"그래프 MMD 텍스트 반환: {filename}")
+            logger.info("그래프 MMD 텍스트 반환: %s", filename)
             
             # MMD 파일 내용 읽기
             with open(latest_mmd, "r", encoding="utf-8") as f:
@@ -222,7 +234,7 @@ async def get_graph_image():
         if graph_result and isinstance(graph_result, str):
             if graph_result.endswith(".png"):
                 # PNG 생성 성공
-                logger.info(f"새 그래프 PNG 이미지 생성됨: {graph_result}")
+                logger.info("새 그래프 PNG 이미지 생성됨: %s", graph_result)
                 return FileResponse(
                     graph_result, 
                     media_type="image/png", 
@@ -231,7 +243,7 @@ async def get_graph_image():
                 )
             elif graph_result.endswith(".mmd"):
                 # MMD 생성 성공
-                logger.info(f"새 그래프 MMD 텍스트 생성됨: {graph_result}")
+                logger.info("새 그래프 MMD 텍스트 생성됨: %s", graph_result)
                 with open(graph_result, "r", encoding="utf-8") as f:
                     mmd_content = f.read()
                 
@@ -302,7 +314,7 @@ async def get_graph_image():
                 </html>
                 """)
     except Exception as e:
-        logger.error(f"그래프 이미지 생성 중 오류: {str(e)}")
+        logger.error("그래프 이미지 생성 중 오류: %s", e)
         logger.error(traceback.format_exc())
         return HTMLResponse(content=f"""
         <!DOCTYPE html>
@@ -334,7 +346,7 @@ async def get_graph_image():
 @app.post("/ask", response_model=QueryResponse)
 async def ask_smart_home(request: QueryRequest = Body(...)):
     request_id = str(uuid4())
-    logger.info(f"[{request_id}] 단일 질의 요청: {request.query[:100]}..." if len(request.query) > 100 else request.query)
+    logger.info("[%s] 단일 질의 요청: %s%s", request_id, request.query[:100], "..." if len(request.query) > 100 else "")
     
     # Langfuse 트레이스 시작
     trace = None
@@ -349,8 +361,8 @@ async def ask_smart_home(request: QueryRequest = Body(...)):
         # 사용자 질의 처리
         user_query = request.query
         
-        # Langfuse 콜백 핸들러 설정
-        callbacks = []
+        # 지표 수집 및 Langfuse 콜백 핸들러 설정
+        callbacks = [MetricsCallbackHandler(endpoint="/ask")]
         if langfuse and trace:
             langfuse_callback = LangfuseCallbackHandler(
                 trace_id=trace.id
@@ -359,18 +371,18 @@ async def ask_smart_home(request: QueryRequest = Body(...)):
             trace.update(input={"query": user_query})
         
         # 멀티에이전트 그래프 호출
-        logger.info(f"[{request_id}] 멀티에이전트 그래프 호출 시작")
+        logger.info("[%s] 멀티에이전트 그래프 호출 시작", request_id)
         start_time = time.time()
-        result = smart_home_graph.invoke({
+        result = await smart_home_graph.ainvoke({
             "messages": [HumanMessage(content=user_query)],
             "next": None
-        }, config={"callbacks": callbacks} if callbacks else {})
+        }, config={"callbacks": callbacks})
         elapsed_time = time.time() - start_time
-        logger.info(f"[{request_id}] 멀티에이전트 그래프 응답 (소요시간: {elapsed_time:.2f}초)")
+        logger.info("[%s] 멀티에이전트 그래프 응답 (소요시간: %.2f초)", request_id, elapsed_time)
         
         # 마지막 응답 추출
         if not result["messages"]:
-            logger.error(f"[{request_id}] 에이전트 응답이 없습니다.")
+            logger.error("[%s] 에이전트 응답이 없습니다.", request_id)
             if trace:
                 trace.update(status="error", error={"message": "에이전트 응답이 없습니다."})
             raise HTTPException(status_code=500, detail="에이전트 응답이 없습니다.")
@@ -379,8 +391,10 @@ async def ask_smart_home(request: QueryRequest = Body(...)):
         response_text = last_message.content
         agent_name = getattr(last_message, "name", "unknown")
         
-        logger.info(f"[{request_id}] 응답 에이전트: {agent_name}")
-        logger.info(f"[{request_id}] 응답 내용: {response_text[:100]}..." if len(response_text) > 100 else response_text)
+        supervisor_calls_avoided = result.get("supervisor_calls_avoided", 0)
+        
+        logger.info("[%s] 응답 에이전트: %s (생략된 슈퍼바이저 호출: %s)", request_id, agent_name, supervisor_calls_avoided)
+        logger.info("[%s] 응답 내용: %s%s", request_id, response_text[:100], "..." if len(response_text) > 100 else "")
         
         # Langfuse 트레이스 완료
         if trace:
@@ -391,13 +405,14 @@ async def ask_smart_home(request: QueryRequest = Body(...)):
         
         return QueryResponse(
             response=response_text,
-            agent=agent_name
+            agent=agent_name,
+            supervisor_calls_avoided=supervisor_calls_avoided
         )
         
     except Exception as e:
         error_msg = f"오류가 발생했습니다: {str(e)}"
-        logger.error(f"[{request_id}] {error_msg}")
-        logger.error(f"[{request_id}] {traceback.format_exc()}")
+        logger.error("[%s] %s", request_id, error_msg)
+        logger.error("[%s] %s", request_id, traceback.format_exc())
         
         # Langfuse 트레이스 오류 기록
         if trace:
@@ -408,12 +423,35 @@ async def ask_smart_home(request: QueryRequest = Body(...)):
         
         raise HTTPException(status_code=500, detail=error_msg)
 
+# 세션 로드 또는 생성
+async def load_or_create_session(request_id: str, requested_session_id: Optional[str], trace=None):
+    """요청한 세션을 불러옵니다. 세션 ID가 없거나 존재하지 않는 세션이면 새로 생성합니다."""
+    if not requested_session_id:
+        session_id = await session_manager.create_session()
+        logger.info("[%s] 새 세션 생성: %s", request_id, session_id)
+    else:
+        session_id = requested_session_id
+    
+    # 세션 상태 가져오기
+    state = await session_manager.get_session(session_id)
+    if not state:
+        # 존재하지 않는 세션이면 새로 생성
+        logger.info("[%s] 세션 %s가 존재하지 않아 새로 생성합니다.", request_id, session_id)
+        session_id = await session_manager.create_session()
+        state = await session_manager.get_session(session_id)
+        if not state:
+            logger.error("[%s] 세션을 생성할 수 없습니다.", request_id)
+            if trace:
+                trace.update(status="error", error={"message": "세션을 생성할 수 없습니다."})
+            raise HTTPException(status_code=500, detail="세션을 생성할 수 없습니다.")
+    return session_id, state
+
 # 대화형 세션 엔드포인트
 @app.post("/chat", response_model=ChatResponse)
 async def chat_with_smart_home(request: ChatRequest = Body(...)):
     request_id = str(uuid4())
     session_id = request.session_id or "new"
-    logger.info(f"[{request_id}] 대화형 세션 요청: 세션={session_id}, 쿼리={request.query[:100]}..." if len(request.query) > 100 else request.query)
+    logger.info("[%s] 대화형 세션 요청: 세션=%s, 쿼리=%s%s", request_id, session_id, request.query[:100], "..." if len(request.query) > 100 else "")
     
     # Langfuse 트레이스 시작
     trace = None
@@ -426,35 +464,22 @@ async def chat_with_smart_home(request: ChatRequest = Body(...)):
         )
     
     try:
-        # 세션 ID 확인 또는 생성
-        if not request.session_id:
-            session_id = session_manager.create_session()
-            logger.info(f"[{request_id}] 새 세션 생성: {session_id}")
-        else:
-            session_id = request.session_id
-        
-        # 세션 상태 가져오기
-        state = session_manager.get_session(session_id)
-        if not state:
-            # 존재하지 않는 세션이면 새로 생성
-            logger.info(f"[{request_id}] 세션 {session_id}가 존재하지 않아 새로 생성합니다.")
-            session_id = session_manager.create_session()
-            state = session_manager.get_session(session_id)
-            if not state:
-                logger.error(f"[{request_id}] 세션을 생성할 수 없습니다.")
-                if trace:
-                    trace.update(status="error", error={"message": "세션을 생성할 수 없습니다."})
-                raise HTTPException(status_code=500, detail="세션을 생성할 수 없습니다.")
+        # 세션 ID 확인 또는 생성 후 세션 상태 가져오기
+        session_id, state = await load_or_create_session(request_id, request.session_id, trace)
         
         # 세션 메시지 목록 가져오기
         messages = state.get("messages", [])
-        logger.info(f"[{request_id}] 세션 {session_id}의 메시지 수: {len(messages)}")
+        logger.info("[%s] 세션 %s의 메시지 수: %s", request_id, session_id, len(messages))
         
         # 사용자 메시지 추가
         messages.append(HumanMessage(content=request.query))
         
-        # Langfuse 콜백 핸들러 설정
-        callbacks = []
+        # 오래된 턴은 누적 요약에 합치고 최근 턴만 그래프에 전달
+        summary, summary_upto = get_context_window().fold(messages, state.get("summary"), state.get("summary_upto", 0))
+        window = messages[summary_upto:]
+        
+        # 지표 수집 및 Langfuse 콜백 핸들러 설정
+        callbacks = [MetricsCallbackHandler(endpoint="/chat")]
         if langfuse and trace:
             langfuse_callback = LangfuseCallbackHandler(
                 trace_id=trace.id
@@ -463,21 +488,22 @@ async def chat_with_smart_home(request: ChatRequest = Body(...)):
             trace.update(input={"query": request.query, "messages": [str(m) for m in messages]})
         
         # 멀티에이전트 그래프 호출
-        logger.info(f"[{request_id}] 멀티에이전트 그래프 호출 시작 (세션: {session_id})")
+        logger.info("[%s] 멀티에이전트 그래프 호출 시작 (세션: %s)", request_id, session_id)
         start_time = time.time()
-        result = smart_home_graph.invoke({
-            "messages": messages,
-            "next": None
-        }, config={"callbacks": callbacks} if callbacks else {})
+        result = await smart_home_graph.ainvoke({
+            "messages": window,
+            "next": None,
+            "summary": summary
+        }, config={"callbacks": callbacks})
         elapsed_time = time.time() - start_time
-        logger.info(f"[{request_id}] 멀티에이전트 그래프 응답 (소요시간: {elapsed_time:.2f}초)")
+        logger.info("[%s] 멀티에이전트 그래프 응답 (소요시간: %.2f초)", request_id, elapsed_time)
         
-        # 결과에서 메시지 목록 가져오기
-        updated_messages = result.get("messages", [])
+        # 결과에서 메시지 목록 가져오기 (요약된 앞부분과 다시 합침)
+        updated_messages = messages[:summary_upto] + result.get("messages", [])
         
         # 마지막 응답 추출
         if not updated_messages or len(updated_messages) <= len(messages):
-            logger.error(f"[{request_id}] 에이전트 응답이 없습니다.")
+            logger.error("[%s] 에이전트 응답이 없습니다.", request_id)
             if trace:
                 trace.update(status="error", error={"message": "에이전트 응답이 없습니다."})
             raise HTTPException(status_code=500, detail="에이전트 응답이 없습니다.")
@@ -485,13 +511,16 @@ async def chat_with_smart_home(request: ChatRequest = Body(...)):
         last_message = updated_messages[-1]
         response_text = last_message.content
         agent_name = getattr(last_message, "name", "unknown")
+        supervisor_calls_avoided = result.get("supervisor_calls_avoided", 0)
         
-        logger.info(f"[{request_id}] 응답 에이전트: {agent_name}")
-        logger.info(f"[{request_id}] 응답 내용: {response_text[:100]}..." if len(response_text) > 100 else response_text)
+        logger.info("[%s] 응답 에이전트: %s (생략된 슈퍼바이저 호출: %s)", request_id, agent_name, supervisor_calls_avoided)
+        logger.info("[%s] 응답 내용: %s%s", request_id, response_text[:100], "..." if len(response_text) > 100 else "")
         
         # 세션 상태 업데이트
         state["messages"] = updated_messages
-        session_manager.update_session(session_id, state)
+        state["summary"] = summary
+        state["summary_upto"] = summary_upto
+        await session_manager.update_session(session_id, state)
         
         # Langfuse 트레이스 완료
         if trace:
@@ -508,12 +537,13 @@ async def chat_with_smart_home(request: ChatRequest = Body(...)):
             response=response_text,
             agent=agent_name,
             session_id=session_id,
-            message_count=len(updated_messages)
+            message_count=len(updated_messages),
+            supervisor_calls_avoided=supervisor_calls_avoided
         )
     except Exception as e:
         error_msg = f"오류가 발생했습니다: {str(e)}"
-        logger.error(f"[{request_id}] {error_msg}")
-        logger.error(f"[{request_id}] {traceback.format_exc()}")
+        logger.error("[%s] %s", request_id, error_msg)
+        logger.error("[%s] %s", request_id, traceback.format_exc())
         
         # Langfuse 트레이스 오류 기록
         if trace:
@@ -524,34 +554,204 @@ async def chat_with_smart_home(request: ChatRequest = Body(...)):
         
         raise HTTPException(status_code=500, detail=error_msg)
 
+# 스트리밍 이벤트로 전달할 그래프 노드
+STREAM_GRAPH_NODES = ("supervisor", "routine_agent", "device_agent", "robot_cleaner_agent", "completion_check", "merge_replies")
+# 토큰을 스트리밍할 에이전트 노드 (슈퍼바이저의 구조화된 출력은 제외)
+STREAM_AGENT_NODES = ("routine_agent", "device_agent", "robot_cleaner_agent")
+# 도구 입출력 이벤트에 포함할 최대 문자 수
+STREAM_TOOL_PREVIEW_CHARS = int(os.getenv("STREAM_TOOL_PREVIEW_CHARS", "500"))
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 메시지를 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def _top_level_node(metadata: Dict[str, Any]) -> Optional[str]:
+    """이벤트가 발생한 최상위 그래프 노드 이름을 반환합니다. (에이전트 내부 그래프 이벤트 포함)"""
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+    if checkpoint_ns:
+        return checkpoint_ns.split("|")[0].split(":")[0]
+    return metadata.get("langgraph_node")
+
+def _chunk_text(chunk: Any) -> str:
+    """LLM 스트리밍 청크에서 텍스트를 추출합니다."""
+    content = getattr(chunk, "content", "")
+    if isinstance(content, str):
+        return content
+    # 멀티파트 콘텐츠(리스트)인 경우 텍스트 부분만 이어 붙임
+    return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+
+# 대화형 세션 스트리밍 엔드포인트 (Server-Sent Events)
+@app.post("/chat/stream")
+async def chat_with_smart_home_stream(request: ChatRequest = Body(...)):
+    request_id = str(uuid4())
+    logger.info("[%s] 스트리밍 세션 요청: 세션=%s, 쿼리=%s", request_id, request.session_id or 'new', request.query[:100])
+    
+    # Langfuse 트레이스 시작
+    trace = None
+    if langfuse:
+        trace = langfuse.trace(
+            name="smart_home_chat_stream",
+            id=request_id,
+            user_id=request.session_id or "new",
+            metadata={"query": request.query, "session_id": request.session_id}
+        )
+    
+    # 세션은 스트림을 시작하기 전에 준비하여, 실패하면 일반 HTTP 오류로 응답
+    session_id, state = await load_or_create_session(request_id, request.session_id, trace)
+    messages = state.get("messages", [])
+    messages.append(HumanMessage(content=request.query))
+    
+    # 오래된 턴은 누적 요약에 합치고 최근 턴만 그래프에 전달
+    summary, summary_upto = get_context_window().fold(messages, state.get("summary"), state.get("summary_upto", 0))
+    window = messages[summary_upto:]
+    
+    # 지표 수집 및 Langfuse 콜백 핸들러 설정
+    callbacks = [MetricsCallbackHandler(endpoint="/chat/stream")]
+    if langfuse and trace:
+        callbacks.append(LangfuseCallbackHandler(trace_id=trace.id))
+        trace.update(input={"query": request.query, "messages": [str(m) for m in messages]})
+    
+    async def event_stream():
+        start_time = time.time()
+        first_token_time = None
+        final_state = None
+        
+        yield format_sse("session", {"session_id": session_id, "request_id": request_id})
+        try:
+            async for event in smart_home_graph.astream_events(
+                {"messages": window, "next": None, "summary": summary},
+                config={"callbacks": callbacks},
+                version="v2"
+            ):
+                kind = event["event"]
+                name = event.get("name", "")
+                metadata = event.get("metadata", {})
+                
+                # 노드 전환 이벤트
+                if kind in ("on_chain_start", "on_chain_end") and name in STREAM_GRAPH_NODES and metadata.get("langgraph_node") == name:
+                    phase = "node_start" if kind == "on_chain_start" else "node_end"
+                    yield format_sse(phase, {"node": name, "elapsed": round(time.time() - start_time, 3)})
+                # 에이전트 LLM 토큰
+                elif kind == "on_chat_model_stream":
+                    node = _top_level_node(metadata)
+                    text = _chunk_text(event["data"].get("chunk"))
+                    if text and node in STREAM_AGENT_NODES:
+                        if first_token_time is None:
+                            first_token_time = time.time() - start_time
+                            logger.info("[%s] 첫 토큰 전송 (소요시간: %.2f초)", request_id, first_token_time)
+                        yield format_sse("token", {"node": node, "text": text})
+                # 도구 호출 이벤트
+                elif kind == "on_tool_start":
+                    yield format_sse("tool_start", {
+                        "node": _top_level_node(metadata),
+                        "tool": name,
+                        "input": str(event["data"].get("input"))[:STREAM_TOOL_PREVIEW_CHARS]
+                    })
+                elif kind == "on_tool_end":
+                    output = event["data"].get("output")
+                    yield format_sse("tool_end", {
+                        "node": _top_level_node(metadata),
+                        "tool": name,
+                        "output": str(getattr(output, "content", output))[:STREAM_TOOL_PREVIEW_CHARS]
+                    })
+                # 그래프 전체 실행 완료
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    final_state = event["data"].get("output")
+            
+            updated_messages = messages[:summary_upto] + (final_state or {}).get("messages", [])
+            if not updated_messages or len(updated_messages) <= len(messages):
+                raise RuntimeError("에이전트 응답이 없습니다.")
+            
+            last_message = updated_messages[-1]
+            agent_name = getattr(last_message, "name", None) or "unknown"
+            
+            # 세션 상태 업데이트
+            state["messages"] = updated_messages
+            state["summary"] = summary
+            state["summary_upto"] = summary_upto
+            await session_manager.update_session(session_id, state)
+            
+            elapsed_time = time.time() - start_time
+            logger.info("[%s] 스트리밍 완료 (첫 토큰: %s초, 전체: %.2f초, 응답 에이전트: %s)", request_id, first_token_time if first_token_time is not None else '-', elapsed_time, agent_name)
+            
+            # Langfuse 트레이스 완료
+            if trace:
+                trace.update(
+                    output={"response": last_message.content, "agent": agent_name, "message_count": len(updated_messages)},
+                    status="success"
+                )
+            
+            yield format_sse("done", {
+                "response": last_message.content,
+                "agent": agent_name,
+                "session_id": session_id,
+                "message_count": len(updated_messages),
+                "supervisor_calls_avoided": final_state.get("supervisor_calls_avoided", 0),
+                "time_to_first_token": round(first_token_time, 3) if first_token_time is not None else None,
+                "elapsed": round(elapsed_time, 3)
+            })
+        except Exception as e:
+            error_msg = f"오류가 발생했습니다: {str(e)}"
+            logger.error("[%s] %s", request_id, error_msg)
+            logger.error("[%s] %s", request_id, traceback.format_exc())
+            
+            # Langfuse 트레이스 오류 기록
+            if trace:
+                trace.update(
+                    status="error",
+                    error={"message": str(e), "traceback": traceback.format_exc()}
+                )
+            yield format_sse("error", {"detail": error_msg, "session_id": session_id})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # 세션 초기화 엔드포인트
 @app.delete("/chat/{session_id}")
 async def reset_session(session_id: str):
-    logger.info(f"세션 초기화 요청: {session_id}")
+    logger.info("세션 초기화 요청: %s", session_id)
     
-    if session_manager.delete_session(session_id):
-        logger.info(f"세션 {session_id} 초기화 성공")
+    if await session_manager.delete_session(session_id):
+        logger.info("세션 %s 초기화 성공", session_id)
         return {"message": f"세션 {session_id}가 초기화되었습니다."}
     
-    logger.error(f"세션 {session_id}를 찾을 수 없습니다.")
+    logger.error("세션 %s를 찾을 수 없습니다.", session_id)
     raise HTTPException(status_code=404, detail=f"세션 {session_id}를 찾을 수 없습니다.")
 
 # 세션 목록 조회 엔드포인트
 @app.get("/sessions")
-async def list_sessions():
-    logger.info("세션 목록 조회 요청")
-    sessions = session_manager.list_sessions()
-    logger.info(f"총 {len(sessions)} 개의 세션 반환")
-    return sessions
+async def list_sessions(cursor: Optional[int] = None, limit: Optional[int] = None):
+    """
+    세션 목록을 조회합니다.
+    
+    cursor 또는 limit를 지정하면 {"sessions": {...}, "next_cursor": ...} 형식의 페이지를 반환하고,
+    지정하지 않으면 전체 세션 목록을 반환합니다.
+    """
+    if cursor is None and limit is None:
+        logger.info("세션 목록 조회 요청")
+        sessions = await session_manager.list_sessions()
+        logger.info("총 %s 개의 세션 반환", len(sessions))
+        return sessions
+    
+    cursor = cursor or 0
+    limit = min(max(limit or 50, 1), 1000)
+    logger.info("세션 목록 페이지 조회 요청 (cursor: %s, limit: %s)", cursor, limit)
+    page = await session_manager.list_sessions_page(cursor=cursor, limit=limit)
+    logger.info("%s 개의 세션 반환 (다음 커서: %s)", len(page['sessions']), page['next_cursor'])
+    return page
 
 # 세션 대화 내용 조회 엔드포인트
 @app.get("/chat/{session_id}/messages")
-async def get_session_messages(session_id: str):
-    logger.info(f"세션 {session_id} 메시지 조회 요청")
+async def get_session_messages(session_id: str, limit: Optional[int] = None):
+    logger.info("세션 %s 메시지 조회 요청 (limit: %s)", session_id, limit)
     
-    state = session_manager.get_session(session_id)
+    # limit가 있으면 마지막 limit개의 메시지만 가져옴
+    state = await session_manager.get_session(session_id, max_messages=limit if limit and limit > 0 else None)
     if not state:
-        logger.error(f"세션 {session_id}를 찾을 수 없습니다.")
+        logger.error("세션 %s를 찾을 수 없습니다.", session_id)
         raise HTTPException(status_code=404, detail=f"세션 {session_id}를 찾을 수 없습니다.")
     
     # 메시지 내용과 발신자 정보만 추출
@@ -564,8 +764,12 @@ async def get_session_messages(session_id: str):
         for msg in state["messages"]
     ]
     
-    logger.info(f"세션 {session_id}의 메시지 {len(messages)}개 반환")
-    return {"session_id": session_id, "messages": messages}
+    logger.info("세션 %s의 메시지 %s개 반환", session_id, len(messages))
+    return {
+        "session_id": session_id,
+        "messages": messages,
+        "message_count": state.get("message_count", len(messages))
+    }
 
 # 애플리케이션 상태 확인 엔드포인트
 @app.get("/health")
@@ -573,11 +777,89 @@ async def health_check():
     logger.info("상태 확인 요청")
     return {"status": "healthy"}
 
+# Prometheus 지표 조회 엔드포인트
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """그래프, 노드, 도구, LLM 호출 지연 시간과 슈퍼바이저 호출, 오류 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    return PlainTextResponse(get_agent_metrics().render_prometheus(), media_type="text/plain; version=0.0.4")
+
+# 에이전트 레지스트리 통계 조회 엔드포인트
+@app.get("/agents/stats")
+async def get_agent_stats():
+    logger.info("에이전트 레지스트리 통계 조회 요청")
+    return get_agent_registry().get_stats()
+
+# 빠른 경로 라우터 통계 조회 엔드포인트
+@app.get("/router/stats")
+async def get_router_stats():
+    logger.info("빠른 경로 라우터 통계 조회 요청")
+    return get_fast_router().get_stats()
+
+# 완료 정책 통계 조회 엔드포인트
+@app.get("/completion/stats")
+async def get_completion_stats():
+    logger.info("완료 정책 통계 조회 요청")
+    return get_completion_policy().get_stats()
+
+# 기기 기능 정보 캐시 통계 조회 엔드포인트
+@app.get("/capabilities/stats")
+async def get_capability_stats():
+    logger.info("기기 기능 정보 캐시 통계 조회 요청")
+    return get_capability_cache().get_stats()
+
+# 기기 기능 정보 캐시 무효화 엔드포인트 (기기 펌웨어 등으로 모드 목록이 바뀐 경우 사용)
+@app.post("/capabilities/invalidate")
+async def invalidate_capabilities(key: Optional[str] = None):
+    logger.info("기기 기능 정보 캐시 무효화 요청: %s", key or '전체')
+    cache = get_capability_cache()
+    removed = cache.invalidate(key)
+    return {"invalidated": key or "all", "removed": removed, "stats": cache.get_stats()}
+
+# 턴 메모(한 턴 안의 중복 조회 제거) 통계 조회 엔드포인트
+@app.get("/tool-memo/stats")
+async def get_tool_memo_stats():
+    logger.info("턴 메모 통계 조회 요청")
+    return get_turn_memo_stats().get_stats()
+
+# 컨텍스트 관리자 통계 엔드포인트 (요약에 합친 메시지 수, 노드별로 제외한 메시지 수와 최대 추정 토큰 수)
+@app.get("/context/stats")
+async def get_context_stats():
+    logger.info("컨텍스트 관리자 통계 조회 요청")
+    return get_context_window().get_stats()
+
+# 에이전트 캐시 무효화 엔드포인트 (모델 이름 또는 도구 구성 변경 시 사용)
+@app.post("/agents/invalidate")
+async def invalidate_agents(name: Optional[str] = None):
+    logger.info("에이전트 캐시 무효화 요청: %s", name or '전체')
+    registry = get_agent_registry()
+    if name in (None, "supervisor"):
+        reset_supervisor_router()
+    if name != "supervisor":
+        registry.invalidate(name)
+    return {"invalidated": name or "all", "stats": registry.get_stats()}
+
+# 앱 시작 이벤트
+@app.on_event("startup")
+async def startup_event():
+    logger.info("애플리케이션 시작 중...")
+    
+    # 에이전트 사전 생성 - 첫 요청에서 생성 비용이 발생하지 않도록 함
+    # (Vertex AI 초기화와 기능 정보 조회가 동기 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+    logger.info("에이전트 사전 생성(warm-up) 시작")
+    await asyncio.to_thread(get_agent_registry().warm_up)
+
 # 앱 종료 이벤트
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("애플리케이션 종료 중...")
     
+    # 세션 관리자 종료
+    try:
+        await session_manager.close()
+    except Exception as e:
+        logger.error("세션 관리자 종료 중 오류 발생: %s", e)
+        logger.error(traceback.format_exc())
+    
     # Langfuse 종료
     if LANGFUSE_ENABLE and langfuse:
         try:
@@ -585,9 +867,12 @@ async def shutdown_event():
             langfuse.flush()
             logger.info("Langfuse 연결 종료 완료")
         except Exception as e:
-            logger.error(f"Langfuse 종료 중 오류 발생: {str(e)}")
+            logger.error("Langfuse 종료 중 오류 발생: %s", e)
             logger.error(traceback.format_exc())
     
+    # 공유 HTTP 연결 풀 종료
+    await close_http_clients()
+    
     logger.info("애플리케이션이 정상적으로 종료되었습니다.")
 
 # 메인 실행 함수
@@ -599,11 +884,11 @@ if __name__ == "__main__":
     image_files = glob.glob(os.path.join(GRAPH_IMG_DIR, "*.png"))
     if image_files:
         latest_image = max(image_files, key=os.path.getmtime)
-        logger.info(f"멀티에이전트 그래프 이미지: {latest_image}")
+        logger.info("멀티에이전트 그래프 이미지: %s", latest_image)
         print(f"😊 멀티에이전트 그래프 이미지: {latest_image}")
         print(f"📊 브라우저에서 그래프 확인: http://localhost:{port}/graph")
     
     # 서버 실행
-    logger.info(f"서버 시작: http://localhost:{port}")
+    logger.info("서버 시작: http://localhost:%s", port)
     print(f"🚀 서버 시작: http://localhost:{port}")
     uvicorn.run("app:app", host="0.0.0.0", port=port, reload=True) 
\ No newline at end of file
@@ -11,6 +11,7 @@ from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 from graph import create_smart_home_graph
 from langchain_core.messages import HumanMessage
+from mcp_client import get_mcp_client_manager
 
 # 환경 변수 로드
 load_dotenv(override=True)
@@ -111,6 +112,28 @@ def test_mcp_connection(config):
     
     return results
 
+# MCP 도구 설정 적용 함수
+async def apply_mcp_servers(new_config, old_config):
+    """
+    공유 MCP 클라이언트 매니저로 새 설정의 도구를 불러오고, 이전 설정의 연결 참조를 반납합니다.
+    
+    Returns:
+        불러온 도구 이름 목록
+    """
+    tool_names = []
+    if new_config:
+        manager = get_mcp_client_manager(new_config)
+        await manager.acquire()
+        try:
+            tools = await manager.get_tools()
+        except Exception:
+            await manager.release()
+            raise
+        tool_names = [getattr(tool, "name", str(tool)) for tool in tools]
+    if old_config:
+        await get_mcp_client_manager(old_config).release()
+    return tool_names
+
 # Mock 서버 연결 테스트 함수
 def test_mock_server_connection(url):
     """Mock 서버 연결을 테스트합니다."""
@@ -146,7 +169,9 @@ def test_mock_server_connection(url):
 # 시스템 정보
 with st.sidebar:
     st.subheader("🔧 시스템 정보")
-    st.write(f"🛠️ MCP 도구 수: {len(st.session_state.get('mcp_servers', {}))}")
+    st.write(f"🛠️ MCP 도구 수: {len(st.session_state.get('mcp_tool_names', []))} (서버 {len(st.session_state.get('mcp_servers', {}))}개)")
+    robot_cleaner_mcp = get_mcp_client_manager().get_info()
+    st.write(f"🤖 로봇청소기 MCP: {'연결됨' if robot_cleaner_mcp['connected'] else '연결 안 됨'} (도구 {robot_cleaner_mcp['tool_count'] or 0}개)")
     st.write(f"🏠 Mock 서버: {st.session_state.mock_server_url}")
     st.write(f"🧠 모델: {MODEL_NAME}")
     st.divider()
@@ -310,21 +335,36 @@ with st.sidebar:
                 ):
                     # 적용 중 메시지 표시
                     with st.spinner("변경사항을 적용하는 중..."):
+                        # 공유 MCP 클라이언트 매니저로 도구 불러오기 (같은 설정이면 캐시된 연결과 도구를 재사용)
+                        new_servers = st.session_state.pending_mcp_config.copy()
+                        tool_names = st.session_state.event_loop.run_until_complete(
+                            apply_mcp_servers(new_servers, st.session_state.mcp_servers)
+                        )
+                        
                         # 설정 저장
                         st.session_state.mcp_config_text = json.dumps(
                             st.session_state.pending_mcp_config, indent=2, ensure_ascii=False
                         )
-                        st.session_state.mcp_servers = st.session_state.pending_mcp_config.copy()
-                        
-                        # 진행 표시를 위한 지연
-                        time.sleep(1)
+                        st.session_state.mcp_servers = new_servers
+                        st.session_state.mcp_tool_names = tool_names
                         
                         st.success("✅ 새로운 MCP 도구 설정이 적용되었습니다.")
-                        st.info(f"🛠️ 총 {len(st.session_state.mcp_servers)}개의 MCP 도구가 로드되었습니다.")
+                        st.info(f"🛠️ 총 {len(tool_names)}개의 MCP 도구가 로드되었습니다.")
                         
                         # 시스템 정보 갱신을 위해 재실행
-                        time.sleep(1)
                         st.rerun()
+                
+                # 도구 새로고침 버튼 - 서버에 다시 연결하여 도구 목록을 갱신
+                if st.session_state.mcp_servers and st.button(
+                    "도구 목록 새로고침",
+                    key="refresh_tools_button",
+                    use_container_width=True,
+                ):
+                    with st.spinner("MCP 도구 목록을 새로 불러오는 중..."):
+                        manager = get_mcp_client_manager(st.session_state.mcp_servers)
+                        tools = st.session_state.event_loop.run_until_complete(manager.refresh_tools())
+                        st.session_state.mcp_tool_names = [getattr(tool, "name", str(tool)) for tool in tools]
+                        st.success(f"🛠️ {len(tools)}개의 MCP 도구를 새로 불러왔습니다.")
         except Exception as e:
             st.error(f"유효한 MCP 도구 설정이 아닙니다: {str(e)}")
             
@@ -465,11 +505,13 @@ if user_query:
                 debug_container.info("멀티에이전트 그래프 호출 시작")
                 start_time = time.time()
                 
-                # 그래프 호출
-                result = st.session_state.smart_home_graph.invoke({
-                    "messages": [HumanMessage(content=user_query)],
-                    "next": None
-                })
+                # 그래프 호출 - 노드가 비동기이므로 세션의 이벤트 루프에서 ainvoke 실행
+                result = st.session_state.event_loop.run_until_complete(
+                    st.session_state.smart_home_graph.ainvoke({
+                        "messages": [HumanMessage(content=user_query)],
+                        "next": None
+                    })
+                )
                 
                 elapsed_time = time.time() - start_time
                 debug_container.success(f"그래프 응답 완료 (소요시간: {elapsed_time:.2f}초)")
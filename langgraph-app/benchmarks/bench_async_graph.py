@@ -0,0 +1,142 @@
+"""
+동시 요청 처리량 벤치마크: 동기 graph.invoke 방식 vs 비동기 graph.ainvoke 방식
+
+Vertex AI 대신 지정한 지연 시간만큼 대기하는 로컬 가짜 LLM을 사용합니다.
+실제 네트워크 호출 없이 슈퍼바이저 → device_agent → 슈퍼바이저 경로를 실행합니다.
+--fast-path를 지정하면 빠른 경로 라우터와 완료 정책을 켜서 슈퍼바이저 LLM 호출을 생략한 경로를 측정합니다.
+
+사용법:
+    cd langgraph-app
+    python benchmarks/bench_async_graph.py --requests 20 --latency 0.3
+    python benchmarks/bench_async_graph.py --requests 20 --latency 0.3 --fast-path
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from langgraph.prebuilt import create_react_agent
+
+import graph.supervisor as supervisor
+from graph.fast_router import get_fast_router
+from graph.completion_policy import get_completion_policy
+from agents.agent_registry import get_agent_registry
+
+
+class FakeLatencyChatModel(BaseChatModel):
+    """지정된 시간만큼 대기한 뒤 고정 응답을 반환하는 가짜 채팅 모델"""
+
+    latency: float = 0.3
+    reply: str = "에어컨 설정이 변경되었습니다."
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-latency-chat-model"
+
+
+def _route(messages: List[BaseMessage]) -> dict:
+    """에이전트 응답이 있으면 FINISH, 없으면 device_agent로 라우팅합니다."""
+    if any(getattr(m, "name", None) == "device_agent" for m in messages):
+        return {"next": "FINISH"}
+    return {"next": "device_agent"}
+
+
+def install_fakes(latency: float, fast_path: bool) -> None:
+    """슈퍼바이저와 device_agent를 가짜 LLM 기반 구현으로 교체합니다."""
+    get_fast_router().enabled = fast_path
+    get_completion_policy().enabled = fast_path
+
+    def route_sync(messages):
+        time.sleep(latency)
+        return _route(messages)
+
+    async def route_async(messages):
+        await asyncio.sleep(latency)
+        return _route(messages)
+
+    fake_router = RunnableLambda(route_sync, afunc=route_async)
+    supervisor.get_supervisor_router = lambda: fake_router
+
+    model = FakeLatencyChatModel(latency=latency)
+    get_agent_registry().register(
+        "device_agent",
+        lambda: create_react_agent(model=model, tools=[]),
+        lambda: [],
+    )
+
+
+def make_input(i: int) -> dict:
+    return {"messages": [HumanMessage(content=f"에어컨 켜줘 #{i}")], "next": None}
+
+
+async def run_blocking(graph, n: int) -> float:
+    """기존 방식: 핸들러 안에서 그래프 실행이 끝날 때까지 이벤트 루프를 막습니다."""
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def handler(i):
+        # 동기 invoke와 마찬가지로 결과가 나올 때까지 이벤트 루프 스레드를 점유합니다
+        return executor.submit(asyncio.run, graph.ainvoke(make_input(i))).result()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handler(i) for i in range(n)))
+    elapsed = time.perf_counter() - start
+    executor.shutdown()
+    return elapsed
+
+
+async def run_async(graph, n: int) -> float:
+    """새 방식: 핸들러가 graph.ainvoke를 await 하므로 요청들이 동시에 진행됩니다."""
+
+    async def handler(i):
+        return await graph.ainvoke(make_input(i))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handler(i) for i in range(n)))
+    return time.perf_counter() - start
+
+
+async def main(n: int, latency: float, fast_path: bool) -> None:
+    install_fakes(latency, fast_path)
+    graph = supervisor.create_smart_home_graph()
+
+    # 첫 실행 비용(에이전트 생성 등) 제외
+    await graph.ainvoke(make_input(-1))
+
+    blocking = await run_blocking(graph, n)
+    concurrent = await run_async(graph, n)
+
+    llm_calls = 1 if fast_path else 3
+    print(f"요청 수: {n}, 가짜 LLM 지연: {latency:.2f}초 (요청당 LLM 호출 {llm_calls}회)")
+    print(f"{'방식':<24}{'총 소요(초)':>12}{'처리량(req/s)':>16}")
+    print(f"{'blocking invoke':<24}{blocking:>12.2f}{n / blocking:>16.2f}")
+    print(f"{'ainvoke':<24}{concurrent:>12.2f}{n / concurrent:>16.2f}")
+    print(f"처리량 향상: {blocking / concurrent:.1f}배")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스마트홈 그래프 동시 요청 처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--latency", type=float, default=0.3, help="가짜 LLM 호출당 지연 시간(초)")
+    parser.add_argument("--fast-path", action="store_true", help="빠른 경로 라우터와 완료 정책 사용")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.latency, args.fast_path))
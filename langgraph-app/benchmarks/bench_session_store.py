@@ -0,0 +1,105 @@
+"""
+파일 시스템 세션 저장 벤치마크: 전체 JSON 다시 쓰기 방식 vs 추가 전용 JSONL 방식
+
+대화가 N개 메시지까지 늘어나는 동안 턴마다 update_session을 호출하여
+누적 저장 시간과 턴당 저장 시간(중앙값), 세션 조회 시간을 비교합니다.
+
+사용법:
+    cd langgraph-app
+    python benchmarks/bench_session_store.py --sizes 10 100 1000
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+from typing import Any, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from session_manager import FileSystemSessionManager, deserialize_message, serialize_message
+
+
+def legacy_update(file_path: str, state: Dict[str, Any]) -> None:
+    """이전 방식: 기존 파일을 읽어 created_at을 얻고 전체 메시지를 indent=2로 다시 씁니다."""
+    created_at = time.time()
+    if os.path.exists(file_path):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            created_at = json.load(f).get("created_at", created_at)
+    serialized_state = {
+        "messages": [serialize_message(msg) for msg in state.get("messages", [])],
+        "next": state.get("next"),
+        "created_at": created_at,
+        "updated_at": time.time(),
+    }
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(serialized_state, f, ensure_ascii=False, indent=2)
+
+
+def make_turn(i: int) -> List:
+    """사용자 메시지와 에이전트 응답으로 이루어진 한 턴을 만듭니다."""
+    return [
+        HumanMessage(content=f"거실 에어컨 온도를 {18 + i % 12}도로 맞춰줘 #{i}"),
+        AIMessage(content=f"에어컨 온도를 {18 + i % 12}도로 설정했습니다. 현재 모드는 냉방입니다. #{i}", name="device_agent"),
+    ]
+
+
+def run_legacy(session_dir: str, size: int) -> Dict[str, float]:
+    file_path = os.path.join(session_dir, "legacy.json")
+    messages: List = []
+    timings: List[float] = []
+    while len(messages) < size:
+        messages.extend(make_turn(len(messages) // 2))
+        start = time.perf_counter()
+        legacy_update(file_path, {"messages": messages, "next": None})
+        timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        [deserialize_message(msg) for msg in json.load(f)["messages"]]
+    read = time.perf_counter() - start
+    return {"total": sum(timings), "median": statistics.median(timings), "read": read, "bytes": os.path.getsize(file_path)}
+
+
+def run_jsonl(session_dir: str, size: int) -> Dict[str, float]:
+    manager = FileSystemSessionManager(session_dir)
+    session_id = manager.create_session()
+    messages: List = []
+    timings: List[float] = []
+    while len(messages) < size:
+        messages.extend(make_turn(len(messages) // 2))
+        start = time.perf_counter()
+        manager.update_session(session_id, {"messages": messages, "next": None})
+        timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    manager.get_session(session_id)
+    read = time.perf_counter() - start
+    return {"total": sum(timings), "median": statistics.median(timings), "read": read, "bytes": os.path.getsize(manager._get_file_path(session_id))}
+
+
+def main(sizes: List[int]) -> None:
+    print(f"{'메시지 수':>10}{'방식':>10}{'누적 저장(ms)':>16}{'턴 중앙값(ms)':>16}{'조회(ms)':>12}{'파일 크기(B)':>14}")
+    for size in sizes:
+        for name, runner in (("json", run_legacy), ("jsonl", run_jsonl)):
+            session_dir = tempfile.mkdtemp(prefix="bench_session_")
+            try:
+                result = runner(session_dir, size)
+            finally:
+                shutil.rmtree(session_dir, ignore_errors=True)
+            print(
+                f"{size:>10}{name:>10}{result['total'] * 1000:>16.2f}{result['median'] * 1000:>16.3f}"
+                f"{result['read'] * 1000:>12.2f}{result['bytes']:>14}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="파일 시스템 세션 저장 방식 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="세션 메시지 수 목록")
+    args = parser.parse_args()
+    main(args.sizes)
@@ -0,0 +1,253 @@
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage
+from dotenv import load_dotenv
+from logging_config import setup_logger
+
+# 로거 설정
+logger = setup_logger("context_window")
+
+# 환경 변수 로드
+load_dotenv()
+CONTEXT_WINDOW_ENABLE = os.getenv("CONTEXT_WINDOW_ENABLE", "true").lower() in ("true", "1", "yes")
+# 원문 그대로 유지할 최근 턴 수 (현재 요청 포함)
+CONTEXT_KEEP_TURNS = int(os.getenv("CONTEXT_KEEP_TURNS", "4"))
+# 누적 요약의 최대 문자 수 (넘으면 오래된 줄부터 버림)
+CONTEXT_SUMMARY_MAX_CHARS = int(os.getenv("CONTEXT_SUMMARY_MAX_CHARS", "2000"))
+# 노드별 토큰 예산 (예: "supervisor=1500,device_agent=3000"), 지정하지 않은 노드는 기본 예산 사용
+CONTEXT_TOKEN_BUDGETS = os.getenv("CONTEXT_TOKEN_BUDGETS", "")
+CONTEXT_DEFAULT_TOKEN_BUDGET = int(os.getenv("CONTEXT_DEFAULT_TOKEN_BUDGET", "4000"))
+# 토큰 수 추정에 사용하는 토큰당 문자 수 (한국어 기준 보수적으로 설정)
+CONTEXT_CHARS_PER_TOKEN = float(os.getenv("CONTEXT_CHARS_PER_TOKEN", "2"))
+
+# 에이전트 응답 메시지 이름 (이름이 없는 HumanMessage만 사용자 요청으로 간주)
+AGENT_MESSAGE_NAMES = ("supervisor", "routine_agent", "device_agent", "robot_cleaner_agent")
+# 요약 메시지 이름과 머리말
+SUMMARY_MESSAGE_NAME = "conversation_summary"
+SUMMARY_HEADER = "[이전 대화 요약]"
+# 요약 한 줄에 남길 최대 문자 수
+SUMMARY_USER_CHARS = 150
+SUMMARY_REPLY_CHARS = 200
+
+
+def parse_budgets(value: str) -> Dict[str, int]:
+    """CONTEXT_TOKEN_BUDGETS 값을 {노드 이름: 토큰 예산} 딕셔너리로 변환합니다."""
+    budgets = {}
+    for item in value.split(","):
+        name, _, budget = item.partition("=")
+        if not name.strip() or not budget.strip():
+            continue
+        try:
+            budgets[name.strip()] = int(budget)
+        except ValueError:
+            logger.warning("잘못된 토큰 예산 설정을 무시합니다: %s", item)
+    return budgets
+
+
+def message_text(message: BaseMessage) -> str:
+    """메시지 내용을 문자열로 반환합니다. 멀티파트 콘텐츠는 텍스트 부분만 이어 붙입니다."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 수로 토큰 수를 추정합니다."""
+    return int(len(text) / CONTEXT_CHARS_PER_TOKEN) + 1
+
+
+def is_user_message(message: BaseMessage) -> bool:
+    """에이전트 응답이 아닌 사용자 요청 메시지인지 확인합니다."""
+    return isinstance(message, HumanMessage) and getattr(message, "name", None) not in AGENT_MESSAGE_NAMES + (SUMMARY_MESSAGE_NAME,)
+
+
+def _shorten(text: str, limit: int) -> str:
+    """공백을 정리하고 limit자를 넘으면 잘라 "..."을 붙입니다."""
+    text = re.sub(r"\s+", " ", text).strip()
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class ContextWindow:
+    """
+    대화 컨텍스트를 일정 크기로 유지하는 컨텍스트 관리자.
+
+    최근 keep_turns개의 턴(사용자 요청과 그에 대한 에이전트 응답)은 원문 그대로 두고,
+    그보다 오래된 턴은 결정적인 규칙으로 한 줄씩 요약해 누적 요약에 합칩니다.
+    요약은 LLM을 호출하지 않으므로 요청 지연 시간에 영향을 주지 않습니다.
+    노드에 전달할 메시지는 노드별 토큰 예산 안에서 오래된 턴부터 잘라냅니다.
+    """
+
+    def __init__(
+        self,
+        keep_turns: int = CONTEXT_KEEP_TURNS,
+        budgets: Optional[Dict[str, int]] = None,
+        default_budget: int = CONTEXT_DEFAULT_TOKEN_BUDGET,
+        summary_max_chars: int = CONTEXT_SUMMARY_MAX_CHARS,
+        enabled: bool = CONTEXT_WINDOW_ENABLE,
+    ):
+        self.keep_turns = max(keep_turns, 1)
+        self.budgets = budgets if budgets is not None else parse_budgets(CONTEXT_TOKEN_BUDGETS)
+        self.default_budget = default_budget
+        self.summary_max_chars = summary_max_chars
+        self.enabled = enabled
+        self._stats: Dict[str, Any] = {
+            "folds": 0,
+            "folded_messages": 0,
+            "builds": 0,
+            "trimmed_messages": 0,
+            "summary_truncations": 0,
+            "by_node": {},
+        }
+        self._lock = threading.Lock()
+
+    def budget_for(self, node: str) -> int:
+        """노드의 토큰 예산을 반환합니다."""
+        return self.budgets.get(node, self.default_budget)
+
+    def window_start(self, messages: List[BaseMessage]) -> int:
+        """최근 keep_turns개 턴이 시작하는 메시지 위치를 반환합니다."""
+        turn_starts = [index for index, message in enumerate(messages) if is_user_message(message)]
+        if len(turn_starts) <= self.keep_turns:
+            return 0
+        return turn_starts[-self.keep_turns]
+
+    @staticmethod
+    def summarize_messages(messages: List[BaseMessage]) -> List[str]:
+        """턴을 사용자 요청과 에이전트 응답 한 줄씩으로 요약합니다."""
+        lines = []
+        for message in messages:
+            text = message_text(message)
+            if not text.strip():
+                continue
+            if is_user_message(message):
+                lines.append(f"- 사용자: {_shorten(text, SUMMARY_USER_CHARS)}")
+            elif getattr(message, "name", None) in AGENT_MESSAGE_NAMES:
+                lines.append(f"  {message.name}: {_shorten(text, SUMMARY_REPLY_CHARS)}")
+        return lines
+
+    def _cap_summary(self, lines: List[str], max_chars: int) -> Tuple[str, bool]:
+        """최신 줄부터 max_chars 안에 들어가는 만큼만 남깁니다. 잘렸는지 여부를 함께 반환합니다."""
+        kept: List[str] = []
+        size = 0
+        for line in reversed(lines):
+            if size + len(line) + 1 > max_chars:
+                break
+            kept.append(line)
+            size += len(line) + 1
+        return "\n".join(reversed(kept)), len(kept) < len(lines)
+
+    def fold(self, messages: List[BaseMessage], summary: Optional[str] = None, summary_upto: int = 0) -> Tuple[Optional[str], int]:
+        """
+        최근 턴보다 오래된 메시지를 누적 요약에 합칩니다.
+
+        Args:
+            messages: 세션의 전체 메시지 목록
+            summary: 세션에 저장된 누적 요약
+            summary_upto: 요약에 이미 합쳐진 메시지 수
+
+        Returns:
+            (새 누적 요약, 요약에 합쳐진 메시지 수). messages[summary_upto:]를 그래프에 전달하면 됩니다.
+        """
+        if not self.enabled:
+            return summary, summary_upto
+        # 세션이 초기화되는 등 메시지가 요약 위치보다 적으면 요약을 버림
+        if summary_upto > len(messages):
+            summary, summary_upto = None, 0
+
+        start = self.window_start(messages)
+        if start <= summary_upto:
+            return summary, summary_upto
+
+        lines = (summary.split("\n") if summary else []) + self.summarize_messages(messages[summary_upto:start])
+        new_summary, truncated = self._cap_summary(lines, self.summary_max_chars)
+        with self._lock:
+            self._stats["folds"] += 1
+            self._stats["folded_messages"] += start - summary_upto
+            self._stats["summary_truncations"] += int(truncated)
+        logger.info("오래된 메시지 %s개를 요약에 합침 (요약 위치: %s → %s, 요약 길이: %s자)", start - summary_upto, summary_upto, start, len(new_summary))
+        return new_summary or None, start
+
+    def build_context(self, messages: List[BaseMessage], summary: Optional[str], node: str) -> List[BaseMessage]:
+        """
+        노드에 전달할 메시지 목록을 만듭니다.
+
+        최근 keep_turns개 턴만 남긴 뒤 토큰 예산을 넘으면 오래된 턴부터 버립니다.
+        현재 턴(마지막 사용자 요청 이후)은 예산을 넘어도 버리지 않습니다.
+        누적 요약이 있으면 남은 예산 안에서 맨 앞에 요약 메시지로 넣습니다.
+        """
+        if not self.enabled:
+            return list(messages)
+
+        budget = self.budget_for(node)
+        start = self.window_start(messages)
+        window = list(messages[start:])
+        tokens = [estimate_tokens(message_text(message)) for message in window]
+        total = sum(tokens)
+
+        # 예산을 넘으면 오래된 턴부터 턴 단위로 버림 (현재 턴은 항상 유지)
+        boundaries = [index for index, message in enumerate(window) if is_user_message(message) and index > 0]
+        dropped = 0
+        for boundary in boundaries:
+            if total <= budget:
+                break
+            total -= sum(tokens[dropped:boundary])
+            dropped = boundary
+        window = window[dropped:]
+
+        context: List[BaseMessage] = []
+        truncated = False
+        if summary:
+            remaining_chars = int((budget - total) * CONTEXT_CHARS_PER_TOKEN) - len(SUMMARY_HEADER) - 1
+            # 남은 예산이 없으면 요약은 넣지 않음
+            if remaining_chars > 0:
+                summary_text, truncated = self._cap_summary(summary.split("\n"), remaining_chars)
+                if summary_text:
+                    context.append(HumanMessage(content=f"{SUMMARY_HEADER}\n{summary_text}", name=SUMMARY_MESSAGE_NAME))
+            else:
+                truncated = True
+        context.extend(window)
+
+        trimmed = start + dropped
+        with self._lock:
+            self._stats["builds"] += 1
+            self._stats["trimmed_messages"] += trimmed
+            self._stats["summary_truncations"] += int(truncated)
+            node_stats = self._stats["by_node"].setdefault(node, {"builds": 0, "trimmed_messages": 0, "max_tokens": 0})
+            node_stats["builds"] += 1
+            node_stats["trimmed_messages"] += trimmed
+            node_stats["max_tokens"] = max(node_stats["max_tokens"], total)
+        if trimmed:
+            logger.info("%s 컨텍스트: 메시지 %s개 중 %s개 제외 (추정 토큰: %s/%s)", node, len(messages), trimmed, total, budget)
+        return context
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요약/잘라내기 통계와 설정을 반환합니다."""
+        with self._lock:
+            return {
+                **self._stats,
+                "by_node": {node: dict(stats) for node, stats in self._stats["by_node"].items()},
+                "enabled": self.enabled,
+                "keep_turns": self.keep_turns,
+                "budgets": dict(self.budgets),
+                "default_budget": self.default_budget,
+            }
+
+
+# 싱글톤 인스턴스
+_context_window_instance = None
+_context_window_lock = threading.Lock()
+
+
+def get_context_window() -> ContextWindow:
+    """컨텍스트 관리자의 싱글톤 인스턴스를 반환합니다."""
+    global _context_window_instance
+    if _context_window_instance is None:
+        with _context_window_lock:
+            if _context_window_instance is None:
+                _context_window_instance = ContextWindow()
+                logger.info("컨텍스트 관리자 생성 완료 (사용: %s, 유지 턴 수: %s, 기본 토큰 예산: %s)", CONTEXT_WINDOW_ENABLE, CONTEXT_KEEP_TURNS, CONTEXT_DEFAULT_TOKEN_BUDGET)
+    return _context_window_instance
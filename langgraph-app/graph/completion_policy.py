@@ -0,0 +1,122 @@
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage
+from dotenv import load_dotenv
+from logging_config import setup_logger
+from graph.fast_router import FastRouter, ROUTABLE_AGENTS, get_fast_router
+
+# 로거 설정
+logger = setup_logger("completion_policy")
+
+# 환경 변수 로드
+load_dotenv()
+COMPLETION_POLICY_ENABLE = os.getenv("COMPLETION_POLICY_ENABLE", "true").lower() in ("true", "1", "yes")
+
+# 에이전트 응답이 실패를 나타내는 표현 (소문자로 비교)
+ERROR_MARKERS = (
+    "오류",
+    "실패",
+    "죄송",
+    "다시 시도",
+    "응답을 생성할 수 없습니다",
+    "error",
+    "failed",
+)
+
+
+class CompletionPolicy:
+    """
+    에이전트 응답 직후 슈퍼바이저를 다시 호출할지 결정하는 완료 정책.
+
+    요청이 한 에이전트의 작업(단일 의도)이고 그 에이전트가 오류 없이 응답했으면
+    슈퍼바이저 LLM 호출 없이 실행을 종료합니다. 복합 요청이거나 규칙으로 의도를 분류할 수 없거나
+    오류가 있으면 슈퍼바이저로 돌아갑니다.
+    """
+
+    def __init__(self, router: FastRouter, enabled: bool = COMPLETION_POLICY_ENABLE):
+        self.router = router
+        self.enabled = enabled
+        self._stats: Dict[str, Any] = {"finished": 0, "deferred": 0, "reasons": {}}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _split_turn(messages: List[BaseMessage]) -> Tuple[Optional[BaseMessage], List[BaseMessage]]:
+        """마지막 사용자 요청과 그 뒤에 이어진 에이전트 응답 목록을 반환합니다."""
+        replies = []
+        for message in reversed(messages):
+            if getattr(message, "name", None) in ROUTABLE_AGENTS:
+                replies.append(message)
+            else:
+                return message, list(reversed(replies))
+        return None, list(reversed(replies))
+
+    def _evaluate(self, messages: List[BaseMessage]) -> Tuple[bool, str]:
+        """종료 여부와 그 이유를 판단합니다."""
+        if not self.enabled:
+            return False, "disabled"
+
+        user_request, replies = self._split_turn(messages)
+        if user_request is None or not replies:
+            return False, "no_reply"
+        # 이미 여러 에이전트를 거친 요청은 슈퍼바이저가 마무리
+        if len(replies) > 1:
+            return False, "multi_step"
+
+        reply = replies[-1]
+        content = reply.content if isinstance(reply.content, str) else ""
+        lowered = content.lower()
+        if not content.strip() or any(marker in lowered for marker in ERROR_MARKERS):
+            return False, "error_reply"
+
+        # 요청에 다른 에이전트의 작업이 함께 있으면 슈퍼바이저가 다음 에이전트를 결정
+        request_text = user_request.content if isinstance(user_request.content, str) else ""
+        scores = self.router.score(request_text)
+        # 규칙으로 분류할 수 없는 요청은 의도 수를 알 수 없으므로 슈퍼바이저가 판단
+        if not scores:
+            return False, "unclassified_intent"
+        if len(scores) > 1:
+            return False, "multi_intent"
+        if reply.name not in scores:
+            return False, "unhandled_intent"
+        return True, "single_intent_success"
+
+    def should_finish(self, messages: List[BaseMessage], request_id: str = "") -> bool:
+        """
+        마지막 에이전트 응답으로 요청이 완료되었는지 판단합니다.
+
+        Returns:
+            True이면 슈퍼바이저 호출 없이 종료, False이면 슈퍼바이저로 돌아감
+        """
+        finish, reason = self._evaluate(messages)
+        with self._lock:
+            self._stats["finished" if finish else "deferred"] += 1
+            self._stats["reasons"][reason] = self._stats["reasons"].get(reason, 0) + 1
+        logger.info("[%s] 완료 정책 판단: %s (%s)", request_id, '종료' if finish else '슈퍼바이저로 반환', reason)
+        return finish
+
+    def get_stats(self) -> Dict[str, Any]:
+        """종료/반환 횟수와 이유별 통계를 반환합니다. finished는 생략된 슈퍼바이저 호출 수와 같습니다."""
+        with self._lock:
+            return {
+                **self._stats,
+                "reasons": dict(self._stats["reasons"]),
+                "enabled": self.enabled,
+            }
+
+
+# 싱글톤 인스턴스
+_completion_policy_instance = None
+_completion_policy_lock = threading.Lock()
+
+
+def get_completion_policy() -> CompletionPolicy:
+    """완료 정책의 싱글톤 인스턴스를 반환합니다."""
+    global _completion_policy_instance
+    if _completion_policy_instance is None:
+        with _completion_policy_lock:
+            if _completion_policy_instance is None:
+                _completion_policy_instance = CompletionPolicy(get_fast_router())
+                logger.info("완료 정책 생성 완료 (사용: %s)", COMPLETION_POLICY_ENABLE)
+    return _completion_policy_instance
@@ -0,0 +1,24 @@
+"""
+빠른 경로 라우터.
+
+구현은 저장소 최상위 common/fast_router.py에 있으며, 이 모듈은 기존 import 경로를 유지하기 위해 다시 내보냅니다.
+"""
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "common"))
+
+from fast_router import (
+    CLAUSE_SPLIT_PATTERN,
+    DEFAULT_CLAUSE_CONNECTIVES,
+    DEFAULT_RULES,
+    FAST_ROUTER_ENABLE,
+    FAST_ROUTER_RULES_PATH,
+    FAST_ROUTER_THRESHOLD,
+    ROUTABLE_AGENTS,
+    FastRouter,
+    build_clause_split_pattern,
+    get_fast_router,
+    load_clause_connectives,
+    load_rules,
+)
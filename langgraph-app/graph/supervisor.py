@@ -5,9 +5,12 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, Base
 from langchain_google_vertexai import ChatVertexAI
 from langgraph.graph import MessagesState, StateGraph, END
 from langgraph.prebuilt import ToolNode
+from langgraph.types import Send
 from langchain_core.runnables import RunnableConfig
 import json
 import os
+import operator
+import functools
 import datetime
 import time
 from PIL import Image
@@ -21,6 +24,7 @@ import matplotlib.image as mpimg
 import networkx as nx
 import glob
 import asyncio
+import threading
 
 # 로깅 설정 가져오기
 import sys
@@ -30,13 +34,29 @@ from logging_config import setup_logger
 # 로거 설정
 logger = setup_logger("supervisor")
 
-from agents.agents import create_routine_agent, create_device_agent, create_robot_cleaner_agent
+from agents.agents import create_robot_cleaner_agent
+from agents.agent_registry import get_agent_registry
+from mcp_client import get_mcp_client_manager
+from graph.fast_router import get_fast_router
+from graph.completion_policy import get_completion_policy
+from context_window import get_context_window
+from tools.turn_memo import TurnMemo, with_tool_memo, get_turn_memo_stats
 
 # 멀티에이전트 메시지 상태 정의
 class SmartHomeState(TypedDict):
     """스마트홈 멀티에이전트 시스템의 상태"""
     messages: List[BaseMessage]
     next: Optional[str]
+    # 완료 정책으로 생략한 슈퍼바이저 호출 수 (요청 단위)
+    supervisor_calls_avoided: int
+    # 복합 요청을 동시에 처리할 에이전트 목록
+    targets: List[str]
+    # 병렬 실행 중인 에이전트 분기 여부 (Send로 전달되는 분기 입력에만 설정)
+    fan_out: bool
+    # 병렬 실행된 에이전트들의 응답 (분기별 응답이 합쳐짐)
+    parallel_replies: Annotated[List[BaseMessage], operator.add]
+    # 최근 턴보다 오래된 대화의 누적 요약 (세션에 저장됨)
+    summary: Optional[str]
 
 # 라우팅 결정 클래스 정의 - Vertex AI 함수 호출 형식에 맞게 수정
 class Router(TypedDict):
@@ -46,6 +66,23 @@ class Router(TypedDict):
 # 각 에이전트 메모리
 AGENT_MEMORY = {}
 
+# 슈퍼바이저가 복합 요청을 여러 에이전트에 동시에 보낼 때 사용하는 next 값
+FAN_OUT = "fan_out"
+
+# 병렬 실행 시 각 에이전트에 덧붙이는 담당 범위 안내
+AGENT_TASK_HINTS = {
+    "routine_agent": "이 요청 중 루틴 관련 작업만 처리하세요.",
+    "device_agent": "이 요청 중 냉장고, 에어컨 관련 작업만 처리하세요.",
+    "robot_cleaner_agent": "이 요청 중 로봇청소기 관련 작업만 처리하세요.",
+}
+
+# 병렬 실행 결과를 합칠 때 사용하는 에이전트 표시 이름
+AGENT_LABELS = {
+    "routine_agent": "루틴",
+    "device_agent": "가전제품",
+    "robot_cleaner_agent": "로봇청소기",
+}
+
 # 슈퍼바이저 모델 초기화
 def get_supervisor_llm():
     """슈퍼바이저용 Vertex AI 모델을 초기화합니다."""
@@ -86,6 +123,9 @@ def get_supervisor_llm():
         
         # 슈퍼바이저 결정을 시뮬레이션하는 장치
         class FakeSupervisorLLM:
+            # Vertex AI 초기화 실패 시 대신 쓰는 LLM임을 표시 (러너블 캐시가 재시도 여부를 판단할 때 사용)
+            is_fallback = True
+            
             def with_structured_output(self, schema):
                 logger.info("FakeSupervisorLLM: 구조화된 출력 요청")
                 return self
@@ -151,9 +191,70 @@ def get_supervisor_llm():
                 # 기본값은 디바이스 에이전트
                 logger.info("FakeSupervisorLLM: 기본값, 디바이스 에이전트로 라우팅")
                 return {"next": "device_agent"}
+            
+            async def ainvoke(self, messages, config=None):
+                return self.invoke(messages, config)
         
         return FakeSupervisorLLM()
 
+# Vertex AI 초기화에 실패해 로컬 테스트 모드로 동작할 때 다시 초기화를 시도하는 주기(초)
+SUPERVISOR_LLM_RETRY_INTERVAL = float(os.getenv("SUPERVISOR_LLM_RETRY_INTERVAL", "30"))
+
+# 싱글톤 인스턴스 - 슈퍼바이저 LLM과 구조화된 출력 러너블
+_supervisor_llm = None
+_supervisor_router = None
+_supervisor_model_name = None
+# 로컬 테스트 모드 러너블을 쓰는 동안 다음 초기화 재시도 시각 (Vertex AI 러너블이면 None)
+_supervisor_retry_at = None
+_supervisor_lock = threading.Lock()
+
+def _supervisor_router_valid(model_name: str) -> bool:
+    """캐시된 러너블을 그대로 써도 되는지 확인합니다."""
+    if _supervisor_router is None or _supervisor_model_name != model_name:
+        return False
+    return _supervisor_retry_at is None or time.time() < _supervisor_retry_at
+
+def get_supervisor_router():
+    """
+    구조화된 출력(Router)이 바인딩된 슈퍼바이저 러너블의 싱글톤 인스턴스를 반환합니다.
+    MODEL_NAME 환경 변수가 바뀌면 자동으로 다시 생성합니다.
+    
+    Vertex AI 초기화에 실패해 로컬 테스트 모드 러너블을 받은 경우에는 영구히 캐시하지 않고,
+    SUPERVISOR_LLM_RETRY_INTERVAL초가 지난 뒤 다음 호출에서 다시 초기화를 시도합니다.
+    """
+    global _supervisor_llm, _supervisor_router, _supervisor_model_name, _supervisor_retry_at
+    model_name = os.getenv("MODEL_NAME", "gemini-1.5-pro")
+    if _supervisor_router_valid(model_name):
+        return _supervisor_router
+    
+    with _supervisor_lock:
+        if not _supervisor_router_valid(model_name):
+            if _supervisor_retry_at is not None and _supervisor_model_name == model_name:
+                logger.info("슈퍼바이저 Vertex AI 초기화 재시도 (모델: %s)", model_name)
+            elif _supervisor_router is not None:
+                logger.info("슈퍼바이저 모델 변경 감지 (%s -> %s), 러너블 재생성", _supervisor_model_name, model_name)
+            llm = get_supervisor_llm()
+            _supervisor_router = llm.with_structured_output(Router)
+            _supervisor_llm = llm
+            _supervisor_model_name = model_name
+            if getattr(llm, "is_fallback", False):
+                _supervisor_retry_at = time.time() + SUPERVISOR_LLM_RETRY_INTERVAL
+                logger.warning("슈퍼바이저 러너블을 로컬 테스트 모드로 생성 (%s초 후 재시도)", SUPERVISOR_LLM_RETRY_INTERVAL)
+            else:
+                _supervisor_retry_at = None
+                logger.info("슈퍼바이저 러너블 생성 완료 (모델: %s)", model_name)
+    return _supervisor_router
+
+def reset_supervisor_router():
+    """캐시된 슈퍼바이저 LLM과 러너블을 폐기합니다. 다음 호출 시 다시 생성됩니다."""
+    global _supervisor_llm, _supervisor_router, _supervisor_model_name, _supervisor_retry_at
+    with _supervisor_lock:
+        _supervisor_llm = None
+        _supervisor_router = None
+        _supervisor_model_name = None
+        _supervisor_retry_at = None
+    logger.info("슈퍼바이저 러너블 캐시 초기화")
+
 # 슈퍼바이저 시스템 프롬프트 정의
 SUPERVISOR_SYSTEM_PROMPT = """당신은 스마트홈 시스템의 슈퍼바이저 에이전트입니다. 사용자의 요청을 분석하여 적절한 에이전트에 작업을 할당합니다.
 
@@ -178,90 +279,96 @@ SUPERVISOR_SYSTEM_PROMPT = """당신은 스마트홈 시스템의 슈퍼바이
 """
 
 # 슈퍼바이저 노드 정의
-def supervisor_node(state: SmartHomeState, config: RunnableConfig):
-    """슈퍼바이저 노드 구현"""
+async def supervisor_node(state: SmartHomeState, config: RunnableConfig):
+    """슈퍼바이저 노드 구현 (비동기)"""
     request_id = f"req-{time.time()}"
-    logger.info(f"[{request_id}] 슈퍼바이저 노드 시작")
+    logger.info("[%s] 슈퍼바이저 노드 시작", request_id)
     
     # 메시지 로깅
     if state["messages"]:
         last_message = state["messages"][-1]
-        logger.info(f"[{request_id}] 마지막 메시지: {last_message.content[:100]}..." if len(last_message.content) > 100 else last_message.content)
+        logger.info("[%s] 마지막 메시지: %.100s%s", request_id, last_message.content, "..." if len(last_message.content) > 100 else "")
+    
+    # 여러 에이전트의 독립적인 작업으로 나뉘는 요청은 동시에 실행
+    targets = get_fast_router().fan_out_targets(state["messages"], request_id)
+    if targets:
+        return {"next": FAN_OUT, "targets": targets}
     
-    # 슈퍼바이저 LLM 초기화
-    logger.info(f"[{request_id}] 슈퍼바이저 LLM 가져오기")
-    llm = get_supervisor_llm()
+    # 규칙으로 분류 가능한 새 요청은 LLM 호출 없이 라우팅
+    fast_route = get_fast_router().route(state["messages"], request_id)
+    if fast_route is not None:
+        return {"next": fast_route}
     
-    # 현재 메시지 목록
+    # 캐시된 슈퍼바이저 러너블 가져오기
+    logger.info("[%s] 슈퍼바이저 러너블 가져오기", request_id)
+    router = get_supervisor_router()
+    
+    # 현재 메시지 목록 (최근 턴과 누적 요약만 토큰 예산 안에서 전달)
     messages = [
         SystemMessage(content=SUPERVISOR_SYSTEM_PROMPT),
-    ] + state["messages"]
+    ] + get_context_window().build_context(state["messages"], state.get("summary"), "supervisor")
     
-    logger.info(f"[{request_id}] 총 {len(messages)} 개의 메시지로 슈퍼바이저에 요청")
+    logger.info("[%s] 총 %s 개의 메시지로 슈퍼바이저에 요청", request_id, len(messages))
     
     try:
         # LLM에게 라우팅 결정 요청
-        logger.info(f"[{request_id}] 슈퍼바이저 LLM 호출 시작")
-        start_time = time.time()
-        response = llm.with_structured_output(Router).invoke(messages, config)
-        elapsed_time = time.time() - start_time
-        logger.info(f"[{request_id}] 슈퍼바이저 LLM 응답 (소요시간: {elapsed_time:.2f}초): {response}")
+        logger.info("[%s] 슈퍼바이저 LLM 호출 시작", request_id)
+        response = await router.ainvoke(messages, config)
+        logger.info("[%s] 슈퍼바이저 LLM 응답: %s", request_id, response)
         
         # 다음 에이전트 결정
         goto = response["next"]
-        logger.info(f"[{request_id}] 슈퍼바이저 결정: {goto}")
+        logger.info("[%s] 슈퍼바이저 결정: %s", request_id, goto)
         
         if goto == "FINISH":
             # END 노드로 명시적 라우팅
-            logger.info(f"[{request_id}] 작업 완료, END 노드로 라우팅")
+            logger.info("[%s] 작업 완료, END 노드로 라우팅", request_id)
             return {"next": END}
         
         # 다음 노드 반환
-        logger.info(f"[{request_id}] 다음 노드: {goto}")
+        logger.info("[%s] 다음 노드: %s", request_id, goto)
         return {"next": goto}
     except Exception as e:
         error_msg = f"슈퍼바이저 결정 중 오류 발생: {str(e)}"
-        logger.error(f"[{request_id}] {error_msg}")
-        logger.error(f"[{request_id}] {traceback.format_exc()}")
+        logger.error("[%s] %s", request_id, error_msg)
+        logger.error("[%s] %s", request_id, traceback.format_exc())
         # 오류 발생 시 기본값으로 device_agent 반환
-        logger.warning(f"[{request_id}] 오류 발생으로 기본값(device_agent) 반환")
+        logger.warning("[%s] 오류 발생으로 기본값(device_agent) 반환", request_id)
         return {"next": "device_agent"}
 
 # 루틴 에이전트 노드 정의
-def routine_agent_node(state: SmartHomeState, config: RunnableConfig):
-    """루틴 에이전트 노드 구현"""
+async def routine_agent_node(state: SmartHomeState, config: RunnableConfig):
+    """루틴 에이전트 노드 구현 (비동기)"""
     request_id = f"req-{time.time()}"
-    logger.info(f"[{request_id}] 루틴 에이전트 노드 시작")
+    logger.info("[%s] 루틴 에이전트 노드 시작", request_id)
     
-    # 루틴 에이전트 초기화
-    logger.info(f"[{request_id}] 루틴 에이전트 초기화")
-    agent = create_routine_agent()
+    # 캐시된 루틴 에이전트 가져오기
+    logger.info("[%s] 루틴 에이전트 가져오기", request_id)
+    agent = await get_agent_registry().aget("routine_agent")
     
     # 사용자 쿼리 추출
     user_message = state["messages"][-1].content if state["messages"] else ""
-    logger.info(f"[{request_id}] 사용자 쿼리: {user_message[:100]}..." if len(user_message) > 100 else user_message)
+    logger.info("[%s] 사용자 쿼리: %.100s%s", request_id, user_message, "..." if len(user_message) > 100 else "")
     
     try:
         # 에이전트 실행 - LangGraph 에이전트 호출 방식으로 변경
-        logger.info(f"[{request_id}] 루틴 에이전트 실행 시작")
-        start_time = time.time()
-        response = agent.invoke(
+        logger.info("[%s] 루틴 에이전트 실행 시작", request_id)
+        response = await agent.ainvoke(
             # LangGraph 에이전트는 messages 형식의 입력을 받습니다
             {"messages": [HumanMessage(content=user_message)]},
             config
         )
-        elapsed_time = time.time() - start_time
-        logger.info(f"[{request_id}] 루틴 에이전트 응답 (소요시간: {elapsed_time:.2f}초)")
+        logger.info("[%s] 루틴 에이전트 응답", request_id)
         
         # 응답에서 마지막 메시지 추출
         last_message = response["messages"][-1] if "messages" in response else None
         response_text = last_message.content if last_message else str(response)
-        logger.info(f"[{request_id}] 응답 내용: {response_text[:100]}..." if len(response_text) > 100 else response_text)
+        logger.info("[%s] 응답 내용: %.100s%s", request_id, response_text, "..." if len(response_text) > 100 else "")
         
         # 새로운 메시지 목록 생성 (기존 메시지 + 에이전트 응답)
         new_messages = list(state["messages"])
         new_messages.append(HumanMessage(content=response_text, name="routine_agent"))
-        logger.info(f"[{request_id}] 루틴 에이전트 완료, 슈퍼바이저로 반환")
+        logger.info("[%s] 루틴 에이전트 완료, 슈퍼바이저로 반환", request_id)
         
         # 상태 업데이트 및 다음 노드 반환
         return {
@@ -270,8 +377,8 @@ def routine_agent_node(state: SmartHomeState, config: RunnableConfig):
         }
     except Exception as e:
         error_msg = f"루틴 에이전트 실행 중 오류 발생: {str(e)}"
-        logger.error(f"[{request_id}] {error_msg}")
-        logger.error(f"[{request_id}] {traceback.format_exc()}")
+        logger.error("[%s] %s", request_id, error_msg)
+        logger.error("[%s] %s", request_id, traceback.format_exc())
         
         # 오류 발생 시 오류 메시지를 응답으로 추가
         error_response = f"루틴 처리 중 오류가 발생했습니다: {str(e)}"
@@ -285,40 +392,41 @@ def routine_agent_node(state: SmartHomeState, config: RunnableConfig):
 
 
 # 가전제품 제어 에이전트 노드 정의
-def device_agent_node(state: SmartHomeState, config: RunnableConfig):
-    """가전제품 제어 에이전트 노드 구현"""
+async def device_agent_node(state: SmartHomeState, config: RunnableConfig):
+    """가전제품 제어 에이전트 노드 구현 (비동기)"""
     request_id = f"req-{time.time()}"
-    logger.info(f"[{request_id}] 가전제품 제어 에이전트 노드 시작")
+    logger.info("[%s] 가전제품 제어 에이전트 노드 시작", request_id)
     
-    # 가전제품 제어 에이전트 초기화
-    logger.info(f"[{request_id}] 가전제품 제어 에이전트 초기화")
-    agent = create_device_agent()
+    # 캐시된 가전제품 제어 에이전트 가져오기
+    logger.info("[%s] 가전제품 제어 에이전트 가져오기", request_id)
+    agent = await get_agent_registry().aget("device_agent")
     
     # 사용자 쿼리 추출
     user_message = state["messages"][-1].content if state["messages"] else ""
-    logger.info(f"[{request_id}] 사용자 쿼리: {user_message[:100]}..." if len(user_message) > 100 else user_message)
+    logger.info("[%s] 사용자 쿼리: %.100s%s", request_id, user_message, "..." if len(user_message) > 100 else "")
     
+    # 이번 턴 동안의 조회 도구 결과 메모 (같은 조회는 한 번만 요청하고, 설정 변경 시 해당 기기 메모를 지움)
+    memo = TurnMemo()
     try:
         # 에이전트 실행 - LangGraph 에이전트 호출 방식으로 변경
-        logger.info(f"[{request_id}] 가전제품 제어 에이전트 실행 시작")
-        start_time = time.time()
-        response = agent.invoke(
+        logger.info("[%s] 가전제품 제어 에이전트 실행 시작", request_id)
+        response = await agent.ainvoke(
             # LangGraph 에이전트는 messages 형식의 입력을 받습니다
             {"messages": [HumanMessage(content=user_message)]},
-            config
+            with_tool_memo(config, memo)
         )
-        elapsed_time = time.time() - start_time
-        logger.info(f"[{request_id}] 가전제품 제어 에이전트 응답 (소요시간: {elapsed_time:.2f}초)")
+        logger.info("[%s] 가전제품 제어 에이전트 응답", request_id)
+        get_turn_memo_stats().record(memo, request_id)
         
         # 응답에서 마지막 메시지 추출
         last_message = response["messages"][-1] if "messages" in response else None
         response_text = last_message.content if last_message else str(response)
-        logger.info(f"[{request_id}] 응답 내용: {response_text[:100]}..." if len(response_text) > 100 else response_text)
+        logger.info("[%s] 응답 내용: %.100s%s", request_id, response_text, "..." if len(response_text) > 100 else "")
         
         # 새로운 메시지 목록 생성 (기존 메시지 + 에이전트 응답)
         new_messages = list(state["messages"])
         new_messages.append(HumanMessage(content=response_text, name="device_agent"))
-        logger.info(f"[{request_id}] 가전제품 제어 에이전트 완료, 슈퍼바이저로 반환")
+        logger.info("[%s] 가전제품 제어 에이전트 완료, 슈퍼바이저로 반환", request_id)
         
         # 상태 업데이트 및 다음 노드 반환
         return {
@@ -326,9 +434,10 @@ def device_agent_node(state: SmartHomeState, config: RunnableConfig):
             "next": "supervisor"
         }
     except Exception as e:
+        get_turn_memo_stats().record(memo, request_id)
         error_msg = f"가전제품 제어 에이전트 실행 중 오류 발생: {str(e)}"
-        logger.error(f"[{request_id}] {error_msg}")
-        logger.error(f"[{request_id}] {traceback.format_exc()}")
+        logger.error("[%s] %s", request_id, error_msg)
+        logger.error("[%s] %s", request_id, traceback.format_exc())
         
         # 오류 발생 시 오류 메시지를 응답으로 추가
         error_response = f"가전제품 제어 중 오류가 발생했습니다: {str(e)}"
@@ -340,52 +449,75 @@ def device_agent_node(state: SmartHomeState, config: RunnableConfig):
             "next": "supervisor"
         }
 
+# 로봇청소기 에이전트 생성 잠금 - 동시에 들어온 첫 요청들이 MCP 클라이언트를 각각 생성하지 않도록 함
+_robot_cleaner_agent_lock = asyncio.Lock()
+
+async def get_robot_cleaner_agent_async():
+    """
+    로봇청소기 에이전트를 한 번만 생성하여 반환합니다.
+    
+    MCP 연결이 끊어져 재연결되면(generation 변경) 새 도구로 에이전트를 다시 생성합니다.
+    """
+    manager = get_mcp_client_manager()
+    generation = await manager.ensure_healthy()
+    agent = AGENT_MEMORY.get("robot_cleaner_agent")
+    if agent is not None and AGENT_MEMORY.get("robot_cleaner_generation") == generation:
+        return agent
+    
+    async with _robot_cleaner_agent_lock:
+        # 잠금을 기다리는 동안 다른 요청이 이미 생성했을 수 있음
+        if "robot_cleaner_agent" not in AGENT_MEMORY or AGENT_MEMORY.get("robot_cleaner_generation") != manager.generation:
+            stale = "robot_cleaner_agent" in AGENT_MEMORY
+            logger.info("로봇청소기 에이전트 생성 시작 (비동기, MCP generation: %s)", manager.generation)
+            AGENT_MEMORY["robot_cleaner_agent"] = await create_robot_cleaner_agent()
+            AGENT_MEMORY["robot_cleaner_generation"] = manager.generation
+            # 이전 에이전트가 잡고 있던 MCP 연결 참조 반납 (새 에이전트가 먼저 참조를 획득하므로 연결은 유지됨)
+            if stale:
+                await manager.release()
+            logger.info("로봇청소기 에이전트 생성 완료 (비동기)")
+    return AGENT_MEMORY["robot_cleaner_agent"]
+
 # 로봇청소기 제어 에이전트 노드 정의
-async def robot_cleaner_agent_node_async(state: SmartHomeState):
+async def robot_cleaner_agent_node_async(state: SmartHomeState, config: RunnableConfig):
     """로봇청소기 에이전트 노드의 비동기 구현: 로봇청소기 제어 처리"""
     request_id = f"req-{time.time()}"
-    logger.info(f"[{request_id}] 로봇청소기 에이전트 노드 비동기 실행")
+    logger.info("[%s] 로봇청소기 에이전트 노드 비동기 실행", request_id)
     
-    # 로봇청소기 에이전트가 이미 생성되어 있는지 확인
-    if "robot_cleaner_agent" not in AGENT_MEMORY:
-        logger.info(f"[{request_id}] 로봇청소기 에이전트 생성 시작 (비동기)")
-        try:
-            # 로봇청소기 에이전트 비동기 생성
-            AGENT_MEMORY["robot_cleaner_agent"] = await create_robot_cleaner_agent()
-            logger.info(f"[{request_id}] 로봇청소기 에이전트 생성 완료 (비동기)")
-        except Exception as e:
-            logger.error(f"[{request_id}] 로봇청소기 에이전트 생성 실패: {str(e)}")
-            logger.error(traceback.format_exc())
-            error_message = AIMessage(
-                content=f"죄송합니다. 로봇청소기 에이전트를 초기화하는 중에 오류가 발생했습니다: {str(e)}",
-                name="robot_cleaner_agent"
-            )
-            return {"messages": state["messages"] + [error_message], "next": "supervisor"}
+    # 로봇청소기 에이전트 가져오기 (최초 1회만 생성)
+    try:
+        agent = await get_robot_cleaner_agent_async()
+    except Exception as e:
+        logger.error("[%s] 로봇청소기 에이전트 생성 실패: %s", request_id, e)
+        logger.error(traceback.format_exc())
+        error_message = AIMessage(
+            content=f"죄송합니다. 로봇청소기 에이전트를 초기화하는 중에 오류가 발생했습니다: {str(e)}",
+            name="robot_cleaner_agent"
+        )
+        return {"messages": state["messages"] + [error_message], "next": "supervisor"}
     
     # 사용자 쿼리 추출
     user_message = state["messages"][-1].content if state["messages"] else ""
-    logger.info(f"[{request_id}] 사용자 쿼리: {user_message[:100]}..." if len(user_message) > 100 else user_message)
+    logger.info("[%s] 사용자 쿼리: %.100s%s", request_id, user_message, "..." if len(user_message) > 100 else "")
     
     # 로봇청소기 에이전트 실행
     try:
         # create_react_agent로 생성된 에이전트 실행
-        logger.info(f"[{request_id}] 로봇청소기 에이전트 실행 시작")
-        start_time = time.time()
-        result = await AGENT_MEMORY["robot_cleaner_agent"].ainvoke({
-            "messages": [HumanMessage(content=user_message)]
-        })
-        elapsed_time = time.time() - start_time
-        logger.info(f"[{request_id}] 로봇청소기 에이전트 응답 (소요시간: {elapsed_time:.2f}초)")
+        logger.info("[%s] 로봇청소기 에이전트 실행 시작", request_id)
+        result = await agent.ainvoke(
+            {"messages": [HumanMessage(content=user_message)]},
+            config
+        )
+        logger.info("[%s] 로봇청소기 에이전트 응답", request_id)
         
         # 응답에서 마지막 메시지 추출
         last_message = result["messages"][-1] if "messages" in result else None
         response_text = last_message.content if last_message else str(result)
-        logger.info(f"[{request_id}] 응답 내용: {response_text[:100]}..." if len(response_text) > 100 else response_text)
+        logger.info("[%s] 응답 내용: %.100s%s", request_id, response_text, "..." if len(response_text) > 100 else "")
         
         # 새로운 메시지 목록 생성 (기존 메시지 + 에이전트 응답)
         new_messages = list(state["messages"])
         new_messages.append(HumanMessage(content=response_text, name="robot_cleaner_agent"))
-        logger.info(f"[{request_id}] 로봇청소기 에이전트 완료, 슈퍼바이저로 반환")
+        logger.info("[%s] 로봇청소기 에이전트 완료, 슈퍼바이저로 반환", request_id)
         
         # 상태 업데이트 및 다음 노드 반환
         return {
@@ -393,8 +525,10 @@ async def robot_cleaner_agent_node_async(state: SmartHomeState):
             "next": "supervisor"
         }
     except Exception as e:
-        logger.error(f"[{request_id}] 로봇청소기 에이전트 실행 중 오류 발생: {str(e)}")
+        logger.error("[%s] 로봇청소기 에이전트 실행 중 오류 발생: %s", request_id, e)
         logger.error(traceback.format_exc())
+        # MCP 전송 오류일 수 있으므로 다음 요청에서 연결 상태를 바로 확인
+        get_mcp_client_manager().mark_unhealthy()
         
         # 오류 발생 시 오류 메시지를 응답으로 추가
         error_response = f"로봇청소기 제어 중 오류가 발생했습니다: {str(e)}"
@@ -406,6 +540,69 @@ async def robot_cleaner_agent_node_async(state: SmartHomeState):
             "next": "supervisor"
         }
 
+# 병렬 실행 분기 래퍼
+def parallel_branch(node):
+    """병렬 실행 분기에서는 에이전트 응답을 messages 대신 parallel_replies에 기록하도록 노드를 감쌉니다."""
+    @functools.wraps(node)
+    async def wrapper(state: SmartHomeState, config: RunnableConfig):
+        update = await node(state, config)
+        if not state.get("fan_out"):
+            return update
+        return {"parallel_replies": update["messages"][-1:]}
+    return wrapper
+
+# 슈퍼바이저 다음 경로 결정
+def route_from_supervisor(state: SmartHomeState):
+    """슈퍼바이저 결정에 따라 다음 노드를 반환합니다. 복합 요청이면 대상 에이전트마다 Send를 반환합니다."""
+    if state["next"] != FAN_OUT:
+        return state["next"]
+    
+    query = state["messages"][-1].content
+    return [
+        Send(agent, {
+            "messages": state["messages"][:-1] + [HumanMessage(content=f"{query}\n\n({AGENT_TASK_HINTS[agent]})")],
+            "next": None,
+            "fan_out": True,
+        })
+        for agent in state["targets"]
+    ]
+
+# 에이전트 다음 경로 결정
+def route_after_agent(state: SmartHomeState) -> str:
+    """병렬 실행 중이면 응답 병합 노드로, 아니면 완료 정책 노드로 이동합니다."""
+    return "merge_replies" if state.get("parallel_replies") else "completion_check"
+
+# 병렬 응답 병합 노드 정의
+def merge_replies_node(state: SmartHomeState):
+    """병렬 실행된 에이전트 응답을 대상 순서대로 합쳐 하나의 최종 응답으로 만듭니다."""
+    request_id = f"req-{time.time()}"
+    targets = state.get("targets") or []
+    replies = sorted(
+        state.get("parallel_replies", []),
+        key=lambda message: targets.index(message.name) if message.name in targets else len(targets)
+    )
+    sections = [f"[{AGENT_LABELS.get(reply.name, reply.name)}] {reply.content}" for reply in replies]
+    summary = HumanMessage(content="\n\n".join(sections), name="supervisor")
+    
+    # 순차 실행이었다면 에이전트 응답마다 슈퍼바이저를 한 번씩 호출했을 것
+    avoided = state.get("supervisor_calls_avoided", 0) + len(replies)
+    logger.info("[%s] 병렬 응답 병합 완료: %s (생략된 슈퍼바이저 호출: %s)", request_id, [reply.name for reply in replies], avoided)
+    return {
+        "messages": list(state["messages"]) + [summary],
+        "next": END,
+        "supervisor_calls_avoided": avoided
+    }
+
+# 완료 정책 노드 정의
+def completion_check_node(state: SmartHomeState):
+    """에이전트 응답 후 슈퍼바이저를 다시 호출하지 않고 종료할 수 있는지 확인합니다."""
+    request_id = f"req-{time.time()}"
+    if get_completion_policy().should_finish(state["messages"], request_id):
+        avoided = state.get("supervisor_calls_avoided", 0) + 1
+        logger.info("[%s] 단일 의도 요청 완료, 슈퍼바이저 호출 생략 (요청 내 생략 횟수: %s)", request_id, avoided)
+        return {"next": END, "supervisor_calls_avoided": avoided}
+    return {"next": "supervisor"}
+
 # 그래프 이미지 저장 함수
 def save_graph_as_image(graph, filename=None):
     """
@@ -430,7 +627,7 @@ def save_graph_as_image(graph, filename=None):
     
     # 파일 경로 설정
     filepath = os.path.join(graph_dir, filename)
-    logger.info(f"그래프 이미지 경로: {filepath}")
+    logger.info("그래프 이미지 경로: %s", filepath)
     
     # 그래프를 이미지로 변환하여 저장
     try:
@@ -443,10 +640,10 @@ def save_graph_as_image(graph, filename=None):
             with open(filepath, "wb") as f:
                 f.write(png_data)
             
-            logger.info(f"그래프 이미지가 저장되었습니다: {filepath}")
+            logger.info("그래프 이미지가 저장되었습니다: %s", filepath)
             return filepath
         except Exception as e:
-            logger.warning(f"PNG 생성 실패, 대체 텍스트 형식으로 시도합니다: {str(e)}")
+            logger.warning("PNG 생성 실패, 대체 텍스트 형식으로 시도합니다: %s", e)
             
             # 대체: 텍스트 형식 (mermaid)으로 저장
             text_filename = filename.replace(".png", ".mmd")
@@ -457,7 +654,7 @@ def save_graph_as_image(graph, filename=None):
             with open(text_filepath, "w", encoding="utf-8") as f:
                 f.write(mermaid_text)
                 
-            logger.info(f"그래프 텍스트가 저장되었습니다: {text_filepath}")
+            logger.info("그래프 텍스트가 저장되었습니다: %s", text_filepath)
             return text_filepath
             
     except Exception as e:
@@ -486,27 +683,40 @@ def create_smart_home_graph():
         workflow = StateGraph(SmartHomeState)
         
         # 노드 추가
-        logger.info("그래프에 노드 추가: supervisor, routine_agent, device_agent, robot_cleaner_agent")
+        logger.info("그래프에 노드 추가: supervisor, routine_agent, device_agent, robot_cleaner_agent, completion_check, merge_replies")
         workflow.add_node("supervisor", supervisor_node)
-        workflow.add_node("routine_agent", routine_agent_node)
-        workflow.add_node("device_agent", device_agent_node)
-        workflow.add_node("robot_cleaner_agent", robot_cleaner_agent_node)
+        workflow.add_node("routine_agent", parallel_branch(routine_agent_node))
+        workflow.add_node("device_agent", parallel_branch(device_agent_node))
+        workflow.add_node("robot_cleaner_agent", parallel_branch(robot_cleaner_agent_node_async))
+        workflow.add_node("completion_check", completion_check_node)
+        workflow.add_node("merge_replies", merge_replies_node)
         
         # 시작 노드 설정
         logger.info("시작 노드 설정: supervisor")
         workflow.set_entry_point("supervisor")
         
-        # 에이전트 → 슈퍼바이저 엣지 추가
-        logger.info("에이전트 → 슈퍼바이저 엣지 추가")
-        workflow.add_edge("routine_agent", "supervisor")
-        workflow.add_edge("device_agent", "supervisor")
-        workflow.add_edge("robot_cleaner_agent", "supervisor")
+        # 에이전트 → 완료 정책 또는 병렬 응답 병합 조건부 엣지 추가
+        logger.info("에이전트 → 완료 정책 또는 병렬 응답 병합 조건부 엣지 추가")
+        for agent_name in ("routine_agent", "device_agent", "robot_cleaner_agent"):
+            workflow.add_conditional_edges(agent_name, route_after_agent, ["completion_check", "merge_replies"])
+        workflow.add_edge("merge_replies", END)
+        
+        # 완료 정책 → 슈퍼바이저 또는 종료 조건부 엣지 추가
+        logger.info("완료 정책 → 슈퍼바이저 또는 종료 조건부 엣지 추가")
+        workflow.add_conditional_edges(
+            "completion_check",
+            lambda state: state["next"],
+            {
+                "supervisor": "supervisor",
+                END: END
+            }
+        )
         
-        # 슈퍼바이저 → 에이전트 또는 종료 조건부 엣지 추가
+        # 슈퍼바이저 → 에이전트(병렬 실행 포함) 또는 종료 조건부 엣지 추가
         logger.info("슈퍼바이저 → 에이전트 또는 종료 조건부 엣지 추가")
         workflow.add_conditional_edges(
             "supervisor",
-            lambda state: state["next"],
+            route_from_supervisor,
             {
                 "routine_agent": "routine_agent",
                 "device_agent": "device_agent",
@@ -535,20 +745,4 @@ def create_smart_home_graph():
         error_msg = f"멀티에이전트 그래프 생성 중 오류 발생: {str(e)}"
         logger.error(error_msg)
         logger.error(traceback.format_exc())
-        raise 
-
-# 동기식 래퍼 함수
-def robot_cleaner_agent_node(state: SmartHomeState, config: RunnableConfig):
-    """로봇청소기 에이전트 노드: 로봇청소기 제어 처리 (동기식 래퍼)"""
-    logger.info("로봇청소기 에이전트 노드 실행 (동기 래퍼)")
-    
-    # 이벤트 루프 가져오기
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        # 이벤트 루프가 없는 경우 새로 생성
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    # 비동기 함수 실행
-    return loop.run_until_complete(robot_cleaner_agent_node_async(state)) 
\ No newline at end of file
+        raise
@@ -1,5 +1,11 @@
 import os
+import json
+import time
+import asyncio
+import hashlib
 import logging
+import traceback
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from logging_config import setup_logger
@@ -14,7 +20,11 @@ load_dotenv()
 mcp_server_url = os.getenv("MCP_SERVER_URL", "http://0.0.0.0:8001")
 if mcp_server_url.endswith("/sse"):
     mcp_server_url = mcp_server_url[:-4]  # /sse 부분 제거
-logger.info(f"MCP 서버 URL: {mcp_server_url}")
+logger.info("MCP 서버 URL: %s", mcp_server_url)
+
+# 연결 상태 확인 주기(초) - 이 시간이 지나면 다음 사용 시 ping으로 세션을 확인함
+MCP_HEALTHCHECK_INTERVAL = float(os.getenv("MCP_HEALTHCHECK_INTERVAL", "30"))
+MCP_HEALTHCHECK_TIMEOUT = float(os.getenv("MCP_HEALTHCHECK_TIMEOUT", "5"))
 
 # MCP 클라이언트 설정
 # RobotCleaner라는 이름의 MCP 서버와 통신하기 위한 설정
@@ -25,32 +35,194 @@ mcp_config = {
     }
 }
 
-logger.info(f"MCP 클라이언트 설정: {mcp_config}")
+logger.info("MCP 클라이언트 설정: %s", mcp_config)
+
+
+def get_config_hash(config: Dict[str, Any]) -> str:
+    """MCP 서버 설정의 해시값을 반환합니다. 도구 캐시와 매니저의 키로 사용됩니다."""
+    serialized = json.dumps(config, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:16]
+
+
+# 설정 해시별 도구 목록 캐시
+_tools_cache: Dict[str, Dict[str, Any]] = {}
+
+
+class MCPClientManager:
+    """
+    MultiServerMCPClient 연결을 오래 유지하고 도구 목록을 캐싱하는 매니저.
+
+    acquire/release로 참조 횟수를 관리하며, 마지막 참조가 해제되면 연결을 닫습니다.
+    연결이 끊어지면 다시 연결하고 generation을 증가시켜, 이전 도구로 만든 에이전트를
+    다시 생성해야 함을 알립니다.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.config_hash = get_config_hash(config)
+        self.generation = 0
+        self._client: Optional[MultiServerMCPClient] = None
+        self._refs = 0
+        self._last_healthy_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    async def _connect(self) -> None:
+        """MCP 서버에 연결합니다. (잠금 상태에서 호출)"""
+        logger.info("MCP 클라이언트 연결 시작 (설정 해시: %s)", self.config_hash)
+        start_time = time.time()
+        client = MultiServerMCPClient(self.config)
+        await client.__aenter__()
+        self._client = client
+        self._last_healthy_at = time.time()
+        self.generation += 1
+        logger.info("MCP 클라이언트 연결 완료 (소요시간: %.2f초, generation: %s)", time.time() - start_time, self.generation)
+
+    async def _disconnect(self) -> None:
+        """MCP 서버 연결을 닫고 도구 캐시를 비웁니다. (잠금 상태에서 호출)"""
+        client, self._client = self._client, None
+        _tools_cache.pop(self.config_hash, None)
+        if client is None:
+            return
+        try:
+            await client.__aexit__(None, None, None)
+            logger.info("MCP 클라이언트 연결 종료 (설정 해시: %s)", self.config_hash)
+        except Exception as e:
+            # 연결이 이미 끊어진 경우 등 종료 중 오류는 무시
+            logger.warning("MCP 클라이언트 종료 중 오류 (무시됨): %s", e)
+
+    async def acquire(self) -> MultiServerMCPClient:
+        """참조 횟수를 증가시키고 연결된 클라이언트를 반환합니다."""
+        async with self._lock:
+            self._refs += 1
+            if self._client is None:
+                await self._connect()
+            return self._client
+
+    async def release(self) -> None:
+        """참조 횟수를 감소시키고, 더 이상 참조가 없으면 연결을 닫습니다."""
+        async with self._lock:
+            self._refs = max(self._refs - 1, 0)
+            if self._refs == 0:
+                await self._disconnect()
+
+    async def reconnect(self) -> None:
+        """연결을 다시 맺습니다. 도구 캐시는 무효화됩니다."""
+        async with self._lock:
+            logger.info("MCP 클라이언트 재연결 (설정 해시: %s)", self.config_hash)
+            await self._disconnect()
+            await self._connect()
+
+    def mark_unhealthy(self) -> None:
+        """다음 사용 시 주기와 관계없이 연결 상태를 확인하도록 표시합니다."""
+        self._last_healthy_at = 0.0
+
+    async def ensure_healthy(self) -> int:
+        """
+        연결 상태를 확인하고, 끊어졌으면 다시 연결합니다.
+
+        마지막 확인 후 MCP_HEALTHCHECK_INTERVAL이 지난 경우에만 ping을 보냅니다.
+
+        Returns:
+            현재 연결의 generation
+        """
+        if self._client is not None and time.time() - self._last_healthy_at < MCP_HEALTHCHECK_INTERVAL:
+            return self.generation
+
+        async with self._lock:
+            if self._client is None:
+                await self._connect()
+                return self.generation
+            try:
+                for session in self._client.sessions.values():
+                    await asyncio.wait_for(session.send_ping(), timeout=MCP_HEALTHCHECK_TIMEOUT)
+                self._last_healthy_at = time.time()
+            except Exception as e:
+                logger.warning("MCP 서버 연결 확인 실패, 재연결합니다: %s", e)
+                await self._disconnect()
+                await self._connect()
+        return self.generation
+
+    async def get_tools(self, refresh: bool = False) -> List:
+        """
+        MCP 서버의 도구 목록을 반환합니다. 설정 해시별로 캐싱됩니다.
+
+        Args:
+            refresh: True이면 서버에 다시 연결하여 도구 목록을 새로 가져옵니다.
+        """
+        if refresh:
+            await self.reconnect()
+        else:
+            await self.ensure_healthy()
+
+        cached = _tools_cache.get(self.config_hash)
+        if cached is not None and cached["generation"] == self.generation:
+            return cached["tools"]
+
+        async with self._lock:
+            if self._client is None:
+                await self._connect()
+            tools = self._client.get_tools()
+            _tools_cache[self.config_hash] = {
+                "tools": tools,
+                "generation": self.generation,
+                "loaded_at": time.time(),
+            }
+        logger.info("MCP 도구 목록 로드: %s개 도구 (설정 해시: %s)", len(tools), self.config_hash)
+        return tools
+
+    async def refresh_tools(self) -> List:
+        """도구 목록을 서버에서 다시 가져옵니다."""
+        return await self.get_tools(refresh=True)
+
+    def get_info(self) -> Dict[str, Any]:
+        """연결 상태와 도구 캐시 정보를 반환합니다."""
+        cached = _tools_cache.get(self.config_hash)
+        return {
+            "config_hash": self.config_hash,
+            "connected": self.connected,
+            "refs": self._refs,
+            "generation": self.generation,
+            "tool_count": len(cached["tools"]) if cached else None,
+            "tools_loaded_at": cached["loaded_at"] if cached else None,
+        }
+
+
+# 설정 해시별 매니저 인스턴스
+_managers: Dict[str, MCPClientManager] = {}
+
+
+def get_mcp_client_manager(config: Optional[Dict[str, Any]] = None) -> MCPClientManager:
+    """
+    서버 설정에 해당하는 MCP 클라이언트 매니저를 반환합니다.
+
+    Args:
+        config: MCP 서버 설정 (없으면 기본 로봇청소기 설정)
+    """
+    config = config if config is not None else mcp_config
+    config_hash = get_config_hash(config)
+    manager = _managers.get(config_hash)
+    if manager is None:
+        manager = MCPClientManager(config)
+        _managers[config_hash] = manager
+        logger.info("MCP 클라이언트 매니저 생성 (설정 해시: %s)", config_hash)
+    return manager
 
-# MCP 클라이언트 초기화
-def init_mcp_client():
-    """MultiServerMCPClient 인스턴스를 초기화하고 반환합니다."""
-    try:
-        logger.info("MCP 클라이언트 초기화 시작")
-        client = MultiServerMCPClient(mcp_config)
-        logger.info("MCP 클라이언트 초기화 성공")
-        return client
-    except Exception as e:
-        logger.error(f"MCP 클라이언트 초기화 실패: {str(e)}")
-        raise
 
 # MCP 도구 가져오기
-def get_mcp_tools():
+async def get_mcp_tools(refresh: bool = False):
     """MCP 서버에서 제공하는 도구를 가져옵니다."""
     try:
         logger.info("MCP 도구 가져오기 시작")
-        client = init_mcp_client()
-        # 모든 MCP 도구를 가져옵니다
-        tools = client.get_tools()
-        logger.info(f"MCP 도구 가져오기 성공: {len(tools)}개 도구 발견")
+        tools = await get_mcp_client_manager().get_tools(refresh=refresh)
+        logger.info("MCP 도구 가져오기 성공: %s개 도구 발견", len(tools))
         return tools
     except Exception as e:
-        logger.error(f"MCP 도구 가져오기 실패: {str(e)}")
+        logger.error("MCP 도구 가져오기 실패: %s", e)
+        logger.error(traceback.format_exc())
         raise
 
 # MCP 서버 연결 정보 가져오기
@@ -58,5 +230,6 @@ def get_connection_info():
     """MCP 서버 연결 정보를 가져옵니다."""
     return {
         "server_url": mcp_server_url,
-        "config": mcp_config
-    } 
\ No newline at end of file
+        "config": mcp_config,
+        "manager": get_mcp_client_manager().get_info(),
+    }
@@ -0,0 +1,242 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from logging_config import setup_logger
+
+# 로거 설정
+logger = setup_logger("metrics")
+
+# 지연 시간 히스토그램 버킷 경계 (초). LLM 호출과 에이전트 실행은 수 초~수십 초까지 걸릴 수 있음
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 요청당 슈퍼바이저 호출 횟수 히스토그램 버킷 경계
+HOP_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 4, 5, 7, 10)
+
+# 지연 시간을 기록할 최상위 그래프 노드
+METRIC_NODES = ("supervisor", "routine_agent", "device_agent", "robot_cleaner_agent")
+
+
+class Histogram:
+    """라벨 조합별로 관측값의 버킷 개수, 합계, 개수를 모으는 Prometheus 히스토그램."""
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        """관측값 하나를 기록합니다."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._series[labels] = series
+            if index < len(self.buckets):
+                series["buckets"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식의 줄 목록을 반환합니다."""
+        with self._lock:
+            series_list = sorted((labels, dict(series, buckets=list(series["buckets"]))) for labels, series in self._series.items())
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for labels, series in series_list:
+            label_text = ",".join(f'{key}="{value}"' for key, value in zip(self.label_names, labels))
+            prefix = f"{label_text}," if label_text else ""
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, series["buckets"]):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series["count"]}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {series['sum']:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {series['count']}")
+        return lines
+
+
+class Counter:
+    """라벨 조합별로 값을 누적하는 Prometheus 카운터."""
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        """카운터를 증가시킵니다."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식의 줄 목록을 반환합니다."""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for labels, value in values:
+            label_text = ",".join(f'{key}="{label}"' for key, label in zip(self.label_names, labels))
+            lines.append(f"{self.name}{{{label_text}}} {value:g}")
+        return lines
+
+
+class AgentMetrics:
+    """에이전트 서버의 그래프, 노드, 도구, LLM 호출 지표 모음."""
+
+    def __init__(self):
+        self.graph_duration = Histogram(
+            "smart_home_graph_duration_seconds", "End-to-end multi-agent graph latency per endpoint.", ("endpoint",))
+        self.node_duration = Histogram(
+            "smart_home_node_duration_seconds", "Top-level graph node latency.", ("node",))
+        self.tool_duration = Histogram(
+            "smart_home_tool_duration_seconds", "Tool call latency, including device HTTP requests.", ("node", "tool"))
+        self.llm_duration = Histogram(
+            "smart_home_llm_duration_seconds", "LLM call latency.", ("node", "model"))
+        self.supervisor_hops = Histogram(
+            "smart_home_supervisor_hops_per_request", "Supervisor node executions per graph run.", ("endpoint",), HOP_BUCKETS)
+        self.requests = Counter(
+            "smart_home_graph_requests_total", "Graph runs per endpoint and result.", ("endpoint", "status"))
+        self.supervisor_hops_total = Counter(
+            "smart_home_supervisor_hops_total", "Total supervisor node executions.", ("endpoint",))
+        self.errors = Counter(
+            "smart_home_errors_total", "Errors raised by graph runs, nodes, tools and LLM calls.", ("component", "name"))
+
+    def render_prometheus(self) -> str:
+        """모든 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+        lines: List[str] = []
+        for metric in (self.graph_duration, self.node_duration, self.tool_duration, self.llm_duration,
+                       self.supervisor_hops, self.requests, self.supervisor_hops_total, self.errors):
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+
+def _top_level_node(metadata: Optional[Dict[str, Any]]) -> str:
+    """실행이 속한 최상위 그래프 노드 이름을 반환합니다. (에이전트 내부 그래프 실행 포함)"""
+    metadata = metadata or {}
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+    if checkpoint_ns:
+        return checkpoint_ns.split("|")[0].split(":")[0]
+    return metadata.get("langgraph_node") or "none"
+
+
+def _run_name(serialized: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> str:
+    """콜백 인자에서 실행 이름을 찾습니다."""
+    return kwargs.get("name") or (serialized or {}).get("name") or "unknown"
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    그래프 실행 한 번의 지연 시간과 오류를 AgentMetrics에 기록하는 콜백 핸들러.
+
+    요청마다 새로 만들어 그래프 호출 설정의 callbacks에 넣습니다.
+    최상위 실행(그래프 전체), 최상위 노드, 도구, LLM 호출의 시작/종료 시각으로 지연 시간을 계산합니다.
+    """
+
+    # 기록만 하므로 스레드 풀을 거치지 않고 이벤트 루프에서 바로 실행
+    run_inline = True
+
+    def __init__(self, endpoint: str, metrics: Optional[AgentMetrics] = None):
+        self.endpoint = endpoint
+        self.metrics = metrics or get_agent_metrics()
+        # run_id -> (종류, 라벨, 시작 시각)
+        self._runs: Dict[UUID, Tuple[str, Tuple[str, ...], float]] = {}
+        self._root_run_id: Optional[UUID] = None
+        self.supervisor_hops = 0
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID, kind: str, labels: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._runs[run_id] = (kind, labels, time.perf_counter())
+
+    def _finish(self, run_id: UUID, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        kind, labels, start_time = run
+        duration = time.perf_counter() - start_time
+
+        if kind == "graph":
+            self.metrics.graph_duration.observe(labels, duration)
+            self.metrics.supervisor_hops.observe(labels, self.supervisor_hops)
+            self.metrics.requests.inc((self.endpoint, "error" if error else "success"))
+        elif kind == "node":
+            self.metrics.node_duration.observe(labels, duration)
+        elif kind == "tool":
+            self.metrics.tool_duration.observe(labels, duration)
+        elif kind == "llm":
+            self.metrics.llm_duration.observe(labels, duration)
+
+        if error is not None:
+            self.metrics.errors.inc((kind, labels[-1]))
+            logger.debug("%s 실행 오류 기록: %s (%s)", kind, labels, type(error).__name__)
+
+    # 그래프와 노드
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        name = _run_name(serialized, kwargs)
+        if parent_run_id is None and self._root_run_id is None:
+            self._root_run_id = run_id
+            self._start(run_id, "graph", (self.endpoint,))
+            return
+        # 최상위 노드만 기록 (같은 이름의 하위 실행은 제외)
+        if name in METRIC_NODES and (metadata or {}).get("langgraph_node") == name and _top_level_node(metadata) == name:
+            parent = self._runs.get(parent_run_id)
+            if parent is not None and parent[0] == "node":
+                return
+            if name == "supervisor":
+                self.supervisor_hops += 1
+                self.metrics.supervisor_hops_total.inc((self.endpoint,))
+            self._start(run_id, "node", (name,))
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._finish(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, error)
+
+    # 도구
+    def on_tool_start(self, serialized, input_str, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        self._start(run_id, "tool", (_top_level_node(metadata), _run_name(serialized, kwargs)))
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._finish(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, error)
+
+    # LLM
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        model = (metadata or {}).get("ls_model_name") or _run_name(serialized, kwargs)
+        self._start(run_id, "llm", (_top_level_node(metadata), model))
+
+    def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        model = (metadata or {}).get("ls_model_name") or _run_name(serialized, kwargs)
+        self._start(run_id, "llm", (_top_level_node(metadata), model))
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._finish(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, error)
+
+
+# 싱글톤 인스턴스
+_agent_metrics_instance = None
+_agent_metrics_lock = threading.Lock()
+
+
+def get_agent_metrics() -> AgentMetrics:
+    """에이전트 서버 지표의 싱글톤 인스턴스를 반환합니다."""
+    global _agent_metrics_instance
+    if _agent_metrics_instance is None:
+        with _agent_metrics_lock:
+            if _agent_metrics_instance is None:
+                _agent_metrics_instance = AgentMetrics()
+    return _agent_metrics_instance
@@ -61,7 +61,7 @@ async def health_check():
 # 냉장고 상태 조회 API
 @app.get("/refrigerator/state")
 async def get_refrigerator_state():
-    logger.info(f"냉장고 상태 조회: {refrigerator_state['power']}")
+    logger.info("냉장고 상태 조회: %s", refrigerator_state['power'])
     return {"state": refrigerator_state["power"]}
 
 # 냉장고 상태 설정 API
@@ -74,14 +74,14 @@ async def set_refrigerator_state(request: Request):
         raise HTTPException(status_code=400, detail="상태는 'on' 또는 'off'로만 설정할 수 있습니다.")
     
     refrigerator_state["power"] = state
-    logger.info(f"냉장고 상태 설정: {state}")
+    logger.info("냉장고 상태 설정: %s", state)
     
     return {"state": state, "message": f"냉장고가 {state}되었습니다."}
 
 # 냉장고 온도 조회 API
 @app.get("/refrigerator/temperature")
 async def get_refrigerator_temperature():
-    logger.info(f"냉장고 온도 조회: {refrigerator_state['temperature']}도")
+    logger.info("냉장고 온도 조회: %s도", refrigerator_state['temperature'])
     return {"temperature": refrigerator_state["temperature"]}
 
 # 냉장고 온도 설정 API
@@ -94,14 +94,14 @@ async def set_refrigerator_temperature(request: Request):
         raise HTTPException(status_code=400, detail="온도는 1~7 사이의 정수로만 설정할 수 있습니다.")
     
     refrigerator_state["temperature"] = temperature
-    logger.info(f"냉장고 온도 설정: {temperature}도")
+    logger.info("냉장고 온도 설정: %s도", temperature)
     
     return {"temperature": temperature, "message": f"냉장고 온도가 {temperature}도로 설정되었습니다."}
 
 # 냉장고 모드 조회 API
 @app.get("/refrigerator/mode")
 async def get_refrigerator_mode():
-    logger.info(f"냉장고 모드 조회: {refrigerator_state['mode']}")
+    logger.info("냉장고 모드 조회: %s", refrigerator_state['mode'])
     return {"mode": refrigerator_state["mode"]}
 
 # 냉장고 모드 설정 API
@@ -115,7 +115,7 @@ async def set_refrigerator_mode(request: Request):
         raise HTTPException(status_code=400, detail=f"모드는 {', '.join(valid_modes)} 중 하나여야 합니다.")
     
     refrigerator_state["mode"] = mode
-    logger.info(f"냉장고 모드 설정: {mode}")
+    logger.info("냉장고 모드 설정: %s", mode)
     
     return {"mode": mode, "message": f"냉장고 모드가 {mode}로 설정되었습니다."}
 
@@ -133,7 +133,7 @@ async def get_refrigerator_mode_list():
 # 냉장고 내 식품 목록 조회 API
 @app.get("/refrigerator/items")
 async def get_refrigerator_items():
-    logger.info(f"냉장고 식품 목록 조회: {refrigerator_state['items']}")
+    logger.info("냉장고 식품 목록 조회: %s", refrigerator_state['items'])
     return {"items": refrigerator_state["items"]}
 
 # 냉장고 식품 추가 API
@@ -146,7 +146,7 @@ async def add_refrigerator_item(request: Request):
         raise HTTPException(status_code=400, detail="추가할 식품 이름을 문자열로 입력해주세요.")
     
     refrigerator_state["items"].append(item)
-    logger.info(f"냉장고 식품 추가: {item}")
+    logger.info("냉장고 식품 추가: %s", item)
     
     return {"items": refrigerator_state["items"], "message": f"{item}이(가) 냉장고에 추가되었습니다."}
 
@@ -161,7 +161,7 @@ async def remove_refrigerator_item(request: Request):
     
     if item in refrigerator_state["items"]:
         refrigerator_state["items"].remove(item)
-        logger.info(f"냉장고 식품 제거: {item}")
+        logger.info("냉장고 식품 제거: %s", item)
         return {"items": refrigerator_state["items"], "message": f"{item}이(가) 냉장고에서 제거되었습니다."}
     else:
         raise HTTPException(status_code=404, detail=f"{item}이(가) 냉장고에 존재하지 않습니다.")
@@ -171,7 +171,7 @@ async def remove_refrigerator_item(request: Request):
 # 에어컨 상태 조회 API
 @app.get("/airconditioner/state")
 async def get_airconditioner_state():
-    logger.info(f"에어컨 상태 조회: {airconditioner_state['power']}")
+    logger.info("에어컨 상태 조회: %s", airconditioner_state['power'])
     return {"state": airconditioner_state["power"]}
 
 # 에어컨 상태 설정 API
@@ -184,14 +184,14 @@ async def set_airconditioner_state(request: Request):
         raise HTTPException(status_code=400, detail="상태는 'on' 또는 'off'로만 설정할 수 있습니다.")
     
     airconditioner_state["power"] = state
-    logger.info(f"에어컨 상태 설정: {state}")
+    logger.info("에어컨 상태 설정: %s", state)
     
     return {"state": state, "message": f"에어컨이 {state}되었습니다."}
 
 # 에어컨 온도 조회 API
 @app.get("/airconditioner/temperature")
 async def get_airconditioner_temperature():
-    logger.info(f"에어컨 온도 조회: {airconditioner_state['temperature']}도")
+    logger.info("에어컨 온도 조회: %s도", airconditioner_state['temperature'])
     return {"temperature": airconditioner_state["temperature"]}
 
 # 에어컨 온도 설정 API
@@ -204,14 +204,14 @@ async def set_airconditioner_temperature(request: Request):
         raise HTTPException(status_code=400, detail="온도는 18~30 사이의 정수로만 설정할 수 있습니다.")
     
     airconditioner_state["temperature"] = temperature
-    logger.info(f"에어컨 온도 설정: {temperature}도")
+    logger.info("에어컨 온도 설정: %s도", temperature)
     
     return {"temperature": temperature, "message": f"에어컨 온도가 {temperature}도로 설정되었습니다."}
 
 # 에어컨 모드 조회 API
 @app.get("/airconditioner/mode")
 async def get_airconditioner_mode():
-    logger.info(f"에어컨 모드 조회: {airconditioner_state['mode']}")
+    logger.info("에어컨 모드 조회: %s", airconditioner_state['mode'])
     return {"mode": airconditioner_state["mode"]}
 
 # 에어컨 모드 설정 API
@@ -225,7 +225,7 @@ async def set_airconditioner_mode(request: Request):
         raise HTTPException(status_code=400, detail=f"모드는 {', '.join(valid_modes)} 중 하나여야 합니다.")
     
     airconditioner_state["mode"] = mode
-    logger.info(f"에어컨 모드 설정: {mode}")
+    logger.info("에어컨 모드 설정: %s", mode)
     
     return {"mode": mode, "message": f"에어컨 모드가 {mode}로 설정되었습니다."}
 
@@ -245,7 +245,7 @@ async def get_airconditioner_mode_list():
 # 에어컨 팬 속도 조회 API
 @app.get("/airconditioner/fan-speed")
 async def get_airconditioner_fan_speed():
-    logger.info(f"에어컨 팬 속도 조회: {airconditioner_state['fan_speed']}")
+    logger.info("에어컨 팬 속도 조회: %s", airconditioner_state['fan_speed'])
     return {"fan_speed": airconditioner_state["fan_speed"]}
 
 # 에어컨 팬 속도 설정 API
@@ -259,7 +259,7 @@ async def set_airconditioner_fan_speed(request: Request):
         raise HTTPException(status_code=400, detail=f"팬 속도는 {', '.join(valid_speeds)} 중 하나여야 합니다.")
     
     airconditioner_state["fan_speed"] = fan_speed
-    logger.info(f"에어컨 팬 속도 설정: {fan_speed}")
+    logger.info("에어컨 팬 속도 설정: %s", fan_speed)
     
     return {"fan_speed": fan_speed, "message": f"에어컨 팬 속도가 {fan_speed}로 설정되었습니다."}
 
@@ -278,7 +278,7 @@ async def get_airconditioner_fan_speed_list():
 # 에어컨 에너지 사용량 조회 API
 @app.get("/airconditioner/energy-usage")
 async def get_airconditioner_energy_usage():
-    logger.info(f"에어컨 에너지 사용량 조회: {airconditioner_state['energy_usage']}kWh")
+    logger.info("에어컨 에너지 사용량 조회: %skWh", airconditioner_state['energy_usage'])
     return {"energy_usage": airconditioner_state["energy_usage"]}
 
 # ------ 로봇청소기 관련 API ------
@@ -286,7 +286,7 @@ async def get_airconditioner_energy_usage():
 # 로봇청소기 상태 조회 API
 @app.get("/robot-cleaner/state")
 async def get_robot_cleaner_state():
-    logger.info(f"로봇청소기 상태 조회: {robot_cleaner_state['state']}")
+    logger.info("로봇청소기 상태 조회: %s", robot_cleaner_state['state'])
     return {"state": robot_cleaner_state["state"]}
 
 # 로봇청소기 상태 설정 API
@@ -299,14 +299,14 @@ async def set_robot_cleaner_state(request: Request):
         raise HTTPException(status_code=400, detail="상태는 'on' 또는 'off'로만 설정할 수 있습니다.")
     
     robot_cleaner_state["state"] = state
-    logger.info(f"로봇청소기 상태 설정: {state}")
+    logger.info("로봇청소기 상태 설정: %s", state)
     
     return {"state": state, "message": f"로봇청소기가 {state}되었습니다."}
 
 # 로봇청소기 모드 조회 API
 @app.get("/robot-cleaner/mode")
 async def get_robot_cleaner_mode():
-    logger.info(f"로봇청소기 모드 조회: {robot_cleaner_state['mode']}")
+    logger.info("로봇청소기 모드 조회: %s", robot_cleaner_state['mode'])
     return {"mode": robot_cleaner_state["mode"]}
 
 # 로봇청소기 모드 설정 API
@@ -320,7 +320,7 @@ async def set_robot_cleaner_mode(request: Request):
         raise HTTPException(status_code=400, detail=f"모드는 {', '.join(valid_modes)} 중 하나여야 합니다.")
     
     robot_cleaner_state["mode"] = mode
-    logger.info(f"로봇청소기 모드 설정: {mode}")
+    logger.info("로봇청소기 모드 설정: %s", mode)
     
     return {"mode": mode, "message": f"로봇청소기 모드가 {mode}로 설정되었습니다."}
 
@@ -341,25 +341,25 @@ async def get_robot_cleaner_mode_list():
 # 로봇청소기 필터 사용량 조회 API
 @app.get("/robot-cleaner/filter")
 async def get_robot_cleaner_filter_usage():
-    logger.info(f"로봇청소기 필터 사용량 조회: {robot_cleaner_state['filter_used']}%")
+    logger.info("로봇청소기 필터 사용량 조회: %s%%", robot_cleaner_state['filter_used'])
     return {"filter_used": robot_cleaner_state['filter_used']}
 
 # 로봇청소기 청소 횟수 조회 API
 @app.get("/robot-cleaner/cleaner-count")
 async def get_robot_cleaner_count():
-    logger.info(f"로봇청소기 청소 횟수 조회: {robot_cleaner_state['cleaner_count']}회")
+    logger.info("로봇청소기 청소 횟수 조회: %s회", robot_cleaner_state['cleaner_count'])
     return {"count": robot_cleaner_state['cleaner_count']}
 
 # 로봇청소기 방범 가능 구역 목록 조회 API
 @app.get("/robot-cleaner/patrol/list")
 async def get_available_patrol_areas():
-    logger.info(f"로봇청소기 방범 가능 구역 목록 조회: {robot_cleaner_state['available_patrol_areas']}")
+    logger.info("로봇청소기 방범 가능 구역 목록 조회: %s", robot_cleaner_state['available_patrol_areas'])
     return {"available_areas": robot_cleaner_state['available_patrol_areas']}
 
 # 로봇청소기 방범 구역 설정 조회 API
 @app.get("/robot-cleaner/patrol/setting")
 async def get_patrol_settings():
-    logger.info(f"로봇청소기 방범 구역 설정 조회: {robot_cleaner_state['patrol_areas']}")
+    logger.info("로봇청소기 방범 구역 설정 조회: %s", robot_cleaner_state['patrol_areas'])
     return {"patrol_areas": robot_cleaner_state['patrol_areas']}
 
 # 로봇청소기 방범 구역 설정 API
@@ -381,7 +381,7 @@ async def set_patrol_areas(request: Request):
     if robot_cleaner_state['state'] == 'on':
         robot_cleaner_state['mode'] = 'patrol'
     
-    logger.info(f"로봇청소기 방범 구역 설정: {valid_areas}")
+    logger.info("로봇청소기 방범 구역 설정: %s", valid_areas)
     
     return {
         "patrol_areas": valid_areas, 
@@ -392,5 +392,5 @@ async def set_patrol_areas(request: Request):
 if __name__ == "__main__":
     # 서버 포트 설정
     port = int(os.environ.get("PORT", 8000))
-    logger.info(f"스마트홈 모의 서버를 {port}번 포트에서 시작합니다...")
+    logger.info("스마트홈 모의 서버를 %s번 포트에서 시작합니다...", port)
     uvicorn.run("mock_server:app", host="0.0.0.0", port=port, reload=True) 
\ No newline at end of file
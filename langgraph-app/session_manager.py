@@ -1,21 +1,70 @@
 import json
 import os
 import time
-from typing import Dict, Any, Optional, List, Protocol
+import asyncio
+from typing import Dict, Any, Optional, List, Protocol, Tuple, Union
 from uuid import uuid4
 import redis
+import redis.asyncio as aioredis
 from abc import ABC, abstractmethod
 from langchain_core.messages import HumanMessage, BaseMessage, AIMessage, SystemMessage
 from dotenv import load_dotenv
 import traceback
 from logging_config import setup_logger
 import pathlib
+import sqlite3
+import threading
+from collections import OrderedDict
 
 # 로거 설정
 logger = setup_logger("session_manager")
 
 load_dotenv()
 
+# 세션별 저장 상태 캐시에 보관할 최대 세션 수
+SESSION_STATE_CACHE_SIZE = int(os.getenv("SESSION_STATE_CACHE_SIZE", "1024"))
+
+class LRUCache:
+    """
+    최근에 사용한 항목을 최대 max_size개까지만 보관하는 딕셔너리 형태의 캐시.
+    
+    가득 차면 가장 오래 사용하지 않은 항목부터 버립니다. 버려진 세션은 다음 업데이트에서
+    저장소를 한 번 다시 읽어 복구하므로, 만료되거나 더 이상 쓰지 않는 세션 때문에 계속 커지지 않습니다.
+    """
+    
+    def __init__(self, max_size: int = SESSION_STATE_CACHE_SIZE):
+        self.max_size = max(1, max_size)
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """항목을 조회하고 가장 최근에 사용한 항목으로 표시합니다."""
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._items
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+    
+    def pop(self, key: str, default: Any = None) -> Any:
+        """항목을 제거하고 반환합니다."""
+        with self._lock:
+            return self._items.pop(key, default)
+
 # 메시지 직렬화/역직렬화 함수
 def serialize_message(message: BaseMessage) -> Dict[str, Any]:
     """메시지 객체를 직렬화합니다."""
@@ -54,8 +103,13 @@ class SessionManager(ABC):
         pass
     
     @abstractmethod
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """세션 ID로 세션 상태를 조회합니다."""
+    def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        세션 ID로 세션 상태를 조회합니다.
+        
+        max_messages를 지정하면 마지막 max_messages개의 메시지만 담고 전체 메시지 수를 message_count로 함께 반환합니다.
+        이 경우 반환된 상태는 조회용이며 update_session에 그대로 넘기면 안 됩니다.
+        """
         pass
     
     @abstractmethod
@@ -72,6 +126,22 @@ class SessionManager(ABC):
     def list_sessions(self) -> Dict[str, Dict[str, Any]]:
         """모든 세션 목록을 반환합니다."""
         pass
+    
+    def list_sessions_page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """
+        세션 목록을 페이지 단위로 반환합니다.
+        
+        Args:
+            cursor: 이전 페이지에서 받은 커서 (처음에는 0)
+            limit: 한 페이지에 가져올 세션 수
+        
+        Returns:
+            sessions(세션 목록)와 next_cursor(다음 페이지 커서, 마지막 페이지면 None)를 담은 딕셔너리
+        """
+        items = list(self.list_sessions().items())
+        page = items[cursor:cursor + limit]
+        next_cursor = cursor + limit if cursor + limit < len(items) else None
+        return {"sessions": dict(page), "next_cursor": next_cursor}
 
 # 메모리 기반 세션 관리자
 class InMemorySessionManager(SessionManager):
@@ -88,32 +158,35 @@ class InMemorySessionManager(SessionManager):
             "messages": [],
             "next": None
         }
-        logger.info(f"새 세션 생성: {session_id}")
+        logger.info("새 세션 생성: %s", session_id)
         return session_id
     
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """세션 ID로 세션 상태를 조회합니다."""
         if session_id in self.sessions:
-            logger.info(f"세션 조회: {session_id}")
-            return self.sessions[session_id]
-        logger.warning(f"존재하지 않는 세션 조회 시도: {session_id}")
+            logger.info("세션 조회: %s", session_id)
+            state = self.sessions[session_id]
+            if max_messages:
+                return {**state, "messages": state["messages"][-max_messages:], "message_count": len(state["messages"])}
+            return state
+        logger.warning("존재하지 않는 세션 조회 시도: %s", session_id)
         return None
     
     def update_session(self, session_id: str, state: Dict[str, Any]) -> None:
         """세션 상태를 업데이트합니다."""
         self.sessions[session_id] = state
         if "messages" in state:
-            logger.info(f"세션 {session_id} 업데이트: 메시지 수 {len(state['messages'])}")
+            logger.info("세션 %s 업데이트: 메시지 수 %s", session_id, len(state['messages']))
         else:
-            logger.info(f"세션 {session_id} 업데이트")
+            logger.info("세션 %s 업데이트", session_id)
     
     def delete_session(self, session_id: str) -> bool:
         """세션을 삭제합니다."""
         if session_id in self.sessions:
             del self.sessions[session_id]
-            logger.info(f"세션 삭제: {session_id}")
+            logger.info("세션 삭제: %s", session_id)
             return True
-        logger.warning(f"존재하지 않는 세션 삭제 시도: {session_id}")
+        logger.warning("존재하지 않는 세션 삭제 시도: %s", session_id)
         return False
     
     def list_sessions(self) -> Dict[str, Dict[str, Any]]:
@@ -124,56 +197,367 @@ class InMemorySessionManager(SessionManager):
             }
             for session_id, state in self.sessions.items()
         }
-        logger.info(f"세션 목록 조회: {len(session_info)}개 세션")
+        logger.info("세션 목록 조회: %s개 세션", len(session_info))
         return session_info
 
+# 파일 시스템 세션 인덱스
+class SessionIndex:
+    """
+    세션 파일 옆에 두는 SQLite 인덱스.
+    
+    세션별 message_count, created_at, updated_at만 저장하여, 세션 목록 조회와 만료 검사 시
+    세션 파일을 열어 메시지를 파싱하지 않도록 합니다.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                message_count INTEGER NOT NULL DEFAULT 0,
+                created_at REAL,
+                updated_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at)")
+    
+    def upsert(self, session_id: str, message_count: int, created_at: Optional[float], updated_at: Optional[float]) -> None:
+        """세션 메타데이터를 추가하거나 갱신합니다."""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO sessions (session_id, message_count, created_at, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    message_count = excluded.message_count,
+                    created_at = COALESCE(sessions.created_at, excluded.created_at),
+                    updated_at = excluded.updated_at
+                """,
+                (session_id, message_count, created_at, updated_at),
+            )
+    
+    def delete(self, session_id: str) -> None:
+        """세션 메타데이터를 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+    
+    def list(self, updated_after: float = 0, limit: int = -1, offset: int = 0) -> List[Dict[str, Any]]:
+        """updated_after 이후 갱신된 세션 메타데이터 목록을 최근 갱신 순으로 반환합니다. (limit -1은 제한 없음)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id, message_count, created_at, updated_at FROM sessions WHERE updated_at > ? ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+                (updated_after, limit, offset),
+            ).fetchall()
+        return [
+            {"session_id": row[0], "message_count": row[1], "created_at": row[2], "updated_at": row[3]}
+            for row in rows
+        ]
+    
+    def expired(self, updated_before: float) -> List[str]:
+        """updated_before 이전에 마지막으로 갱신된 세션 ID 목록을 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id FROM sessions WHERE updated_at <= ?",
+                (updated_before,),
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def count(self) -> int:
+        """인덱스에 등록된 세션 수를 반환합니다."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    
+    def clear(self) -> None:
+        """인덱스를 비웁니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions")
+    
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+# 세션 디렉토리별 공유 자원: 인덱스 연결, 정리 스레드, 이를 사용하는 관리자 수
+# (Streamlit처럼 관리자를 여러 번 만들어도 디렉토리당 하나씩만 사용)
+_shared_stores: Dict[str, Dict[str, Any]] = {}
+_shared_stores_lock = threading.Lock()
+
 # 파일 시스템 기반 세션 관리자
 class FileSystemSessionManager(SessionManager):
-    """파일 시스템 기반 세션 관리자."""
+    """
+    파일 시스템 기반 세션 관리자.
     
-    def __init__(self, session_dir: Optional[str] = None, ttl: int = 86400):
+    세션은 추가 전용 JSONL 파일로 저장됩니다. 첫 줄은 헤더 레코드이고, 이후 메시지마다
+    message 레코드 한 줄, 업데이트마다 meta 레코드 한 줄이 추가됩니다.
+    
+        {"type": "header", "version": 1, "created_at": ...}
+        {"type": "message", "message": {...}}
+        {"type": "meta", "next": ..., "updated_at": ..., "message_count": ..., "summary": ..., "summary_upto": ...}
+    
+    summary/summary_upto는 컨텍스트 관리자가 오래된 턴을 합친 누적 요약과 요약된 메시지 수이며,
+    마지막 meta 레코드의 값을 사용합니다.
+    
+    meta 레코드가 일정 개수 이상 쌓이면 임시 파일에 다시 쓴 뒤 원자적으로 교체(compaction)합니다.
+    
+    세션 목록은 SQLite 인덱스(SessionIndex)에서 조회하며, 만료된 세션은 백그라운드 스레드가
+    주기적으로 정리합니다. 인덱스와 정리 스레드는 같은 세션 디렉토리를 쓰는 관리자 인스턴스끼리
+    프로세스 안에서 공유합니다.
+    """
+    
+    INDEX_FILE_NAME = "_index.sqlite3"
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, session_dir: Optional[str] = None, ttl: int = 86400, compact_every: Optional[int] = None, sweep_interval: Optional[float] = None):
         """
         파일 시스템 기반 세션 관리자를 초기화합니다.
         
         Args:
             session_dir: 세션 파일을 저장할 디렉토리. 없으면 기본 디렉토리를 사용합니다.
             ttl: 세션 유효 시간(초). 이 시간이 지난 세션은 조회 시 자동 삭제됩니다. 기본값은 24시간.
+            compact_every: meta 레코드가 이 개수만큼 쌓이면 파일을 다시 씁니다. 없으면 SESSION_COMPACT_EVERY 환경 변수(기본 50)를 사용합니다.
+            sweep_interval: 만료 세션 정리 주기(초). 없으면 SESSION_SWEEP_INTERVAL 환경 변수(기본 300)를 사용하며, 0이면 정리 스레드를 띄우지 않습니다.
         """
         self.ttl = ttl
         self.session_dir = session_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "session_store")
+        self.compact_every = compact_every or int(os.getenv("SESSION_COMPACT_EVERY", "50"))
+        
+        # 세션별 저장 상태 캐시: 저장된 메시지 수, 마지막 메시지 레코드, 누적 meta 레코드 수, 생성 시각, 마지막 쓰기 후 파일 서명
+        # 최근에 쓴 세션만 SESSION_STATE_CACHE_SIZE개까지 보관 (버려진 세션은 다음 업데이트에서 파일을 다시 읽음)
+        self._file_stats = LRUCache()
+        self._lock = threading.Lock()
         
         # 세션 디렉토리가 없으면 생성
         pathlib.Path(self.session_dir).mkdir(exist_ok=True)
-        logger.info(f"파일 시스템 기반 세션 관리자 초기화됨 (디렉토리: {self.session_dir}, TTL: {self.ttl}초)")
+        
+        self.sweep_interval = sweep_interval if sweep_interval is not None else float(os.getenv("SESSION_SWEEP_INTERVAL", "300"))
+        self._store_key = os.path.abspath(self.session_dir)
+        self._closed = False
+        
+        with _shared_stores_lock:
+            store = _shared_stores.get(self._store_key)
+            if store is None:
+                # 세션 인덱스 초기화 - 비어 있는데 세션 파일이 있으면(이전 버전에서 생성된 세션) 한 번 재구성
+                store = {
+                    "index": SessionIndex(os.path.join(self.session_dir, self.INDEX_FILE_NAME)),
+                    "stop_event": threading.Event(),
+                    "sweeper": None,
+                    "refs": 0,
+                }
+                _shared_stores[self._store_key] = store
+                self.index = store["index"]
+                if self.index.count() == 0 and self._list_session_ids():
+                    self.rebuild_index()
+            store["refs"] += 1
+            self.index = store["index"]
+            self._stop_event = store["stop_event"]
+            
+            # 만료 세션 정리 스레드 시작 (디렉토리당 하나)
+            if store["sweeper"] is None and self.sweep_interval > 0:
+                store["sweeper"] = threading.Thread(target=self._sweep_loop, name="session-sweeper", daemon=True)
+                store["sweeper"].start()
+            self._sweeper: Optional[threading.Thread] = store["sweeper"]
+        
+        logger.info("파일 시스템 기반 세션 관리자 초기화됨 (디렉토리: %s, TTL: %s초, 압축 주기: %s, 정리 주기: %s초)", self.session_dir, self.ttl, self.compact_every, self.sweep_interval)
     
     def _get_file_path(self, session_id: str) -> str:
         """세션 ID에 해당하는 파일 경로를 반환합니다."""
+        return os.path.join(self.session_dir, f"{session_id}.jsonl")
+    
+    def _get_legacy_file_path(self, session_id: str) -> str:
+        """이전 형식(단일 JSON) 세션 파일 경로를 반환합니다."""
         return os.path.join(self.session_dir, f"{session_id}.json")
     
-    def create_session(self) -> str:
-        """새 세션을 생성하고 세션 ID를 반환합니다."""
-        session_id = str(uuid4())
-        state = {
-            "messages": [],
-            "next": None,
-            "created_at": time.time(),
-            "updated_at": time.time()
+    def _list_session_ids(self) -> List[str]:
+        """디렉토리에 있는 세션 파일의 세션 ID 목록을 반환합니다. (.jsonl과 이전 형식 .json 모두 포함)"""
+        return sorted({
+            os.path.splitext(file_name)[0]
+            for file_name in os.listdir(self.session_dir)
+            if file_name.endswith(('.jsonl', '.json'))
+        })
+    
+    def rebuild_index(self) -> int:
+        """세션 파일을 모두 읽어 인덱스를 다시 만듭니다. 재구성된 세션 수를 반환합니다."""
+        self.index.clear()
+        rebuilt = 0
+        for session_id in self._list_session_ids():
+            try:
+                data = self._read_records(session_id)
+                if data is None:
+                    continue
+                self.index.upsert(session_id, len(data["messages"]), data.get("created_at"), data.get("updated_at") or 0)
+                rebuilt += 1
+            except Exception as e:
+                logger.error("세션 파일 %s 인덱싱 실패: %s", session_id, e)
+        logger.info("세션 인덱스 재구성 완료: %s개 세션", rebuilt)
+        return rebuilt
+    
+    def sweep_expired(self) -> int:
+        """TTL이 지난 세션을 삭제합니다. 삭제된 세션 수를 반환합니다."""
+        expired = self.index.expired(time.time() - self.ttl)
+        for session_id in expired:
+            logger.info("세션 %s TTL 만료로 삭제됨", session_id)
+            self.delete_session(session_id)
+        if expired:
+            logger.info("만료 세션 정리 완료: %s개 삭제", len(expired))
+        return len(expired)
+    
+    def _sweep_loop(self) -> None:
+        """정리 주기마다 만료 세션을 삭제하는 백그라운드 루프"""
+        while not self._stop_event.wait(self.sweep_interval):
+            try:
+                self.sweep_expired()
+            except Exception as e:
+                logger.error("만료 세션 정리 실패: %s", e)
+                logger.error(traceback.format_exc())
+    
+    def close(self) -> None:
+        """
+        관리자 사용을 마칩니다. 같은 디렉토리를 쓰는 마지막 관리자가 닫힐 때
+        정리 스레드를 멈추고 인덱스 연결을 닫습니다.
+        """
+        with _shared_stores_lock:
+            if self._closed:
+                return
+            self._closed = True
+            store = _shared_stores[self._store_key]
+            store["refs"] -= 1
+            if store["refs"] > 0:
+                return
+            del _shared_stores[self._store_key]
+        self._stop_event.set()
+        if store["sweeper"] is not None:
+            store["sweeper"].join(timeout=5)
+        self.index.close()
+    
+    @staticmethod
+    def _file_signature(file_path: str) -> Optional[tuple]:
+        """파일의 (inode, 크기, 수정 시각)을 반환합니다. 파일이 없으면 None을 반환합니다."""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    
+    @staticmethod
+    def _dump_record(record: Dict[str, Any]) -> str:
+        """레코드를 JSONL 한 줄로 직렬화합니다."""
+        return json.dumps(record, ensure_ascii=False) + "\n"
+    
+    def _read_records(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        세션 파일을 읽어 직렬화된 상태를 반환합니다. 이전 형식의 JSON 파일도 읽습니다.
+        
+        Returns:
+            messages(직렬화된 메시지 목록), next, created_at, updated_at, summary, summary_upto, meta_records를 담은 딕셔너리
+        """
+        file_path = self._get_file_path(session_id)
+        if os.path.exists(file_path):
+            data = {"messages": [], "next": None, "created_at": None, "updated_at": None, "summary": None, "summary_upto": 0, "meta_records": 0}
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    record_type = record.get("type")
+                    if record_type == "message":
+                        data["messages"].append(record["message"])
+                    elif record_type == "meta":
+                        data["next"] = record.get("next")
+                        data["updated_at"] = record.get("updated_at")
+                        data["summary"] = record.get("summary")
+                        data["summary_upto"] = record.get("summary_upto", 0)
+                        data["meta_records"] += 1
+                    elif record_type == "header":
+                        data["created_at"] = record.get("created_at")
+                        data["updated_at"] = data["updated_at"] or record.get("created_at")
+            return data
+        
+        legacy_path = self._get_legacy_file_path(session_id)
+        if os.path.exists(legacy_path):
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            return {
+                "messages": legacy.get("messages", []),
+                "next": legacy.get("next"),
+                "created_at": legacy.get("created_at"),
+                "updated_at": legacy.get("updated_at", 0),
+                "summary": None,
+                "summary_upto": 0,
+                "meta_records": 0,
+                "legacy": True,
+            }
+        return None
+    
+    def _rewrite(self, session_id: str, serialized_messages: List[Dict[str, Any]], next_node: Any, created_at: float, updated_at: float, summary: Optional[str] = None, summary_upto: int = 0) -> None:
+        """세션 파일 전체를 임시 파일에 쓴 뒤 원자적으로 교체합니다."""
+        file_path = self._get_file_path(session_id)
+        tmp_path = f"{file_path}.tmp"
+        lines = [self._dump_record({"type": "header", "version": self.FORMAT_VERSION, "created_at": created_at})]
+        lines.extend(self._dump_record({"type": "message", "message": msg}) for msg in serialized_messages)
+        lines.append(self._dump_record({
+            "type": "meta",
+            "next": next_node,
+            "updated_at": updated_at,
+            "message_count": len(serialized_messages),
+            "summary": summary,
+            "summary_upto": summary_upto,
+        }))
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("".join(lines))
+        os.replace(tmp_path, file_path)
+        
+        # 이전 형식 파일이 남아 있으면 정리
+        legacy_path = self._get_legacy_file_path(session_id)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+        
+        self._file_stats[session_id] = {
+            "message_count": len(serialized_messages),
+            "last_message": json.dumps(serialized_messages[-1], ensure_ascii=False) if serialized_messages else None,
+            "meta_records": 1,
+            "created_at": created_at,
+            "signature": self._file_signature(file_path),
         }
+        self.index.upsert(session_id, len(serialized_messages), created_at, updated_at)
+    
+    def _get_file_stats(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션의 저장 상태를 반환합니다. 캐시에 없으면 파일을 한 번 읽어 복구합니다."""
+        stats = self._file_stats.get(session_id)
+        if stats is not None:
+            return stats
         
-        # 메시지 직렬화
-        serialized_state = {
-            "messages": [],
-            "next": None,
-            "created_at": state["created_at"],
-            "updated_at": state["updated_at"]
+        # 읽는 도중 다른 쓰기가 끼어들면 다음 업데이트에서 서명이 달라 다시 읽도록 읽기 전에 서명을 구함
+        signature = self._file_signature(self._get_file_path(session_id))
+        data = self._read_records(session_id)
+        if data is None or data.get("legacy"):
+            return None
+        messages = data["messages"]
+        stats = {
+            "message_count": len(messages),
+            "last_message": json.dumps(messages[-1], ensure_ascii=False) if messages else None,
+            "meta_records": data["meta_records"],
+            "created_at": data["created_at"],
+            "signature": signature,
         }
+        self._file_stats[session_id] = stats
+        return stats
+    
+    def create_session(self) -> str:
+        """새 세션을 생성하고 세션 ID를 반환합니다."""
+        session_id = str(uuid4())
+        created_at = time.time()
         
         # 파일에 저장
         try:
             file_path = self._get_file_path(session_id)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(serialized_state, f, ensure_ascii=False, indent=2)
-            logger.info(f"파일 시스템에 새 세션 생성: {session_id} (위치: {file_path})")
+            with self._lock:
+                self._rewrite(session_id, [], None, created_at, created_at)
+            logger.info("파일 시스템에 새 세션 생성: %s (위치: %s)", session_id, file_path)
             return session_id
         except Exception as e:
             error_msg = f"파일 시스템 세션 생성 실패: {str(e)}"
@@ -181,36 +565,37 @@ class FileSystemSessionManager(SessionManager):
             logger.error(traceback.format_exc())
             raise
     
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """세션 ID로 세션 상태를 조회합니다."""
-        file_path = self._get_file_path(session_id)
-        
         try:
-            if not os.path.exists(file_path):
-                logger.warning(f"파일 시스템에서 존재하지 않는 세션 조회 시도: {session_id}")
+            serialized_state = self._read_records(session_id)
+            if serialized_state is None:
+                logger.warning("파일 시스템에서 존재하지 않는 세션 조회 시도: %s", session_id)
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                serialized_state = json.load(f)
-            
             # TTL 체크
             current_time = time.time()
-            if current_time - serialized_state.get("updated_at", 0) > self.ttl:
-                logger.info(f"세션 {session_id} TTL 만료로 삭제됨")
+            if current_time - (serialized_state.get("updated_at") or 0) > self.ttl:
+                logger.info("세션 %s TTL 만료로 삭제됨", session_id)
                 self.delete_session(session_id)
                 return None
             
-            # 메시지 객체로 변환
+            # 메시지 객체로 변환 (max_messages가 있으면 마지막 메시지들만 변환)
+            serialized_messages = serialized_state.get("messages", [])
             state = {
                 "messages": [
-                    deserialize_message(msg) for msg in serialized_state.get("messages", [])
+                    deserialize_message(msg) for msg in (serialized_messages[-max_messages:] if max_messages else serialized_messages)
                 ],
                 "next": serialized_state.get("next"),
                 "created_at": serialized_state.get("created_at"),
-                "updated_at": serialized_state.get("updated_at")
+                "updated_at": serialized_state.get("updated_at"),
+                "summary": serialized_state.get("summary"),
+                "summary_upto": serialized_state.get("summary_upto", 0)
             }
+            if max_messages:
+                state["message_count"] = len(serialized_messages)
             
-            logger.info(f"파일 시스템에서 세션 조회: {session_id} (메시지 수: {len(state['messages'])})")
+            logger.info("파일 시스템에서 세션 조회: %s (메시지 수: %s)", session_id, len(state['messages']))
             return state
         except Exception as e:
             error_msg = f"파일 시스템 세션 조회 실패: {str(e)}"
@@ -219,35 +604,74 @@ class FileSystemSessionManager(SessionManager):
             return None
     
     def update_session(self, session_id: str, state: Dict[str, Any]) -> None:
-        """세션 상태를 업데이트합니다."""
+        """
+        세션 상태를 업데이트합니다.
+        
+        이미 저장된 메시지 뒤에 새로 추가된 메시지만 파일 끝에 덧붙입니다. 저장된 메시지와
+        앞부분이 달라졌거나(대화 초기화 등) meta 레코드가 많이 쌓였으면 파일 전체를 다시 씁니다.
+        """
         try:
-            # 기존 상태에서 타임스탬프 정보 가져오기
-            created_at = time.time()
+            messages = state.get("messages", [])
+            updated_at = time.time()
             file_path = self._get_file_path(session_id)
             
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    old_state = json.load(f)
-                    created_at = old_state.get("created_at", created_at)
-            
-            # 메시지 직렬화
-            serialized_state = {
-                "messages": [
-                    serialize_message(msg) for msg in state.get("messages", [])
-                ],
-                "next": state.get("next"),
-                "created_at": created_at,
-                "updated_at": time.time()
-            }
-            
-            # 파일에 저장
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(serialized_state, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                stats = self._get_file_stats(session_id)
+                
+                # 다른 관리자 인스턴스나 프로세스가 마지막 쓰기 이후 파일을 바꿨으면 캐시를 버리고 파일에서 다시 읽음
+                if stats is not None and stats["signature"] != self._file_signature(file_path):
+                    logger.info("파일 시스템 세션 %s가 외부에서 변경됨, 저장 상태를 다시 읽음", session_id)
+                    self._file_stats.pop(session_id, None)
+                    stats = self._get_file_stats(session_id)
+                
+                # 새 파일, 이전 형식 파일, 또는 저장된 메시지와 앞부분이 달라진 경우 전체 다시 쓰기
+                rewrite = stats is None
+                if not rewrite:
+                    persisted = stats["message_count"]
+                    if len(messages) < persisted:
+                        rewrite = True
+                    elif persisted and json.dumps(serialize_message(messages[persisted - 1]), ensure_ascii=False) != stats["last_message"]:
+                        rewrite = True
+                
+                if rewrite or stats["meta_records"] >= self.compact_every:
+                    created_at = stats["created_at"] if stats else None
+                    if created_at is None:
+                        legacy = self._read_records(session_id)
+                        created_at = (legacy or {}).get("created_at") or updated_at
+                    self._rewrite(
+                        session_id,
+                        [serialize_message(msg) for msg in messages],
+                        state.get("next"),
+                        created_at,
+                        updated_at,
+                        state.get("summary"),
+                        state.get("summary_upto", 0),
+                    )
+                    logger.info("파일 시스템 세션 %s 전체 저장(압축): 메시지 수 %s", session_id, len(messages))
+                    return
+                
+                # 새 메시지와 meta 레코드만 한 번의 쓰기로 추가
+                new_messages = [serialize_message(msg) for msg in messages[stats["message_count"]:]]
+                lines = [self._dump_record({"type": "message", "message": msg}) for msg in new_messages]
+                lines.append(self._dump_record({
+                    "type": "meta",
+                    "next": state.get("next"),
+                    "updated_at": updated_at,
+                    "message_count": len(messages),
+                    "summary": state.get("summary"),
+                    "summary_upto": state.get("summary_upto", 0),
+                }))
+                with open(file_path, 'a', encoding='utf-8') as f:
+                    f.write("".join(lines))
+                
+                if new_messages:
+                    stats["message_count"] = len(messages)
+                    stats["last_message"] = json.dumps(new_messages[-1], ensure_ascii=False)
+                stats["meta_records"] += 1
+                stats["signature"] = self._file_signature(file_path)
+                self.index.upsert(session_id, len(messages), stats["created_at"], updated_at)
             
-            if "messages" in state:
-                logger.info(f"파일 시스템 세션 {session_id} 업데이트: 메시지 수 {len(state['messages'])}")
-            else:
-                logger.info(f"파일 시스템 세션 {session_id} 업데이트")
+            logger.info("파일 시스템 세션 %s 업데이트: 메시지 수 %s (추가 %s개)", session_id, len(messages), len(new_messages))
         except Exception as e:
             error_msg = f"파일 시스템 세션 업데이트 실패: {str(e)}"
             logger.error(error_msg)
@@ -255,57 +679,60 @@ class FileSystemSessionManager(SessionManager):
     
     def delete_session(self, session_id: str) -> bool:
         """세션을 삭제합니다."""
-        file_path = self._get_file_path(session_id)
+        deleted = False
         
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"파일 시스템 세션 삭제: {session_id}")
-                return True
+            with self._lock:
+                self._file_stats.pop(session_id, None)
+                self.index.delete(session_id)
+                for file_path in (self._get_file_path(session_id), self._get_legacy_file_path(session_id)):
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                        deleted = True
+            if deleted:
+                logger.info("파일 시스템 세션 삭제: %s", session_id)
             else:
-                logger.warning(f"파일 시스템에서 존재하지 않는 세션 삭제 시도: {session_id}")
-                return False
+                logger.warning("파일 시스템에서 존재하지 않는 세션 삭제 시도: %s", session_id)
+            return deleted
         except Exception as e:
             error_msg = f"파일 시스템 세션 삭제 실패: {str(e)}"
             logger.error(error_msg)
             logger.error(traceback.format_exc())
             return False
     
-    def list_sessions(self) -> Dict[str, Dict[str, Any]]:
-        """모든 세션 목록을 반환합니다."""
+    def _index_rows_to_sessions(self, rows: List[Dict[str, Any]], current_time: float) -> Dict[str, Dict[str, Any]]:
+        """인덱스 행 목록을 세션 목록 응답 형식으로 변환합니다."""
         result = {}
+        for row in rows:
+            updated_at = row["updated_at"] or 0
+            result[row["session_id"]] = {
+                "message_count": row["message_count"],
+                "created_at": row["created_at"],
+                "updated_at": updated_at,
+                "ttl_remaining": int(self.ttl - (current_time - updated_at))
+            }
+        return result
+    
+    def list_sessions_page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """인덱스에서 최근 갱신 순으로 세션 목록을 페이지 단위로 반환합니다. 커서는 오프셋입니다."""
+        current_time = time.time()
+        rows = self.index.list(updated_after=current_time - self.ttl, limit=limit + 1, offset=cursor)
+        next_cursor = cursor + limit if len(rows) > limit else None
+        return {"sessions": self._index_rows_to_sessions(rows[:limit], current_time), "next_cursor": next_cursor}
+    
+    def list_sessions(self) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 세션 목록을 반환합니다.
+        
+        세션 파일을 열지 않고 인덱스만 조회합니다. 만료된 세션은 결과에서 제외되며,
+        실제 삭제는 백그라운드 정리 스레드가 담당합니다.
+        """
         current_time = time.time()
         
         try:
-            for file_name in os.listdir(self.session_dir):
-                if not file_name.endswith('.json'):
-                    continue
-                
-                session_id = file_name[:-5]  # .json 제거
-                file_path = self._get_file_path(session_id)
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # TTL 체크
-                    updated_at = data.get("updated_at", 0)
-                    if current_time - updated_at > self.ttl:
-                        # TTL이 지난 세션은 삭제
-                        logger.info(f"세션 {session_id} TTL 만료로 삭제됨")
-                        os.remove(file_path)
-                        continue
-                    
-                    result[session_id] = {
-                        "message_count": len(data.get("messages", [])),
-                        "created_at": data.get("created_at"),
-                        "updated_at": updated_at,
-                        "ttl_remaining": int(self.ttl - (current_time - updated_at))
-                    }
-                except Exception as e:
-                    logger.error(f"세션 파일 {file_name} 읽기 실패: {str(e)}")
+            result = self._index_rows_to_sessions(self.index.list(updated_after=current_time - self.ttl), current_time)
             
-            logger.info(f"파일 시스템 세션 목록 조회: {len(result)}개 세션")
+            logger.info("파일 시스템 세션 목록 조회: %s개 세션", len(result))
             return result
         except Exception as e:
             error_msg = f"파일 시스템 세션 목록 조회 실패: {str(e)}"
@@ -313,9 +740,228 @@ class FileSystemSessionManager(SessionManager):
             logger.error(traceback.format_exc())
             return {}
 
+# Redis 세션 키 구성과 명령 구성 (동기/비동기 Redis 세션 관리자가 공유)
+class RedisSessionLayout:
+    """
+    Redis 세션 저장 구조를 정의합니다.
+    
+    메시지는 세션별 Redis 리스트(smarthome:session_messages:<id>)에 한 항목씩 저장하고,
+    next와 메타데이터는 해시(smarthome:session_meta:<id>)에 저장합니다.
+    파이프라인에 명령을 쌓는 부분까지만 담당하며, 실행은 동기/비동기 관리자가 각각 수행합니다.
+    """
+    
+    # 이전 형식(전체 상태 JSON 문자열) 세션 키 접두사
+    prefix = "smarthome:session:"
+    # 세션별 메시지 리스트 키 접두사
+    messages_prefix = "smarthome:session_messages:"
+    # 세션별 메타데이터(message_count, created_at, updated_at, next, summary, summary_upto) 해시 키 접두사
+    meta_prefix = "smarthome:session_meta:"
+    # 세션 목록 조회용 SCAN 패턴 (새 형식 메타데이터 해시와 아직 옮겨지지 않은 이전 형식 키를 함께 찾음)
+    list_pattern = "smarthome:session*"
+    
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        # 세션별로 마지막으로 저장한 메시지 수와 마지막 메시지 (앞부분이 바뀌었는지 확인용)
+        # TTL로 만료된 세션이 남지 않도록 최근에 쓴 세션만 SESSION_STATE_CACHE_SIZE개까지 보관
+        # (버려진 세션은 다음 갱신에서 메타데이터의 message_count를 다시 읽음)
+        self._persisted = LRUCache()
+    
+    def _get_key(self, session_id: str) -> str:
+        """세션 ID로부터 이전 형식의 Redis 키를 생성합니다."""
+        return f"{self.prefix}{session_id}"
+    
+    def _get_messages_key(self, session_id: str) -> str:
+        """세션 ID로부터 메시지 리스트 키를 생성합니다."""
+        return f"{self.messages_prefix}{session_id}"
+    
+    def _get_meta_key(self, session_id: str) -> str:
+        """세션 ID로부터 메타데이터 해시 키를 생성합니다."""
+        return f"{self.meta_prefix}{session_id}"
+    
+    @staticmethod
+    def _encode_next(next_node: Any) -> str:
+        """next 값을 해시 필드에 저장할 문자열로 변환합니다."""
+        return json.dumps(next_node)
+    
+    @staticmethod
+    def _decode_next(value: Optional[bytes]) -> Any:
+        """해시 필드에 저장된 next 값을 복원합니다."""
+        return json.loads(value) if value else None
+    
+    @staticmethod
+    def _summary_fields(state: Dict[str, Any]) -> Dict[str, Any]:
+        """세션 상태의 누적 요약과 요약된 메시지 수를 해시 필드로 변환합니다."""
+        return {"summary": state.get("summary") or "", "summary_upto": state.get("summary_upto", 0)}
+    
+    @staticmethod
+    def _decode_summary(meta: Dict[bytes, bytes]) -> Dict[str, Any]:
+        """해시 필드에 저장된 누적 요약과 요약된 메시지 수를 복원합니다."""
+        summary = meta.get(b"summary")
+        return {
+            "summary": summary.decode("utf-8") if summary else None,
+            "summary_upto": int(meta.get(b"summary_upto", 0)),
+        }
+    
+    def _queue_create(self, pipe, session_id: str) -> None:
+        """새 세션 생성 명령을 쌓습니다. 빈 리스트는 Redis에 존재하지 않으므로 메타데이터 해시만 생성합니다."""
+        now = time.time()
+        pipe.hset(self._get_meta_key(session_id), mapping={
+            "message_count": 0,
+            "created_at": now,
+            "updated_at": now,
+            "next": self._encode_next(None)
+        })
+        pipe.expire(self._get_meta_key(session_id), self.ttl)
+        self._persisted[session_id] = {"message_count": 0, "last_message": None}
+    
+    def _queue_get(self, pipe, session_id: str, max_messages: Optional[int]) -> None:
+        """메시지, 메타데이터 조회와 TTL 갱신 명령을 쌓습니다."""
+        start = -max_messages if max_messages else 0
+        pipe.lrange(self._get_messages_key(session_id), start, -1)
+        pipe.hgetall(self._get_meta_key(session_id))
+        pipe.expire(self._get_messages_key(session_id), self.ttl)
+        pipe.expire(self._get_meta_key(session_id), self.ttl)
+    
+    def _build_state(self, serialized_messages: List[Dict[str, Any]], next_node: Any, message_count: int, max_messages: Optional[int], summary_fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """조회 결과로 세션 상태를 만듭니다."""
+        state = {
+            "messages": [deserialize_message(msg) for msg in serialized_messages],
+            "next": next_node,
+            **(summary_fields or {"summary": None, "summary_upto": 0})
+        }
+        if max_messages:
+            state["message_count"] = message_count
+        return state
+    
+    def _needs_rewrite(self, persisted: Dict[str, Any], messages: List[BaseMessage]) -> bool:
+        """저장된 메시지 뒤에 덧붙일 수 없어 리스트 전체를 다시 써야 하는지 확인합니다."""
+        persisted_count = persisted["message_count"]
+        if persisted_count is None or len(messages) < persisted_count:
+            return True
+        if persisted_count and persisted["last_message"] is not None:
+            return json.dumps(serialize_message(messages[persisted_count - 1])) != persisted["last_message"]
+        return False
+    
+    def _queue_rewrite(self, pipe, session_id: str, messages: List[BaseMessage], next_node: Any, summary_fields: Dict[str, Any]) -> None:
+        """메시지 리스트 전체를 다시 쓰는 명령을 쌓습니다. 이전 형식 키가 있으면 함께 삭제합니다."""
+        now = time.time()
+        serialized_messages = [json.dumps(serialize_message(msg)) for msg in messages]
+        pipe.delete(self._get_messages_key(session_id), self._get_key(session_id))
+        if serialized_messages:
+            pipe.rpush(self._get_messages_key(session_id), *serialized_messages)
+            pipe.expire(self._get_messages_key(session_id), self.ttl)
+        pipe.hset(self._get_meta_key(session_id), mapping={
+            "message_count": len(serialized_messages),
+            "updated_at": now,
+            "next": self._encode_next(next_node),
+            **summary_fields
+        })
+        pipe.hsetnx(self._get_meta_key(session_id), "created_at", now)
+        pipe.expire(self._get_meta_key(session_id), self.ttl)
+    
+    def _queue_append(self, pipe, session_id: str, messages: List[BaseMessage], persisted_count: int, next_node: Any, summary_fields: Dict[str, Any]) -> int:
+        """
+        새 메시지 추가, 메타데이터 갱신, TTL 갱신 명령을 쌓습니다.
+        
+        첫 번째 명령의 응답은 추가 후 리스트 길이이며, 추가된 메시지 수를 반환합니다.
+        """
+        now = time.time()
+        new_messages = [json.dumps(serialize_message(msg)) for msg in messages[persisted_count:]]
+        if new_messages:
+            pipe.rpush(self._get_messages_key(session_id), *new_messages)
+        else:
+            pipe.llen(self._get_messages_key(session_id))
+        pipe.expire(self._get_messages_key(session_id), self.ttl)
+        pipe.hset(self._get_meta_key(session_id), mapping={
+            "message_count": len(messages),
+            "updated_at": now,
+            "next": self._encode_next(next_node),
+            **summary_fields
+        })
+        pipe.hsetnx(self._get_meta_key(session_id), "created_at", now)
+        pipe.expire(self._get_meta_key(session_id), self.ttl)
+        return len(new_messages)
+    
+    def _remember_persisted(self, session_id: str, messages: List[BaseMessage]) -> None:
+        """마지막으로 저장한 메시지 수와 마지막 메시지를 기록합니다."""
+        self._persisted[session_id] = {
+            "message_count": len(messages),
+            "last_message": json.dumps(serialize_message(messages[-1])) if messages else None
+        }
+    
+    def _session_keys(self, session_id: str) -> List[str]:
+        """세션과 관련된 모든 Redis 키를 반환합니다."""
+        return [self._get_messages_key(session_id), self._get_meta_key(session_id), self._get_key(session_id)]
+    
+    def _session_list_keys(self, keys: List[bytes]) -> List[bytes]:
+        """SCAN 결과에서 세션 목록에 쓰는 키(메타데이터 해시, 이전 형식 키)만 남깁니다."""
+        meta_prefix = self.meta_prefix.encode("utf-8")
+        legacy_prefix = self.prefix.encode("utf-8")
+        return [key for key in keys if key.startswith(meta_prefix) or key.startswith(legacy_prefix)]
+    
+    def _queue_fetch_sessions(self, pipe, keys: List[bytes]) -> Tuple[List[bytes], List[bytes]]:
+        """
+        세션 목록 조회 명령을 쌓습니다. 메타데이터 해시는 HGETALL, 이전 형식 키는 GET으로 읽고 각각 TTL을 함께 조회합니다.
+        
+        Returns:
+            (메타데이터 해시 키 목록, 이전 형식 키 목록). 응답도 이 순서로 쌓입니다.
+        """
+        meta_prefix = self.meta_prefix.encode("utf-8")
+        meta_keys = [key for key in keys if key.startswith(meta_prefix)]
+        legacy_keys = [key for key in keys if not key.startswith(meta_prefix)]
+        self._queue_fetch_meta(pipe, meta_keys)
+        for key in legacy_keys:
+            pipe.get(key)
+            pipe.ttl(key)
+        return meta_keys, legacy_keys
+    
+    def _parse_sessions(self, meta_keys: List[bytes], legacy_keys: List[bytes], replies: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """세션 목록 조회 결과를 변환합니다. 두 형식이 모두 있는 세션은 메타데이터 해시를 사용합니다."""
+        meta_replies = replies[:len(meta_keys) * 2]
+        legacy_replies = replies[len(meta_keys) * 2:]
+        result = {}
+        for key, data, ttl in zip(legacy_keys, legacy_replies[0::2], legacy_replies[1::2]):
+            if not data:
+                continue
+            serialized_state = json.loads(data)
+            result[key.decode("utf-8")[len(self.prefix):]] = {
+                "message_count": len(serialized_state.get("messages", [])),
+                "created_at": None,
+                "updated_at": None,
+                "ttl": ttl
+            }
+        result.update(self._parse_meta(meta_keys, meta_replies))
+        return result
+    
+    def _queue_fetch_meta(self, pipe, meta_keys: List[bytes]) -> None:
+        """메타데이터 해시와 TTL 조회 명령을 쌓습니다."""
+        for key in meta_keys:
+            pipe.hgetall(key)
+            pipe.ttl(key)
+    
+    def _parse_meta(self, meta_keys: List[bytes], replies: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """메타데이터 조회 결과를 세션 목록 형식으로 변환합니다."""
+        result = {}
+        for key, meta, ttl in zip(meta_keys, replies[0::2], replies[1::2]):
+            if not meta:
+                continue
+            session_id = key.decode("utf-8")[len(self.meta_prefix):]
+            result[session_id] = {
+                "message_count": int(meta.get(b"message_count", 0)),
+                "created_at": float(meta[b"created_at"]) if b"created_at" in meta else None,
+                "updated_at": float(meta[b"updated_at"]) if b"updated_at" in meta else None,
+                "ttl": ttl
+            }
+        return result
+
 # Redis 기반 세션 관리자
-class RedisSessionManager(SessionManager):
-    """Redis 기반 세션 관리자."""
+class RedisSessionManager(RedisSessionLayout, SessionManager):
+    """
+    Redis 기반 세션 관리자.
+    
+    업데이트할 때는 새 메시지만 RPUSH하고 TTL 갱신까지 한 번의 MULTI 파이프라인으로 처리합니다.
+    이전 형식(smarthome:session:<id> 문자열)의 세션도 읽을 수 있으며, 다음 업데이트 때 새 형식으로 옮겨집니다.
+    """
     
     def __init__(self, redis_url: Optional[str] = None, ttl: int = 86400):
         """
@@ -325,12 +971,11 @@ class RedisSessionManager(SessionManager):
             redis_url: Redis 연결 URL. 없으면 환경 변수에서 가져옵니다.
             ttl: 세션 만료 시간(초). 기본값은 24시간.
         """
+        super().__init__(ttl)
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        self.ttl = ttl
-        self.prefix = "smarthome:session:"
         
         try:
-            logger.info(f"Redis 연결 시도: {self.redis_url}")
+            logger.info("Redis 연결 시도: %s", self.redis_url)
             self.redis_client = redis.from_url(self.redis_url)
             logger.info("Redis 연결 성공")
         except Exception as e:
@@ -339,32 +984,15 @@ class RedisSessionManager(SessionManager):
             logger.error(traceback.format_exc())
             raise
     
-    def _get_key(self, session_id: str) -> str:
-        """세션 ID로부터 Redis 키를 생성합니다."""
-        return f"{self.prefix}{session_id}"
-    
     def create_session(self) -> str:
         """새 세션을 생성하고 세션 ID를 반환합니다."""
         session_id = str(uuid4())
-        state = {
-            "messages": [],
-            "next": None
-        }
         
-        # 메시지 직렬화
-        serialized_state = {
-            "messages": [],
-            "next": None
-        }
-        
-        # Redis에 저장
         try:
-            self.redis_client.set(
-                self._get_key(session_id),
-                json.dumps(serialized_state),
-                ex=self.ttl
-            )
-            logger.info(f"Redis에 새 세션 생성: {session_id} (TTL: {self.ttl}초)")
+            pipe = self.redis_client.pipeline()
+            self._queue_create(pipe, session_id)
+            pipe.execute()
+            logger.info("Redis에 새 세션 생성: %s (TTL: %s초)", session_id, self.ttl)
             return session_id
         except Exception as e:
             error_msg = f"Redis 세션 생성 실패: {str(e)}"
@@ -372,29 +1000,50 @@ class RedisSessionManager(SessionManager):
             logger.error(traceback.format_exc())
             raise
     
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """세션 ID로 세션 상태를 조회합니다."""
+    def _get_legacy_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """이전 형식으로 저장된 세션을 조회합니다."""
+        data = self.redis_client.get(self._get_key(session_id))
+        if not data:
+            return None
+        serialized_state = json.loads(data)
+        self.redis_client.expire(self._get_key(session_id), self.ttl)
+        return {
+            "messages": serialized_state.get("messages", []),
+            "next": serialized_state.get("next")
+        }
+    
+    def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        세션 ID로 세션 상태를 조회합니다.
+        
+        Args:
+            session_id: 세션 ID
+            max_messages: 지정하면 마지막 max_messages개의 메시지만 LRANGE로 가져옵니다.
+                일부만 담긴 상태는 조회용이며, update_session에 그대로 넘기면 안 됩니다.
+        """
         try:
-            data = self.redis_client.get(self._get_key(session_id))
-            if not data:
-                logger.warning(f"Redis에서 존재하지 않는 세션 조회 시도: {session_id}")
-                return None
-            
-            # 역직렬화
-            serialized_state = json.loads(data)
-            
-            # 메시지 객체로 변환
-            state = {
-                "messages": [
-                    deserialize_message(msg) for msg in serialized_state.get("messages", [])
-                ],
-                "next": serialized_state.get("next")
-            }
+            # 메시지, 메타데이터 조회와 TTL 갱신을 한 번의 왕복으로 처리
+            pipe = self.redis_client.pipeline()
+            self._queue_get(pipe, session_id, max_messages)
+            raw_messages, meta, _, _ = pipe.execute()
             
-            # TTL 갱신
-            self.redis_client.expire(self._get_key(session_id), self.ttl)
-            logger.info(f"Redis에서 세션 조회: {session_id} (메시지 수: {len(state['messages'])})")
+            if meta:
+                serialized_messages = [json.loads(item) for item in raw_messages]
+                next_node = self._decode_next(meta.get(b"next"))
+                message_count = int(meta.get(b"message_count", len(serialized_messages)))
+                summary_fields = self._decode_summary(meta)
+            else:
+                legacy = self._get_legacy_session(session_id)
+                if legacy is None:
+                    logger.warning("Redis에서 존재하지 않는 세션 조회 시도: %s", session_id)
+                    return None
+                message_count = len(legacy["messages"])
+                serialized_messages = legacy["messages"][-max_messages:] if max_messages else legacy["messages"]
+                next_node = legacy["next"]
+                summary_fields = None
             
+            state = self._build_state(serialized_messages, next_node, message_count, max_messages, summary_fields)
+            logger.info("Redis에서 세션 조회: %s (메시지 수: %s/%s)", session_id, len(state['messages']), message_count)
             return state
         except Exception as e:
             error_msg = f"Redis 세션 조회 실패: {str(e)}"
@@ -402,29 +1051,50 @@ class RedisSessionManager(SessionManager):
             logger.error(traceback.format_exc())
             return None
     
+    def _rewrite_messages(self, session_id: str, messages: List[BaseMessage], next_node: Any, summary_fields: Dict[str, Any]) -> None:
+        """메시지 리스트 전체를 다시 씁니다."""
+        pipe = self.redis_client.pipeline(transaction=True)
+        self._queue_rewrite(pipe, session_id, messages, next_node, summary_fields)
+        pipe.execute()
+    
     def update_session(self, session_id: str, state: Dict[str, Any]) -> None:
-        """세션 상태를 업데이트합니다."""
+        """
+        세션 상태를 업데이트합니다.
+        
+        마지막으로 저장한 메시지 뒤에 추가된 메시지만 RPUSH합니다. 메시지 앞부분이 달라졌거나
+        다른 프로세스가 같은 세션을 갱신해 리스트 길이가 맞지 않으면 리스트 전체를 다시 씁니다.
+        """
         try:
-            # 메시지 직렬화
-            serialized_state = {
-                "messages": [
-                    serialize_message(msg) for msg in state.get("messages", [])
-                ],
-                "next": state.get("next")
-            }
+            messages = state.get("messages", [])
+            next_node = state.get("next")
+            summary_fields = self._summary_fields(state)
             
-            # Redis에 저장
-            self.redis_client.set(
-                self._get_key(session_id),
-                json.dumps(serialized_state),
-                ex=self.ttl
-            )
+            # 저장된 메시지 수 확인 (처음 갱신하는 세션이면 메타데이터에서 한 번 읽음)
+            persisted = self._persisted.get(session_id)
+            if persisted is None:
+                count = self.redis_client.hget(self._get_meta_key(session_id), "message_count")
+                persisted = {"message_count": int(count) if count is not None else None, "last_message": None}
             
-            if "messages" in state:
-                logger.info(f"Redis 세션 {session_id} 업데이트: 메시지 수 {len(state['messages'])}")
+            if self._needs_rewrite(persisted, messages):
+                self._rewrite_messages(session_id, messages, next_node, summary_fields)
+                logger.info("Redis 세션 %s 전체 저장: 메시지 수 %s", session_id, len(messages))
             else:
-                logger.info(f"Redis 세션 {session_id} 업데이트")
+                # 새 메시지 추가, 메타데이터 갱신, TTL 갱신을 한 번의 MULTI로 처리
+                pipe = self.redis_client.pipeline(transaction=True)
+                appended = self._queue_append(pipe, session_id, messages, persisted["message_count"], next_node, summary_fields)
+                list_length = pipe.execute()[0]
+                
+                # 다른 프로세스가 같은 세션을 갱신한 경우 리스트 길이가 어긋나므로 전체를 다시 씀
+                if list_length != len(messages):
+                    logger.warning("Redis 세션 %s 메시지 수 불일치 (리스트: %s, 상태: %s), 전체 다시 저장", session_id, list_length, len(messages))
+                    self._rewrite_messages(session_id, messages, next_node, summary_fields)
+                else:
+                    logger.info("Redis 세션 %s 업데이트: 메시지 수 %s (추가 %s개)", session_id, len(messages), appended)
+            
+            self._remember_persisted(session_id, messages)
         except Exception as e:
+            # 저장 상태를 알 수 없으므로 다음 갱신 때 메타데이터를 다시 읽도록 함
+            self._persisted.pop(session_id, None)
             error_msg = f"Redis 세션 업데이트 실패: {str(e)}"
             logger.error(error_msg)
             logger.error(traceback.format_exc())
@@ -432,11 +1102,12 @@ class RedisSessionManager(SessionManager):
     def delete_session(self, session_id: str) -> bool:
         """세션을 삭제합니다."""
         try:
-            result = bool(self.redis_client.delete(self._get_key(session_id)))
+            self._persisted.pop(session_id, None)
+            result = bool(self.redis_client.delete(*self._session_keys(session_id)))
             if result:
-                logger.info(f"Redis 세션 삭제: {session_id}")
+                logger.info("Redis 세션 삭제: %s", session_id)
             else:
-                logger.warning(f"Redis에서 존재하지 않는 세션 삭제 시도: {session_id}")
+                logger.warning("Redis에서 존재하지 않는 세션 삭제 시도: %s", session_id)
             return result
         except Exception as e:
             error_msg = f"Redis 세션 삭제 실패: {str(e)}"
@@ -444,55 +1115,389 @@ class RedisSessionManager(SessionManager):
             logger.error(traceback.format_exc())
             return False
     
+    def _fetch_sessions(self, keys: List[bytes]) -> Dict[str, Dict[str, Any]]:
+        """세션 목록 키(메타데이터 해시, 이전 형식 키)의 내용과 TTL을 파이프라인 한 번으로 가져옵니다."""
+        if not keys:
+            return {}
+        pipe = self.redis_client.pipeline()
+        meta_keys, legacy_keys = self._queue_fetch_sessions(pipe, keys)
+        return self._parse_sessions(meta_keys, legacy_keys, pipe.execute())
+    
+    def list_sessions_page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """
+        SCAN 커서를 사용하여 세션 목록을 페이지 단위로 반환합니다.
+        
+        SCAN 특성상 한 페이지의 세션 수는 limit보다 조금 많을 수 있으며, 커서가 0으로 돌아오면 마지막 페이지입니다.
+        이전 형식으로 저장된 세션도 함께 조회합니다.
+        """
+        try:
+            session_keys: List[bytes] = []
+            while True:
+                cursor, keys = self.redis_client.scan(cursor=cursor, match=self.list_pattern, count=limit)
+                session_keys.extend(self._session_list_keys(keys))
+                if cursor == 0 or len(session_keys) >= limit:
+                    break
+            
+            sessions = self._fetch_sessions(session_keys)
+            logger.info("Redis 세션 목록 페이지 조회: %s개 세션 (다음 커서: %s)", len(sessions), cursor)
+            return {"sessions": sessions, "next_cursor": cursor or None}
+        except Exception as e:
+            error_msg = f"Redis 세션 목록 페이지 조회 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return {"sessions": {}, "next_cursor": None}
+    
     def list_sessions(self) -> Dict[str, Dict[str, Any]]:
-        """모든 세션 목록을 반환합니다."""
+        """
+        모든 세션 목록을 반환합니다. KEYS 대신 SCAN으로 나누어 조회하여 Redis를 막지 않습니다.
+        이전 형식으로 저장된 세션도 함께 조회합니다.
+        """
         try:
-            keys = self.redis_client.keys(f"{self.prefix}*")
             result = {}
+            for key_batch in self._scan_batches(self.list_pattern):
+                result.update(self._fetch_sessions(self._session_list_keys(key_batch)))
             
-            for key in keys:
-                session_id = key.decode("utf-8").replace(self.prefix, "")
-                data = self.redis_client.get(key)
-                if data:
-                    serialized_state = json.loads(data)
-                    result[session_id] = {
-                        "message_count": len(serialized_state.get("messages", [])),
-                        "ttl": self.redis_client.ttl(key)
-                    }
+            logger.info("Redis 세션 목록 조회: %s개 세션", len(result))
+            return result
+        except Exception as e:
+            error_msg = f"Redis 세션 목록 조회 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return {}
+    
+    def _scan_batches(self, pattern: str, count: int = 500):
+        """SCAN 결과를 배치 단위로 반환하는 제너레이터"""
+        cursor = 0
+        while True:
+            cursor, keys = self.redis_client.scan(cursor=cursor, match=pattern, count=count)
+            if keys:
+                yield keys
+            if cursor == 0:
+                break
+
+# 비동기 세션 관리자 인터페이스
+class AsyncSessionManager(ABC):
+    """
+    대화 세션을 관리하는 비동기 추상 클래스.
+    
+    FastAPI 핸들러처럼 이벤트 루프 위에서 실행되는 코드가 세션 저장 I/O로 루프를 막지 않도록 합니다.
+    메서드 의미와 반환 형식은 SessionManager와 같습니다.
+    """
+    
+    @abstractmethod
+    async def create_session(self) -> str:
+        """새 세션을 생성하고 세션 ID를 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """세션 ID로 세션 상태를 조회합니다."""
+        pass
+    
+    @abstractmethod
+    async def update_session(self, session_id: str, state: Dict[str, Any]) -> None:
+        """세션 상태를 업데이트합니다."""
+        pass
+    
+    @abstractmethod
+    async def delete_session(self, session_id: str) -> bool:
+        """세션을 삭제합니다."""
+        pass
+    
+    @abstractmethod
+    async def list_sessions(self) -> Dict[str, Dict[str, Any]]:
+        """모든 세션 목록을 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def list_sessions_page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """세션 목록을 페이지 단위로 반환합니다."""
+        pass
+    
+    async def close(self) -> None:
+        """저장소 연결 등 세션 관리자가 사용하는 자원을 정리합니다."""
+        pass
+
+# 메모리 기반 비동기 세션 관리자
+class AsyncInMemorySessionManager(AsyncSessionManager):
+    """메모리 기반 비동기 세션 관리자. I/O가 없으므로 메모리 기반 관리자를 그대로 호출합니다."""
+    
+    def __init__(self):
+        self._manager = InMemorySessionManager()
+    
+    async def create_session(self) -> str:
+        return self._manager.create_session()
+    
+    async def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        return self._manager.get_session(session_id, max_messages=max_messages)
+    
+    async def update_session(self, session_id: str, state: Dict[str, Any]) -> None:
+        self._manager.update_session(session_id, state)
+    
+    async def delete_session(self, session_id: str) -> bool:
+        return self._manager.delete_session(session_id)
+    
+    async def list_sessions(self) -> Dict[str, Dict[str, Any]]:
+        return self._manager.list_sessions()
+    
+    async def list_sessions_page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        return self._manager.list_sessions_page(cursor=cursor, limit=limit)
+
+# 파일 시스템 기반 비동기 세션 관리자
+class AsyncFileSystemSessionManager(AsyncSessionManager):
+    """
+    파일 시스템 기반 비동기 세션 관리자.
+    
+    파일 추가 쓰기, 압축 시 원자적 교체, SQLite 인덱스 갱신을 하나의 작업으로 묶어
+    작업 스레드에서 실행합니다. 이벤트 루프는 파일 I/O 동안 다른 요청을 처리합니다.
+    """
+    
+    def __init__(self, session_dir: Optional[str] = None, ttl: int = 86400):
+        self._manager = FileSystemSessionManager(session_dir, ttl)
+    
+    async def create_session(self) -> str:
+        return await asyncio.to_thread(self._manager.create_session)
+    
+    async def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._manager.get_session, session_id, max_messages)
+    
+    async def update_session(self, session_id: str, state: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._manager.update_session, session_id, state)
+    
+    async def delete_session(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self._manager.delete_session, session_id)
+    
+    async def list_sessions(self) -> Dict[str, Dict[str, Any]]:
+        return await asyncio.to_thread(self._manager.list_sessions)
+    
+    async def list_sessions_page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._manager.list_sessions_page, cursor, limit)
+    
+    async def close(self) -> None:
+        """만료 세션 정리 스레드와 인덱스 연결을 닫습니다."""
+        await asyncio.to_thread(self._manager.close)
+
+# Redis 기반 비동기 세션 관리자
+class AsyncRedisSessionManager(RedisSessionLayout, AsyncSessionManager):
+    """Redis 기반 비동기 세션 관리자. redis.asyncio 클라이언트를 사용하며 저장 구조는 RedisSessionManager와 같습니다."""
+    
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 86400):
+        """
+        Redis 비동기 클라이언트를 초기화합니다. 실제 연결은 첫 명령 실행 시 맺어집니다.
+        
+        Args:
+            redis_url: Redis 연결 URL. 없으면 환경 변수에서 가져옵니다.
+            ttl: 세션 만료 시간(초). 기본값은 24시간.
+        """
+        super().__init__(ttl)
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        
+        try:
+            logger.info("Redis 비동기 클라이언트 생성: %s", self.redis_url)
+            self.redis_client = aioredis.from_url(self.redis_url)
+        except Exception as e:
+            error_msg = f"Redis 비동기 클라이언트 생성 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            raise
+    
+    async def create_session(self) -> str:
+        """새 세션을 생성하고 세션 ID를 반환합니다."""
+        session_id = str(uuid4())
+        
+        try:
+            pipe = self.redis_client.pipeline()
+            self._queue_create(pipe, session_id)
+            await pipe.execute()
+            logger.info("Redis에 새 세션 생성: %s (TTL: %s초)", session_id, self.ttl)
+            return session_id
+        except Exception as e:
+            error_msg = f"Redis 세션 생성 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            raise
+    
+    async def _get_legacy_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """이전 형식으로 저장된 세션을 조회합니다."""
+        data = await self.redis_client.get(self._get_key(session_id))
+        if not data:
+            return None
+        serialized_state = json.loads(data)
+        await self.redis_client.expire(self._get_key(session_id), self.ttl)
+        return {
+            "messages": serialized_state.get("messages", []),
+            "next": serialized_state.get("next")
+        }
+    
+    async def get_session(self, session_id: str, max_messages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """세션 ID로 세션 상태를 조회합니다. max_messages의 의미는 RedisSessionManager.get_session과 같습니다."""
+        try:
+            pipe = self.redis_client.pipeline()
+            self._queue_get(pipe, session_id, max_messages)
+            raw_messages, meta, _, _ = await pipe.execute()
+            
+            if meta:
+                serialized_messages = [json.loads(item) for item in raw_messages]
+                next_node = self._decode_next(meta.get(b"next"))
+                message_count = int(meta.get(b"message_count", len(serialized_messages)))
+                summary_fields = self._decode_summary(meta)
+            else:
+                legacy = await self._get_legacy_session(session_id)
+                if legacy is None:
+                    logger.warning("Redis에서 존재하지 않는 세션 조회 시도: %s", session_id)
+                    return None
+                message_count = len(legacy["messages"])
+                serialized_messages = legacy["messages"][-max_messages:] if max_messages else legacy["messages"]
+                next_node = legacy["next"]
+                summary_fields = None
+            
+            state = self._build_state(serialized_messages, next_node, message_count, max_messages, summary_fields)
+            logger.info("Redis에서 세션 조회: %s (메시지 수: %s/%s)", session_id, len(state['messages']), message_count)
+            return state
+        except Exception as e:
+            error_msg = f"Redis 세션 조회 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return None
+    
+    async def _rewrite_messages(self, session_id: str, messages: List[BaseMessage], next_node: Any, summary_fields: Dict[str, Any]) -> None:
+        """메시지 리스트 전체를 다시 씁니다."""
+        pipe = self.redis_client.pipeline(transaction=True)
+        self._queue_rewrite(pipe, session_id, messages, next_node, summary_fields)
+        await pipe.execute()
+    
+    async def update_session(self, session_id: str, state: Dict[str, Any]) -> None:
+        """세션 상태를 업데이트합니다. 동작은 RedisSessionManager.update_session과 같습니다."""
+        try:
+            messages = state.get("messages", [])
+            next_node = state.get("next")
+            summary_fields = self._summary_fields(state)
+            
+            persisted = self._persisted.get(session_id)
+            if persisted is None:
+                count = await self.redis_client.hget(self._get_meta_key(session_id), "message_count")
+                persisted = {"message_count": int(count) if count is not None else None, "last_message": None}
+            
+            if self._needs_rewrite(persisted, messages):
+                await self._rewrite_messages(session_id, messages, next_node, summary_fields)
+                logger.info("Redis 세션 %s 전체 저장: 메시지 수 %s", session_id, len(messages))
+            else:
+                pipe = self.redis_client.pipeline(transaction=True)
+                appended = self._queue_append(pipe, session_id, messages, persisted["message_count"], next_node, summary_fields)
+                list_length = (await pipe.execute())[0]
+                
+                if list_length != len(messages):
+                    logger.warning("Redis 세션 %s 메시지 수 불일치 (리스트: %s, 상태: %s), 전체 다시 저장", session_id, list_length, len(messages))
+                    await self._rewrite_messages(session_id, messages, next_node, summary_fields)
+                else:
+                    logger.info("Redis 세션 %s 업데이트: 메시지 수 %s (추가 %s개)", session_id, len(messages), appended)
+            
+            self._remember_persisted(session_id, messages)
+        except Exception as e:
+            self._persisted.pop(session_id, None)
+            error_msg = f"Redis 세션 업데이트 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+    
+    async def delete_session(self, session_id: str) -> bool:
+        """세션을 삭제합니다."""
+        try:
+            self._persisted.pop(session_id, None)
+            result = bool(await self.redis_client.delete(*self._session_keys(session_id)))
+            if result:
+                logger.info("Redis 세션 삭제: %s", session_id)
+            else:
+                logger.warning("Redis에서 존재하지 않는 세션 삭제 시도: %s", session_id)
+            return result
+        except Exception as e:
+            error_msg = f"Redis 세션 삭제 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return False
+    
+    async def _fetch_sessions(self, keys: List[bytes]) -> Dict[str, Dict[str, Any]]:
+        """세션 목록 키(메타데이터 해시, 이전 형식 키)의 내용과 TTL을 파이프라인 한 번으로 가져옵니다."""
+        if not keys:
+            return {}
+        pipe = self.redis_client.pipeline()
+        meta_keys, legacy_keys = self._queue_fetch_sessions(pipe, keys)
+        return self._parse_sessions(meta_keys, legacy_keys, await pipe.execute())
+    
+    async def list_sessions_page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """SCAN 커서를 사용하여 세션 목록을 페이지 단위로 반환합니다. 이전 형식으로 저장된 세션도 함께 조회합니다."""
+        try:
+            session_keys: List[bytes] = []
+            while True:
+                cursor, keys = await self.redis_client.scan(cursor=cursor, match=self.list_pattern, count=limit)
+                session_keys.extend(self._session_list_keys(keys))
+                if cursor == 0 or len(session_keys) >= limit:
+                    break
             
-            logger.info(f"Redis 세션 목록 조회: {len(result)}개 세션")
+            sessions = await self._fetch_sessions(session_keys)
+            logger.info("Redis 세션 목록 페이지 조회: %s개 세션 (다음 커서: %s)", len(sessions), cursor)
+            return {"sessions": sessions, "next_cursor": cursor or None}
+        except Exception as e:
+            error_msg = f"Redis 세션 목록 페이지 조회 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return {"sessions": {}, "next_cursor": None}
+    
+    async def list_sessions(self) -> Dict[str, Dict[str, Any]]:
+        """모든 세션 목록을 반환합니다. 이전 형식으로 저장된 세션도 함께 조회합니다."""
+        try:
+            result = {}
+            cursor = 0
+            while True:
+                cursor, keys = await self.redis_client.scan(cursor=cursor, match=self.list_pattern, count=500)
+                result.update(await self._fetch_sessions(self._session_list_keys(keys)))
+                if cursor == 0:
+                    break
+            
+            logger.info("Redis 세션 목록 조회: %s개 세션", len(result))
             return result
         except Exception as e:
             error_msg = f"Redis 세션 목록 조회 실패: {str(e)}"
             logger.error(error_msg)
             logger.error(traceback.format_exc())
             return {}
+    
+    async def close(self) -> None:
+        """Redis 연결을 닫습니다."""
+        await self.redis_client.aclose()
 
 # 세션 관리자 팩토리
-def create_session_manager() -> SessionManager:
+def create_session_manager(use_async: bool = False) -> Union[SessionManager, AsyncSessionManager]:
     """
     설정에 따라 적절한 세션 관리자를 생성합니다.
     REDIS_URL 환경 변수가 설정되어 있으면 Redis 기반 관리자를,
     USE_FILE_SESSION 환경 변수가 설정되어 있으면 파일 시스템 기반 관리자를,
     그렇지 않으면 메모리 기반 관리자를 반환합니다.
+    
+    Args:
+        use_async: True이면 AsyncSessionManager 구현을 반환합니다.
     """
     redis_url = os.getenv("REDIS_URL")
     use_file_session = os.getenv("USE_FILE_SESSION", "true").lower() in ("true", "1", "yes")
     
+    if use_async:
+        file_manager_cls, memory_manager_cls, redis_manager_cls = AsyncFileSystemSessionManager, AsyncInMemorySessionManager, AsyncRedisSessionManager
+    else:
+        file_manager_cls, memory_manager_cls, redis_manager_cls = FileSystemSessionManager, InMemorySessionManager, RedisSessionManager
+    
     if redis_url:
-        logger.info(f"Redis 기반 세션 관리자 사용: {redis_url}")
+        logger.info("Redis 기반 세션 관리자 사용: %s (비동기: %s)", redis_url, use_async)
         try:
-            return RedisSessionManager(redis_url)
+            return redis_manager_cls(redis_url)
         except Exception as e:
-            logger.error(f"Redis 세션 관리자 생성 실패, 파일 시스템 세션 관리자로 대체: {str(e)}")
+            logger.error("Redis 세션 관리자 생성 실패, 파일 시스템 세션 관리자로 대체: %s", e)
             if use_file_session:
-                return FileSystemSessionManager()
-            return InMemorySessionManager()
+                return file_manager_cls()
+            return memory_manager_cls()
     
     if use_file_session:
         session_dir = os.getenv("SESSION_STORE_DIR")
-        logger.info(f"파일 시스템 기반 세션 관리자 사용 (디렉토리: {session_dir or '기본 디렉토리'})")
-        return FileSystemSessionManager(session_dir)
+        logger.info("파일 시스템 기반 세션 관리자 사용 (디렉토리: %s, 비동기: %s)", session_dir or '기본 디렉토리', use_async)
+        return file_manager_cls(session_dir)
     
-    logger.info("메모리 기반 세션 관리자 사용")
-    return InMemorySessionManager() 
\ No newline at end of file
+    logger.info("메모리 기반 세션 관리자 사용 (비동기: %s)", use_async)
+    return memory_manager_cls()
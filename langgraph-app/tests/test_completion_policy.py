@@ -0,0 +1,98 @@
+"""
+완료 정책 테스트
+
+사용법:
+    cd langgraph-app
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import HumanMessage
+from langgraph.graph import END
+
+from graph import supervisor
+from graph.completion_policy import CompletionPolicy
+from graph.fast_router import DEFAULT_RULES, FastRouter
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    policy = CompletionPolicy(FastRouter(DEFAULT_RULES, enabled=True), enabled=True)
+    monkeypatch.setattr(supervisor, "get_completion_policy", lambda: policy)
+    return policy
+
+
+def reply_state(query: str, reply: str, agent: str = "device_agent", avoided: int = 0):
+    return {
+        "messages": [HumanMessage(content=query), HumanMessage(content=reply, name=agent)],
+        "next": None,
+        "supervisor_calls_avoided": avoided,
+    }
+
+
+def test_completion_check_ends_single_intent_request(policy):
+    update = supervisor.completion_check_node(reply_state("에어컨 켜줘", "에어컨을 켰습니다.", avoided=2))
+    assert update == {"next": END, "supervisor_calls_avoided": 3}
+    assert policy.get_stats()["finished"] == 1
+
+
+def test_completion_check_returns_unclassified_request_to_supervisor(policy):
+    update = supervisor.completion_check_node(reply_state("오늘 저녁 준비 좀 부탁해", "저녁 준비를 도와드렸습니다."))
+    assert update == {"next": "supervisor"}
+    assert policy.get_stats()["reasons"] == {"unclassified_intent": 1}
+
+
+def test_completion_check_returns_multi_intent_request_to_supervisor(policy):
+    update = supervisor.completion_check_node(reply_state("에어컨 켜고 로봇청소기 청소 시작해줘", "에어컨을 켰습니다."))
+    assert update == {"next": "supervisor"}
+    assert policy.get_stats()["reasons"] == {"multi_intent": 1}
+
+
+def test_route_after_agent():
+    assert supervisor.route_after_agent({"messages": []}) == "completion_check"
+    assert supervisor.route_after_agent({"messages": [], "parallel_replies": [HumanMessage(content="완료")]}) == "merge_replies"
+
+
+def run_graph(monkeypatch, query: str):
+    """슈퍼바이저와 가전제품 에이전트를 가짜 노드로 바꾼 그래프를 실행합니다."""
+    supervisor_calls = []
+
+    async def fake_supervisor_node(state, config):
+        supervisor_calls.append(state["messages"][-1].content)
+        # 에이전트 응답을 받은 뒤에는 종료, 새 요청이면 가전제품 에이전트로 라우팅
+        if state["messages"][-1].name == "device_agent":
+            return {"next": END}
+        return {"next": "device_agent"}
+
+    async def fake_device_agent_node(state, config):
+        reply = HumanMessage(content="요청을 처리했습니다.", name="device_agent")
+        return {"messages": list(state["messages"]) + [reply]}
+
+    monkeypatch.setattr(supervisor, "supervisor_node", fake_supervisor_node)
+    monkeypatch.setattr(supervisor, "device_agent_node", fake_device_agent_node)
+    graph = supervisor.create_smart_home_graph()
+    result = asyncio.run(graph.ainvoke({
+        "messages": [HumanMessage(content=query)],
+        "next": None,
+        "supervisor_calls_avoided": 0,
+    }))
+    return result, supervisor_calls
+
+
+def test_graph_skips_supervisor_after_single_intent_reply(policy, monkeypatch):
+    result, supervisor_calls = run_graph(monkeypatch, "에어컨 켜줘")
+    assert len(supervisor_calls) == 1
+    assert result["supervisor_calls_avoided"] == 1
+    assert result["messages"][-1].name == "device_agent"
+
+
+def test_graph_calls_supervisor_again_for_unclassified_request(policy, monkeypatch):
+    result, supervisor_calls = run_graph(monkeypatch, "오늘 저녁 준비 좀 부탁해")
+    assert len(supervisor_calls) == 2
+    assert result["supervisor_calls_avoided"] == 0
@@ -0,0 +1,58 @@
+"""
+빠른 경로 라우터 절 분리 테스트
+
+사용법:
+    cd langgraph-app
+    python -m pytest tests
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graph.fast_router import DEFAULT_RULES, FastRouter, load_clause_connectives, load_rules
+
+
+@pytest.fixture
+def router():
+    return FastRouter(DEFAULT_RULES, enabled=True)
+
+
+@pytest.mark.parametrize("query", [
+    "냉장고 재고 확인해줘",
+    "우리집 차고 문 열어줘",
+    "공기 좋고 조용한 모드로",
+])
+def test_nouns_and_adjectives_ending_in_go_are_not_split(router, query):
+    assert router.split_clauses(query) == [query]
+
+
+def test_listed_verb_forms_split_clauses(router):
+    assert router.split_clauses("에어컨 켜고 로봇청소기 돌려줘") == ["에어컨 켜고", "로봇청소기 돌려줘"]
+    assert router.split_targets("에어컨 켜고 로봇청소기 돌려줘") == ["device_agent", "robot_cleaner_agent"]
+
+
+def test_explicit_connectors_split_clauses(router):
+    assert router.split_clauses("에어컨 꺼줘, 그리고 청소기 멈춰") == ["에어컨 꺼줘", "청소기 멈춰"]
+    assert router.split_clauses("에어컨 및 냉장고 상태") == ["에어컨", "냉장고 상태"]
+
+
+def test_custom_clause_connectives(router):
+    custom = FastRouter(DEFAULT_RULES, enabled=True, clause_connectives=["열고"])
+    assert custom.split_clauses("창문 열고 에어컨 꺼줘") == ["창문 열고", "에어컨 꺼줘"]
+    assert custom.split_clauses("에어컨 켜고 로봇청소기 돌려줘") == ["에어컨 켜고 로봇청소기 돌려줘"]
+
+
+def test_rules_file_with_clause_connectives(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"rules": DEFAULT_RULES[:1], "clause_connectives": ["열고"]}), encoding="utf-8")
+    assert load_rules(str(path)) == DEFAULT_RULES[:1]
+    assert load_clause_connectives(str(path)) == ["열고"]
+
+    # 규칙 목록만 담은 이전 형식은 기본 연결형 동사를 사용
+    path.write_text(json.dumps(DEFAULT_RULES[:1]), encoding="utf-8")
+    assert load_rules(str(path)) == DEFAULT_RULES[:1]
+    assert "켜고" in load_clause_connectives(str(path))
@@ -0,0 +1,92 @@
+"""
+공유 HTTP 클라이언트와 기능 정보 비동기 로더 테스트
+
+사용법:
+    cd langgraph-app
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools import device_tools, http_client
+from tools.capability_cache import CapabilityCache
+
+
+@pytest.fixture
+def mock_server(monkeypatch):
+    """비동기 클라이언트가 실제 서버 대신 경로별 응답 목록을 돌려주도록 합니다."""
+    requests_seen = []
+    responses = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request.url.path)
+        queue = responses[request.url.path]
+        status_code, body = queue.pop(0) if len(queue) > 1 else queue[0]
+        return httpx.Response(status_code, json=body)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        http_client.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(http_client, "HTTP_BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(http_client, "_async_client_instance", None)
+    monkeypatch.setattr(http_client, "_async_client_loop", None)
+    monkeypatch.setattr(device_tools, "MOCK_SERVER_URL", "http://mock")
+    return responses, requests_seen
+
+
+def test_async_client_is_created_per_event_loop(mock_server):
+    async def get_client():
+        first = http_client.get_async_http_client()
+        assert http_client.get_async_http_client() is first
+        return first
+
+    assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+
+def test_async_get_retries_transient_server_errors(mock_server):
+    responses, requests_seen = mock_server
+    responses["/flaky"] = [(503, {}), (200, {"ok": True})]
+
+    async def main():
+        response = await http_client.async_http_get("http://mock/flaky")
+        await http_client.close_http_clients()
+        return response
+
+    response = asyncio.run(main())
+    assert response.status_code == 200
+    assert requests_seen == ["/flaky", "/flaky"]
+
+
+def test_async_post_is_not_retried(mock_server):
+    responses, requests_seen = mock_server
+    responses["/write"] = [(503, {}), (200, {"ok": True})]
+
+    response = asyncio.run(http_client.async_http_post("http://mock/write", json={}))
+    assert response.status_code == 503
+    assert requests_seen == ["/write"]
+
+
+def test_aget_capability_prompt_loads_once_through_cache(mock_server, monkeypatch):
+    responses, requests_seen = mock_server
+    responses["/robot-cleaner/mode/list"] = [(200, {"modes": ["일반", "강력"]})]
+    responses["/robot-cleaner/patrol/list"] = [(500, {"detail": "error"})]
+    cache = CapabilityCache(ttl=60, enabled=True)
+    monkeypatch.setattr(device_tools, "get_capability_cache", lambda: cache)
+
+    keys = ["robot_cleaner.modes", "robot_cleaner.patrol_areas"]
+    prompt = asyncio.run(device_tools.aget_capability_prompt(keys))
+    assert "로봇청소기 모드: 일반, 강력" in prompt
+    assert "로봇청소기 방범 가능 구역:" not in prompt
+
+    # 성공한 정보는 캐시에서, 실패한 정보는 다시 불러옴
+    asyncio.run(device_tools.aget_capability_prompt(keys))
+    assert requests_seen.count("/robot-cleaner/mode/list") == 1
+    assert requests_seen.count("/robot-cleaner/patrol/list") == 2
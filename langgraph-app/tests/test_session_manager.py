@@ -0,0 +1,181 @@
+"""
+세션 관리자 테스트
+
+Redis 테스트는 fakeredis로 실행합니다 (requirements-dev.txt).
+
+사용법:
+    cd langgraph-app
+    python -m pytest tests
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import HumanMessage
+
+import session_manager
+from session_manager import FileSystemSessionManager, RedisSessionManager, serialize_message
+
+
+def make_messages(count: int):
+    return [
+        HumanMessage(content=f"메시지 {i}", name=None if i % 2 == 0 else "device_agent")
+        for i in range(count)
+    ]
+
+
+def read_lines(manager: FileSystemSessionManager, session_id: str):
+    with open(manager._get_file_path(session_id), "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture
+def fs_manager(tmp_path):
+    manager = FileSystemSessionManager(str(tmp_path), compact_every=3, sweep_interval=0)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def redis_manager(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setattr(session_manager.redis, "from_url", lambda url: fakeredis.FakeRedis())
+    return RedisSessionManager("redis://fake:6379/0", ttl=3600)
+
+
+def test_filesystem_append_compaction_round_trip(fs_manager, tmp_path):
+    session_id = fs_manager.create_session()
+    assert [record["type"] for record in read_lines(fs_manager, session_id)] == ["header", "meta"]
+
+    # 새 메시지와 meta 레코드만 파일 끝에 추가
+    fs_manager.update_session(session_id, {"messages": make_messages(1), "next": None})
+    fs_manager.update_session(session_id, {"messages": make_messages(2), "next": None})
+    assert [record["type"] for record in read_lines(fs_manager, session_id)] == [
+        "header", "meta", "message", "meta", "message", "meta",
+    ]
+
+    # meta 레코드가 compact_every개 쌓였으므로 다음 업데이트에서 파일 전체를 다시 씀
+    state = {"messages": make_messages(3), "next": "supervisor", "summary": "이전 대화 요약", "summary_upto": 1}
+    fs_manager.update_session(session_id, state)
+    assert [record["type"] for record in read_lines(fs_manager, session_id)] == [
+        "header", "message", "message", "message", "meta",
+    ]
+
+    # 캐시 없이 파일만 다시 읽어도 같은 상태가 복원됨
+    reader = FileSystemSessionManager(str(tmp_path), sweep_interval=0)
+    try:
+        restored = reader.get_session(session_id)
+    finally:
+        reader.close()
+    assert [serialize_message(msg) for msg in restored["messages"]] == [serialize_message(msg) for msg in make_messages(3)]
+    assert restored["next"] == "supervisor"
+    assert restored["summary"] == "이전 대화 요약"
+    assert restored["summary_upto"] == 1
+
+
+def test_filesystem_rewrites_when_history_changes(fs_manager):
+    session_id = fs_manager.create_session()
+    fs_manager.update_session(session_id, {"messages": make_messages(2), "next": None})
+
+    # 대화를 초기화하면 앞부분이 달라지므로 덧붙이지 않고 전체를 다시 씀
+    fs_manager.update_session(session_id, {"messages": [HumanMessage(content="새 대화")], "next": None})
+    restored = fs_manager.get_session(session_id)
+    assert [msg.content for msg in restored["messages"]] == ["새 대화"]
+
+
+def test_filesystem_list_sessions_from_index(fs_manager, tmp_path):
+    session_ids = [fs_manager.create_session() for _ in range(3)]
+    fs_manager.update_session(session_ids[0], {"messages": make_messages(2), "next": None})
+
+    sessions = fs_manager.list_sessions()
+    assert set(sessions) == set(session_ids)
+    assert sessions[session_ids[0]]["message_count"] == 2
+    assert sessions[session_ids[1]]["message_count"] == 0
+
+    # 최근 갱신 순으로 오프셋 커서 페이지 조회
+    first_page = fs_manager.list_sessions_page(cursor=0, limit=2)
+    assert len(first_page["sessions"]) == 2
+    assert list(first_page["sessions"])[0] == session_ids[0]
+    assert first_page["next_cursor"] == 2
+    second_page = fs_manager.list_sessions_page(cursor=first_page["next_cursor"], limit=2)
+    assert len(second_page["sessions"]) == 1
+    assert second_page["next_cursor"] is None
+
+    # 삭제된 세션은 인덱스에서도 빠짐
+    fs_manager.delete_session(session_ids[2])
+    assert set(fs_manager.list_sessions()) == set(session_ids[:2])
+
+
+def test_filesystem_index_rebuilt_for_existing_files(tmp_path):
+    writer = FileSystemSessionManager(str(tmp_path), sweep_interval=0)
+    session_id = writer.create_session()
+    writer.update_session(session_id, {"messages": make_messages(4), "next": None})
+    writer.close()
+
+    # 인덱스 파일이 없어도 기존 세션 파일에서 다시 만듦
+    os.remove(os.path.join(str(tmp_path), FileSystemSessionManager.INDEX_FILE_NAME))
+    reader = FileSystemSessionManager(str(tmp_path), sweep_interval=0)
+    try:
+        assert reader.list_sessions()[session_id]["message_count"] == 4
+    finally:
+        reader.close()
+
+
+def test_redis_list_sessions_page_includes_legacy_keys(redis_manager):
+    new_ids = [redis_manager.create_session() for _ in range(5)]
+    for session_id in new_ids:
+        redis_manager.update_session(session_id, {"messages": make_messages(2), "next": None})
+
+    # 이전 형식(전체 상태 JSON 문자열) 세션
+    legacy_ids = [f"legacy-{i}" for i in range(3)]
+    for session_id in legacy_ids:
+        redis_manager.redis_client.set(
+            redis_manager._get_key(session_id),
+            json.dumps({"messages": [serialize_message(msg) for msg in make_messages(3)], "next": None}),
+            ex=3600,
+        )
+
+    # 커서가 끝날 때까지 페이지를 넘기며 모음 (메시지 리스트 키는 세션으로 취급하지 않음)
+    collected = {}
+    cursor = 0
+    while True:
+        page = redis_manager.list_sessions_page(cursor=cursor, limit=2)
+        collected.update(page["sessions"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert set(collected) == set(new_ids) | set(legacy_ids)
+    assert all(collected[session_id]["message_count"] == 2 for session_id in new_ids)
+    assert all(collected[session_id]["message_count"] == 3 for session_id in legacy_ids)
+    assert set(redis_manager.list_sessions()) == set(collected)
+
+
+def test_redis_max_messages_windowing(redis_manager):
+    session_id = redis_manager.create_session()
+    messages = make_messages(6)
+    redis_manager.update_session(session_id, {"messages": messages[:4], "next": None})
+    redis_manager.update_session(session_id, {"messages": messages, "next": "supervisor"})
+
+    window = redis_manager.get_session(session_id, max_messages=2)
+    assert [msg.content for msg in window["messages"]] == ["메시지 4", "메시지 5"]
+    assert window["message_count"] == 6
+    assert window["next"] == "supervisor"
+
+    full = redis_manager.get_session(session_id)
+    assert len(full["messages"]) == 6
+    assert "message_count" not in full
+
+
+def test_redis_max_messages_windowing_for_legacy_session(redis_manager):
+    redis_manager.redis_client.set(
+        redis_manager._get_key("legacy"),
+        json.dumps({"messages": [serialize_message(msg) for msg in make_messages(5)], "next": None}),
+    )
+    window = redis_manager.get_session("legacy", max_messages=3)
+    assert [msg.content for msg in window["messages"]] == ["메시지 2", "메시지 3", "메시지 4"]
+    assert window["message_count"] == 5
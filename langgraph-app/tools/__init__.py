@@ -3,6 +3,8 @@ from tools.device_tools import (
     get_refrigerator_tools, 
     get_air_conditioner_tools, 
     get_robot_cleaner_tools, 
+    get_snapshot_tools,
+    get_batch_tools,
     get_all_device_tools
 )
 from tools.mcp_tools import get_robot_cleaner_mcp_tools 
\ No newline at end of file
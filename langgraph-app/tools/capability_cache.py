@@ -0,0 +1,121 @@
+import os
+import time
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+from logging_config import setup_logger
+
+# 로거 설정
+logger = setup_logger("capability_cache")
+
+# 환경 변수 로드
+load_dotenv()
+CAPABILITY_CACHE_ENABLE = os.getenv("CAPABILITY_CACHE_ENABLE", "true").lower() in ("true", "1", "yes")
+CAPABILITY_CACHE_TTL = float(os.getenv("CAPABILITY_CACHE_TTL", "3600"))
+
+
+class CapabilityCache:
+    """
+    실행 중에 바뀌지 않는 기기 기능 정보(모드 목록, 온도 범위, 방범 가능 구역 등)의 읽기 캐시.
+
+    키별로 값을 TTL 동안 보관하며, 만료되었거나 없으면 loader를 호출해 채웁니다.
+    {"error": ...} 형태의 실패 응답은 캐싱하지 않습니다.
+    """
+
+    def __init__(self, ttl: float = CAPABILITY_CACHE_TTL, enabled: bool = CAPABILITY_CACHE_ENABLE):
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._stats: Dict[str, Any] = {"hits": 0, "misses": 0, "invalidations": 0, "by_key": {}}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None and time.time() - entry["loaded_at"] < self.ttl
+            if entry is not None and not hit:
+                del self._entries[key]
+            key_stats = self._stats["by_key"].setdefault(key, {"hits": 0, "misses": 0})
+            self._stats["hits" if hit else "misses"] += 1
+            key_stats["hits" if hit else "misses"] += 1
+            return entry["value"] if hit else None
+
+    def set(self, key: str, value: Any) -> None:
+        """값을 저장합니다. 실패 응답은 저장하지 않습니다."""
+        if isinstance(value, dict) and "error" in value:
+            return
+        with self._lock:
+            self._entries[key] = {"value": value, "loaded_at": time.time()}
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """캐시된 값을 반환하고, 없으면 loader로 불러와 저장합니다."""
+        if not self.enabled:
+            return loader()
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.set(key, value)
+            logger.info("기능 정보 캐시 적재: %s", key)
+        return value
+
+    async def aget_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_load의 비동기 버전입니다."""
+        if not self.enabled:
+            return await loader()
+        value = self.get(key)
+        if value is None:
+            value = await loader()
+            self.set(key, value)
+            logger.info("기능 정보 캐시 적재: %s", key)
+        return value
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """
+        캐시를 무효화합니다.
+
+        Args:
+            key: 무효화할 키 (없으면 전체)
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            if key is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                removed = 1 if self._entries.pop(key, None) is not None else 0
+            self._stats["invalidations"] += 1
+        logger.info("기능 정보 캐시 무효화: %s (%s개 항목)", key or '전체', removed)
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/실패 횟수와 적중률, 키별 통계를 반환합니다."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "by_key": {key: dict(stats) for key, stats in self._stats["by_key"].items()},
+                "hit_rate": self._stats["hits"] / lookups if lookups else None,
+                "size": len(self._entries),
+                "enabled": self.enabled,
+                "ttl": self.ttl,
+            }
+
+
+# 싱글톤 인스턴스
+_capability_cache_instance = None
+_capability_cache_lock = threading.Lock()
+
+
+def get_capability_cache() -> CapabilityCache:
+    """기능 정보 캐시의 싱글톤 인스턴스를 반환합니다."""
+    global _capability_cache_instance
+    if _capability_cache_instance is None:
+        with _capability_cache_lock:
+            if _capability_cache_instance is None:
+                _capability_cache_instance = CapabilityCache()
+                logger.info("기능 정보 캐시 생성 완료 (사용: %s, TTL: %s초)", CAPABILITY_CACHE_ENABLE, CAPABILITY_CACHE_TTL)
+    return _capability_cache_instance
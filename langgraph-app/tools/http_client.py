@@ -0,0 +1,133 @@
+import os
+import asyncio
+import threading
+from typing import Any, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+from logging_config import setup_logger
+
+# 로거 설정
+logger = setup_logger("http_client")
+
+# 환경 변수 로드
+load_dotenv()
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.2"))
+
+# 재시도 대상 상태 코드 (일시적인 서버 오류)
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# 싱글톤 인스턴스
+_session_instance = None
+_session_lock = threading.Lock()
+_async_client_instance = None
+_async_client_loop = None
+
+
+def get_http_session() -> requests.Session:
+    """
+    연결 풀과 재시도가 설정된 requests 세션의 싱글톤 인스턴스를 반환합니다.
+
+    POST 요청은 연결 단계 오류에서만 재시도하고, 응답을 받은 뒤에는 재시도하지 않습니다.
+    """
+    global _session_instance
+    if _session_instance is None:
+        with _session_lock:
+            if _session_instance is None:
+                retry = Retry(
+                    total=HTTP_MAX_RETRIES,
+                    backoff_factor=HTTP_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session_instance = session
+                logger.info("HTTP 세션 생성 완료 (풀 크기: %s, 타임아웃: %s초, 재시도: %s회)", HTTP_POOL_SIZE, HTTP_TIMEOUT, HTTP_MAX_RETRIES)
+    return _session_instance
+
+
+def http_get(url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+    """공유 세션으로 GET 요청을 보냅니다."""
+    return get_http_session().get(url, timeout=timeout or HTTP_TIMEOUT, **kwargs)
+
+
+def http_post(url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+    """공유 세션으로 POST 요청을 보냅니다."""
+    return get_http_session().post(url, timeout=timeout or HTTP_TIMEOUT, **kwargs)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    연결 풀이 설정된 httpx 비동기 클라이언트를 반환합니다.
+
+    비동기 클라이언트는 생성된 이벤트 루프에 묶이므로, 다른 루프에서 호출되면 새로 생성합니다.
+    """
+    global _async_client_instance, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client_instance is None or _async_client_loop is not loop or _async_client_instance.is_closed:
+        _async_client_instance = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_SIZE,
+                max_keepalive_connections=HTTP_POOL_SIZE,
+            ),
+        )
+        _async_client_loop = loop
+        logger.info("비동기 HTTP 클라이언트 생성 완료 (풀 크기: %s, 타임아웃: %s초)", HTTP_POOL_SIZE, HTTP_TIMEOUT)
+    return _async_client_instance
+
+
+async def _async_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """재시도와 지수 백오프를 적용하여 비동기 요청을 보냅니다."""
+    client = get_async_http_client()
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        try:
+            response = await client.request(method, url, **kwargs)
+            # GET 요청만 일시적인 서버 오류에서 재시도
+            if method != "GET" or response.status_code not in RETRY_STATUS_CODES or attempt == HTTP_MAX_RETRIES:
+                return response
+            logger.warning("HTTP %s %s 응답 코드 %s, 재시도 %s/%s", method, url, response.status_code, attempt + 1, HTTP_MAX_RETRIES)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            if attempt == HTTP_MAX_RETRIES:
+                raise
+            logger.warning("HTTP %s %s 연결 실패: %s, 재시도 %s/%s", method, url, e, attempt + 1, HTTP_MAX_RETRIES)
+        await asyncio.sleep(HTTP_BACKOFF_FACTOR * (2 ** attempt))
+
+
+async def async_http_get(url: str, **kwargs: Any) -> httpx.Response:
+    """공유 비동기 클라이언트로 GET 요청을 보냅니다."""
+    return await _async_request("GET", url, **kwargs)
+
+
+async def async_http_post(url: str, **kwargs: Any) -> httpx.Response:
+    """공유 비동기 클라이언트로 POST 요청을 보냅니다."""
+    return await _async_request("POST", url, **kwargs)
+
+
+async def close_http_clients() -> None:
+    """공유 HTTP 세션과 비동기 클라이언트를 종료합니다. 서버 종료 시 호출됩니다."""
+    global _session_instance, _async_client_instance, _async_client_loop
+    with _session_lock:
+        if _session_instance is not None:
+            _session_instance.close()
+            _session_instance = None
+    if _async_client_instance is not None:
+        # 다른 이벤트 루프에서 생성된 클라이언트는 해당 루프에서만 닫을 수 있음
+        if not _async_client_instance.is_closed and _async_client_loop is asyncio.get_running_loop():
+            await _async_client_instance.aclose()
+        _async_client_instance = None
+        _async_client_loop = None
+    logger.info("HTTP 클라이언트 종료 완료")
@@ -39,7 +39,7 @@ def process_sse_stream(url: str) -> Dict[str, Any]:
         data = json.loads(event.data)
         return data
     except Exception as e:
-        logger.error(f"SSE 스트림 처리 오류: {str(e)}")
+        logger.error("SSE 스트림 처리 오류: %s", e)
         return {"error": str(e)}
 
 
@@ -63,7 +63,7 @@ def send_post_request_sse(url: str, data: Dict[str, Any]) -> Dict[str, Any]:
         result = json.loads(event.data)
         return result
     except Exception as e:
-        logger.error(f"POST 요청 및 SSE 응답 처리 오류: {str(e)}")
+        logger.error("POST 요청 및 SSE 응답 처리 오류: %s", e)
         return {"error": str(e)}
 
 
@@ -79,7 +79,8 @@ class GetRobotCleanerStateTool(BaseTool):
         return process_sse_stream(url)
     
     async def _arun(self, **kwargs: Any) -> Dict[str, Any]:
-        return self._run(**kwargs)
+        # 동기 HTTP/SSE 호출이 이벤트 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(self._run, **kwargs)
 
 
 class SetRobotCleanerStateTool(BaseTool):
@@ -100,7 +101,7 @@ class SetRobotCleanerStateTool(BaseTool):
         return send_post_request_sse(url, data)
     
     async def _arun(self, state: str) -> Dict[str, Any]:
-        return self._run(state=state)
+        return await asyncio.to_thread(self._run, state=state)
 
 
 class GetRobotCleanerModeTool(BaseTool):
@@ -113,7 +114,7 @@ class GetRobotCleanerModeTool(BaseTool):
         return process_sse_stream(url)
     
     async def _arun(self, **kwargs: Any) -> Dict[str, Any]:
-        return self._run(**kwargs)
+        return await asyncio.to_thread(self._run, **kwargs)
 
 
 class SetRobotCleanerModeTool(BaseTool):
@@ -135,7 +136,7 @@ class SetRobotCleanerModeTool(BaseTool):
         return send_post_request_sse(url, data)
     
     async def _arun(self, mode: str) -> Dict[str, Any]:
-        return self._run(mode=mode)
+        return await asyncio.to_thread(self._run, mode=mode)
 
 
 class GetRobotCleanerModeListTool(BaseTool):
@@ -148,7 +149,7 @@ class GetRobotCleanerModeListTool(BaseTool):
         return process_sse_stream(url)
     
     async def _arun(self, **kwargs: Any) -> Dict[str, Any]:
-        return self._run(**kwargs)
+        return await asyncio.to_thread(self._run, **kwargs)
 
 
 class GetRobotCleanerFilterUsageTool(BaseTool):
@@ -161,7 +162,7 @@ class GetRobotCleanerFilterUsageTool(BaseTool):
         return process_sse_stream(url)
     
     async def _arun(self, **kwargs: Any) -> Dict[str, Any]:
-        return self._run(**kwargs)
+        return await asyncio.to_thread(self._run, **kwargs)
 
 
 class GetRobotCleanerCountTool(BaseTool):
@@ -174,7 +175,7 @@ class GetRobotCleanerCountTool(BaseTool):
         return process_sse_stream(url)
     
     async def _arun(self, **kwargs: Any) -> Dict[str, Any]:
-        return self._run(**kwargs)
+        return await asyncio.to_thread(self._run, **kwargs)
 
 
 class GetAvailablePatrolAreasTool(BaseTool):
@@ -187,7 +188,7 @@ class GetAvailablePatrolAreasTool(BaseTool):
         return process_sse_stream(url)
     
     async def _arun(self, **kwargs: Any) -> Dict[str, Any]:
-        return self._run(**kwargs)
+        return await asyncio.to_thread(self._run, **kwargs)
 
 
 class GetPatrolSettingsTool(BaseTool):
@@ -200,7 +201,7 @@ class GetPatrolSettingsTool(BaseTool):
         return process_sse_stream(url)
     
     async def _arun(self, **kwargs: Any) -> Dict[str, Any]:
-        return self._run(**kwargs)
+        return await asyncio.to_thread(self._run, **kwargs)
 
 
 class SetPatrolAreasTool(BaseTool):
@@ -221,7 +222,7 @@ class SetPatrolAreasTool(BaseTool):
         return send_post_request_sse(url, data)
     
     async def _arun(self, areas: str) -> Dict[str, Any]:
-        return self._run(areas=areas)
+        return await asyncio.to_thread(self._run, areas=areas)
 
 
 def get_robot_cleaner_mcp_tools() -> List[BaseTool]:
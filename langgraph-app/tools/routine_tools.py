@@ -5,6 +5,7 @@ import traceback
 from typing import List, Dict, Annotated
 from dotenv import load_dotenv
 from langchain_core.tools import tool
+from tools.http_client import http_get, http_post
 from logging_config import setup_logger
 
 # 로거 설정
@@ -29,7 +30,7 @@ def register_routine(
     Returns:
         등록 결과 메시지
     """
-    logger.info(f"새 루틴 등록 도구 호출됨: '{routine_name}' ({len(routine_flow)}개 단계)")
+    logger.info("새 루틴 등록 도구 호출됨: '%s' (%s개 단계)", routine_name, len(routine_flow))
     url = f"{MOCK_SERVER_URL}/routine/register"
     payload = {
         "routine_name": routine_name,
@@ -37,10 +38,10 @@ def register_routine(
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = http_post(url, json=payload)
         response.raise_for_status()
         result = response.json()
-        logger.info(f"루틴 등록 결과: {result}")
+        logger.info("루틴 등록 결과: %s", result)
         return result
     except requests.exceptions.RequestException as e:
         error_msg = f"루틴 등록 실패: {str(e)}"
@@ -60,11 +61,11 @@ def list_routines():
     url = f"{MOCK_SERVER_URL}/routine/list"
     
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
         result = response.json()
         routine_count = len(result.get("routines", {}))
-        logger.info(f"루틴 목록 조회 결과: {routine_count}개 루틴 확인됨")
+        logger.info("루틴 목록 조회 결과: %s개 루틴 확인됨", routine_count)
         return result
     except requests.exceptions.RequestException as e:
         error_msg = f"루틴 목록 조회 실패: {str(e)}"
@@ -83,17 +84,17 @@ def delete_routine(routine_name: Annotated[str, "삭제할 루틴의 이름"]):
     Returns:
         삭제 결과 메시지
     """
-    logger.info(f"루틴 삭제 도구 호출됨: '{routine_name}'")
+    logger.info("루틴 삭제 도구 호출됨: '%s'", routine_name)
     url = f"{MOCK_SERVER_URL}/routine/delete"
     payload = {
         "routine_name": routine_name
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = http_post(url, json=payload)
         response.raise_for_status()
         result = response.json()
-        logger.info(f"루틴 삭제 결과: {result}")
+        logger.info("루틴 삭제 결과: %s", result)
         return result
     except requests.exceptions.RequestException as e:
         error_msg = f"루틴 삭제 실패: {str(e)}"
@@ -117,7 +118,7 @@ def suggest_routine(
     Returns:
         제안된 루틴 단계 목록
     """
-    logger.info(f"루틴 제안 도구 호출됨: '{routine_name}' - 설명: {routine_description[:50]}..." if len(routine_description) > 50 else routine_description)
+    logger.info("루틴 제안 도구 호출됨: '%s' - 설명: %s%s", routine_name, routine_description[:50], "..." if len(routine_description) > 50 else "")
     
     # 여기서는 실제 API 호출이 아닌 표준화된 제안 형식을 반환합니다.
     # 실제 제안은 LLM이 수행합니다.
@@ -132,5 +133,5 @@ def suggest_routine(
         "note": "위 흐름은 에이전트가 생성한 제안이며, 실제로 등록하려면 register_routine 도구를 사용하세요."
     }
     
-    logger.info(f"루틴 제안 생성 완료: '{routine_name}'")
+    logger.info("루틴 제안 생성 완료: '%s'", routine_name)
     return result 
\ No newline at end of file
@@ -0,0 +1,173 @@
+import json
+import threading
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, StructuredTool
+from logging_config import setup_logger
+
+# 로거 설정
+logger = setup_logger("turn_memo")
+
+# RunnableConfig["configurable"]에서 턴 메모를 찾는 키
+TOOL_MEMO_CONFIG_KEY = "tool_memo"
+
+# 메모 대상 기기
+ALL_DEVICES: FrozenSet[str] = frozenset({"refrigerator", "air_conditioner", "robot_cleaner"})
+
+# 조회 도구와 상태를 바꾸는 도구의 이름 접두사
+READ_PREFIXES = ("get_",)
+WRITE_PREFIXES = ("set_", "increase_", "decrease_", "apply_")
+
+
+def get_tool_devices(tool_name: str, args: Dict[str, Any]) -> FrozenSet[str]:
+    """도구 호출이 읽거나 바꾸는 기기를 찾습니다. 알 수 없으면 모든 기기로 간주합니다."""
+    devices = {device for device in ALL_DEVICES if device in tool_name}
+    if "patrol" in tool_name:
+        devices.add("robot_cleaner")
+    # 기기를 인자로 받는 도구 (get_device_snapshot, apply_device_settings)
+    device = args.get("device")
+    if device in ALL_DEVICES:
+        devices.add(device)
+    for setting in args.get("settings") or []:
+        values = setting if isinstance(setting, dict) else getattr(setting, "__dict__", {})
+        if values.get("device") in ALL_DEVICES:
+            devices.add(values["device"])
+    return frozenset(devices) or ALL_DEVICES
+
+
+class TurnMemo:
+    """
+    한 턴(에이전트 한 번 실행) 동안의 조회 도구 결과 메모.
+
+    도구 이름과 인자로 결과를 기억해 같은 조회를 다시 하지 않으며,
+    set_*, increase_*, decrease_*, apply_* 도구가 실행되면 해당 기기의 메모를 지웁니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[FrozenSet[str], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(tool_name: str, args: Dict[str, Any]) -> Tuple[str, str]:
+        return tool_name, json.dumps(args, sort_keys=True, ensure_ascii=False, default=str)
+
+    def get(self, tool_name: str, args: Dict[str, Any]) -> Tuple[bool, Any]:
+        """메모된 결과를 찾습니다. (찾았는지 여부, 결과)를 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(self._key(tool_name, args))
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, tool_name: str, args: Dict[str, Any], value: Any) -> None:
+        """조회 결과를 메모합니다. 실패 응답은 메모하지 않습니다."""
+        if isinstance(value, dict) and "error" in value:
+            return
+        with self._lock:
+            self._entries[self._key(tool_name, args)] = (get_tool_devices(tool_name, args), value)
+
+    def invalidate_devices(self, devices: FrozenSet[str]) -> int:
+        """지정한 기기와 관련된 메모를 지우고 지운 항목 수를 반환합니다."""
+        with self._lock:
+            stale = [key for key, (entry_devices, _) in self._entries.items() if entry_devices & devices]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+
+class TurnMemoStats:
+    """턴 메모의 누적 적중/실패 통계."""
+
+    def __init__(self):
+        self._stats: Dict[str, Any] = {"turns": 0, "hits": 0, "misses": 0, "invalidations": 0, "last_turn_hits": 0}
+        self._lock = threading.Lock()
+
+    def record(self, memo: TurnMemo, request_id: str = "") -> None:
+        """끝난 턴의 메모 통계를 누적하고 로그로 남깁니다."""
+        with self._lock:
+            self._stats["turns"] += 1
+            self._stats["hits"] += memo.hits
+            self._stats["misses"] += memo.misses
+            self._stats["invalidations"] += memo.invalidations
+            self._stats["last_turn_hits"] = memo.hits
+        logger.info("[%s] 턴 메모 통계: 적중 %s회, 실패 %s회, 무효화 %s개", request_id, memo.hits, memo.misses, memo.invalidations)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """누적 적중/실패 횟수와 적중률, 턴당 평균 적중 횟수를 반환합니다."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else None,
+                "hits_per_turn": self._stats["hits"] / self._stats["turns"] if self._stats["turns"] else None,
+            }
+
+
+def with_tool_memo(config: RunnableConfig, memo: TurnMemo) -> RunnableConfig:
+    """턴 메모를 configurable에 넣은 새 설정을 반환합니다."""
+    return {**config, "configurable": {**(config.get("configurable") or {}), TOOL_MEMO_CONFIG_KEY: memo}}
+
+
+def memoize_tool(tool: BaseTool) -> BaseTool:
+    """
+    도구를 턴 메모를 사용하는 도구로 감쌉니다.
+
+    설정에 턴 메모가 없으면 원래 도구와 똑같이 동작합니다.
+    조회 도구도 상태 변경 도구도 아닌 도구는 그대로 반환합니다.
+    """
+    is_read = tool.name.startswith(READ_PREFIXES)
+    is_write = tool.name.startswith(WRITE_PREFIXES)
+    func = getattr(tool, "func", None)
+    if func is None or not (is_read or is_write):
+        return tool
+
+    def run(config: RunnableConfig, **kwargs: Any) -> Any:
+        memo: Optional[TurnMemo] = (config.get("configurable") or {}).get(TOOL_MEMO_CONFIG_KEY)
+        if memo is None:
+            return func(**kwargs)
+        if is_write:
+            result = func(**kwargs)
+            removed = memo.invalidate_devices(get_tool_devices(tool.name, kwargs))
+            logger.debug("%s 실행으로 턴 메모 %s개 무효화", tool.name, removed)
+            return result
+        found, result = memo.get(tool.name, kwargs)
+        if found:
+            logger.info("턴 메모 적중: %s(%s)", tool.name, kwargs)
+            return result
+        result = func(**kwargs)
+        memo.set(tool.name, kwargs, result)
+        return result
+
+    return StructuredTool.from_function(
+        func=run,
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.args_schema,
+    )
+
+
+def memoize_tools(tools: List[BaseTool]) -> List[BaseTool]:
+    """도구 목록을 턴 메모를 사용하는 도구 목록으로 감쌉니다."""
+    return [memoize_tool(tool) for tool in tools]
+
+
+# 싱글톤 인스턴스
+_turn_memo_stats_instance = None
+_turn_memo_stats_lock = threading.Lock()
+
+
+def get_turn_memo_stats() -> TurnMemoStats:
+    """턴 메모 통계의 싱글톤 인스턴스를 반환합니다."""
+    global _turn_memo_stats_instance
+    if _turn_memo_stats_instance is None:
+        with _turn_memo_stats_lock:
+            if _turn_memo_stats_instance is None:
+                _turn_memo_stats_instance = TurnMemoStats()
+    return _turn_memo_stats_instance
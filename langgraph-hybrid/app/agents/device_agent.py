@@ -10,14 +10,20 @@ from langgraph.prebuilt import create_react_agent
 from dotenv import load_dotenv
 from logging_config import setup_logger
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableConfig
 
 
 # 도구 가져오기
-from tools.device_tools import get_refrigerator_tools, get_air_conditioner_tools, get_all_device_tools
+from tools.device_tools import get_refrigerator_tools, get_air_conditioner_tools, get_all_device_tools, get_capability_prompt
+from tools.turn_memo import TurnMemo, memoize_tools, with_tool_memo, get_turn_memo_stats
+from context_window import get_context_window
 
 # 로거 설정
 logger = setup_logger("device_agent")
 
+# 프롬프트에 미리 넣을 기기 기능 정보
+DEVICE_AGENT_CAPABILITIES = ["refrigerator.modes", "air_conditioner.modes", "air_conditioner.temperature_range"]
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -30,22 +36,23 @@ def get_device_tools_with_details() -> List:
     logger.info("가전제품 도구 로딩 시작")
     
     try:
-        tools = get_all_device_tools()
+        # 한 턴 안의 중복 조회를 없애도록 턴 메모를 사용하는 도구로 감쌈
+        tools = memoize_tools(get_all_device_tools())
         
         # 도구 정보 로깅
-        logger.info(f"총 {len(tools)}개의 가전제품 도구를 가져왔습니다")
+        logger.info("총 %s개의 가전제품 도구를 가져왔습니다", len(tools))
         for i, tool in enumerate(tools, 1):
             try:
                 tool_name = getattr(tool, "name", f"Tool-{i}")
                 tool_desc = getattr(tool, "description", "설명 없음")
-                logger.info(f"  도구 {i}: {tool_name} - {tool_desc}")
+                logger.info("  도구 %s: %s - %s", i, tool_name, tool_desc)
             except Exception as e:
-                logger.warning(f"  도구 {i}의 정보를 가져오는 중 오류: {str(e)}")
+                logger.warning("  도구 %s의 정보를 가져오는 중 오류: %s", i, e)
         
         logger.info("가전제품 도구 로딩 완료")
         return tools
     except Exception as e:
-        logger.error(f"가전제품 도구 로딩 중 오류 발생: {str(e)}")
+        logger.error("가전제품 도구 로딩 중 오류 발생: %s", e)
         raise
 
 
@@ -58,7 +65,7 @@ def get_device_agent():
             
             # 모델 설정 가져오기
             model_name = os.getenv("MODEL_NAME", "gemini-2.5-pro-exp-03-25")
-            logger.info(f"가전제품 제어 에이전트 LLM 모델: {model_name}")
+            logger.info("가전제품 제어 에이전트 LLM 모델: %s", model_name)
             
             # LLM 초기화
             logger.info("LLM 초기화 중...")
@@ -72,6 +79,9 @@ def get_device_agent():
             # 모든 가전제품 도구 가져오기
             tools = get_device_tools_with_details()
             
+            # 바뀌지 않는 기능 정보(모드 목록, 온도 범위)를 프롬프트에 미리 넣어 조회 도구 호출을 줄임
+            capability_prompt = get_capability_prompt(DEVICE_AGENT_CAPABILITIES)
+            
             # 시스템 프롬프트 설정
             logger.info("시스템 프롬프트 구성 중...")
             system_prompt = ChatPromptTemplate.from_messages([
@@ -83,12 +93,14 @@ def get_device_agent():
 
 사용자의 요청에 따라 적절한 가전제품과 기능을 선택하여 제어하세요.
 항상 현재 상태를 확인한 후 변경하는 것이 좋습니다.
+현재 상태는 get_device_snapshot 도구 한 번으로 확인하세요. 상태, 모드, 모드 목록, 온도 범위 등을 개별 도구로 여러 번 조회하지 마세요.
+설정을 두 가지 이상 바꿀 때(예: 에어컨을 켜고 냉방 모드, 22도로 설정)는 apply_device_settings 도구로 한 번에 적용하세요.
 작업 완료 후에는 수행한 작업의 결과를 사용자에게 명확히 알려주세요.
 
 참고: 로봇청소기는 별도의 에이전트가 담당하므로 당신은 제어할 수 없습니다.
 
 모든 응답은 명확하고 친절하게 제공하세요.
-"""),
+""" + capability_prompt),
         MessagesPlaceholder(variable_name="messages"),
     ])
             logger.info("시스템 프롬프트 설정 완료")
@@ -104,22 +116,27 @@ def get_device_agent():
             
             logger.info("가전제품 제어 에이전트 초기화 완료")
         except Exception as e:
-            logger.error(f"가전제품 제어 에이전트 초기화 중 오류 발생: {str(e)}")
+            logger.error("가전제품 제어 에이전트 초기화 중 오류 발생: %s", e)
             raise
         
     return _agent_instance
 
 
-def device_node(state: MessagesState) -> Command[Literal["supervisor"]]:
+def device_node(state: MessagesState, config: RunnableConfig) -> Command[Literal["completion_check", "merge_replies"]]:
     """
     가전제품 제어 에이전트 노드 함수입니다.
     
     Args:
         state: 현재 메시지와 상태 정보
-        
+        config: 그래프 실행 설정 (턴 메모를 추가하여 에이전트에 전달)
+
     Returns:
-        슈퍼바이저로 돌아가는 명령
+        완료 정책 확인 또는 병렬 응답 병합 노드로 가는 명령
     """
+    # 이번 턴 동안의 조회 도구 결과 메모
+    memo = TurnMemo()
+    # 턴 메모 통계 로그에 남길 요청 ID (세션 thread_id, 없으면 실행 ID)
+    request_id = (config or {}).get("configurable", {}).get("thread_id") or str((config or {}).get("run_id", ""))
     try:
         # 에이전트 인스턴스 가져오기
         logger.info("가전제품 제어 에이전트 노드 함수 실행 시작")
@@ -128,36 +145,39 @@ def device_node(state: MessagesState) -> Command[Literal["supervisor"]]:
         # 입력 메시지 로깅
         if "messages" in state and state["messages"]:
             last_user_msg = state["messages"][-1].content
-            logger.info(f"가전제품 에이전트에 전달된 메시지: '{last_user_msg[:100]}...'")
+            logger.info("가전제품 에이전트에 전달된 메시지: '%s...'", last_user_msg[:100])
         
-        # 에이전트 호출
+        # 에이전트 호출 (최근 턴과 누적 요약만 토큰 예산 안에서 전달)
         logger.info("가전제품 제어 에이전트 추론 시작")
-        result = device_agent.invoke(state)
+        messages = get_context_window().build_context(state["messages"], state.get("summary"), "device_agent")
+        result = device_agent.invoke({**state, "messages": messages}, with_tool_memo(config, memo))
         logger.info("가전제품 제어 에이전트 추론 완료")
+        get_turn_memo_stats().record(memo, request_id)
         
         # 결과 메시지 생성
         if "messages" in result and result["messages"]:
             last_message = result["messages"][-1]
             device_message = HumanMessage(content=last_message.content, name="device_agent")
-            logger.info(f"가전제품 에이전트 응답: '{last_message.content[:100]}...'")
+            logger.info("가전제품 에이전트 응답: '%s...'", last_message.content[:100])
         else:
             logger.warning("가전제품 에이전트가 응답을 생성하지 않음")
             device_message = HumanMessage(content="응답을 생성할 수 없습니다.", name="device_agent")
         
-        logger.info("가전제품 제어 에이전트 작업 완료, 슈퍼바이저로 반환")
+        logger.info("가전제품 제어 에이전트 작업 완료, 완료 정책 확인으로 이동")
         
-        # 슈퍼바이저로 돌아가기
+        # 완료 정책 확인 (단일 의도 요청이면 슈퍼바이저 없이 종료, 병렬 실행 중이면 응답 병합)
         return Command(
             update={"messages": [device_message]},
-            goto="supervisor"
+            goto="merge_replies" if state.get("fan_out") else "completion_check"
         )
     except Exception as e:
-        logger.error(f"가전제품 노드 함수 실행 중 오류 발생: {str(e)}")
+        get_turn_memo_stats().record(memo, request_id)
+        logger.error("가전제품 노드 함수 실행 중 오류 발생: %s", e)
         error_message = HumanMessage(
             content=f"가전제품 에이전트 실행 중 오류가 발생했습니다: {str(e)}",
             name="device_agent"
         )
         return Command(
             update={"messages": [error_message]},
-            goto="supervisor"
+            goto="merge_replies" if state.get("fan_out") else "completion_check"
         ) 
\ No newline at end of file
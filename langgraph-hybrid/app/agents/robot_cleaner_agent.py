@@ -13,10 +13,15 @@ from logging_config import setup_logger
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from tools.device_tools import aget_capability_prompt
+from context_window import get_context_window
 
 # 로거 설정
 logger = setup_logger("robot_cleaner_agent")
 
+# 프롬프트에 미리 넣을 기기 기능 정보
+ROBOT_CLEANER_AGENT_CAPABILITIES = ["robot_cleaner.modes", "robot_cleaner.patrol_areas"]
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -24,11 +29,22 @@ load_dotenv()
 _agent_instance = None
 _mcp_client = None
 
+# 초기화 잠금 - 동시에 들어온 첫 요청들이 MCP 클라이언트와 에이전트를 각각 생성하지 않도록 함
+_mcp_client_lock = asyncio.Lock()
+_agent_lock = asyncio.Lock()
+
 
 async def init_mcp_client():
     """MCP 클라이언트를 초기화합니다."""
     global _mcp_client
-    if _mcp_client is None:
+    if _mcp_client is not None:
+        return _mcp_client
+    
+    async with _mcp_client_lock:
+        # 잠금을 기다리는 동안 다른 요청이 이미 초기화했을 수 있음
+        if _mcp_client is not None:
+            return _mcp_client
+        
         logger.info("MCP 클라이언트 초기화 시작")
         
         # MCP 서버 설정
@@ -38,7 +54,7 @@ async def init_mcp_client():
                 "transport": "sse",
             },
         }
-        logger.info(f"MCP 서버 설정: {json.dumps(mcp_config, indent=2)}")
+        logger.info("MCP 서버 설정: %s", json.dumps(mcp_config, indent=2))
         
         try:
             # MCP 클라이언트 생성
@@ -54,7 +70,7 @@ async def init_mcp_client():
             _mcp_client = client
             logger.info("MCP 클라이언트 초기화 완료")
         except Exception as e:
-            logger.error(f"MCP 클라이언트 초기화 중 오류 발생: {str(e)}")
+            logger.error("MCP 클라이언트 초기화 중 오류 발생: %s", e)
             raise
     
     return _mcp_client
@@ -68,14 +84,14 @@ async def get_tools_with_details() -> List:
     tools = client.get_tools()
     
     # 도구 정보 로깅
-    logger.info(f"총 {len(tools)}개의 MCP 도구를 가져왔습니다")
+    logger.info("총 %s개의 MCP 도구를 가져왔습니다", len(tools))
     for i, tool in enumerate(tools, 1):
         try:
             tool_name = getattr(tool, "name", f"Tool-{i}")
             tool_desc = getattr(tool, "description", "설명 없음")
-            logger.info(f"  도구 {i}: {tool_name} - {tool_desc}")
+            logger.info("  도구 %s: %s - %s", i, tool_name, tool_desc)
         except Exception as e:
-            logger.warning(f"  도구 {i}의 정보를 가져오는 중 오류: {str(e)}")
+            logger.warning("  도구 %s의 정보를 가져오는 중 오류: %s", i, e)
     
     return tools
 
@@ -83,12 +99,19 @@ async def get_tools_with_details() -> List:
 async def get_robot_cleaner_agent_async():
     """로봇청소기 제어 에이전트의 싱글톤 인스턴스를 비동기적으로 생성합니다."""
     global _agent_instance
-    if _agent_instance is None:
+    if _agent_instance is not None:
+        return _agent_instance
+    
+    async with _agent_lock:
+        # 잠금을 기다리는 동안 다른 요청이 이미 생성했을 수 있음
+        if _agent_instance is not None:
+            return _agent_instance
+        
         logger.info("로봇청소기 제어 에이전트 초기화 시작")
         
         # 모델 설정 가져오기
         model_name = os.getenv("MODEL_NAME", "gemini-2.5-pro-exp-03-25")
-        logger.info(f"로봇청소기 제어 에이전트 LLM 모델: {model_name}")
+        logger.info("로봇청소기 제어 에이전트 LLM 모델: %s", model_name)
         
         try:
             # LLM 초기화
@@ -105,13 +128,18 @@ async def get_robot_cleaner_agent_async():
             tools = await get_tools_with_details()
             logger.info("MCP 도구 로딩 완료")
             
+            # 바뀌지 않는 기능 정보(모드 목록, 방범 가능 구역)를 프롬프트에 미리 넣어 조회 도구 호출을 줄임
+            capability_prompt = await aget_capability_prompt(ROBOT_CLEANER_AGENT_CAPABILITIES)
+            
             # 시스템 프롬프트 설정
             logger.info("시스템 프롬프트 구성 중...")
             system_prompt = ChatPromptTemplate.from_messages([
             ("system", """당신은 로봇청소기를 제어하는 스마트홈 에이전트입니다. 
 로봇청소기의 상태 확인, 전원 제어, 모드 변경, 방범 기능 설정 등을 수행할 수 있습니다.
+현재 상태는 get_robot_cleaner_snapshot 도구 한 번으로 확인하세요. 상태, 모드, 방범 구역 등을 개별 도구로 여러 번 조회하지 마세요.
+설정을 두 가지 이상 바꿀 때는 apply_robot_cleaner_settings 도구로 한 번에 적용하세요.
 
-응답은 항상 한국어로 제공하세요.제공된 MCP 도구를 사용하여 로봇청소기를 제어하세요."""),
+응답은 항상 한국어로 제공하세요.제공된 MCP 도구를 사용하여 로봇청소기를 제어하세요.""" + capability_prompt),
             MessagesPlaceholder(variable_name="messages")
         ])
             
@@ -129,30 +157,13 @@ async def get_robot_cleaner_agent_async():
             
             logger.info("로봇청소기 제어 에이전트 초기화 완료")
         except Exception as e:
-            logger.error(f"로봇청소기 제어 에이전트 초기화 중 오류 발생: {str(e)}")
+            logger.error("로봇청소기 제어 에이전트 초기화 중 오류 발생: %s", e)
             raise
         
     return _agent_instance
 
 
-def get_robot_cleaner_agent():
-    """로봇청소기 제어 에이전트의 싱글톤 인스턴스를 반환합니다."""
-    global _agent_instance
-    if _agent_instance is None:
-        try:
-            # 비동기 초기화 함수를 동기적으로 실행
-            logger.info("로봇청소기 에이전트 비동기 초기화 시작")
-            loop = asyncio.get_event_loop()
-            _agent_instance = loop.run_until_complete(get_robot_cleaner_agent_async())
-            logger.info("로봇청소기 에이전트 비동기 초기화 완료")
-        except Exception as e:
-            logger.error(f"로봇청소기 에이전트 초기화 실패: {str(e)}")
-            raise
-    
-    return _agent_instance
-
-
-def robot_cleaner_node(state: MessagesState) -> Command[Literal["supervisor"]]:
+async def robot_cleaner_node(state: MessagesState) -> Command[Literal["completion_check", "merge_replies"]]:
     """
     로봇청소기 제어 에이전트 노드 함수입니다.
     
@@ -160,46 +171,47 @@ def robot_cleaner_node(state: MessagesState) -> Command[Literal["supervisor"]]:
         state: 현재 메시지와 상태 정보
         
     Returns:
-        슈퍼바이저로 돌아가는 명령
+        완료 정책 확인 또는 병렬 응답 병합 노드로 가는 명령
     """
     try:
         # 에이전트 인스턴스 가져오기
         logger.info("로봇청소기 제어 에이전트 노드 함수 실행 시작")
-        robot_cleaner_agent = get_robot_cleaner_agent()
+        robot_cleaner_agent = await get_robot_cleaner_agent_async()
         
         # 입력 메시지 로깅
         if "messages" in state and state["messages"]:
             last_user_msg = state["messages"][-1].content
-            logger.info(f"로봇청소기 에이전트에 전달된 메시지: '{last_user_msg[:100]}...'")
+            logger.info("로봇청소기 에이전트에 전달된 메시지: '%s...'", last_user_msg[:100])
         
-        # 에이전트 호출
+        # 에이전트 호출 (최근 턴과 누적 요약만 토큰 예산 안에서 전달)
         logger.info("로봇청소기 제어 에이전트 추론 시작")
-        result = robot_cleaner_agent.invoke(state)
+        messages = get_context_window().build_context(state["messages"], state.get("summary"), "robot_cleaner_agent")
+        result = await robot_cleaner_agent.ainvoke({**state, "messages": messages})
         logger.info("로봇청소기 제어 에이전트 추론 완료")
         
         # 결과 메시지 생성
         if "messages" in result and result["messages"]:
             last_message = result["messages"][-1]
             robot_cleaner_message = HumanMessage(content=last_message.content, name="robot_cleaner_agent")
-            logger.info(f"로봇청소기 에이전트 응답: '{last_message.content[:1000]}...'")
+            logger.info("로봇청소기 에이전트 응답: '%s...'", last_message.content[:1000])
         else:
             logger.warning("로봇청소기 에이전트가 응답을 생성하지 않음")
             robot_cleaner_message = HumanMessage(content="응답을 생성할 수 없습니다.", name="robot_cleaner_agent")
         
-        logger.info("로봇청소기 제어 에이전트 작업 완료, 슈퍼바이저로 반환")
+        logger.info("로봇청소기 제어 에이전트 작업 완료, 완료 정책 확인으로 이동")
         
-        # 슈퍼바이저로 돌아가기
+        # 완료 정책 확인 (단일 의도 요청이면 슈퍼바이저 없이 종료, 병렬 실행 중이면 응답 병합)
         return Command(
             update={"messages": [robot_cleaner_message]},
-            goto="supervisor"
+            goto="merge_replies" if state.get("fan_out") else "completion_check"
         )
     except Exception as e:
-        logger.error(f"로봇청소기 노드 함수 실행 중 오류 발생: {str(e)}")
+        logger.error("로봇청소기 노드 함수 실행 중 오류 발생: %s", e)
         error_message = HumanMessage(
             content=f"로봇청소기 에이전트 실행 중 오류가 발생했습니다: {str(e)}",
             name="robot_cleaner_agent"
         )
         return Command(
             update={"messages": [error_message]},
-            goto="supervisor"
+            goto="merge_replies" if state.get("fan_out") else "completion_check"
         ) 
\ No newline at end of file
@@ -12,6 +12,7 @@ from logging_config import setup_logger
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 # 도구 가져오기
+from context_window import get_context_window
 from tools.routine_tools import register_routine, list_routines, delete_routine, suggest_routine
 
 # 로거 설정
@@ -32,19 +33,19 @@ def get_routine_tools_with_details() -> List:
         tools = [register_routine, list_routines, delete_routine, suggest_routine]
         
         # 도구 정보 로깅
-        logger.info(f"총 {len(tools)}개의 루틴 관리 도구를 가져왔습니다")
+        logger.info("총 %s개의 루틴 관리 도구를 가져왔습니다", len(tools))
         for i, tool in enumerate(tools, 1):
             try:
                 tool_name = getattr(tool, "name", f"Tool-{i}")
                 tool_desc = getattr(tool, "description", "설명 없음")
-                logger.info(f"  도구 {i}: {tool_name} - {tool_desc}")
+                logger.info("  도구 %s: %s - %s", i, tool_name, tool_desc)
             except Exception as e:
-                logger.warning(f"  도구 {i}의 정보를 가져오는 중 오류: {str(e)}")
+                logger.warning("  도구 %s의 정보를 가져오는 중 오류: %s", i, e)
         
         logger.info("루틴 관리 도구 로딩 완료")
         return tools
     except Exception as e:
-        logger.error(f"루틴 관리 도구 로딩 중 오류 발생: {str(e)}")
+        logger.error("루틴 관리 도구 로딩 중 오류 발생: %s", e)
         raise
 
 
@@ -57,7 +58,7 @@ def get_routine_agent():
             
             # 모델 설정 가져오기
             model_name = os.getenv("MODEL_NAME", "gemini-2.5-pro-exp-03-25")
-            logger.info(f"루틴 관리 에이전트 LLM 모델: {model_name}")
+            logger.info("루틴 관리 에이전트 LLM 모델: %s", model_name)
             
             # LLM 초기화
             logger.info("LLM 초기화 중...")
@@ -118,13 +119,13 @@ def get_routine_agent():
             
             logger.info("루틴 관리 에이전트 초기화 완료")
         except Exception as e:
-            logger.error(f"루틴 관리 에이전트 초기화 중 오류 발생: {str(e)}")
+            logger.error("루틴 관리 에이전트 초기화 중 오류 발생: %s", e)
             raise
         
     return _agent_instance
 
 
-def routine_node(state: MessagesState) -> Command[Literal["supervisor"]]:
+def routine_node(state: MessagesState) -> Command[Literal["completion_check", "merge_replies"]]:
     """
     루틴 관리 에이전트 노드 함수입니다.
     
@@ -132,7 +133,7 @@ def routine_node(state: MessagesState) -> Command[Literal["supervisor"]]:
         state: 현재 메시지와 상태 정보
         
     Returns:
-        슈퍼바이저로 돌아가는 명령
+        완료 정책 확인 또는 병렬 응답 병합 노드로 가는 명령
     """
     try:
         # 에이전트 인스턴스 가져오기
@@ -142,36 +143,37 @@ def routine_node(state: MessagesState) -> Command[Literal["supervisor"]]:
         # 입력 메시지 로깅
         if "messages" in state and state["messages"]:
             last_user_msg = state["messages"][-1].content
-            logger.info(f"루틴 에이전트에 전달된 메시지: '{last_user_msg[:100]}...'")
+            logger.info("루틴 에이전트에 전달된 메시지: '%s...'", last_user_msg[:100])
         
-        # 에이전트 호출
+        # 에이전트 호출 (최근 턴과 누적 요약만 토큰 예산 안에서 전달)
         logger.info("루틴 관리 에이전트 추론 시작")
-        result = routine_agent.invoke(state)
+        messages = get_context_window().build_context(state["messages"], state.get("summary"), "routine_agent")
+        result = routine_agent.invoke({**state, "messages": messages})
         logger.info("루틴 관리 에이전트 추론 완료")
         
         # 결과 메시지 생성
         if "messages" in result and result["messages"]:
             last_message = result["messages"][-1]
             routine_message = HumanMessage(content=last_message.content, name="routine_agent")
-            logger.info(f"루틴 에이전트 응답: '{last_message.content[:1000]}...'")
+            logger.info("루틴 에이전트 응답: '%s...'", last_message.content[:1000])
         else:
             logger.warning("루틴 에이전트가 응답을 생성하지 않음")
             routine_message = HumanMessage(content="응답을 생성할 수 없습니다.", name="routine_agent")
         
-        logger.info("루틴 관리 에이전트 작업 완료, 슈퍼바이저로 반환")
+        logger.info("루틴 관리 에이전트 작업 완료, 완료 정책 확인으로 이동")
         
-        # 슈퍼바이저로 돌아가기
+        # 완료 정책 확인 (단일 의도 요청이면 슈퍼바이저 없이 종료, 병렬 실행 중이면 응답 병합)
         return Command(
             update={"messages": [routine_message]},
-            goto="supervisor"
+            goto="merge_replies" if state.get("fan_out") else "completion_check"
         )
     except Exception as e:
-        logger.error(f"루틴 관리 노드 함수 실행 중 오류 발생: {str(e)}")
+        logger.error("루틴 관리 노드 함수 실행 중 오류 발생: %s", e)
         error_message = HumanMessage(
             content=f"루틴 관리 에이전트 실행 중 오류가 발생했습니다: {str(e)}",
             name="routine_agent"
         )
         return Command(
             update={"messages": [error_message]},
-            goto="supervisor"
+            goto="merge_replies" if state.get("fan_out") else "completion_check"
         ) 
\ No newline at end of file
@@ -1,14 +1,17 @@
 import os
 import json
-from typing import Literal, List, Dict, Any
+from typing import Literal, List, Dict, Any, Optional
 from typing_extensions import TypedDict
 
-from langchain_core.messages import SystemMessage, BaseMessage
+from langchain_core.messages import SystemMessage, BaseMessage, HumanMessage
 from langgraph.graph import MessagesState, END
-from langgraph.types import Command
+from langgraph.types import Command, Send
 from langchain_google_vertexai import ChatVertexAI
 from dotenv import load_dotenv
 from logging_config import setup_logger
+from agents.fast_router import get_fast_router
+from agents.completion_policy import get_completion_policy
+from context_window import get_context_window
 
 # 로거 설정
 logger = setup_logger("supervisor_agent")
@@ -21,8 +24,22 @@ members = ["device_agent", "routine_agent", "robot_cleaner_agent"]
 # 라우팅 옵션 (모든 멤버 + 종료)
 options = members + ["FINISH"]
 
-logger.info(f"슈퍼바이저 에이전트 멤버 목록: {members}")
-logger.info(f"라우팅 옵션: {options}")
+logger.info("슈퍼바이저 에이전트 멤버 목록: %s", members)
+logger.info("라우팅 옵션: %s", options)
+
+# 병렬 실행 시 각 에이전트에 덧붙이는 담당 범위 안내
+AGENT_TASK_HINTS = {
+    "routine_agent": "이 요청 중 루틴 관련 작업만 처리하세요.",
+    "device_agent": "이 요청 중 냉장고, 에어컨 관련 작업만 처리하세요.",
+    "robot_cleaner_agent": "이 요청 중 로봇청소기 관련 작업만 처리하세요.",
+}
+
+# 병렬 실행 결과를 합칠 때 사용하는 에이전트 표시 이름
+AGENT_LABELS = {
+    "routine_agent": "루틴",
+    "device_agent": "가전제품",
+    "robot_cleaner_agent": "로봇청소기",
+}
 
 # 슈퍼바이저 시스템 프롬프트
 system_prompt = """당신은 스마트홈 시스템의 슈퍼바이저 에이전트입니다. 사용자의 요청을 분석하여 적절한 에이전트에 작업을 할당합니다.
@@ -65,7 +82,7 @@ def get_llm():
             logger.info("슈퍼바이저 LLM 모델 초기화 시작")
             
             model_name = os.getenv("MODEL_NAME", "gemini-2.5-pro-exp-03-25")
-            logger.info(f"슈퍼바이저 에이전트 LLM 모델: {model_name}")
+            logger.info("슈퍼바이저 에이전트 LLM 모델: %s", model_name)
             
             _llm_instance = ChatVertexAI(
                 model=model_name,
@@ -75,7 +92,7 @@ def get_llm():
             
             logger.info("슈퍼바이저 LLM 모델 초기화 완료")
         except Exception as e:
-            logger.error(f"슈퍼바이저 LLM 모델 초기화 중 오류 발생: {str(e)}")
+            logger.error("슈퍼바이저 LLM 모델 초기화 중 오류 발생: %s", e)
             raise
     
     return _llm_instance
@@ -84,11 +101,19 @@ def get_llm():
 class State(MessagesState):
     """메시지 상태와 다음 라우팅 정보를 포함하는 상태 클래스"""
     next: str
+    # 완료 정책으로 생략한 슈퍼바이저 호출 수 (요청 단위)
+    supervisor_calls_avoided: int
+    # 복합 요청을 동시에 처리할 에이전트 목록
+    targets: List[str]
+    # 병렬 실행 중인 에이전트 분기 여부 (Send로 전달되는 분기 입력에만 설정)
+    fan_out: bool
+    # 최근 턴보다 오래된 대화의 누적 요약
+    summary: Optional[str]
 
 
 def log_messages(messages: List[BaseMessage]) -> None:
     """메시지 목록의 내용을 로그로 남깁니다."""
-    logger.info(f"총 {len(messages)}개의 메시지가 있습니다")
+    logger.info("총 %s개의 메시지가 있습니다", len(messages))
     
     # 마지막 메시지 로깅
     if messages:
@@ -102,7 +127,7 @@ def log_messages(messages: List[BaseMessage]) -> None:
             
         if hasattr(last_msg, "content"):
             content = last_msg.content
-            logger.info(f"마지막 메시지(타입: {msg_type}): '{content[:100]}...'")
+            logger.info("마지막 메시지(타입: %s): '%s...'", msg_type, content[:100])
 
 
 def supervisor_node(state: State) -> Command[Literal[*members, "__end__"]]:
@@ -123,11 +148,30 @@ def supervisor_node(state: State) -> Command[Literal[*members, "__end__"]]:
         if "messages" in state:
             log_messages(state["messages"])
         
-        # 시스템 메시지와 상태 메시지 결합
+        # 여러 에이전트의 독립적인 작업으로 나뉘는 요청은 동시에 실행
+        targets = get_fast_router().fan_out_targets(state["messages"])
+        if targets:
+            query = state["messages"][-1].content
+            sends = [
+                Send(agent, {
+                    "messages": list(state["messages"][:-1]) + [HumanMessage(content=f"{query}\n\n({AGENT_TASK_HINTS[agent]})")],
+                    "fan_out": True,
+                })
+                for agent in targets
+            ]
+            logger.info("복합 요청 병렬 실행: %s", targets)
+            return Command(goto=sends, update={"next": "fan_out", "targets": targets})
+        
+        # 규칙으로 분류 가능한 새 요청은 LLM 호출 없이 라우팅
+        fast_route = get_fast_router().route(state["messages"])
+        if fast_route is not None:
+            return Command(goto=fast_route, update={"next": fast_route})
+        
+        # 시스템 메시지와 상태 메시지 결합 (최근 턴과 누적 요약만 토큰 예산 안에서 전달)
         logger.info("슈퍼바이저 메시지 구성 중")
         messages = [
             SystemMessage(content=system_prompt),
-        ] + state["messages"]
+        ] + get_context_window().build_context(state["messages"], state.get("summary"), "supervisor")
         
         # LLM 모델 가져오기
         logger.info("슈퍼바이저 LLM 모델 호출 준비")
@@ -138,20 +182,67 @@ def supervisor_node(state: State) -> Command[Literal[*members, "__end__"]]:
         response = llm.with_structured_output(Router).invoke(messages)
         goto = response["next"]
         
-        logger.info(f"슈퍼바이저 라우팅 결정 완료: {goto}")
+        logger.info("슈퍼바이저 라우팅 결정 완료: %s", goto)
         
         # FINISH인 경우 종료
         if goto == "FINISH":
             logger.info("모든 작업 완료, 대화 종료")
             goto = END
         else:
-            logger.info(f"다음 에이전트로 {goto} 선택됨")
+            logger.info("다음 에이전트로 %s 선택됨", goto)
         
         # 명령 생성 및 반환
-        logger.info(f"슈퍼바이저 노드 함수 실행 완료, 다음 경로: {goto}")
+        logger.info("슈퍼바이저 노드 함수 실행 완료, 다음 경로: %s", goto)
         return Command(goto=goto, update={"next": goto})
     
     except Exception as e:
-        logger.error(f"슈퍼바이저 노드 함수 실행 중 오류 발생: {str(e)}")
+        logger.error("슈퍼바이저 노드 함수 실행 중 오류 발생: %s", e)
         # 오류 발생 시 종료
-        return Command(goto=END, update={"next": "ERROR"}) 
\ No newline at end of file
+        return Command(goto=END, update={"next": "ERROR"})
+
+
+def completion_check_node(state: State) -> Command[Literal["supervisor", "__end__"]]:
+    """
+    완료 정책 노드 함수입니다.
+    단일 의도 요청을 에이전트가 오류 없이 처리했으면 슈퍼바이저 호출 없이 종료합니다.
+    
+    Args:
+        state: 현재 메시지와 상태 정보
+        
+    Returns:
+        종료 또는 슈퍼바이저로 돌아가는 명령
+    """
+    if get_completion_policy().should_finish(state["messages"]):
+        avoided = state.get("supervisor_calls_avoided", 0) + 1
+        logger.info("단일 의도 요청 완료, 슈퍼바이저 호출 생략 (요청 내 생략 횟수: %s)", avoided)
+        return Command(goto=END, update={"next": END, "supervisor_calls_avoided": avoided})
+    return Command(goto="supervisor")
+
+
+def merge_replies_node(state: State) -> Command[Literal["__end__"]]:
+    """
+    병렬 응답 병합 노드 함수입니다.
+    병렬 실행된 에이전트 응답을 대상 순서대로 합쳐 하나의 최종 응답으로 만들고 종료합니다.
+    
+    Args:
+        state: 현재 메시지와 상태 정보
+        
+    Returns:
+        최종 응답을 추가하고 종료하는 명령
+    """
+    targets = state.get("targets") or []
+    # 마지막 사용자 요청 이후의 에이전트 응답
+    replies = []
+    for message in reversed(state["messages"]):
+        if getattr(message, "name", None) not in members:
+            break
+        replies.append(message)
+    replies.sort(key=lambda message: targets.index(message.name) if message.name in targets else len(targets))
+    
+    sections = [f"[{AGENT_LABELS.get(reply.name, reply.name)}] {reply.content}" for reply in replies]
+    summary = HumanMessage(content="\n\n".join(sections), name="supervisor")
+    
+    # 순차 실행이었다면 에이전트 응답마다 슈퍼바이저를 한 번씩 호출했을 것
+    avoided = state.get("supervisor_calls_avoided", 0) + len(replies)
+    logger.info("병렬 응답 병합 완료: %s (생략된 슈퍼바이저 호출: %s)", [reply.name for reply in replies], avoided)
+    return Command(goto=END, update={"messages": [summary], "next": END, "supervisor_calls_avoided": avoided})
@@ -6,6 +6,7 @@ from typing import Optional, Dict, Any, List
 import uuid
 import json
 import sys
+import re
 import time
 import datetime
 
@@ -30,6 +31,7 @@ from logging_config import setup_logger
 # 스마트홈 에이전트 및 그래프 가져오기
 from graphs.smarthome_graph import get_smarthome_graph, get_mermaid_graph
 from session_manager import FileSystemSessionManager
+from context_window import get_context_window
 
 # MCP 클라이언트 및 도구 가져오기 (사이드바 MCP 정보 표시용)
 from agents.robot_cleaner_agent import init_mcp_client, get_tools_with_details
@@ -59,7 +61,7 @@ async def refresh_mcp_info():
         
         # MCP 도구 가져오기
         tools = await get_tools_with_details()
-        logger.info(f"MCP 도구 {len(tools)}개 로드 완료")
+        logger.info("MCP 도구 %s개 로드 완료", len(tools))
         
         # 결과 반환
         return {
@@ -69,14 +71,14 @@ async def refresh_mcp_info():
             "tools": tools
         }
     except Exception as e:
-        logger.error(f"MCP 정보 새로고침 중 오류 발생: {str(e)}")
+        logger.error("MCP 정보 새로고침 중 오류 발생: %s", e)
         return {"status": "error", "error": str(e)}
 
 # 세션 관리자 초기화
 if "session_manager" not in st.session_state:
     session_store_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "session_store")
     st.session_state.session_manager = FileSystemSessionManager(session_dir=session_store_path)
-    logger.info(f"세션 관리자 초기화 완료 (저장 위치: {session_store_path})")
+    logger.info("세션 관리자 초기화 완료 (저장 위치: %s)", session_store_path)
 
 # 세션 상태에 초기화 진행 플래그 추가 (이미 완료했지만 아직 새로고침 안된 상태 구분)
 if "initialization_completed" not in st.session_state:
@@ -95,6 +97,8 @@ if "session_initialized" not in st.session_state:
     st.session_state.graph = None  # 그래프 객체 저장 공간
     st.session_state.history = []  # 대화 기록 저장 리스트
     st.session_state.thread_id = str(uuid.uuid4())  # 세션 고유 ID
+    st.session_state.summary = None  # 최근 턴보다 오래된 대화의 누적 요약
+    st.session_state.summary_upto = 0  # 누적 요약에 합쳐진 메시지 수
 
 # 탭 관리를 위한 세션 상태 초기화
 if "active_tabs" not in st.session_state:
@@ -112,6 +116,8 @@ def create_new_session():
     session_id = st.session_state.session_manager.create_session()
     st.session_state.thread_id = session_id
     st.session_state.history = []
+    st.session_state.summary = None
+    st.session_state.summary_upto = 0
     
     # 새 세션을 메인 탭으로 설정
     st.session_state.active_session_id = session_id
@@ -120,7 +126,7 @@ def create_new_session():
     if session_id not in st.session_state.active_tabs:
         st.session_state.active_tabs.append(session_id)
     
-    logger.info(f"새 세션 생성됨: {session_id}")
+    logger.info("새 세션 생성됨: %s", session_id)
     
     # 세션 상태 UI 업데이트
     st.success("✅ 새 세션이 생성되었습니다!")
@@ -151,6 +157,37 @@ def dict_to_langchain_message(message_dict):
         # 기본적으로 HumanMessage 반환
         return HumanMessage(content=content)
 
+# 응답 끝에 붙인 처리 시간 문구 (그래프에 이전 대화를 전달할 때 제거)
+TIMING_SUFFIX_PATTERN = re.compile(r"\n\n\*(첫 토큰: [^*]*· )?응답 처리 시간: [\d.]+초\*$")
+
+def history_to_graph_message(message_dict):
+    """
+    대화 기록 항목을 그래프에 전달할 메시지로 변환합니다.
+    
+    에이전트 응답은 그래프가 만드는 응답과 같이 이름이 있는 HumanMessage로 변환하여
+    빠른 라우터, 완료 정책, 컨텍스트 관리자가 사용자 요청과 구분할 수 있도록 합니다.
+    """
+    role = message_dict.get("role", "")
+    content = message_dict.get("content") or ""
+    if role == "user":
+        return HumanMessage(content=content)
+    return HumanMessage(content=TIMING_SUFFIX_PATTERN.sub("", content), name=message_dict.get("name") or "supervisor")
+
+def build_graph_inputs(query: str) -> Dict[str, Any]:
+    """
+    이전 대화와 새 질문으로 그래프 입력을 만듭니다.
+    
+    최근 턴보다 오래된 대화는 누적 요약에 합치고, 요약되지 않은 메시지와 요약만 그래프에 전달합니다.
+    요약 위치는 대화 기록 인덱스와 같으므로 질문과 응답을 기록에 추가하면 그대로 이어집니다.
+    """
+    messages = [history_to_graph_message(msg) for msg in st.session_state.history]
+    messages.append(HumanMessage(content=query))
+    
+    summary, summary_upto = get_context_window().fold(messages, st.session_state.summary, st.session_state.summary_upto)
+    st.session_state.summary = summary
+    st.session_state.summary_upto = summary_upto
+    return {"messages": messages[summary_upto:], "summary": summary}
+
 def save_current_session():
     """현재 세션을 저장합니다."""
     if not st.session_state.session_initialized:
@@ -164,21 +201,23 @@ def save_current_session():
             try:
                 langchain_messages.append(dict_to_langchain_message(msg))
             except Exception as e:
-                logger.warning(f"메시지 변환 중 오류 발생: {str(e)}")
+                logger.warning("메시지 변환 중 오류 발생: %s", e)
         
         # 세션 상태 생성
         session_data = {
             "messages": langchain_messages,
             "next": None,
+            "summary": st.session_state.summary,
+            "summary_upto": st.session_state.summary_upto,
         }
         
         # 세션 저장
         st.session_state.session_manager.update_session(st.session_state.thread_id, session_data)
-        logger.info(f"세션 {st.session_state.thread_id} 저장됨 (메시지 수: {len(st.session_state.history)})")
+        logger.info("세션 %s 저장됨 (메시지 수: %s)", st.session_state.thread_id, len(st.session_state.history))
         return True
     except Exception as e:
         import traceback
-        logger.error(f"세션 저장 실패: {str(e)}")
+        logger.error("세션 저장 실패: %s", e)
         logger.error(traceback.format_exc())
         return False
 
@@ -187,7 +226,7 @@ def load_session(session_id: str):
     # 세션 데이터 가져오기
     session_data = st.session_state.session_manager.get_session(session_id)
     if not session_data:
-        logger.warning(f"존재하지 않는 세션을 불러오려고 시도함: {session_id}")
+        logger.warning("존재하지 않는 세션을 불러오려고 시도함: %s", session_id)
         st.error("❌ 세션을 불러올 수 없습니다!")
         return False
     
@@ -202,7 +241,7 @@ def load_session(session_id: str):
     # 현재 활성 세션으로 설정
     st.session_state.active_session_id = session_id
     
-    logger.info(f"세션 {session_id} 불러오기 완료")
+    logger.info("세션 %s 불러오기 완료", session_id)
     st.success(f"✅ 세션 '{session_id[:8]}...'이(가) 열렸습니다!")
     st.rerun()
 
@@ -221,7 +260,7 @@ def close_tab(session_id: str):
                 # 열린 탭이 없으면 현재 세션 유지
                 st.session_state.active_session_id = st.session_state.thread_id
         
-        logger.info(f"세션 탭 닫힘: {session_id}")
+        logger.info("세션 탭 닫힘: %s", session_id)
         st.rerun()
 
 def switch_tab(session_id: str):
@@ -233,7 +272,7 @@ def switch_tab(session_id: str):
     # 활성 세션 전환
     st.session_state.active_session_id = session_id
     
-    logger.info(f"세션 탭 전환: {session_id}")
+    logger.info("세션 탭 전환: %s", session_id)
     st.rerun()
 
 def get_session_history(session_id: str) -> List[Dict]:
@@ -269,19 +308,21 @@ def delete_session(session_id: str):
     # 세션 삭제
     success = st.session_state.session_manager.delete_session(session_id)
     if success:
-        logger.info(f"세션 {session_id} 삭제됨")
+        logger.info("세션 %s 삭제됨", session_id)
         
         # 현재 세션이 삭제된 경우 새 세션 생성
         if is_current:
             st.session_state.thread_id = str(uuid.uuid4())
             st.session_state.history = []
+            st.session_state.summary = None
+            st.session_state.summary_upto = 0
             st.success("✅ 현재 세션이 삭제되었습니다. 새 세션으로 전환합니다.")
         else:
             st.success(f"✅ 세션 '{session_id[:8]}...'이(가) 삭제되었습니다!")
         
         st.rerun()
     else:
-        logger.warning(f"존재하지 않는 세션을 삭제하려고 시도함: {session_id}")
+        logger.warning("존재하지 않는 세션을 삭제하려고 시도함: %s", session_id)
         st.error("❌ 세션 삭제에 실패했습니다!")
 
 def format_timestamp(timestamp: float) -> str:
@@ -304,50 +345,65 @@ def print_message():
                 st.info(f"**{message['name']}**: {message['content']}")
 
 
-def get_streaming_callback(response_placeholder):
+# 토큰을 화면에 표시할 에이전트 노드 (슈퍼바이저의 라우팅 결정 토큰은 표시하지 않음)
+STREAM_AGENT_NODES = ("device_agent", "robot_cleaner_agent", "routine_agent")
+
+# 진행 상황에 표시할 노드 이름
+STREAM_NODE_LABELS = {
+    "supervisor": "슈퍼바이저",
+    "device_agent": "가전 제어 에이전트",
+    "robot_cleaner_agent": "로봇청소기 에이전트",
+    "routine_agent": "루틴 에이전트",
+    "completion_check": "완료 확인",
+    "merge_replies": "응답 병합",
+}
+
+
+def get_stream_node(metadata: Dict[str, Any]) -> Optional[str]:
     """
-    스트리밍 콜백 함수를 생성합니다.
-    
-    Args:
-        response_placeholder: 응답을 표시할 Streamlit 컴포넌트
-    
-    Returns:
-        callback_func: 스트리밍 콜백 함수
+    스트리밍 메타데이터에서 최상위 그래프 노드 이름을 찾습니다.
+
+    에이전트 노드 내부의 ReAct 에이전트가 만든 토큰도 해당 에이전트 노드로 분류되도록
+    checkpoint_ns의 첫 구간("device_agent:<id>|agent:<id>" → "device_agent")을 사용합니다.
     """
-    accumulated_text = []
-    
-    def callback_func(chunk):
-        nonlocal accumulated_text
-        
-        # 청크가 메시지인 경우
-        if isinstance(chunk, dict) and "messages" in chunk:
-            messages = chunk["messages"]
-            if messages and len(messages) > 0:
-                last_message = messages[-1]
-                if hasattr(last_message, 'content'):
-                    content = last_message.content
-                    accumulated_text.append(content)
-                    response_placeholder.markdown("".join(accumulated_text))
-        
-        # 청크가 AIMessageChunk인 경우
-        elif isinstance(chunk, AIMessageChunk):
-            if chunk.content:
-                accumulated_text.append(chunk.content)
-                response_placeholder.markdown("".join(accumulated_text))
-                
-        # 청크가 다른 형태의 메시지인 경우
-        elif isinstance(chunk, dict) and "content" in chunk:
-            accumulated_text.append(chunk["content"])
-            response_placeholder.markdown("".join(accumulated_text))
-        
-        return None
-    
-    return callback_func, accumulated_text
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns") or metadata.get("checkpoint_ns") or ""
+    if checkpoint_ns:
+        return checkpoint_ns.split("|")[0].split(":")[0]
+    return metadata.get("langgraph_node")
+
+
+def render_streaming_response(response_placeholder, steps: List[str], text: str) -> None:
+    """진행 단계와 지금까지 받은 토큰을 함께 표시합니다."""
+    progress = " → ".join(steps)
+    body = f"*{progress}*\n\n{text}" if progress else text
+    response_placeholder.markdown(body + " ▌")
+
+
+def record_query_metrics(query: str, time_to_first_token: Optional[float], processing_time: float) -> None:
+    """질의별 첫 토큰 시간과 전체 처리 시간을 세션 상태에 기록합니다."""
+    if "query_metrics" not in st.session_state:
+        st.session_state.query_metrics = []
+    st.session_state.query_metrics.append({
+        "query": query[:50],
+        "time_to_first_token": time_to_first_token,
+        "processing_time": processing_time,
+        "timestamp": time.time(),
+    })
+
+
+def format_timing(time_to_first_token: Optional[float], processing_time: float) -> str:
+    """응답 아래에 붙일 처리 시간 문구를 만듭니다."""
+    if time_to_first_token is None:
+        return f"\n\n*응답 처리 시간: {processing_time:.2f}초*"
+    return f"\n\n*첫 토큰: {time_to_first_token:.2f}초 · 응답 처리 시간: {processing_time:.2f}초*"
 
 
 async def process_query_streaming(query: str, response_placeholder, timeout_seconds=60) -> Optional[str]:
     """
-    사용자 질문을 처리하고 응답을 스트리밍 방식으로 생성합니다.
+    사용자 질문을 처리하고 그래프의 스트리밍 출력을 생성되는 즉시 표시합니다.
+
+    graph.astream의 "messages" 모드로 에이전트 LLM 토큰을, "updates" 모드로 노드 실행 단계를 받습니다.
+    첫 토큰까지의 시간과 전체 처리 시간을 기록합니다.
     
     Args:
         query: 사용자가 입력한 질문 텍스트
@@ -358,63 +414,81 @@ async def process_query_streaming(query: str, response_placeholder, timeout_seco
         final_text: 최종 응답 텍스트
     """
     start_time = time.time()  # 시작 시간 기록
+    time_to_first_token = None
     
     try:
         if st.session_state.graph:
             # 그래프 호출
-            logger.info(f"사용자 쿼리 처리 시작: '{query[:50]}'..." if len(query) > 50 else query)
+            logger.info("사용자 쿼리 처리 시작: '%s'%s", query[:50], "..." if len(query) > 50 else "")
             
             # 스트리밍 방식으로 호출
             try:
-                inputs = {"messages": [HumanMessage(content=query)]}
+                # 이전 대화(최근 턴과 누적 요약)를 함께 전달
+                inputs = build_graph_inputs(query)
                 config = RunnableConfig(
                     recursion_limit=100,
-                    thread_id=st.session_state.thread_id
+                    configurable={"thread_id": st.session_state.thread_id}
                 )
                 
-                # 간단한 접근 방식: 비동기로 먼저 전체 응답을 받음
-                response = await asyncio.wait_for(
-                    st.session_state.graph.ainvoke(inputs),
-                    timeout=timeout_seconds
-                )
+                steps: List[str] = []
+                streamed_text: List[str] = []
+                last_stream_node = None
+                final_text = None
+                supervisor_calls_avoided = 0
                 
-                # 마지막 메시지 추출
-                if "messages" in response and response["messages"]:
-                    final_text = response["messages"][-1].content
-                    
-                    # 사용자 설정 워드 딜레이 가져오기
-                    word_delay = st.session_state.get("word_delay", 0.01)
-                    
-                    # 응답 텍스트를 단어 단위로 스트리밍처럼 표시 (실제 스트리밍 대신 시뮬레이션)
-                    words = final_text.split()
-                    current_text = []
-                    
-                    for word in words:
-                        current_text.append(word)
-                        display_text = " ".join(current_text)
-                        response_placeholder.markdown(display_text)
-                        # 단어 사이 사용자 설정 딜레이 적용
-                        await asyncio.sleep(word_delay)
-                    
-                    # 처리 시간 계산 및 표시
-                    end_time = time.time()
-                    processing_time = end_time - start_time
-                    processing_time_msg = f"\n\n*응답 처리 시간: {processing_time:.2f}초*"
-                    
-                    # 최종 텍스트에 처리 시간 추가
-                    final_text_with_time = final_text + processing_time_msg
+                async def consume_stream():
+                    nonlocal time_to_first_token, last_stream_node, final_text, supervisor_calls_avoided
+                    async for mode, chunk in st.session_state.graph.astream(
+                        inputs, config, stream_mode=["messages", "updates"]
+                    ):
+                        if mode == "messages":
+                            message, metadata = chunk
+                            node = get_stream_node(metadata)
+                            # 에이전트 LLM의 토큰만 표시 (노드가 반환한 완성 메시지는 updates에서 처리)
+                            if node not in STREAM_AGENT_NODES or not isinstance(message, AIMessageChunk):
+                                continue
+                            token = message.content if isinstance(message.content, str) else ""
+                            if not token:
+                                continue
+                            if time_to_first_token is None:
+                                time_to_first_token = time.time() - start_time
+                                logger.info("첫 토큰 수신: %.2f초 (%s)", time_to_first_token, node)
+                            # 다른 에이전트의 토큰이 이어지면 문단을 나눔
+                            if last_stream_node is not None and node != last_stream_node:
+                                streamed_text.append("\n\n")
+                            last_stream_node = node
+                            streamed_text.append(token)
+                            render_streaming_response(response_placeholder, steps, "".join(streamed_text))
+                        
+                        elif mode == "updates":
+                            for node, update in chunk.items():
+                                steps.append(STREAM_NODE_LABELS.get(node, node))
+                                if not isinstance(update, dict):
+                                    continue
+                                messages = update.get("messages")
+                                if messages:
+                                    final_text = messages[-1].content
+                                supervisor_calls_avoided = update.get("supervisor_calls_avoided", supervisor_calls_avoided)
+                            render_streaming_response(response_placeholder, steps, "".join(streamed_text))
+                
+                await asyncio.wait_for(consume_stream(), timeout=timeout_seconds)
+                
+                # 처리 시간 계산
+                processing_time = time.time() - start_time
+                record_query_metrics(query, time_to_first_token, processing_time)
+                
+                if final_text:
+                    # 최종 응답으로 교체 (병합 요약 등 토큰으로 스트리밍되지 않은 응답 포함)
+                    final_text_with_time = final_text + format_timing(time_to_first_token, processing_time)
                     response_placeholder.markdown(final_text_with_time)
                     
-                    logger.info(f"쿼리 처리 완료: '{query[:30]}...', 처리 시간: {processing_time:.2f}초")
+                    ttft_text = f"{time_to_first_token:.2f}초" if time_to_first_token is not None else "없음"
+                    logger.info("쿼리 처리 완료: '%s...', 첫 토큰: %s, 처리 시간: %.2f초, 생략된 슈퍼바이저 호출: %s", query[:30], ttft_text, processing_time, supervisor_calls_avoided)
                     return final_text_with_time
                 else:
                     logger.warning("응답 메시지가 없습니다.")
                     error_msg = "죄송합니다. 응답을 생성하지 못했습니다."
-                    
-                    # 처리 시간 계산 및 표시
-                    end_time = time.time()
-                    processing_time = end_time - start_time
-                    error_msg_with_time = f"{error_msg}\n\n*응답 처리 시간: {processing_time:.2f}초*"
+                    error_msg_with_time = error_msg + format_timing(time_to_first_token, processing_time)
                     
                     response_placeholder.markdown(error_msg_with_time)
                     return error_msg_with_time
@@ -424,9 +498,9 @@ async def process_query_streaming(query: str, response_placeholder, timeout_seco
                 logger.error(error_msg)
                 
                 # 처리 시간 계산 및 표시
-                end_time = time.time()
-                processing_time = end_time - start_time
-                error_msg_with_time = f"{error_msg}\n\n*응답 처리 시간: {processing_time:.2f}초*"
+                processing_time = time.time() - start_time
+                record_query_metrics(query, time_to_first_token, processing_time)
+                error_msg_with_time = error_msg + format_timing(time_to_first_token, processing_time)
                 
                 response_placeholder.markdown(error_msg_with_time)
                 return error_msg_with_time
@@ -438,9 +512,8 @@ async def process_query_streaming(query: str, response_placeholder, timeout_seco
                 logger.error(traceback.format_exc())
                 
                 # 처리 시간 계산 및 표시
-                end_time = time.time()
-                processing_time = end_time - start_time
-                error_msg_with_time = f"죄송합니다. 오류가 발생했습니다: {str(e)}\n\n*응답 처리 시간: {processing_time:.2f}초*"
+                processing_time = time.time() - start_time
+                error_msg_with_time = f"죄송합니다. 오류가 발생했습니다: {str(e)}" + format_timing(time_to_first_token, processing_time)
                 
                 response_placeholder.markdown(error_msg_with_time)
                 return error_msg_with_time
@@ -485,9 +558,9 @@ async def process_query(query: str) -> Optional[str]:
     try:
         if st.session_state.graph:
             # 그래프 호출
-            logger.info(f"사용자 쿼리 처리 시작: '{query[:50]}'..." if len(query) > 50 else query)
+            logger.info("사용자 쿼리 처리 시작: '%s'%s", query[:50], "..." if len(query) > 50 else "")
             
-            inputs = {"messages": [HumanMessage(content=query)]}
+            inputs = build_graph_inputs(query)
             response = await st.session_state.graph.ainvoke(inputs)
             
             # 응답 처리
@@ -501,7 +574,7 @@ async def process_query(query: str) -> Optional[str]:
                     processing_time = end_time - start_time
                     response_content_with_time = f"{response_content}\n\n*응답 처리 시간: {processing_time:.2f}초*"
                     
-                    logger.info(f"쿼리 처리 완료: '{query[:30]}...', 처리 시간: {processing_time:.2f}초")
+                    logger.info("쿼리 처리 완료: '%s...', 처리 시간: %.2f초, 생략된 슈퍼바이저 호출: %s", query[:30], processing_time, response.get('supervisor_calls_avoided', 0))
                     return response_content_with_time
                 else:
                     logger.warning("응답 메시지가 없습니다.")
@@ -702,7 +775,7 @@ with st.sidebar:
         else:
             st.info("저장된 세션이 없습니다.")
     except Exception as e:
-        logger.error(f"세션 목록 조회 실패: {str(e)}")
+        logger.error("세션 목록 조회 실패: %s", e)
         st.error(f"세션 목록을 불러올 수 없습니다: {str(e)}")
     
     # 구분선
@@ -852,19 +925,22 @@ with st.sidebar:
     # 스트리밍 모드 토글
     st.session_state.streaming_mode = st.toggle("스트리밍 응답 활성화", value=True)
     
-    # 응답 속도 조절 (단어 표시 간격)
-    if st.session_state.get("streaming_mode", True):
-        if "word_delay" not in st.session_state:
-            st.session_state.word_delay = 0.01
-        
-        st.session_state.word_delay = st.slider(
-            "응답 속도 조절", 
-            min_value=0.0, 
-            max_value=0.05, 
-            value=st.session_state.word_delay,
-            step=0.01,
-            format="%.2f초"
-        )
+    # 응답 시간 통계 (스트리밍 모드에서 기록)
+    query_metrics = st.session_state.get("query_metrics", [])
+    if query_metrics:
+        last = query_metrics[-1]
+        ttft_values = [m["time_to_first_token"] for m in query_metrics if m["time_to_first_token"] is not None]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric(
+                "첫 토큰 (최근)",
+                f"{last['time_to_first_token']:.2f}초" if last["time_to_first_token"] is not None else "-"
+            )
+        with col2:
+            st.metric("전체 시간 (최근)", f"{last['processing_time']:.2f}초")
+        avg_total = sum(m["processing_time"] for m in query_metrics) / len(query_metrics)
+        avg_ttft = f"{sum(ttft_values) / len(ttft_values):.2f}초" if ttft_values else "-"
+        st.caption(f"평균 첫 토큰: {avg_ttft} · 평균 전체 시간: {avg_total:.2f}초 ({len(query_metrics)}건)")
 
 # --- 기본 세션 초기화 (초기화되지 않은 경우) ---
 if not st.session_state.session_initialized:
@@ -1,7 +1,7 @@
 import os
 from langgraph.graph import StateGraph, START, END
 
-from agents.supervisor_agent import supervisor_node, State
+from agents.supervisor_agent import supervisor_node, completion_check_node, merge_replies_node, State
 from agents.device_agent import device_node
 from agents.routine_agent import routine_node
 from agents.robot_cleaner_agent import robot_cleaner_node
@@ -31,6 +31,10 @@ def get_smarthome_graph():
         builder.add_node("device_agent", device_node)
         builder.add_node("routine_agent", routine_node)
         builder.add_node("robot_cleaner_agent", robot_cleaner_node)
+        # 에이전트 응답 후 슈퍼바이저 재호출 여부를 결정하는 완료 정책 노드
+        builder.add_node("completion_check", completion_check_node)
+        # 복합 요청을 병렬 실행한 뒤 에이전트 응답을 합치는 노드
+        builder.add_node("merge_replies", merge_replies_node)
         
         # 그래프 컴파일
         _graph_instance = builder.compile()
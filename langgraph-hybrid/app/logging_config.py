@@ -1,70 +1,148 @@
 import os
+import atexit
+import queue
+import random
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import threading
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 import pathlib
-import sys
 
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_LEVEL = getattr(logging, LOG_LEVEL)
+LOG_LEVEL = logging.INFO
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+# 로거별 INFO/DEBUG 로그 샘플링 비율 (예: "device_tools=0.1,http_client=0.05")
+LOG_SAMPLING = os.getenv("LOG_SAMPLING", "")
 
 # 전역 로거 저장소
 LOGGERS = {}
 
+# 프로세스당 하나의 로그 큐와 리스너 (파일/콘솔 핸들러는 리스너 스레드만 사용)
+_log_queue = None
+_queue_handler = None
+_queue_listener = None
+_pipeline_lock = threading.Lock()
+
+
+def parse_sampling(value):
+    """LOG_SAMPLING 값을 {로거 이름: 샘플링 비율} 딕셔너리로 변환합니다."""
+    rates = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        if not name.strip() or not rate.strip():
+            continue
+        try:
+            rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+        except ValueError:
+            continue
+    return rates
+
+
+SAMPLING_RATES = parse_sampling(LOG_SAMPLING)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    INFO 이하 로그를 지정한 비율만 남기는 필터.
+    WARNING 이상의 로그는 항상 남깁니다.
+    """
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    로그 레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러.
+    메시지 포맷과 디스크 쓰기는 모두 리스너 스레드에서 처리됩니다.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def _get_queue_handler():
+    """프로세스 공용 큐 핸들러를 반환하고, 처음 호출될 때 리스너를 시작합니다."""
+    global _log_queue, _queue_handler, _queue_listener
+    if _queue_handler is None:
+        with _pipeline_lock:
+            if _queue_handler is None:
+                # 로그 디렉토리가 없으면 생성
+                pathlib.Path(LOG_DIR).mkdir(exist_ok=True)
+
+                # 파일명에 날짜를 포함시켜 로그 파일을 생성
+                log_file = os.path.join(LOG_DIR, f"{datetime.now().strftime('%Y-%m-%d')}.log")
+
+                # 파일 핸들러 설정 - 날짜별로 파일 교체 (프로세스 전체에서 하나만 사용)
+                file_handler = TimedRotatingFileHandler(
+                    log_file,
+                    when="midnight",
+                    interval=1,
+                    backupCount=30,  # 30일간의 로그 유지
+                    encoding="utf-8",
+                )
+                file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+                file_handler.setLevel(LOG_LEVEL)
+
+                # 콘솔 핸들러 설정
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+                console_handler.setLevel(LOG_LEVEL)
+
+                # 큐 리스너 시작 - 포맷과 파일/콘솔 쓰기를 별도 스레드에서 처리
+                _log_queue = queue.SimpleQueue()
+                _queue_listener = QueueListener(_log_queue, file_handler, console_handler, respect_handler_level=True)
+                _queue_listener.start()
+                atexit.register(stop_logging)
+
+                _queue_handler = LazyQueueHandler(_log_queue)
+    return _queue_handler
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 기록하고 리스너를 멈춥니다. 프로세스 종료 시 자동으로 호출됩니다."""
+    global _queue_listener
+    with _pipeline_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            _queue_listener = None
+
+
 def setup_logger(name):
     """
     날짜별로 로그를 저장하고 콘솔에도 출력하는 로거를 설정합니다.
-    Streamlit 환경에서 로그 중복을 방지하기 위한 로직이 추가되었습니다.
+    모든 로거는 프로세스 공용 큐 하나에 로그를 넣고, 파일/콘솔 출력은 리스너 스레드가 담당합니다.
     """
     # 이미 생성된 로거라면 반환
     global LOGGERS
     if name in LOGGERS:
         return LOGGERS[name]
-        
+
     # 로거 생성
     logger = logging.getLogger(name)
     logger.setLevel(LOG_LEVEL)
-    
+
     # 이미 핸들러가 설정되어 있다면 추가하지 않음
     if logger.handlers:
         LOGGERS[name] = logger
         return logger
-    
-    # 로그 디렉토리가 없으면 생성
-    pathlib.Path(LOG_DIR).mkdir(exist_ok=True)
-    
-    # 파일명에 날짜를 포함시켜 로그 파일을 생성
-    log_file = os.path.join(LOG_DIR, f"{datetime.now().strftime('%Y-%m-%d')}.log")
-    
-    # 파일 핸들러 설정 - 날짜별로 파일 교체
-    file_handler = TimedRotatingFileHandler(
-        log_file,
-        when="midnight",
-        interval=1,
-        backupCount=30,  # 30일간의 로그 유지
-    )
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    file_handler.setLevel(LOG_LEVEL)
-    
-    # 스트림릿 환경에서는 콘솔 출력 최소화
-    is_streamlit = 'streamlit' in sys.modules
-    console_level = logging.WARNING if is_streamlit else LOG_LEVEL
-    
-    # 콘솔 핸들러 설정
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    console_handler.setLevel(console_level)
-    
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+
+    # 공용 큐 핸들러 추가 (루트 로거로 전파하지 않아 중복 출력 방지)
+    logger.addHandler(_get_queue_handler())
+    logger.propagate = False
+
+    # 자주 호출되는 경로의 로거는 INFO 이하 로그를 샘플링
+    if name in SAMPLING_RATES:
+        logger.addFilter(SamplingFilter(SAMPLING_RATES[name]))
+
     # 로거 캐시
     LOGGERS[name] = logger
-    
+
     return logger
 
 # 기본 로거 설정
-default_logger = setup_logger("smart_home_agent") 
\ No newline at end of file
+default_logger = setup_logger("smart_home_agent")
@@ -0,0 +1,90 @@
+"""
+스마트홈 그래프의 완료 정책 경로와 가전제품 노드 테스트
+
+사용법:
+    cd langgraph-hybrid/app
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import HumanMessage
+from langgraph.graph import END
+from langgraph.types import Command
+
+from agents import device_agent, supervisor_agent
+from agents.completion_policy import CompletionPolicy
+from agents.fast_router import DEFAULT_RULES, FastRouter
+from graphs import smarthome_graph
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """슈퍼바이저와 가전제품 에이전트를 가짜 노드로 바꾼 그래프를 만듭니다."""
+    supervisor_calls = []
+
+    def fake_supervisor_node(state):
+        supervisor_calls.append(state["messages"][-1].content)
+        # 에이전트 응답을 받은 뒤에는 종료, 새 요청이면 가전제품 에이전트로 라우팅
+        if state["messages"][-1].name == "device_agent":
+            return Command(goto=END, update={"next": END})
+        return Command(goto="device_agent", update={"next": "device_agent"})
+
+    def fake_device_node(state, config):
+        reply = HumanMessage(content="요청을 처리했습니다.", name="device_agent")
+        return Command(update={"messages": [reply]}, goto="completion_check")
+
+    policy = CompletionPolicy(FastRouter(DEFAULT_RULES, enabled=True), enabled=True)
+    monkeypatch.setattr(supervisor_agent, "get_completion_policy", lambda: policy)
+    monkeypatch.setattr(smarthome_graph, "supervisor_node", fake_supervisor_node)
+    monkeypatch.setattr(smarthome_graph, "device_node", fake_device_node)
+    monkeypatch.setattr(smarthome_graph, "_graph_instance", None)
+    return smarthome_graph.get_smarthome_graph(), supervisor_calls
+
+
+def test_completion_check_edges(monkeypatch):
+    monkeypatch.setattr(smarthome_graph, "_graph_instance", None)
+    edges = {(edge.source, edge.target) for edge in smarthome_graph.get_smarthome_graph().get_graph().edges}
+    assert ("device_agent", "completion_check") in edges
+    assert ("completion_check", "supervisor") in edges
+    assert ("completion_check", "__end__") in edges
+
+
+def test_single_intent_request_skips_supervisor(graph):
+    compiled, supervisor_calls = graph
+    result = compiled.invoke({"messages": [HumanMessage(content="에어컨 켜줘")]})
+    assert len(supervisor_calls) == 1
+    assert result["supervisor_calls_avoided"] == 1
+    assert result["messages"][-1].name == "device_agent"
+
+
+def test_unclassified_request_returns_to_supervisor(graph):
+    compiled, supervisor_calls = graph
+    result = compiled.invoke({"messages": [HumanMessage(content="오늘 저녁 준비 좀 부탁해")]})
+    assert len(supervisor_calls) == 2
+    assert result.get("supervisor_calls_avoided", 0) == 0
+
+
+def test_device_node_records_turn_memo_with_thread_id(monkeypatch):
+    recorded = []
+
+    class FakeAgent:
+        def invoke(self, state, config):
+            return {"messages": [HumanMessage(content="에어컨을 켰습니다.")]}
+
+    class FakeStats:
+        def record(self, memo, request_id=""):
+            recorded.append(request_id)
+
+    monkeypatch.setattr(device_agent, "get_device_agent", lambda: FakeAgent())
+    monkeypatch.setattr(device_agent, "get_turn_memo_stats", lambda: FakeStats())
+    command = device_agent.device_node(
+        {"messages": [HumanMessage(content="에어컨 켜줘")]},
+        {"configurable": {"thread_id": "session-1"}},
+    )
+    assert command.goto == "completion_check"
+    assert recorded == ["session-1"]
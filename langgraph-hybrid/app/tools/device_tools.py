@@ -1,10 +1,14 @@
 import os
 import json
+import asyncio
 import requests
 import traceback
-from typing import List, Dict, Annotated
+from typing import Any, List, Dict, Annotated, Optional
 from dotenv import load_dotenv
 from langchain_core.tools import tool
+from pydantic import BaseModel, Field
+from tools.http_client import http_get, http_post, async_http_get
+from tools.capability_cache import get_capability_cache
 from logging_config import setup_logger
 
 # 로거 설정
@@ -14,6 +18,92 @@ logger = setup_logger("device_tools")
 load_dotenv()
 MOCK_SERVER_URL = os.getenv("MOCK_SERVER_URL")
 
+# --------- 기기 기능 정보 ---------
+# 실행 중 바뀌지 않는 기능 정보의 캐시 키 -> 모의 서버 경로
+CAPABILITY_PATHS = {
+    "refrigerator.modes": "/refrigerator/mode/list",
+    "air_conditioner.modes": "/air-conditioner/mode/list",
+    "air_conditioner.temperature_range": "/air-conditioner/temperature/range",
+    "robot_cleaner.modes": "/robot-cleaner/mode/list",
+    "robot_cleaner.patrol_areas": "/robot-cleaner/patrol/list",
+}
+
+# 프롬프트에 넣을 기능 정보 이름과 표시 형식
+CAPABILITY_DESCRIPTIONS = {
+    "refrigerator.modes": ("냉장고 모드", lambda result: ", ".join(result.get("modes", []))),
+    "air_conditioner.modes": ("에어컨 모드", lambda result: ", ".join(result.get("modes", []))),
+    "air_conditioner.temperature_range": (
+        "에어컨 설정 온도 범위",
+        lambda result: f"{result['range']['min']}~{result['range']['max']}도",
+    ),
+    "robot_cleaner.modes": ("로봇청소기 모드", lambda result: ", ".join(result.get("modes", []))),
+    "robot_cleaner.patrol_areas": ("로봇청소기 방범 가능 구역", lambda result: ", ".join(result.get("areas", []))),
+}
+
+def _strip_capability(key: str, result: Dict) -> Dict:
+    """캐시에 넣지 않을 값을 기능 정보 응답에서 제거합니다."""
+    # 온도 범위 응답의 현재 온도는 바뀌는 값이므로 캐시에 넣지 않음
+    if key == "air_conditioner.temperature_range":
+        result = {"range": {name: value for name, value in result.get("range", {}).items() if name != "current"}}
+    return result
+
+def _fetch_capability(key: str) -> Dict:
+    """모의 서버에서 기능 정보를 가져옵니다. 요청이 실패하면 requests 예외가 발생합니다."""
+    response = http_get(f"{MOCK_SERVER_URL}{CAPABILITY_PATHS[key]}")
+    response.raise_for_status()
+    return _strip_capability(key, response.json())
+
+async def _afetch_capability(key: str) -> Dict:
+    """_fetch_capability의 비동기 버전입니다. 요청이 실패하면 httpx 예외가 발생합니다."""
+    response = await async_http_get(f"{MOCK_SERVER_URL}{CAPABILITY_PATHS[key]}")
+    response.raise_for_status()
+    return _strip_capability(key, response.json())
+
+def get_capability(key: str) -> Dict:
+    """기기 기능 정보를 캐시에서 가져오고, 없으면 모의 서버에서 불러와 캐싱합니다."""
+    return get_capability_cache().get_or_load(key, lambda: _fetch_capability(key))
+
+async def aget_capability(key: str) -> Dict:
+    """get_capability의 비동기 버전입니다. 공유 비동기 HTTP 클라이언트로 불러옵니다."""
+    return await get_capability_cache().aget_or_load(key, lambda: _afetch_capability(key))
+
+def _format_capability_prompt(keys: List[str], results: List[Any]) -> str:
+    """키별 기능 정보(또는 불러오다 발생한 예외)로 프롬프트 문구를 만듭니다."""
+    lines = []
+    for key, result in zip(keys, results):
+        if isinstance(result, Exception):
+            logger.warning("기능 정보를 프롬프트에 넣지 못했습니다 (%s): %s", key, result)
+            continue
+        label, formatter = CAPABILITY_DESCRIPTIONS[key]
+        try:
+            lines.append(f"- {label}: {formatter(result)}")
+        except Exception as e:
+            logger.warning("기능 정보를 프롬프트에 넣지 못했습니다 (%s): %s", key, e)
+    if not lines:
+        return ""
+    text = "\n\n기기 기능 정보 (이미 조회된 값이므로 모드 목록, 온도 범위, 방범 가능 구역 조회 도구를 호출할 필요가 없습니다):\n" + "\n".join(lines)
+    return text.replace("{", "{{").replace("}", "}}")
+
+def get_capability_prompt(keys: List[str]) -> str:
+    """
+    에이전트 시스템 프롬프트에 넣을 기기 기능 정보 문구를 만듭니다.
+
+    불러올 수 없는 정보는 생략하며, 하나도 불러오지 못하면 빈 문자열을 반환합니다.
+    프롬프트 템플릿 변수로 해석되지 않도록 중괄호는 이스케이프합니다.
+    """
+    results = []
+    for key in keys:
+        try:
+            results.append(get_capability(key))
+        except Exception as e:
+            results.append(e)
+    return _format_capability_prompt(keys, results)
+
+async def aget_capability_prompt(keys: List[str]) -> str:
+    """get_capability_prompt의 비동기 버전입니다. 캐시에 없는 정보는 동시에 불러옵니다."""
+    results = await asyncio.gather(*(aget_capability(key) for key in keys), return_exceptions=True)
+    return _format_capability_prompt(keys, list(results))
+
 # --------- 냉장고 도구 ---------
 class RefrigeratorTools:
     @tool
@@ -22,10 +112,10 @@ class RefrigeratorTools:
         logger.info("냉장고 상태 조회 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/refrigerator/state"
         try:
-            response = requests.get(url)
+            response = http_get(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"냉장고 상태 조회 결과: {result}")
+            logger.info("냉장고 상태 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"냉장고 상태 조회 실패: {str(e)}"
@@ -36,14 +126,14 @@ class RefrigeratorTools:
     @tool
     def set_refrigerator_state(state: Annotated[str, "냉장고 상태 (on 또는 off)"]):
         """냉장고의 상태를 설정합니다. 'on' 또는 'off'로 지정합니다."""
-        logger.info(f"냉장고 상태 설정 도구 호출됨: {state}")
+        logger.info("냉장고 상태 설정 도구 호출됨: %s", state)
         url = f"{MOCK_SERVER_URL}/refrigerator/state"
         payload = {"state": state}
         try:
-            response = requests.post(url, json=payload)
+            response = http_post(url, json=payload)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"냉장고 상태 설정 결과: {result}")
+            logger.info("냉장고 상태 설정 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"냉장고 상태 설정 실패: {str(e)}"
@@ -57,10 +147,10 @@ class RefrigeratorTools:
         logger.info("냉장고 모드 조회 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/refrigerator/mode"
         try:
-            response = requests.get(url)
+            response = http_get(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"냉장고 모드 조회 결과: {result}")
+            logger.info("냉장고 모드 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"냉장고 모드 조회 실패: {str(e)}"
@@ -71,14 +161,14 @@ class RefrigeratorTools:
     @tool
     def set_refrigerator_mode(mode: Annotated[str, "냉장고 모드"]):
         """냉장고의 모드를 설정합니다."""
-        logger.info(f"냉장고 모드 설정 도구 호출됨: {mode}")
+        logger.info("냉장고 모드 설정 도구 호출됨: %s", mode)
         url = f"{MOCK_SERVER_URL}/refrigerator/mode"
         payload = {"mode": mode}
         try:
-            response = requests.post(url, json=payload)
+            response = http_post(url, json=payload)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"냉장고 모드 설정 결과: {result}")
+            logger.info("냉장고 모드 설정 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"냉장고 모드 설정 실패: {str(e)}"
@@ -90,12 +180,9 @@ class RefrigeratorTools:
     def get_refrigerator_mode_list():
         """냉장고에서 사용 가능한 모드 목록을 조회합니다."""
         logger.info("냉장고 모드 목록 조회 도구 호출됨")
-        url = f"{MOCK_SERVER_URL}/refrigerator/mode/list"
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"냉장고 모드 목록 조회 결과: {result}")
+            result = get_capability("refrigerator.modes")
+            logger.info("냉장고 모드 목록 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"냉장고 모드 목록 조회 실패: {str(e)}"
@@ -109,10 +196,10 @@ class RefrigeratorTools:
         logger.info("냉장고 식품 목록 조회 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/refrigerator/food"
         try:
-            response = requests.get(url)
+            response = http_get(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"냉장고 식품 목록 조회 결과: {len(result.get('foods', []))}개 식품 확인됨")
+            logger.info("냉장고 식품 목록 조회 결과: %s개 식품 확인됨", len(result.get('foods', [])))
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"냉장고 식품 목록 조회 실패: {str(e)}"
@@ -128,10 +215,10 @@ class AirConditionerTools:
         logger.info("에어컨 상태 조회 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/air-conditioner/state"
         try:
-            response = requests.get(url)
+            response = http_get(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 상태 조회 결과: {result}")
+            logger.info("에어컨 상태 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 상태 조회 실패: {str(e)}"
@@ -142,14 +229,14 @@ class AirConditionerTools:
     @tool
     def set_air_conditioner_state(state: Annotated[str, "에어컨 상태 (on 또는 off)"]):
         """에어컨의 상태를 설정합니다. 'on' 또는 'off'로 지정합니다."""
-        logger.info(f"에어컨 상태 설정 도구 호출됨: {state}")
+        logger.info("에어컨 상태 설정 도구 호출됨: %s", state)
         url = f"{MOCK_SERVER_URL}/air-conditioner/state"
         payload = {"state": state}
         try:
-            response = requests.post(url, json=payload)
+            response = http_post(url, json=payload)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 상태 설정 결과: {result}")
+            logger.info("에어컨 상태 설정 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 상태 설정 실패: {str(e)}"
@@ -163,10 +250,10 @@ class AirConditionerTools:
         logger.info("에어컨 모드 조회 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/air-conditioner/mode"
         try:
-            response = requests.get(url)
+            response = http_get(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 모드 조회 결과: {result}")
+            logger.info("에어컨 모드 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 모드 조회 실패: {str(e)}"
@@ -177,14 +264,14 @@ class AirConditionerTools:
     @tool
     def set_air_conditioner_mode(mode: Annotated[str, "에어컨 모드"]):
         """에어컨의 모드를 설정합니다."""
-        logger.info(f"에어컨 모드 설정 도구 호출됨: {mode}")
+        logger.info("에어컨 모드 설정 도구 호출됨: %s", mode)
         url = f"{MOCK_SERVER_URL}/air-conditioner/mode"
         payload = {"mode": mode}
         try:
-            response = requests.post(url, json=payload)
+            response = http_post(url, json=payload)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 모드 설정 결과: {result}")
+            logger.info("에어컨 모드 설정 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 모드 설정 실패: {str(e)}"
@@ -196,12 +283,9 @@ class AirConditionerTools:
     def get_air_conditioner_mode_list():
         """에어컨에서 사용 가능한 모드 목록을 조회합니다."""
         logger.info("에어컨 모드 목록 조회 도구 호출됨")
-        url = f"{MOCK_SERVER_URL}/air-conditioner/mode/list"
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"에어컨 모드 목록 조회 결과: {result}")
+            result = get_capability("air_conditioner.modes")
+            logger.info("에어컨 모드 목록 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 모드 목록 조회 실패: {str(e)}"
@@ -215,10 +299,10 @@ class AirConditionerTools:
         logger.info("에어컨 필터 사용량 조회 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/air-conditioner/filter"
         try:
-            response = requests.get(url)
+            response = http_get(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 필터 사용량 조회 결과: {result}")
+            logger.info("에어컨 필터 사용량 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 필터 사용량 조회 실패: {str(e)}"
@@ -232,10 +316,10 @@ class AirConditionerTools:
         logger.info("에어컨 온도 조회 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/air-conditioner/temperature"
         try:
-            response = requests.get(url)
+            response = http_get(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 온도 조회 결과: {result}")
+            logger.info("에어컨 온도 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 온도 조회 실패: {str(e)}"
@@ -246,14 +330,14 @@ class AirConditionerTools:
     @tool
     def set_air_conditioner_temperature(temperature: Annotated[int, "설정할 온도"]):
         """에어컨의 온도를 설정합니다."""
-        logger.info(f"에어컨 온도 설정 도구 호출됨: {temperature}도")
+        logger.info("에어컨 온도 설정 도구 호출됨: %s도", temperature)
         url = f"{MOCK_SERVER_URL}/air-conditioner/temperature"
         payload = {"temperature": temperature}
         try:
-            response = requests.post(url, json=payload)
+            response = http_post(url, json=payload)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 온도 설정 결과: {result}")
+            logger.info("에어컨 온도 설정 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 온도 설정 실패: {str(e)}"
@@ -267,10 +351,10 @@ class AirConditionerTools:
         logger.info("에어컨 온도 증가 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/air-conditioner/temperature/increase"
         try:
-            response = requests.post(url)
+            response = http_post(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 온도 증가 결과: {result}")
+            logger.info("에어컨 온도 증가 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 온도 증가 실패: {str(e)}"
@@ -284,10 +368,10 @@ class AirConditionerTools:
         logger.info("에어컨 온도 감소 도구 호출됨")
         url = f"{MOCK_SERVER_URL}/air-conditioner/temperature/decrease"
         try:
-            response = requests.post(url)
+            response = http_post(url)
             response.raise_for_status()
             result = response.json()
-            logger.info(f"에어컨 온도 감소 결과: {result}")
+            logger.info("에어컨 온도 감소 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 온도 감소 실패: {str(e)}"
@@ -297,14 +381,11 @@ class AirConditionerTools:
     
     @tool
     def get_air_conditioner_temperature_range():
-        """에어컨의 설정 가능한 온도 범위를 조회합니다."""
+        """에어컨의 설정 가능한 온도 범위(최소, 최대)를 조회합니다. 현재 온도는 get_air_conditioner_temperature로 조회합니다."""
         logger.info("에어컨 온도 범위 조회 도구 호출됨")
-        url = f"{MOCK_SERVER_URL}/air-conditioner/temperature/range"
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"에어컨 온도 범위 조회 결과: {result}")
+            result = get_capability("air_conditioner.temperature_range")
+            logger.info("에어컨 온도 범위 조회 결과: %s", result)
             return result
         except requests.exceptions.RequestException as e:
             error_msg = f"에어컨 온도 범위 조회 실패: {str(e)}"
@@ -320,7 +401,7 @@ class AirConditionerTools:
 #         logger.info("로봇청소기 상태 조회 도구 호출됨")
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/state"
 #         try:
-#             response = requests.get(url)
+#             response = http_get(url)
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 상태 조회 결과: {result}")
@@ -338,7 +419,7 @@ class AirConditionerTools:
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/state"
 #         payload = {"state": state}
 #         try:
-#             response = requests.post(url, json=payload)
+#             response = http_post(url, json=payload)
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 상태 설정 결과: {result}")
@@ -355,7 +436,7 @@ class AirConditionerTools:
 #         logger.info("로봇청소기 모드 조회 도구 호출됨")
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/mode"
 #         try:
-#             response = requests.get(url)
+#             response = http_get(url)
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 모드 조회 결과: {result}")
@@ -373,7 +454,7 @@ class AirConditionerTools:
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/mode"
 #         payload = {"mode": mode}
 #         try:
-#             response = requests.post(url, json=payload)
+#             response = http_post(url, json=payload)
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 모드 설정 결과: {result}")
@@ -388,11 +469,8 @@ class AirConditionerTools:
 #     def get_robot_cleaner_mode_list():
 #         """로봇청소기에서 사용 가능한 모드 목록을 조회합니다."""
 #         logger.info("로봇청소기 모드 목록 조회 도구 호출됨")
-#         url = f"{MOCK_SERVER_URL}/robot-cleaner/mode/list"
 #         try:
-#             response = requests.get(url)
-#             response.raise_for_status()
-#             result = response.json()
+#             result = get_capability("robot_cleaner.modes")
 #             logger.info(f"로봇청소기 모드 목록 조회 결과: {result}")
 #             return result
 #         except requests.exceptions.RequestException as e:
@@ -407,7 +485,7 @@ class AirConditionerTools:
 #         logger.info("로봇청소기 필터 사용량 조회 도구 호출됨")
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/filter"
 #         try:
-#             response = requests.get(url)
+#             response = http_get(url)
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 필터 사용량 조회 결과: {result}")
@@ -424,7 +502,7 @@ class AirConditionerTools:
 #         logger.info("로봇청소기 청소 횟수 조회 도구 호출됨")
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/cleaner-count"
 #         try:
-#             response = requests.get(url)
+#             response = http_get(url)
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 청소 횟수 조회 결과: {result}")
@@ -439,11 +517,8 @@ class AirConditionerTools:
 #     def get_available_patrol_areas():
 #         """로봇청소기의 방범 가능한 구역 목록을 조회합니다."""
 #         logger.info("로봇청소기 방범 가능 구역 목록 조회 도구 호출됨")
-#         url = f"{MOCK_SERVER_URL}/robot-cleaner/patrol/list"
 #         try:
-#             response = requests.get(url)
-#             response.raise_for_status()
-#             result = response.json()
+#             result = get_capability("robot_cleaner.patrol_areas")
 #             logger.info(f"로봇청소기 방범 가능 구역 목록 조회 결과: {result}")
 #             return result
 #         except requests.exceptions.RequestException as e:
@@ -458,7 +533,7 @@ class AirConditionerTools:
 #         logger.info("로봇청소기 방범 구역 설정 조회 도구 호출됨")
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/patrol/setting"
 #         try:
-#             response = requests.get(url)
+#             response = http_get(url)
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 방범 구역 설정 조회 결과: {result}")
@@ -475,7 +550,7 @@ class AirConditionerTools:
 #         logger.info(f"로봇청소기 방범 구역 설정 도구 호출됨: {areas}")
 #         url = f"{MOCK_SERVER_URL}/robot-cleaner/patrol/start"
 #         try:
-#             response = requests.post(url, json={"areas": areas})
+#             response = http_post(url, json={"areas": areas})
 #             response.raise_for_status()
 #             result = response.json()
 #             logger.info(f"로봇청소기 방범 구역 설정 결과: {result}")
@@ -486,6 +561,87 @@ class AirConditionerTools:
 #             logger.error(traceback.format_exc())
 #             return {"error": error_msg}
 
+# --------- 기기 스냅샷 도구 ---------
+# 기기 이름별 스냅샷 경로 (all은 모든 기기를 한 번에 조회)
+SNAPSHOT_PATHS = {
+    "all": "/devices/snapshot",
+    "refrigerator": "/refrigerator/snapshot",
+    "air_conditioner": "/air-conditioner/snapshot",
+    "robot_cleaner": "/robot-cleaner/snapshot",
+}
+
+class DeviceSnapshotTools:
+    @tool
+    def get_device_snapshot(device: Annotated[str, "조회할 기기 (all, refrigerator, air_conditioner, robot_cleaner)"] = "all"):
+        """기기의 상태, 모드, 사용 가능한 모드 목록, 온도와 온도 범위, 필터 사용량 등 모든 속성을 한 번에 조회합니다.
+        현재 상태를 확인할 때는 개별 조회 도구를 여러 번 호출하지 말고 이 도구를 사용하세요."""
+        logger.info("기기 스냅샷 조회 도구 호출됨: %s", device)
+        path = SNAPSHOT_PATHS.get(device)
+        if path is None:
+            return {"error": f"지원하지 않는 기기입니다: {device} (가능한 값: {', '.join(SNAPSHOT_PATHS)})"}
+        url = f"{MOCK_SERVER_URL}{path}"
+        try:
+            response = http_get(url)
+            response.raise_for_status()
+            result = response.json()
+            logger.info("기기 스냅샷 조회 결과: %s", result)
+            return result
+        except requests.exceptions.RequestException as e:
+            error_msg = f"기기 스냅샷 조회 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return {"error": error_msg}
+
+# --------- 일괄 설정 도구 ---------
+class DeviceSetting(BaseModel):
+    """한 기기에 적용할 설정. 지정한 항목만 state, mode, temperature, patrol_areas 순서로 적용됩니다."""
+    device: str = Field(description="설정할 기기 (refrigerator, air_conditioner, robot_cleaner)")
+    state: Optional[str] = Field(default=None, description="전원 상태 (on 또는 off)")
+    mode: Optional[str] = Field(default=None, description="설정할 모드")
+    temperature: Optional[int] = Field(default=None, description="설정할 온도 (에어컨만 해당)")
+    patrol_areas: Optional[List[str]] = Field(default=None, description="설정할 방범 구역 목록 (로봇청소기만 해당)")
+
+# 설정 항목 -> 모의 서버 일괄 명령 작업 이름 (적용 순서)
+SETTING_ACTIONS = (
+    ("state", "set_state"),
+    ("mode", "set_mode"),
+    ("temperature", "set_temperature"),
+    ("patrol_areas", "set_patrol_areas"),
+)
+
+class DeviceBatchTools:
+    @tool
+    def apply_device_settings(settings: Annotated[List[DeviceSetting], "기기별 설정 목록"]):
+        """여러 설정(전원, 모드, 온도 등)을 한 번에 적용합니다. 여러 기기를 함께 설정할 수도 있습니다.
+        하나라도 실패하면 아무것도 적용되지 않으며, 작업별 결과와 실패 사유를 반환합니다.
+        설정을 두 가지 이상 바꿀 때는 개별 설정 도구를 여러 번 호출하지 말고 이 도구를 사용하세요."""
+        operations = []
+        for setting in settings:
+            values = setting if isinstance(setting, dict) else setting.model_dump()
+            for field, action in SETTING_ACTIONS:
+                if values.get(field) is not None:
+                    operations.append({"device": values.get("device"), "action": action, "value": values[field]})
+        logger.info("기기 일괄 설정 도구 호출됨: %s", operations)
+        if not operations:
+            return {"error": "적용할 설정이 없습니다. state, mode, temperature, patrol_areas 중 하나 이상을 지정하세요."}
+        url = f"{MOCK_SERVER_URL}/batch"
+        try:
+            response = http_post(url, json={"operations": operations})
+            # 검증 실패(400)는 작업별 결과를 그대로 전달하여 어떤 설정이 잘못되었는지 알 수 있게 함
+            if response.status_code == 400:
+                result = {"result": "fail", **response.json().get("detail", {})}
+                logger.info("기기 일괄 설정 거부됨: %s", result)
+                return result
+            response.raise_for_status()
+            result = response.json()
+            logger.info("기기 일괄 설정 결과: %s", result)
+            return result
+        except requests.exceptions.RequestException as e:
+            error_msg = f"기기 일괄 설정 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return {"error": error_msg}
+
 # --------- 도구 목록 반환 함수 ---------
 def get_refrigerator_tools():
     """냉장고 관련 도구 목록을 반환합니다."""
@@ -532,10 +688,26 @@ def get_air_conditioner_tools():
 #         RobotCleanerTools.set_patrol_areas,
 #     ]
 
+def get_snapshot_tools():
+    """기기 스냅샷 도구 목록을 반환합니다."""
+    logger.info("기기 스냅샷 도구 목록 로드됨")
+    return [
+        DeviceSnapshotTools.get_device_snapshot,
+    ]
+
+def get_batch_tools():
+    """기기 일괄 설정 도구 목록을 반환합니다."""
+    logger.info("기기 일괄 설정 도구 목록 로드됨")
+    return [
+        DeviceBatchTools.apply_device_settings,
+    ]
+
 def get_all_device_tools():
     """모든 가전제품 제어 도구 목록을 반환합니다."""
     logger.info("모든 가전제품 도구 목록 로드됨")
     all_tools = []
     all_tools.extend(get_refrigerator_tools())
     all_tools.extend(get_air_conditioner_tools())
+    all_tools.extend(get_snapshot_tools())
+    all_tools.extend(get_batch_tools())
     return all_tools 
\ No newline at end of file
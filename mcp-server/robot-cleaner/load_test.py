@@ -0,0 +1,53 @@
+"""
+MCP 서버 동시 호출 부하 테스트: get_robot_cleaner_state를 N번 동시에 호출합니다.
+
+모의 서버 대신 지정한 지연 시간만큼 대기하는 httpx.MockTransport를 사용합니다.
+모의 서버 요청이 이벤트 루프를 막지 않으면 전체 소요 시간이 왕복 1회 시간에 가깝게 나옵니다.
+
+사용법:
+    cd mcp-server/robot-cleaner
+    python load_test.py --requests 20 --latency 0.2
+"""
+import time
+import asyncio
+import argparse
+
+import httpx
+
+import mcp_server
+
+
+def make_transport(latency: float) -> httpx.MockTransport:
+    """지정된 시간만큼 대기한 뒤 로봇청소기 상태를 반환하는 가짜 트랜스포트"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, json={"state": "on"})
+
+    return httpx.MockTransport(handler)
+
+
+async def main(n: int, latency: float) -> None:
+    await mcp_server.open_http_client(transport=make_transport(latency))
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(mcp_server.mcp.call_tool("get_robot_cleaner_state", {}) for _ in range(n))
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        await mcp_server.close_http_client()
+
+    print(f"요청 수: {n}, 가짜 모의 서버 지연: {latency:.2f}초")
+    print(f"{'총 소요(초)':<20}{elapsed:>10.2f}")
+    print(f"{'왕복 1회(초)':<20}{latency:>10.2f}")
+    print(f"{'순차 실행 예상(초)':<20}{n * latency:>10.2f}")
+    print(f"왕복 시간 대비: {elapsed / latency:.1f}배 (응답 {len(results)}건)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로봇청소기 MCP 서버 동시 호출 부하 테스트")
+    parser.add_argument("--requests", type=int, default=20, help="동시 호출 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="가짜 모의 서버 응답 지연 시간(초)")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.latency))
@@ -0,0 +1,15 @@
+import logging
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """
+    MCP 서버용 로거를 설정합니다.
+
+    langgraph-app의 logging_config와 같은 이름의 함수를 제공하여 capability_cache.py를 앱과 같은 파일로 사용할 수 있게 합니다.
+    MCP 서버는 파일 로그 없이 표준 출력에만 기록합니다.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    return logging.getLogger(name)
@@ -1,21 +1,73 @@
 from mcp.server.fastmcp import FastMCP
 import os
-import requests
 import json
-import logging
-from typing import Dict, List, Any, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Any, Optional
+import httpx
 from dotenv import load_dotenv
+from capability_cache import get_capability_cache
+from logging_config import setup_logger
 
 # 환경 변수 로드
 load_dotenv()
 MOCK_SERVER_URL = os.getenv("MOCK_SERVER_URL", "http://localhost:8000")
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+
+# 로거 설정
+logger = setup_logger("robot_cleaner_mcp_server")
+
+# 공유 HTTP 클라이언트 - SSE 연결마다 lifespan이 실행되므로 참조 횟수로 수명을 관리함
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_refs = 0
+_http_client_lock = asyncio.Lock()
+
+
+async def open_http_client(transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+    """
+    모의 서버 호출용 공유 비동기 HTTP 클라이언트를 열고 참조 횟수를 증가시킵니다.
+    
+    Args:
+        transport: 사용할 httpx 트랜스포트 (부하 테스트용, 기본값은 실제 네트워크)
+    """
+    global _http_client, _http_client_refs
+    async with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.AsyncClient(
+                base_url=MOCK_SERVER_URL,
+                timeout=HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=HTTP_POOL_SIZE,
+                    max_keepalive_connections=HTTP_POOL_SIZE,
+                ),
+                transport=transport,
+            )
+            logger.info("모의 서버 HTTP 클라이언트 생성 (풀 크기: %s, 타임아웃: %s초)", HTTP_POOL_SIZE, HTTP_TIMEOUT)
+        _http_client_refs += 1
+        return _http_client
+
+
+async def close_http_client() -> None:
+    """참조 횟수를 감소시키고, 마지막 참조가 해제되면 공유 HTTP 클라이언트를 닫습니다."""
+    global _http_client, _http_client_refs
+    async with _http_client_lock:
+        _http_client_refs = max(_http_client_refs - 1, 0)
+        if _http_client_refs == 0 and _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+            logger.info("모의 서버 HTTP 클라이언트 종료")
+
+
+@asynccontextmanager
+async def http_client_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """서버 세션 동안 공유 HTTP 클라이언트를 유지합니다."""
+    client = await open_http_client()
+    try:
+        yield {"http_client": client}
+    finally:
+        await close_http_client()
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-logger = logging.getLogger("robot_cleaner_mcp_server")
 
 # FastMCP 인스턴스 생성
 mcp = FastMCP(
@@ -23,28 +75,31 @@ mcp = FastMCP(
     instructions="로봇청소기를 제어하는 도구입니다. 상태 확인, 모드 변경, 방범 구역 설정 등의 기능을 제공합니다.",
     host="0.0.0.0",  # 모든 IP에서 접속 허용
     port=8001,  # 포트 번호
+    lifespan=http_client_lifespan,
 )
 
 # 모의 API 요청 함수
 async def mock_api_request(path: str, method: str = "GET", data: Optional[Dict] = None) -> Dict:
     """실제 모의 서버에 API 요청을 보내는 함수"""
-    url = f"{MOCK_SERVER_URL}{path}"
-    logger.info(f"모의 서버 API 요청: {method} {url}")
+    logger.info("모의 서버 API 요청: %s %s%s", method, MOCK_SERVER_URL, path)
+    
+    if _http_client is None:
+        return {"error": "모의 서버 HTTP 클라이언트가 초기화되지 않았습니다."}
     
     try:
         if method.upper() == "GET":
-            response = requests.get(url)
+            response = await _http_client.get(path)
         elif method.upper() == "POST":
-            response = requests.post(url, json=data)
+            response = await _http_client.post(path, json=data)
         else:
             return {"error": f"지원하지 않는 HTTP 메서드: {method}"}
         
         response.raise_for_status()
         result = response.json()
-        logger.info(f"모의 서버 응답: {json.dumps(result, ensure_ascii=False)}")
+        logger.info("모의 서버 응답: %s", json.dumps(result, ensure_ascii=False))
         return result
     except Exception as e:
-        logger.error(f"모의 서버 요청 실패: {str(e)}")
+        logger.error("모의 서버 요청 실패: %s", e)
         return {"error": f"모의 서버 요청 실패: {str(e)}"}
 
 # 로봇청소기 상태 조회 도구
@@ -73,7 +128,7 @@ async def set_robot_cleaner_state(state: str) -> Dict:
     Returns:
         Dict: 작업 결과가 포함된 딕셔너리
     """
-    logger.info(f"로봇청소기 상태 설정 요청 수신: {state}")
+    logger.info("로봇청소기 상태 설정 요청 수신: %s", state)
     # 모의 서버에 API 요청
     result = await mock_api_request("/robot-cleaner/state", "POST", {"state": state})
     return result
@@ -104,7 +159,7 @@ async def set_robot_cleaner_mode(mode: str) -> Dict:
     Returns:
         Dict: 작업 결과가 포함된 딕셔너리
     """
-    logger.info(f"로봇청소기 모드 설정 요청 수신: {mode}")
+    logger.info("로봇청소기 모드 설정 요청 수신: %s", mode)
     # 모의 서버에 API 요청
     result = await mock_api_request("/robot-cleaner/mode", "POST", {"mode": mode})
     return result
@@ -119,8 +174,8 @@ async def get_robot_cleaner_mode_list() -> Dict:
         Dict: 사용 가능한 모드 목록이 포함된 딕셔너리
     """
     logger.info("로봇청소기 모드 목록 조회 요청 수신")
-    # 모의 서버에 API 요청
-    result = await mock_api_request("/robot-cleaner/mode/list")
+    # 바뀌지 않는 기능 정보이므로 캐시를 거쳐 모의 서버에 API 요청
+    result = await get_capability_cache().aget_or_load("robot_cleaner.modes", lambda: mock_api_request("/robot-cleaner/mode/list"))
     return result
 
 # 로봇청소기 필터 사용량 조회 도구
@@ -161,8 +216,8 @@ async def get_available_patrol_areas() -> Dict:
         Dict: 방범 가능 구역 목록이 포함된 딕셔너리
     """
     logger.info("로봇청소기 방범 가능 구역 목록 조회 요청 수신")
-    # 모의 서버에 API 요청
-    result = await mock_api_request("/robot-cleaner/patrol/list")
+    # 바뀌지 않는 기능 정보이므로 캐시를 거쳐 모의 서버에 API 요청
+    result = await get_capability_cache().aget_or_load("robot_cleaner.patrol_areas", lambda: mock_api_request("/robot-cleaner/patrol/list"))
     return result
 
 # 로봇청소기 방범 구역 설정 조회 도구
@@ -191,11 +246,78 @@ async def set_patrol_areas(areas: List[str]) -> Dict:
     Returns:
         Dict: 작업 결과가 포함된 딕셔너리
     """
-    logger.info(f"로봇청소기 방범 구역 설정 요청 수신: {areas}")
+    logger.info("로봇청소기 방범 구역 설정 요청 수신: %s", areas)
     # 모의 서버에 API 요청
     result = await mock_api_request("/robot-cleaner/patrol/start", "POST", {"areas": areas})
     return result
 
+# 로봇청소기 스냅샷 조회 도구
+@mcp.tool()
+async def get_robot_cleaner_snapshot() -> Dict:
+    """
+    로봇청소기의 상태, 모드, 사용 가능한 모드 목록, 필터 사용량, 청소 횟수,
+    현재 방범 구역과 방범 가능 구역을 한 번에 조회합니다.
+    현재 상태를 확인할 때는 개별 조회 도구를 여러 번 호출하지 말고 이 도구를 사용하세요.
+    
+    Returns:
+        Dict: 로봇청소기의 모든 속성이 포함된 딕셔너리
+    """
+    logger.info("로봇청소기 스냅샷 조회 요청 수신")
+    # 모의 서버에 API 요청
+    result = await mock_api_request("/robot-cleaner/snapshot")
+    return result
+
+# 로봇청소기 일괄 설정 도구
+@mcp.tool()
+async def apply_robot_cleaner_settings(
+    state: Optional[str] = None,
+    mode: Optional[str] = None,
+    patrol_areas: Optional[List[str]] = None,
+) -> Dict:
+    """
+    로봇청소기의 전원 상태, 모드, 방범 구역을 한 번에 설정합니다.
+    지정한 항목만 상태, 모드, 방범 구역 순서로 적용되며, 하나라도 실패하면 아무것도 적용되지 않습니다.
+    설정을 두 가지 이상 바꿀 때는 개별 설정 도구를 여러 번 호출하지 말고 이 도구를 사용하세요.
+    
+    Args:
+        state (str, optional): 설정할 상태 ('on' 또는 'off')
+        mode (str, optional): 설정할 모드
+        patrol_areas (List[str], optional): 설정할 방범 구역 목록
+        
+    Returns:
+        Dict: 작업별 결과가 포함된 딕셔너리
+    """
+    operations = [
+        {"device": "robot_cleaner", "action": action, "value": value}
+        for action, value in (("set_state", state), ("set_mode", mode), ("set_patrol_areas", patrol_areas))
+        if value is not None
+    ]
+    logger.info("로봇청소기 일괄 설정 요청 수신: %s", operations)
+    if not operations:
+        return {"error": "적용할 설정이 없습니다. state, mode, patrol_areas 중 하나 이상을 지정하세요."}
+    # 모의 서버에 API 요청
+    result = await mock_api_request("/batch", "POST", {"operations": operations})
+    return result
+
+# 기능 정보 캐시 통계 리소스 (LLM 도구 목록에는 노출되지 않음)
+@mcp.resource("stats://capability-cache")
+def get_capability_cache_stats() -> str:
+    """기기 기능 정보 캐시의 적중/실패 횟수와 적중률을 JSON으로 반환합니다."""
+    return json.dumps(get_capability_cache().get_stats(), ensure_ascii=False)
+
+@mcp.tool()
+async def invalidate_capability_cache(key: Optional[str] = None) -> Dict:
+    """
+    기기 기능 정보 캐시를 무효화합니다. 모드 목록이나 방범 가능 구역이 바뀐 뒤 호출합니다.
+
+    Args:
+        key: 무효화할 기능 정보 키 (예: robot_cleaner.modes). 생략하면 전체를 무효화합니다.
+    """
+    logger.info("기능 정보 캐시 무효화 요청 수신: %s", key or "전체")
+    cache = get_capability_cache()
+    removed = cache.invalidate(key)
+    return {"invalidated": key or "all", "removed": removed, "stats": cache.get_stats()}
+
 if __name__ == "__main__":
     # 서버 시작 메시지 출력
     print("로봇청소기 MCP 서버가 실행 중입니다...")
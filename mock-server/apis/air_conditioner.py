@@ -22,48 +22,48 @@ class TemperatureRequest(BaseModel):
 async def get_state():
     logger.info("Getting air conditioner state")
     result = service.get_state()
-    logger.info(f"Air conditioner state: {result}")
+    logger.info("Air conditioner state: %s", result)
     return result
 
 @router.post("/state")
 async def set_state(request: StateRequest):
-    logger.info(f"Setting air conditioner state to: {request.state}")
+    logger.info("Setting air conditioner state to: %s", request.state)
     result = service.set_state(request.state)
     if result["result"] == "fail":
-        logger.error(f"Failed to set air conditioner state: {result['msg']}")
+        logger.error("Failed to set air conditioner state: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set air conditioner state: {result}")
+    logger.info("Successfully set air conditioner state: %s", result)
     return result
 
 @router.get("/mode")
 async def get_mode():
     logger.info("Getting air conditioner mode")
     result = service.get_mode()
-    logger.info(f"Air conditioner mode: {result}")
+    logger.info("Air conditioner mode: %s", result)
     return result
 
 @router.post("/mode")
 async def set_mode(request: ModeRequest):
-    logger.info(f"Setting air conditioner mode to: {request.mode}")
+    logger.info("Setting air conditioner mode to: %s", request.mode)
     result = service.set_mode(request.mode)
     if result["result"] == "fail":
-        logger.error(f"Failed to set air conditioner mode: {result['msg']}")
+        logger.error("Failed to set air conditioner mode: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set air conditioner mode: {result}")
+    logger.info("Successfully set air conditioner mode: %s", result)
     return result
 
 @router.get("/mode/list")
 async def get_mode_list():
     logger.info("Getting air conditioner mode list")
     result = service.get_mode_list()
-    logger.info(f"Air conditioner mode list: {result}")
+    logger.info("Air conditioner mode list: %s", result)
     return result
 
 @router.get("/filter")
 async def get_filter_used():
     logger.info("Getting air conditioner filter usage")
     result = service.get_filter_used()
-    logger.info(f"Air conditioner filter usage: {result}")
+    logger.info("Air conditioner filter usage: %s", result)
     return result
 
 # 추가된 온도 관련 API 엔드포인트
@@ -73,7 +73,7 @@ async def get_temperature():
     """현재 설정된 에어컨 온도를 조회합니다."""
     logger.info("Getting air conditioner temperature")
     result = service.get_temperature()
-    logger.info(f"Air conditioner temperature: {result}")
+    logger.info("Air conditioner temperature: %s", result)
     return result
 
 @router.get("/temperature/range")
@@ -81,18 +81,18 @@ async def get_temperature_range():
     """에어컨의 온도 설정 범위를 조회합니다."""
     logger.info("Getting air conditioner temperature range")
     result = service.get_temperature_range()
-    logger.info(f"Air conditioner temperature range: {result}")
+    logger.info("Air conditioner temperature range: %s", result)
     return result
 
 @router.post("/temperature")
 async def set_temperature(request: TemperatureRequest):
     """에어컨의 온도를 설정합니다."""
-    logger.info(f"Setting air conditioner temperature to: {request.temperature}")
+    logger.info("Setting air conditioner temperature to: %s", request.temperature)
     result = service.set_temperature(request.temperature)
     if result["result"] == "fail":
-        logger.error(f"Failed to set air conditioner temperature: {result['msg']}")
+        logger.error("Failed to set air conditioner temperature: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set air conditioner temperature: {result}")
+    logger.info("Successfully set air conditioner temperature: %s", result)
     return result
 
 @router.post("/temperature/increase")
@@ -100,7 +100,7 @@ async def increase_temperature():
     """에어컨의 온도를 1도 올립니다."""
     logger.info("Increasing air conditioner temperature")
     result = service.increase_temperature()
-    logger.info(f"Air conditioner temperature increased to: {result}")
+    logger.info("Air conditioner temperature increased to: %s", result)
     return result
 
 @router.post("/temperature/decrease")
@@ -108,5 +108,13 @@ async def decrease_temperature():
     """에어컨의 온도를 1도 내립니다."""
     logger.info("Decreasing air conditioner temperature")
     result = service.decrease_temperature()
-    logger.info(f"Air conditioner temperature decreased to: {result}")
+    logger.info("Air conditioner temperature decreased to: %s", result)
+    return result
+
+@router.get("/snapshot")
+async def get_snapshot():
+    """에어컨의 모든 속성을 한 번에 조회합니다."""
+    logger.info("Getting air conditioner snapshot")
+    result = service.get_snapshot()
+    logger.info("Air conditioner snapshot: %s", result)
     return result
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import List, Optional, Union
+from apis import refrigerator, air_conditioner, robot_cleaner
+from services.batch_service import BatchService
+from logging_config import setup_logger
+
+# 일괄 명령 API용 로거 설정
+logger = setup_logger("batch_api")
+
+router = APIRouter(tags=["batch"])
+# 각 기기 API와 같은 서비스 인스턴스에 적용
+service = BatchService({
+    "refrigerator": (refrigerator.service, "refrigerator"),
+    "air_conditioner": (air_conditioner.service, "air_conditioner"),
+    "robot_cleaner": (robot_cleaner.service, "robot_cleaner"),
+})
+
+class DeviceOperation(BaseModel):
+    device: str
+    action: str
+    value: Optional[Union[int, str, List[str]]] = None
+
+class BatchRequest(BaseModel):
+    operations: List[DeviceOperation]
+
+@router.post("/batch")
+async def apply_batch(request: BatchRequest):
+    """여러 기기 작업을 한 번에 적용합니다. 하나라도 실패하면 아무것도 적용하지 않습니다."""
+    logger.info("Applying batch of %s operations", len(request.operations))
+    result = service.apply([operation.model_dump() for operation in request.operations])
+    if result["result"] == "fail":
+        logger.error("Failed to apply batch: %s", result['msg'])
+        raise HTTPException(status_code=400, detail={"msg": result["msg"], "results": result["results"]})
+    logger.info("Successfully applied batch: %s", result)
+    return result
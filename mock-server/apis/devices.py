@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from apis import refrigerator, air_conditioner, robot_cleaner
+from logging_config import setup_logger
+
+# 기기 통합 API용 로거 설정
+logger = setup_logger("devices_api")
+
+router = APIRouter(prefix="/devices", tags=["devices"])
+
+@router.get("/snapshot")
+async def get_snapshot():
+    """모든 기기의 속성을 한 번에 조회합니다. 각 기기 API와 같은 서비스 인스턴스를 사용합니다."""
+    logger.info("Getting all devices snapshot")
+    result = {
+        "refrigerator": refrigerator.service.get_snapshot(),
+        "air_conditioner": air_conditioner.service.get_snapshot(),
+        "robot_cleaner": robot_cleaner.service.get_snapshot(),
+    }
+    logger.info("All devices snapshot: %s", result)
+    return result
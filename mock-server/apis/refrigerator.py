@@ -20,46 +20,54 @@ class ModeRequest(BaseModel):
 async def get_state():
     logger.info("Getting refrigerator state")
     result = service.get_state()
-    logger.info(f"Refrigerator state: {result}")
+    logger.info("Refrigerator state: %s", result)
     return result
 
 @router.post("/state")
 async def set_state(request: StateRequest):
-    logger.info(f"Setting refrigerator state to: {request.state}")
+    logger.info("Setting refrigerator state to: %s", request.state)
     result = service.set_state(request.state)
     if result["result"] == "fail":
-        logger.error(f"Failed to set refrigerator state: {result['msg']}")
+        logger.error("Failed to set refrigerator state: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set refrigerator state: {result}")
+    logger.info("Successfully set refrigerator state: %s", result)
     return result
 
 @router.get("/mode")
 async def get_mode():
     logger.info("Getting refrigerator mode")
     result = service.get_mode()
-    logger.info(f"Refrigerator mode: {result}")
+    logger.info("Refrigerator mode: %s", result)
     return result
 
 @router.post("/mode")
 async def set_mode(request: ModeRequest):
-    logger.info(f"Setting refrigerator mode to: {request.mode}")
+    logger.info("Setting refrigerator mode to: %s", request.mode)
     result = service.set_mode(request.mode)
     if result["result"] == "fail":
-        logger.error(f"Failed to set refrigerator mode: {result['msg']}")
+        logger.error("Failed to set refrigerator mode: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set refrigerator mode: {result}")
+    logger.info("Successfully set refrigerator mode: %s", result)
     return result
 
 @router.get("/mode/list")
 async def get_mode_list():
     logger.info("Getting refrigerator mode list")
     result = service.get_mode_list()
-    logger.info(f"Refrigerator mode list: {result}")
+    logger.info("Refrigerator mode list: %s", result)
     return result
 
 @router.get("/food")
 async def get_food_list():
     logger.info("Getting refrigerator food list")
     result = service.get_food_list()
-    logger.info(f"Refrigerator food list: {result}")
+    logger.info("Refrigerator food list: %s", result)
+    return result
+
+@router.get("/snapshot")
+async def get_snapshot():
+    """냉장고의 모든 속성을 한 번에 조회합니다."""
+    logger.info("Getting refrigerator snapshot")
+    result = service.get_snapshot()
+    logger.info("Refrigerator snapshot: %s", result)
     return result
@@ -23,55 +23,55 @@ class PatrolAreasRequest(BaseModel):
 async def get_state():
     logger.info("Getting robot cleaner state")
     result = service.get_state()
-    logger.info(f"Robot cleaner state: {result}")
+    logger.info("Robot cleaner state: %s", result)
     return result
 
 @router.post("/state")
 async def set_state(request: StateRequest):
-    logger.info(f"Setting robot cleaner state to: {request.state}")
+    logger.info("Setting robot cleaner state to: %s", request.state)
     result = service.set_state(request.state)
     if result["result"] == "fail":
-        logger.error(f"Failed to set robot cleaner state: {result['msg']}")
+        logger.error("Failed to set robot cleaner state: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set robot cleaner state: {result}")
+    logger.info("Successfully set robot cleaner state: %s", result)
     return result
 
 @router.get("/mode")
 async def get_mode():
     logger.info("Getting robot cleaner mode")
     result = service.get_mode()
-    logger.info(f"Robot cleaner mode: {result}")
+    logger.info("Robot cleaner mode: %s", result)
     return result
 
 @router.post("/mode")
 async def set_mode(request: ModeRequest):
-    logger.info(f"Setting robot cleaner mode to: {request.mode}")
+    logger.info("Setting robot cleaner mode to: %s", request.mode)
     result = service.set_mode(request.mode)
     if result["result"] == "fail":
-        logger.error(f"Failed to set robot cleaner mode: {result['msg']}")
+        logger.error("Failed to set robot cleaner mode: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set robot cleaner mode: {result}")
+    logger.info("Successfully set robot cleaner mode: %s", result)
     return result
 
 @router.get("/mode/list")
 async def get_mode_list():
     logger.info("Getting robot cleaner mode list")
     result = service.get_mode_list()
-    logger.info(f"Robot cleaner mode list: {result}")
+    logger.info("Robot cleaner mode list: %s", result)
     return result
 
 @router.get("/filter")
 async def get_filter_used():
     logger.info("Getting robot cleaner filter usage")
     result = service.get_filter_used()
-    logger.info(f"Robot cleaner filter usage: {result}")
+    logger.info("Robot cleaner filter usage: %s", result)
     return result
 
 @router.get("/cleaner-count")
 async def get_cleaner_count():
     logger.info("Getting robot cleaner count")
     result = service.get_cleaner_count()
-    logger.info(f"Robot cleaner count: {result}")
+    logger.info("Robot cleaner count: %s", result)
     return result
 
 # 추가된 방범 모드 관련 API 엔드포인트
@@ -81,7 +81,7 @@ async def get_available_patrol_areas():
     """방범 가능한 구역 목록을 조회합니다."""
     logger.info("Getting available patrol areas")
     result = service.get_available_patrol_areas()
-    logger.info(f"Available patrol areas: {result}")
+    logger.info("Available patrol areas: %s", result)
     return result
 
 @router.get("/patrol/setting")
@@ -89,16 +89,24 @@ async def get_patrol_areas():
     """현재 설정된 방범 구역 목록을 조회합니다."""
     logger.info("Getting current patrol areas setting")
     result = service.get_patrol_areas()
-    logger.info(f"Current patrol areas: {result}")
+    logger.info("Current patrol areas: %s", result)
     return result
 
 @router.post("/patrol/start")
 async def set_patrol_areas(request: PatrolAreasRequest):
     """방범 구역을 설정하고 방범 모드를 시작합니다."""
-    logger.info(f"Setting patrol areas: {request.areas}")
+    logger.info("Setting patrol areas: %s", request.areas)
     result = service.set_patrol_areas(request.areas)
     if result["result"] == "fail":
-        logger.error(f"Failed to set patrol areas: {result['msg']}")
+        logger.error("Failed to set patrol areas: %s", result['msg'])
         raise HTTPException(status_code=400, detail=result["msg"])
-    logger.info(f"Successfully set patrol areas: {request.areas}")
+    logger.info("Successfully set patrol areas: %s", request.areas)
+    return result
+
+@router.get("/snapshot")
+async def get_snapshot():
+    """로봇청소기의 모든 속성을 한 번에 조회합니다."""
+    logger.info("Getting robot cleaner snapshot")
+    result = service.get_snapshot()
+    logger.info("Robot cleaner snapshot: %s", result)
     return result
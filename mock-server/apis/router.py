@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from apis import refrigerator, air_conditioner, robot_cleaner, routine
+from apis import refrigerator, air_conditioner, robot_cleaner, routine, devices, batch
 from logging_config import setup_logger
 
 # API 라우터용 로거 설정
@@ -16,3 +16,7 @@ router.include_router(robot_cleaner.router)
 logger.info("Robot cleaner router initialized")
 router.include_router(routine.router)
 logger.info("Routine router initialized")
+router.include_router(devices.router)
+logger.info("Devices router initialized")
+router.include_router(batch.router)
+logger.info("Batch router initialized")
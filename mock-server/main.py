@@ -1,8 +1,9 @@
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from apis.router import router
 import uvicorn
-import time
 from logging_config import setup_logger
+from metrics import TimingMiddleware, get_request_metrics
 
 # 애플리케이션 로거 설정
 logger = setup_logger("smart_home_api")
@@ -15,26 +16,13 @@ app = FastAPI(
 
 app.include_router(router)
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """모든 요청과 응답을 로깅하는 미들웨어"""
-    request_id = str(time.time())
-    request_path = request.url.path
-    request_method = request.method
-    client_host = request.client.host if request.client else "unknown"
-    
-    logger.info(f"Request {request_id} - Method: {request_method} Path: {request_path} - Client: {client_host}")
-    
-    try:
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        
-        logger.info(f"Response {request_id} - Status: {response.status_code} - Took: {process_time:.4f}s")
-        return response
-    except Exception as e:
-        logger.error(f"Request {request_id} failed with error: {str(e)}")
-        raise
+# 라우트별 요청 수와 지연 시간을 기록하는 미들웨어
+app.add_middleware(TimingMiddleware)
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """라우트별 요청 수와 지연 시간 히스토그램을 Prometheus 텍스트 형식으로 반환합니다."""
+    return PlainTextResponse(get_request_metrics().render_prometheus(), media_type="text/plain; version=0.0.4")
 
 @app.get("/")
 async def root():
@@ -0,0 +1,128 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from logging_config import setup_logger
+
+# 요청 단위 로그용 로거 (LOG_SAMPLING=request_log=0.1 처럼 샘플링하거나 0으로 끌 수 있음)
+request_logger = setup_logger("request_log")
+
+# 지연 시간 히스토그램 버킷 경계 (초). 목 서버 응답은 대부분 수 ms 이내이므로 작은 값 위주로 구성
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 라우트와 일치하지 않은 요청의 라우트 라벨 (경로별로 라벨이 늘어나지 않도록 하나로 묶음)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetrics:
+    """
+    라우트별 요청 수와 지연 시간 히스토그램을 모으는 저장소.
+
+    라벨은 실제 경로가 아니라 라우트 템플릿(예: /robot-cleaner/state)을 사용합니다.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        # (method, route, status) -> 요청 수
+        self._counts: Dict[Tuple[str, str, str], int] = {}
+        # (method, route) -> {"buckets": 버킷별 개수, "sum": 합계, "count": 개수}
+        self._latencies: Dict[Tuple[str, str], Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, route: str, status: int, duration: float) -> None:
+        """요청 하나의 결과를 기록합니다."""
+        index = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            count_key = (method, route, str(status))
+            self._counts[count_key] = self._counts.get(count_key, 0) + 1
+            latency = self._latencies.get((method, route))
+            if latency is None:
+                latency = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._latencies[(method, route)] = latency
+            if index < len(self.buckets):
+                latency["buckets"][index] += 1
+            latency["sum"] += duration
+            latency["count"] += 1
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 지표를 반환합니다."""
+        with self._lock:
+            counts = sorted(self._counts.items())
+            latencies = sorted((key, {**value, "buckets": list(value["buckets"])}) for key, value in self._latencies.items())
+
+        lines: List[str] = [
+            "# HELP mock_server_requests_total Total HTTP requests handled by the mock server.",
+            "# TYPE mock_server_requests_total counter",
+        ]
+        for (method, route, status), count in counts:
+            lines.append(f'mock_server_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+
+        lines += [
+            "# HELP mock_server_request_duration_seconds HTTP request latency in seconds.",
+            "# TYPE mock_server_request_duration_seconds histogram",
+        ]
+        for (method, route), latency in latencies:
+            labels = f'method="{method}",route="{route}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, latency["buckets"]):
+                cumulative += bucket_count
+                lines.append(f'mock_server_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'mock_server_request_duration_seconds_bucket{{{labels},le="+Inf"}} {latency["count"]}')
+            lines.append(f'mock_server_request_duration_seconds_sum{{{labels}}} {latency["sum"]:.6f}')
+            lines.append(f'mock_server_request_duration_seconds_count{{{labels}}} {latency["count"]}')
+        return "\n".join(lines) + "\n"
+
+
+class TimingMiddleware:
+    """
+    요청 지연 시간을 재는 순수 ASGI 미들웨어.
+
+    BaseHTTPMiddleware(@app.middleware("http"))와 달리 요청/응답을 감싸는 태스크를 만들지 않고
+    응답 시작 메시지에서 상태 코드만 가로채므로 요청당 오버헤드가 작습니다.
+    """
+
+    def __init__(self, app, metrics: Optional[RequestMetrics] = None):
+        self.app = app
+        self.metrics = metrics or get_request_metrics()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            request_logger.error("%s %s failed with error: %s", scope["method"], scope["path"], str(e))
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+            # 라우팅 후 scope에 남은 라우트 템플릿을 라벨로 사용
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.metrics.record(scope["method"], route, status, duration)
+            request_logger.info("%s %s - Status: %s - Took: %.4fs", scope["method"], scope["path"], status, duration)
+
+
+# 싱글톤 인스턴스
+_request_metrics_instance = None
+_request_metrics_lock = threading.Lock()
+
+
+def get_request_metrics() -> RequestMetrics:
+    """요청 지표 저장소의 싱글톤 인스턴스를 반환합니다."""
+    global _request_metrics_instance
+    if _request_metrics_instance is None:
+        with _request_metrics_lock:
+            if _request_metrics_instance is None:
+                _request_metrics_instance = RequestMetrics()
+    return _request_metrics_instance
@@ -0,0 +1,119 @@
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+from logging_config import setup_logger
+
+# 일괄 명령 서비스용 로거 설정
+logger = setup_logger("batch_service")
+
+# 기기별로 일괄 명령에서 허용하는 작업 (서비스 메서드 이름 -> 값 필요 여부)
+DEVICE_ACTIONS: Dict[str, Dict[str, bool]] = {
+    "refrigerator": {
+        "set_state": True,
+        "set_mode": True,
+    },
+    "air_conditioner": {
+        "set_state": True,
+        "set_mode": True,
+        "set_temperature": True,
+        "increase_temperature": False,
+        "decrease_temperature": False,
+    },
+    "robot_cleaner": {
+        "set_state": True,
+        "set_mode": True,
+        "set_patrol_areas": True,
+    },
+}
+
+class BatchService:
+    """
+    여러 기기 작업을 한 번에 적용하는 서비스.
+
+    모든 작업을 기기 모델의 복사본에 먼저 적용해 보고, 하나라도 실패하면 아무것도 반영하지 않습니다.
+    모두 성공하면 복사본을 각 기기 서비스에 반영합니다.
+    """
+
+    def __init__(self, services: Dict[str, Tuple[Any, str]]):
+        """
+        Args:
+            services: 기기 이름 -> (기기 서비스 인스턴스, 서비스가 모델을 보관하는 속성 이름)
+        """
+        self.services = services
+        logger.info("BatchService initialized with devices: %s", list(services))
+
+    def _validate_operation(self, operation: Dict[str, Any]) -> Optional[str]:
+        """작업 형식을 검사하고, 문제가 있으면 오류 메시지를 반환합니다."""
+        device = operation.get("device")
+        action = operation.get("action")
+        if device not in self.services or device not in DEVICE_ACTIONS:
+            return f"지원하지 않는 기기입니다: {device}"
+        if action not in DEVICE_ACTIONS[device]:
+            return f"{device}에서 지원하지 않는 작업입니다: {action}"
+        if DEVICE_ACTIONS[device][action] and operation.get("value") is None:
+            return f"{action} 작업에는 value가 필요합니다"
+        return None
+
+    def apply(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        작업 목록을 순서대로 적용합니다. 모두 성공한 경우에만 기기 상태가 바뀝니다.
+
+        Returns:
+            {"result": "success" | "fail", "results": 작업별 결과 목록, "msg": 실패 사유(실패 시)}
+        """
+        logger.debug("Attempting to apply %s batch operations", len(operations))
+        if not operations:
+            return {"result": "fail", "msg": "작업 목록이 비어 있습니다", "results": []}
+
+        drafts: Dict[str, Any] = {}
+        results: List[Dict[str, Any]] = []
+        failed_msg = None
+
+        for index, operation in enumerate(operations):
+            entry = {
+                "index": index,
+                "device": operation.get("device"),
+                "action": operation.get("action"),
+                "value": operation.get("value"),
+            }
+            results.append(entry)
+            # 앞선 작업이 실패하면 나머지는 실행하지 않음
+            if failed_msg is not None:
+                entry["result"] = "skipped"
+                continue
+
+            error = self._validate_operation(operation)
+            if error is None:
+                device, action = operation["device"], operation["action"]
+                # 기기별 서비스 복사본을 한 번만 만들어 같은 기기의 작업이 이어서 적용되도록 함
+                if device not in drafts:
+                    service, model_attr = self.services[device]
+                    draft = copy.copy(service)
+                    setattr(draft, model_attr, copy.deepcopy(getattr(service, model_attr)))
+                    drafts[device] = draft
+                method = getattr(drafts[device], action)
+                try:
+                    result = method(operation["value"]) if DEVICE_ACTIONS[device][action] else method()
+                except (TypeError, ValueError) as e:
+                    logger.warning("Invalid batch value for %s.%s: %s", device, action, e)
+                    result = {"result": "fail", "msg": f"유효하지 않은 값입니다: {operation['value']}"}
+                if result.get("result") == "fail":
+                    error = result["msg"]
+                else:
+                    entry.update(result)
+                    entry.setdefault("result", "success")
+
+            if error is not None:
+                entry["result"] = "fail"
+                entry["msg"] = error
+                failed_msg = f"{index + 1}번째 작업 실패: {error}"
+
+        if failed_msg is not None:
+            logger.warning("Batch rejected, no changes applied - %s", failed_msg)
+            return {"result": "fail", "msg": failed_msg, "results": results}
+
+        # 모든 작업이 성공했으므로 복사본을 실제 서비스에 반영
+        for device, draft in drafts.items():
+            service, model_attr = self.services[device]
+            setattr(service, model_attr, getattr(draft, model_attr))
+        logger.debug("Successfully applied %s batch operations to %s", len(operations), list(drafts))
+        return {"result": "success", "results": results}
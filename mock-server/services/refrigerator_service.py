@@ -1,6 +1,6 @@
 from models.refrigerator import Refrigerator
 from models.food_list import get_random_foods
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Union
 from logging_config import setup_logger
 
 # 냉장고 서비스용 로거 설정
@@ -17,11 +17,11 @@ class RefrigeratorService:
         return {"state": state}
     
     def set_state(self, state: str) -> Dict[str, str]:
-        logger.debug(f"Attempting to set refrigerator state to: {state}")
+        logger.debug("Attempting to set refrigerator state to: %s", state)
         if self.refrigerator.set_state(state):
-            logger.debug(f"Successfully set refrigerator state to: {state}")
+            logger.debug("Successfully set refrigerator state to: %s", state)
             return {"result": "success"}
-        logger.warning(f"Failed to set refrigerator state to: {state} - Invalid state")
+        logger.warning("Failed to set refrigerator state to: %s - Invalid state", state)
         return {"result": "fail", "msg": "유효하지 않은 상태입니다"}
     
     def get_mode(self) -> Dict[str, str]:
@@ -30,11 +30,11 @@ class RefrigeratorService:
         return {"mode": mode}
     
     def set_mode(self, mode: str) -> Dict[str, str]:
-        logger.debug(f"Attempting to set refrigerator mode to: {mode}")
+        logger.debug("Attempting to set refrigerator mode to: %s", mode)
         if self.refrigerator.set_mode(mode):
-            logger.debug(f"Successfully set refrigerator mode to: {mode}")
+            logger.debug("Successfully set refrigerator mode to: %s", mode)
             return {"result": "success"}
-        logger.warning(f"Failed to set refrigerator mode to: {mode} - Unsupported mode")
+        logger.warning("Failed to set refrigerator mode to: %s - Unsupported mode", mode)
         return {"result": "fail", "msg": "지원하지 않는 mode입니다"}
     
     def get_mode_list(self) -> Dict[str, List[str]]:
@@ -45,5 +45,16 @@ class RefrigeratorService:
     def get_food_list(self) -> Dict[str, List[str]]:
         logger.debug("Getting random food list from refrigerator")
         foods = get_random_foods()
-        logger.debug(f"Retrieved {len(foods)} food items")
+        logger.debug("Retrieved %s food items", len(foods))
         return {"foods": foods}
+    
+    def get_snapshot(self) -> Dict[str, Any]:
+        """상태, 모드, 모드 목록을 한 번에 반환합니다. 식품 목록은 /refrigerator/food로 따로 조회합니다."""
+        logger.debug("Getting refrigerator snapshot")
+        snapshot = {
+            "state": self.refrigerator.get_state(),
+            "mode": self.refrigerator.get_mode(),
+            "modes": self.refrigerator.get_available_modes(),
+        }
+        logger.debug("Refrigerator snapshot: %s", snapshot)
+        return snapshot
@@ -1,5 +1,5 @@
 from models.robot_cleaner import RobotCleaner
-from typing import Dict, List
+from typing import Any, Dict, List
 from logging_config import setup_logger
 
 # 로봇청소기 서비스용 로거 설정
@@ -16,11 +16,11 @@ class RobotCleanerService:
         return {"state": state}
     
     def set_state(self, state: str) -> Dict[str, str]:
-        logger.debug(f"Attempting to set robot cleaner state to: {state}")
+        logger.debug("Attempting to set robot cleaner state to: %s", state)
         if self.robot_cleaner.set_state(state):
-            logger.debug(f"Successfully set robot cleaner state to: {state}")
+            logger.debug("Successfully set robot cleaner state to: %s", state)
             return {"result": "success"}
-        logger.warning(f"Failed to set robot cleaner state to: {state} - Invalid state")
+        logger.warning("Failed to set robot cleaner state to: %s - Invalid state", state)
         return {"result": "fail", "msg": "유효하지 않은 상태입니다"}
     
     def get_mode(self) -> Dict[str, str]:
@@ -29,11 +29,11 @@ class RobotCleanerService:
         return {"mode": mode}
     
     def set_mode(self, mode: str) -> Dict[str, str]:
-        logger.debug(f"Attempting to set robot cleaner mode to: {mode}")
+        logger.debug("Attempting to set robot cleaner mode to: %s", mode)
         if self.robot_cleaner.set_mode(mode):
-            logger.debug(f"Successfully set robot cleaner mode to: {mode}")
+            logger.debug("Successfully set robot cleaner mode to: %s", mode)
             return {"result": "success"}
-        logger.warning(f"Failed to set robot cleaner mode to: {mode} - Unsupported mode")
+        logger.warning("Failed to set robot cleaner mode to: %s - Unsupported mode", mode)
         return {"result": "fail", "msg": "지원하지 않는 mode입니다"}
     
     def get_mode_list(self) -> Dict[str, List[str]]:
@@ -44,34 +44,49 @@ class RobotCleanerService:
     def get_filter_used(self) -> Dict[str, int]:
         logger.debug("Getting robot cleaner filter usage")
         filter_used = self.robot_cleaner.get_filter_used()
-        logger.debug(f"Robot cleaner filter usage: {filter_used}")
+        logger.debug("Robot cleaner filter usage: %s", filter_used)
         return {"filter_used": filter_used}
     
     def get_cleaner_count(self) -> Dict[str, int]:
         logger.debug("Getting robot cleaner count")
         cleaner_count = self.robot_cleaner.get_cleaner_count()
-        logger.debug(f"Robot cleaner count: {cleaner_count}")
+        logger.debug("Robot cleaner count: %s", cleaner_count)
         return {"cleaner_count": cleaner_count}
     
     def get_patrol_areas(self) -> Dict[str, List[str]]:
         """설정된 방범 구역 목록을 반환합니다."""
         logger.debug("Getting robot cleaner patrol areas")
         areas = self.robot_cleaner.get_patrol_areas()
-        logger.debug(f"Robot cleaner patrol areas: {areas}")
+        logger.debug("Robot cleaner patrol areas: %s", areas)
         return {"areas": areas}
     
     def get_available_patrol_areas(self) -> Dict[str, List[str]]:
         """설정 가능한 모든 방범 구역 목록을 반환합니다."""
         logger.debug("Getting available robot cleaner patrol areas")
         areas = self.robot_cleaner.get_available_patrol_areas()
-        logger.debug(f"Available robot cleaner patrol areas: {areas}")
+        logger.debug("Available robot cleaner patrol areas: %s", areas)
         return {"areas": areas}
     
     def set_patrol_areas(self, areas: List[str]) -> Dict[str, str]:
         """방범 구역을 설정합니다."""
-        logger.debug(f"Attempting to set robot cleaner patrol areas: {areas}")
+        logger.debug("Attempting to set robot cleaner patrol areas: %s", areas)
         if self.robot_cleaner.set_patrol_areas(areas):
-            logger.debug(f"Successfully set robot cleaner patrol areas: {areas}")
+            logger.debug("Successfully set robot cleaner patrol areas: %s", areas)
             return {"result": "success"}
-        logger.warning(f"Failed to set robot cleaner patrol areas: {areas} - Invalid areas")
+        logger.warning("Failed to set robot cleaner patrol areas: %s - Invalid areas", areas)
         return {"result": "fail", "msg": "유효하지 않은 방범 구역입니다"}
+    
+    def get_snapshot(self) -> Dict[str, Any]:
+        """상태, 모드, 모드 목록, 필터 사용량, 청소 횟수, 방범 구역 설정을 한 번에 반환합니다."""
+        logger.debug("Getting robot cleaner snapshot")
+        snapshot = {
+            "state": self.robot_cleaner.get_state(),
+            "mode": self.robot_cleaner.get_mode(),
+            "modes": self.robot_cleaner.get_available_modes(),
+            "filter_used": self.robot_cleaner.get_filter_used(),
+            "cleaner_count": self.robot_cleaner.get_cleaner_count(),
+            "patrol_areas": self.robot_cleaner.get_patrol_areas(),
+            "available_patrol_areas": self.robot_cleaner.get_available_patrol_areas(),
+        }
+        logger.debug("Robot cleaner snapshot: %s", snapshot)
+        return snapshot
@@ -12,7 +12,7 @@ class RoutineService:
     
     def add_routine(self, routine_name: str, routine_flow: List[str]) -> Dict[str, str]:
         """새로운 루틴을 추가합니다."""
-        logger.debug(f"Attempting to add routine: {routine_name}")
+        logger.debug("Attempting to add routine: %s", routine_name)
         
         # 루틴 이름이 비어있는지 확인
         if not routine_name or not routine_name.strip():
@@ -26,12 +26,12 @@ class RoutineService:
         
         # 루틴 추가
         self.routine.add_routine(routine_name, routine_flow)
-        logger.info(f"Successfully added routine: {routine_name} with {len(routine_flow)} steps")
+        logger.info("Successfully added routine: %s with %s steps", routine_name, len(routine_flow))
         return {"result": "success"}
     
     def remove_routine(self, routine_name: str) -> Dict[str, str]:
         """지정된 이름의 루틴을 제거합니다."""
-        logger.debug(f"Attempting to remove routine: {routine_name}")
+        logger.debug("Attempting to remove routine: %s", routine_name)
         
         # 루틴 이름이 비어있는지 확인
         if not routine_name or not routine_name.strip():
@@ -40,26 +40,26 @@ class RoutineService:
         
         # 루틴 제거
         if self.routine.remove_routine(routine_name):
-            logger.info(f"Successfully removed routine: {routine_name}")
+            logger.info("Successfully removed routine: %s", routine_name)
             return {"result": "success"}
         else:
-            logger.warning(f"Failed to remove routine: {routine_name} - Not found")
+            logger.warning("Failed to remove routine: %s - Not found", routine_name)
             return {"result": "fail", "msg": f"'{routine_name}' 루틴을 찾을 수 없습니다"}
     
     def get_all_routines(self) -> Dict[str, Dict[str, List[str]]]:
         """모든 루틴 목록을 반환합니다."""
         logger.debug("Getting all routines")
         routines = self.routine.get_all_routines()
-        logger.info(f"Retrieved {len(routines)} routines")
+        logger.info("Retrieved %s routines", len(routines))
         return {"routines": routines}
     
     def get_routine(self, routine_name: str) -> Dict[str, Optional[List[str]]]:
         """지정된 이름의 루틴을 반환합니다."""
-        logger.debug(f"Getting routine: {routine_name}")
+        logger.debug("Getting routine: %s", routine_name)
         routine = self.routine.get_routine(routine_name)
         if routine:
-            logger.info(f"Retrieved routine: {routine_name}")
+            logger.info("Retrieved routine: %s", routine_name)
             return {"routine": routine}
         else:
-            logger.warning(f"Routine not found: {routine_name}")
+            logger.warning("Routine not found: %s", routine_name)
             return {"routine": None} 
\ No newline at end of file